@@ -13,6 +13,7 @@ from hummingbot.client.config.config_helpers import (
     ClientConfigAdapter,
     create_yml_files_legacy,
     load_client_config_map_from_file,
+    load_client_config_value,
     write_config_to_yml,
 )
 from hummingbot.client.config.security import Security
@@ -24,6 +25,9 @@ from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.event.events import HummingbotUIEvent
 from hummingbot.core.utils import detect_available_port
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.event_loop_monitor import EventLoopMonitor
+from hummingbot.core.utils.event_loop_policy import install_event_loop_policy, use_uvloop_from_env
+from hummingbot.core.utils.trading_pairs_cache import TradingPairsCache
 
 
 class UIStartListener(EventListener):
@@ -61,6 +65,12 @@ async def main_async(client_config_map: ClientConfigAdapter):
     init_logging("hummingbot_logs.yml", client_config_map)
 
     AllConnectorSettings.initialize_paper_trade_settings(client_config_map.paper_trade.paper_trade_exchanges)
+    TradingPairsCache.initialize(ttl=client_config_map.trading_pairs_cache_ttl)
+    EventLoopMonitor.initialize(
+        lag_warning_threshold=client_config_map.event_loop_monitor.lag_warning_threshold,
+        slow_callback_threshold=client_config_map.event_loop_monitor.slow_callback_threshold,
+        profile_tasks=client_config_map.event_loop_monitor.profile_tasks,
+    )
 
     hb = HummingbotApplication.main_application(client_config_map)
 
@@ -85,6 +95,8 @@ def main():
     chdir_to_data_directory()
     secrets_manager_cls = ETHKeyFileSecretManger
 
+    # The event loop is created before the login, so the setting is read without loading the whole configuration
+    install_event_loop_policy(use_uvloop=use_uvloop_from_env(default=load_client_config_value("use_uvloop", False)))
     try:
         ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
     except Exception:
@@ -31,6 +31,9 @@ from hummingbot.client.ui.style import load_style
 from hummingbot.core.event.events import HummingbotUIEvent
 from hummingbot.core.management.console import start_management_console
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.event_loop_monitor import EventLoopMonitor
+from hummingbot.core.utils.event_loop_policy import install_event_loop_policy, use_uvloop_from_env
+from hummingbot.core.utils.trading_pairs_cache import TradingPairsCache
 
 
 class CmdlineParser(argparse.ArgumentParser):
@@ -92,6 +95,12 @@ async def quick_start(args: argparse.Namespace, secrets_manager: BaseSecretsMana
     await read_system_configs_from_yml()
 
     AllConnectorSettings.initialize_paper_trade_settings(client_config_map.paper_trade.paper_trade_exchanges)
+    TradingPairsCache.initialize(ttl=client_config_map.trading_pairs_cache_ttl)
+    EventLoopMonitor.initialize(
+        lag_warning_threshold=client_config_map.event_loop_monitor.lag_warning_threshold,
+        slow_callback_threshold=client_config_map.event_loop_monitor.slow_callback_threshold,
+        profile_tasks=client_config_map.event_loop_monitor.profile_tasks,
+    )
 
     hb = HummingbotApplication.main_application(client_config_map=client_config_map)
     # Todo: validate strategy and config_file_name before assinging
@@ -152,6 +161,8 @@ def main():
     # If no password is given from the command line, prompt for one.
     secrets_manager_cls = ETHKeyFileSecretManger
     client_config_map = load_client_config_map_from_file()
+    # Before the login, that schedules the decryption of the configs in the event loop
+    install_event_loop_policy(use_uvloop=use_uvloop_from_env(default=client_config_map.use_uvloop))
     if args.config_password is None:
         secrets_manager = login_prompt(secrets_manager_cls, style=load_style(client_config_map))
         if not secrets_manager:
@@ -131,8 +131,8 @@ class GridStrike(ControllerBase):
 
     def active_executors(self, is_trading: bool) -> List[ExecutorInfo]:
         return [
-            executor for executor in self.executors_info
-            if executor.is_active and executor.is_trading == is_trading
+            executor for executor in self.executors_registry.get_executors(is_active=True)
+            if executor.is_trading == is_trading
         ]
 
     def determine_executor_actions(self) -> List[ExecutorAction]:
@@ -210,9 +210,8 @@ class GridStrike(ControllerBase):
         short_activation_bounds = self.processed_data["short_activation_bounds"]
         active_executors_order_placed = self.processed_data["active_executors_order_placed"]
         non_active_ranges = [grid_range.id for grid_range in self.config.grid_ranges if not grid_range.active]
-        active_executor_of_non_active_ranges = [executor.id for executor in self.executors_info if
-                                                executor.is_active and
-                                                executor.custom_info["level_id"].split("_")[0] in non_active_ranges]
+        active_executor_of_non_active_ranges = [executor.id for executor in self.executors_registry.get_executors(is_active=True)
+                                                if executor.custom_info["level_id"].split("_")[0] in non_active_ranges]
         long_executors_to_stop = [executor.id for executor in active_executors_order_placed if
                                   executor.side == TradeType.BUY and
                                   executor.config.entry_price <= long_activation_bounds]
@@ -78,10 +78,7 @@ class GridStrike(ControllerBase):
                                                                          trading_pair=self.config.trading_pair)])
 
     def active_executors(self) -> List[ExecutorInfo]:
-        return [
-            executor for executor in self.executors_info
-            if executor.is_active
-        ]
+        return self.executors_registry.get_executors(is_active=True)
 
     def determine_executor_actions(self) -> List[ExecutorAction]:
         if len(self.active_executors()) == 0:
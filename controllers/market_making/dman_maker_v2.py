@@ -106,8 +106,8 @@ class DManMakerV2(MarketMakingControllerBase):
 
     def executors_to_refresh(self) -> List[ExecutorAction]:
         executors_to_refresh = self.filter_executors(
-            executors=self.executors_info,
-            filter_func=lambda x: not x.is_trading and x.is_active and (self.order_level_refresh_condition(x) or self.first_level_refresh_condition(x)))
+            executors=self.executors_registry.get_executors(is_active=True),
+            filter_func=lambda x: not x.is_trading and (self.order_level_refresh_condition(x) or self.first_level_refresh_condition(x)))
         return [StopExecutorAction(
             controller_id=self.config.id,
             executor_id=executor.id) for executor in executors_to_refresh]
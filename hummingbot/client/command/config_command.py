@@ -81,6 +81,12 @@ client_configs_to_display = ["autofill_import",
                              "commands_timeout",
                              "create_command_timeout",
                              "other_commands_timeout",
+                             "use_uvloop",
+                             "event_loop_monitor",
+                             "lag_warning_threshold",
+                             "slow_callback_threshold",
+                             "profile_tasks",
+                             "connector_shards",
                              "tables_format",
                              "tick_size",
                              "market_data_collection",
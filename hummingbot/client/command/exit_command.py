@@ -4,6 +4,7 @@ import asyncio
 from typing import TYPE_CHECKING
 
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.connections.connection_pool_manager import ConnectionPoolManager
 
 if TYPE_CHECKING:
     from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
@@ -35,5 +36,7 @@ class ExitCommand:
         for notifier in self.notifiers:
             notifier.stop()
 
+        await ConnectionPoolManager.get_instance().close()
+
         self.app.exit()
         self.mqtt_stop()
@@ -20,7 +20,7 @@ class RateCommand:
              token: str
              ):
         if threading.current_thread() != threading.main_thread():
-            self.ev_loop.call_soon_threadsafe(self.trades)
+            self.ev_loop.call_soon_threadsafe(self.rate, pair, token)
             return
         if pair:
             safe_ensure_future(self.show_rate(pair))
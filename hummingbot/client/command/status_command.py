@@ -2,7 +2,7 @@ import asyncio
 import threading
 import time
 from collections import OrderedDict, deque
-from typing import TYPE_CHECKING, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List
 
 import pandas as pd
 
@@ -16,8 +16,10 @@ from hummingbot.client.config.config_helpers import (
 from hummingbot.client.config.security import Security
 from hummingbot.client.settings import ethereum_wallet_required, required_exchanges
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.event_loop_monitor import EventLoopMonitor
 from hummingbot.logger.application_warning import ApplicationWarning
 from hummingbot.user.user_balances import UserBalances
 
@@ -79,6 +81,15 @@ class StatusCommand:
         status = paper_trade + "\n" + st_status
         return status
 
+    def event_loop_diagnostics(self,  # type: HummingbotApplication
+                               ) -> Dict[str, Any]:
+        queue_depths = {
+            connector_name: connector.queue_depths()
+            for connector_name, connector in self.markets.items()
+            if isinstance(connector, ExchangePyBase)
+        }
+        return EventLoopMonitor.get_instance().report(queue_depths=queue_depths)
+
     def application_warning(self):
         # Application warnings.
         self._expire_old_application_warnings()
@@ -123,9 +134,14 @@ class StatusCommand:
         return validation_errors
 
     def status(self,  # type: HummingbotApplication
-               live: bool = False):
+               live: bool = False,
+               diagnostics: bool = False):
         if threading.current_thread() != threading.main_thread():
-            self.ev_loop.call_soon_threadsafe(self.status, live)
+            self.ev_loop.call_soon_threadsafe(self.status, live, diagnostics)
+            return
+
+        if diagnostics:
+            self.notify(EventLoopMonitor.get_instance().format_report(self.event_loop_diagnostics()))
             return
 
         safe_ensure_future(self.status_check_all(live=live), loop=self.ev_loop)
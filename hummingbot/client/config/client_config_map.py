@@ -586,6 +586,45 @@ class CommandsTimeoutConfigMap(BaseClientModel):
         return super().validate_decimal(v, field)
 
 
+class EventLoopMonitorConfigMap(BaseClientModel):
+    lag_warning_threshold: float = Field(
+        default=0.5,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Event loop lag that is logged as a warning (in seconds, 0 disables the event loop monitor)"
+            ),
+        ),
+    )
+    slow_callback_threshold: float = Field(
+        default=0.1,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Duration of the callbacks reported as slow by the task profiler (in seconds)",
+        ),
+    )
+    profile_tasks: bool = Field(
+        default=False,
+        description=("Time every callback of the event loop and count the live tasks by origin."
+                     " Adds some overhead to the event loop."),
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Would you like to enable the event loop task profiler? (True/False)",
+        ),
+    )
+
+    class Config:
+        title = "event_loop_monitor"
+
+    @validator("profile_tasks", pre=True)
+    def validate_bool(cls, v: str):
+        """Used for client-friendly error output."""
+        if isinstance(v, str):
+            ret = validate_bool(v)
+            if ret is not None:
+                raise ValueError(ret)
+        return v
+
+
 class AnonymizedMetricsMode(BaseClientModel, ABC):
     @abstractmethod
     def get_collector(
@@ -918,6 +957,15 @@ class ClientConfigMap(BaseClientModel):
             prompt=lambda cm: "Would you like to fetch from all exchanges? (True/False)",
         ),
     )
+    trading_pairs_cache_ttl: float = Field(
+        default=86400,
+        description=("Seconds the trading pairs and exchange information of the connectors are cached on disk to be"
+                     " used at startup. Set to 0 to disable the cache."),
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: "How long should the trading pairs be cached (in seconds, 0 to disable)?",
+        ),
+    )
     log_level: str = Field(default="INFO")
     debug_console: bool = Field(default=False)
     strategy_report_interval: float = Field(default=900)
@@ -1061,6 +1109,25 @@ class ClientConfigMap(BaseClientModel):
         ),
     )
     commands_timeout: CommandsTimeoutConfigMap = Field(default=CommandsTimeoutConfigMap())
+    use_uvloop: bool = Field(
+        default=False,
+        description=("Run the client on the uvloop event loop instead of the default asyncio event loop."
+                     " Requires uvloop to be installed and takes effect after restarting the client."),
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Would you like to use the uvloop event loop? (True/False)",
+        ),
+    )
+    event_loop_monitor: EventLoopMonitorConfigMap = Field(default=EventLoopMonitorConfigMap())
+    connector_shards: int = Field(
+        default=0,
+        description=("Number of worker processes tracking the order books and the user stream of each exchange"
+                     " connector, each one for a share of its trading pairs. Set to 0 to track them in the main process."
+                     " Not available on Windows."),
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: "How many worker processes should track the markets of each exchange (0 to disable)?",
+        ),
+    )
     tables_format: ClientConfigEnum(
         value="TabulateFormats",  # noqa: F821
         names={e: e for e in tabulate_formats},
@@ -1124,7 +1191,7 @@ class ClientConfigMap(BaseClientModel):
             sub_model = TELEGRAM_MODES[v].construct()
         return sub_model
 
-    @validator("send_error_logs", "fetch_pairs_from_all_exchanges", pre=True)
+    @validator("send_error_logs", "fetch_pairs_from_all_exchanges", "use_uvloop", pre=True)
     def validate_bool(cls, v: str):
         """Used for client-friendly error output."""
         if isinstance(v, str):
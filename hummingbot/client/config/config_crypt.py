@@ -1,16 +1,22 @@
 import binascii
+import hashlib
+import hmac
 import json
+import multiprocessing
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
 
-from eth_account import Account
+from Crypto.Protocol.KDF import scrypt
 from eth_keyfile.keyfile import (
     DKLEN,
     SCRYPT_P,
     SCRYPT_R,
     Random,
-    _pbkdf2_hash,
-    _scrypt_hash,
     big_endian_to_int,
+    decode_hex,
+    decrypt_aes_ctr,
     encode_hex_no_prefix,
     encrypt_aes_ctr,
     get_default_work_factor_for_kdf,
@@ -41,8 +47,31 @@ class BaseSecretsManager(ABC):
     def decrypt_secret_value(self, attr: str, value: str) -> str:
         pass
 
+    def derive_keys(self, encrypted_values: Iterable[str], max_workers: Optional[int] = None):
+        """
+        Prepares the decryption of several values at once, e.g. deriving their keys in parallel.
+        The values are decrypted afterwards with decrypt_secret_value.
+        """
+        pass
+
 
 class ETHKeyFileSecretManger(BaseSecretsManager):
+    """
+    Encrypts each secret value as an Ethereum V3 keyfile.
+
+    Deriving the key of a keyfile from the password (pbkdf2 or scrypt) is deliberately slow. The derived keys are kept
+    in memory, indexed by the KDF and its parameters (including the salt), so that a keyfile is only derived once, and
+    derive_keys derives the keys of several keyfiles in a process pool. Neither the derived keys nor the decrypted
+    values are written to disk.
+
+    The pool workers are started with forkserver (or spawn where it is not available) instead of being forked from
+    the client, which runs threads. They only run the key derivation functions of hashlib and pycryptodome, so they
+    don't import the client modules.
+    """
+    def __init__(self, password: str):
+        super().__init__(password)
+        self._derived_keys: Dict[Tuple[str, str], bytes] = {}
+
     def encrypt_secret_value(self, attr: str, value: str):
         if self._password is None:
             raise ValueError(f"Could not encrypt secret attribute {attr} because no password was provided.")
@@ -56,10 +85,44 @@ class ETHKeyFileSecretManger(BaseSecretsManager):
     def decrypt_secret_value(self, attr: str, value: str) -> str:
         if self._password is None:
             raise ValueError(f"Could not decrypt secret attribute {attr} because no password was provided.")
-        value = binascii.unhexlify(value)
-        decrypted_value = Account.decrypt(value.decode(), self._password).decode()
+        crypto = _keyfile_crypto(value)
+        derived_key = self._derived_keys.get(_derived_key_cache_key(crypto))
+        if derived_key is None:
+            derived_key = _derive_key(crypto, self._password.encode())
+            self._derived_keys[_derived_key_cache_key(crypto)] = derived_key
+        decrypted_value = _decrypt_keyfile_crypto(crypto, derived_key).decode()
         return decrypted_value
 
+    def derive_keys(self, encrypted_values: Iterable[str], max_workers: Optional[int] = None):
+        if self._password is None:
+            return
+        pending_keys: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for value in encrypted_values:
+            try:
+                crypto = _keyfile_crypto(value)
+            except (ValueError, TypeError, KeyError, NotImplementedError):
+                continue  # invalid values fail when they are decrypted
+            cache_key = _derived_key_cache_key(crypto)
+            if cache_key not in self._derived_keys:
+                pending_keys[cache_key] = crypto
+        if len(pending_keys) == 0:
+            return
+
+        password_bytes = self._password.encode()
+        cache_keys = list(pending_keys.keys())
+        cryptos = list(pending_keys.values())
+        if len(cryptos) == 1:
+            derived_keys = [_derive_key(cryptos[0], password_bytes)]
+        else:
+            max_workers = min(max_workers or os.cpu_count() or 1, len(cryptos))
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=_key_derivation_mp_context()) as executor:
+                futures = []
+                for crypto in cryptos:
+                    derivation_function, kwargs = _key_derivation(crypto, password_bytes)
+                    futures.append(executor.submit(derivation_function, **kwargs))
+                derived_keys = [future.result() for future in futures]
+        self._derived_keys.update(zip(cache_keys, derived_keys))
+
 
 def store_password_verification(secrets_manager: BaseSecretsManager):
     encrypted_word = secrets_manager.encrypt_secret_value(PASSWORD_VERIFICATION_WORD, PASSWORD_VERIFICATION_WORD)
@@ -80,6 +143,71 @@ def validate_password(secrets_manager: BaseSecretsManager) -> bool:
     return valid
 
 
+def _keyfile_crypto(encrypted_value: str) -> Dict[str, Any]:
+    keyfile_json = json.loads(binascii.unhexlify(encrypted_value).decode())
+    version = keyfile_json["version"]
+    if version != 3:
+        raise NotImplementedError(f"Not yet implemented for keyfile version {version}")
+    return keyfile_json["crypto"] if "crypto" in keyfile_json else keyfile_json["Crypto"]
+
+
+def _derived_key_cache_key(crypto: Dict[str, Any]) -> Tuple[str, str]:
+    return crypto["kdf"], json.dumps(crypto["kdfparams"], sort_keys=True)
+
+
+def _key_derivation_mp_context() -> multiprocessing.context.BaseContext:
+    start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(start_method)
+
+
+def _key_derivation(crypto: Dict[str, Any], password: bytes) -> Tuple[Callable[..., bytes], Dict[str, Any]]:
+    """
+    :return: the function deriving the key of the keyfile and its keyword arguments
+    """
+    kdf = crypto["kdf"]
+    kdf_params = crypto["kdfparams"]
+    if kdf == "pbkdf2":
+        prf, _, hash_name = kdf_params["prf"].partition("-")
+        if prf != "hmac":
+            raise TypeError(f"Unsupported pseudorandom function: {kdf_params['prf']}")
+        return hashlib.pbkdf2_hmac, {
+            "hash_name": hash_name,
+            "password": password,
+            "salt": decode_hex(kdf_params["salt"]),
+            "iterations": kdf_params["c"],
+            "dklen": kdf_params["dklen"],
+        }
+    elif kdf == "scrypt":
+        # hashlib.scrypt (OpenSSL) rejects the keyfiles with the default work factor, n must be below 2 ** (16 * r)
+        return scrypt, {
+            "password": password,
+            "salt": decode_hex(kdf_params["salt"]),
+            "key_len": kdf_params["dklen"],
+            "N": kdf_params["n"],
+            "r": kdf_params["r"],
+            "p": kdf_params["p"],
+        }
+    else:
+        raise TypeError(f"Unsupported key derivation function: {kdf}")
+
+
+def _derive_key(crypto: Dict[str, Any], password: bytes) -> bytes:
+    derivation_function, kwargs = _key_derivation(crypto, password)
+    return derivation_function(**kwargs)
+
+
+def _decrypt_keyfile_crypto(crypto: Dict[str, Any], derived_key: bytes) -> bytes:
+    """
+    Same as eth_keyfile.keyfile.decode_keyfile_json once the key is derived.
+    """
+    ciphertext = decode_hex(crypto["ciphertext"])
+    mac = keccak(derived_key[16:32] + ciphertext)
+    if not hmac.compare_digest(mac, decode_hex(crypto["mac"])):
+        raise ValueError("MAC mismatch")
+    iv = big_endian_to_int(decode_hex(crypto["cipherparams"]["iv"]))
+    return decrypt_aes_ctr(ciphertext, derived_key[:16], iv)
+
+
 def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_factor=None):
     """
     Encrypt message by a given password.
@@ -91,9 +219,9 @@ def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_fac
         work_factor = get_default_work_factor_for_kdf(kdf)
 
     if kdf == 'pbkdf2':
-        derived_key = _pbkdf2_hash(
-            password,
+        derived_key = hashlib.pbkdf2_hmac(
             hash_name='sha256',
+            password=password,
             salt=salt,
             iterations=work_factor,
             dklen=DKLEN,
@@ -105,13 +233,13 @@ def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_fac
             'salt': encode_hex_no_prefix(salt),
         }
     elif kdf == 'scrypt':
-        derived_key = _scrypt_hash(
+        derived_key = scrypt(
             password,
             salt=salt,
-            buflen=DKLEN,
+            key_len=DKLEN,
+            N=work_factor,
             r=SCRYPT_R,
             p=SCRYPT_P,
-            n=work_factor,
         )
         kdfparams = {
             'dklen': DKLEN,
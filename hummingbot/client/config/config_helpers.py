@@ -77,6 +77,10 @@ class ClientConfigAdapter:
     def __repr__(self):
         return f"{self.__class__.__name__}.{self._hb_config.__repr__()}"
 
+    def __reduce__(self):
+        # Pickled with the model, unpickling the attributes would go through __getattr__ before setting _hb_config
+        return self.__class__, (self._hb_config,)
+
     def __eq__(self, other):
         if isinstance(other, ClientConfigAdapter):
             eq = self._hb_config.__eq__(other._hb_config)
@@ -669,6 +673,18 @@ def load_connector_config_map_from_file(yml_path: Path) -> ClientConfigAdapter:
     return config_map
 
 
+def secure_values_from_connector_config_file(yml_path: Path) -> List[str]:
+    """
+    The encrypted values of a connector config file, read without decrypting them.
+    """
+    config_data = read_yml_file(yml_path)
+    config_map = ClientConfigAdapter(get_connector_hb_config(connector_name_from_file(yml_path)))
+    return [
+        str(config_data[key]) for key in config_map.keys()
+        if config_map.is_secure(key) and config_data.get(key) not in (None, "")
+    ]
+
+
 def load_client_config_map_from_file() -> ClientConfigAdapter:
     yml_path = CLIENT_CONFIG_PATH
     if yml_path.exists():
@@ -687,6 +703,17 @@ def load_client_config_map_from_file() -> ClientConfigAdapter:
     return config_map
 
 
+def load_client_config_value(key: str, default: Any = None) -> Any:
+    """
+    Reads a value of the client configuration file without loading the whole configuration, for the settings required
+    before the login (when the secure values can't be decrypted yet), e.g. the event loop implementation.
+    """
+    if CLIENT_CONFIG_PATH.exists():
+        config_data = read_yml_file(CLIENT_CONFIG_PATH) or {}
+        return config_data.get(key, default)
+    return default
+
+
 def load_ssl_config_map_from_file() -> ClientConfigAdapter:
     yml_path = GATEWAY_SSL_CONF_FILE
     if yml_path.exists():
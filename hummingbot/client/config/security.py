@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from hummingbot.client.config.config_crypt import PASSWORD_VERIFICATION_PATH, BaseSecretsManager, validate_password
 from hummingbot.client.config.config_helpers import (
@@ -13,6 +13,7 @@ from hummingbot.client.config.config_helpers import (
     load_connector_config_map_from_file,
     reset_connector_hb_config,
     save_to_yml,
+    secure_values_from_connector_config_file,
     update_connector_hb_config,
 )
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
@@ -61,10 +62,31 @@ class Security:
         cls._secure_configs.clear()
         cls._decryption_done.clear()
         encrypted_files = list_connector_configs()
+        cls.derive_decryption_keys(encrypted_files)
         for file in encrypted_files:
             cls.decrypt_connector_config(file)
         cls._decryption_done.set()
 
+    @classmethod
+    def derive_decryption_keys(cls, file_paths: List[Path]):
+        """
+        Derives the keys of all the secure values of the files at once (in parallel), instead of one by one while the
+        config files are loaded.
+        """
+        if cls.secrets_manager is None:
+            return
+        encrypted_values = []
+        for file_path in file_paths:
+            try:
+                encrypted_values.extend(secure_values_from_connector_config_file(file_path))
+            except Exception:
+                cls.logger().debug(f"Could not read the secure values of {file_path}.", exc_info=True)
+        try:
+            cls.secrets_manager.derive_keys(encrypted_values)
+        except Exception:
+            # The keys are derived one by one while decrypting instead
+            cls.logger().warning("Error deriving the decryption keys in parallel.", exc_info=True)
+
     @classmethod
     def decrypt_connector_config(cls, file_path: Path):
         connector_name = connector_name_from_file(file_path)
@@ -0,0 +1,200 @@
+"""
+Prebuilt manifest of the connector settings.
+
+Discovering the connectors requires importing the utils module of every connector, which transitively imports the
+SDKs of all of them. The manifest stores the settings that are needed at startup, so that the utils module of a
+connector is only imported when its configuration keys are used. It is generated at build time with:
+
+    python -m hummingbot.client.connector_manifest
+
+and compared with the connector directories and the content of their utils modules at startup. If it is missing or
+stale the connectors are discovered by importing their utils modules, and the manifest is written again. The startup
+time with and without the manifest can be compared with:
+
+    python -m hummingbot.client.connector_manifest --benchmark
+"""
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+from decimal import Decimal
+from os.path import exists
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from hummingbot import root_path
+from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeSchema
+
+if TYPE_CHECKING:
+    from hummingbot.client.settings import ConnectorSetting
+
+MANIFEST_FORMAT_VERSION = 2
+CONNECTOR_MANIFEST_PATH = root_path() / "hummingbot" / "connector" / "connector_manifest.json"
+
+
+def hummingbot_version() -> str:
+    with open(root_path() / "hummingbot" / "VERSION") as version_file:
+        return version_file.read().strip()
+
+
+def utils_module_hashes(connector_directories: List[Tuple[str, str]]) -> Dict[str, Optional[str]]:
+    """
+    :return: the SHA-256 of the utils module of every (connector type directory, connector directory), None if the
+        connector has no utils module
+    """
+    connector_path = root_path() / "hummingbot" / "connector"
+    hashes = {}
+    for type_dir, connector_dir in sorted(connector_directories):
+        try:
+            with open(connector_path / type_dir / connector_dir / f"{connector_dir}_utils.py", "rb") as utils_file:
+                module_hash = hashlib.sha256(utils_file.read()).hexdigest()
+        except OSError:
+            module_hash = None
+        hashes[f"{type_dir}/{connector_dir}"] = module_hash
+    return hashes
+
+
+def trade_fee_schema_to_json(trade_fee_schema: TradeFeeSchema) -> Dict[str, Any]:
+    return {
+        "percent_fee_token": trade_fee_schema.percent_fee_token,
+        "maker_percent_fee_decimal": str(trade_fee_schema.maker_percent_fee_decimal),
+        "taker_percent_fee_decimal": str(trade_fee_schema.taker_percent_fee_decimal),
+        "buy_percent_fee_deducted_from_returns": trade_fee_schema.buy_percent_fee_deducted_from_returns,
+        "maker_fixed_fees": [TokenAmount(token, amount).to_json() for token, amount in trade_fee_schema.maker_fixed_fees],
+        "taker_fixed_fees": [TokenAmount(token, amount).to_json() for token, amount in trade_fee_schema.taker_fixed_fees],
+    }
+
+
+def trade_fee_schema_from_json(data: Dict[str, Any]) -> TradeFeeSchema:
+    return TradeFeeSchema(
+        percent_fee_token=data["percent_fee_token"],
+        maker_percent_fee_decimal=Decimal(data["maker_percent_fee_decimal"]),
+        taker_percent_fee_decimal=Decimal(data["taker_percent_fee_decimal"]),
+        buy_percent_fee_deducted_from_returns=data["buy_percent_fee_deducted_from_returns"],
+        maker_fixed_fees=[TokenAmount.from_json(fee) for fee in data["maker_fixed_fees"]],
+        taker_fixed_fees=[TokenAmount.from_json(fee) for fee in data["taker_fixed_fees"]],
+    )
+
+
+def build_connector_manifest(connector_settings: List["ConnectorSetting"],
+                             connector_directories: List[Tuple[str, str]]) -> Dict[str, Any]:
+    """
+    :param connector_settings: the settings of the connectors, discovered from their utils modules
+    :param connector_directories: the (connector type directory, connector directory) scanned to discover them
+    """
+    connectors = []
+    for setting in connector_settings:
+        connectors.append({
+            "name": setting.name,
+            "type": setting.type.name,
+            "example_pair": setting.example_pair,
+            "centralised": setting.centralised,
+            "use_ethereum_wallet": setting.use_ethereum_wallet,
+            "trade_fee_schema": trade_fee_schema_to_json(setting.trade_fee_schema),
+            "has_config_keys": setting.config_keys is not None,
+            "is_sub_domain": setting.is_sub_domain,
+            "parent_name": setting.parent_name,
+            "domain_parameter": setting.domain_parameter,
+            "use_eth_gas_lookup": setting.use_eth_gas_lookup,
+        })
+    return {
+        "format_version": MANIFEST_FORMAT_VERSION,
+        "hummingbot_version": hummingbot_version(),
+        "utils_module_hashes": utils_module_hashes(connector_directories),
+        "connectors": connectors,
+    }
+
+
+def load_connector_manifest(connector_directories: List[Tuple[str, str]],
+                            path: str = CONNECTOR_MANIFEST_PATH) -> Optional[Dict[str, Any]]:
+    """
+    :return: the manifest, or None if it doesn't exist or it doesn't match the current version, connectors and
+        utils modules
+    """
+    if not exists(path):
+        return None
+    try:
+        with open(path) as manifest_file:
+            manifest = json.load(manifest_file)
+    except (OSError, ValueError):
+        return None
+    if (manifest.get("format_version") != MANIFEST_FORMAT_VERSION
+            or manifest.get("hummingbot_version") != hummingbot_version()
+            or manifest.get("utils_module_hashes") != utils_module_hashes(connector_directories)):
+        return None
+    return manifest
+
+
+def save_connector_manifest(manifest: Dict[str, Any], path: str = CONNECTOR_MANIFEST_PATH) -> bool:
+    """
+    Writes the manifest to a temporary file that then replaces the previous manifest, so that other processes never
+    read a partially written manifest.
+
+    :return: True if the manifest was written, False if the directory is not writable
+    """
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary_path, "w") as manifest_file:
+            json.dump(manifest, manifest_file, indent=2)
+        os.replace(temporary_path, path)
+    except OSError:
+        if exists(temporary_path):
+            os.remove(temporary_path)
+        return False
+    return True
+
+
+def write_connector_manifest(path: str = CONNECTOR_MANIFEST_PATH) -> Dict[str, Any]:
+    from hummingbot.client.settings import AllConnectorSettings
+
+    manifest = AllConnectorSettings.create_connector_manifest()
+    if not save_connector_manifest(manifest, path):
+        raise OSError(f"Could not write the connector manifest to {path}")
+    return manifest
+
+
+def benchmark_startup(runs: int = 3) -> Dict[str, float]:
+    """
+    Measures the time to create the connector settings in a new interpreter, with and without the manifest.
+
+    :return: the best time in seconds of each mode
+    """
+    code = (
+        "import time; start = time.perf_counter(); "
+        "from hummingbot.client.settings import AllConnectorSettings; "
+        "AllConnectorSettings.create_connector_settings(use_manifest={use_manifest}); "
+        "print(time.perf_counter() - start)"
+    )
+    results = {}
+    for mode, use_manifest in (("manifest", True), ("scan", False)):
+        timings = []
+        for _ in range(runs):
+            output = subprocess.run(
+                [sys.executable, "-c", code.format(use_manifest=use_manifest)],
+                cwd=root_path(),
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            timings.append(float(output.stdout.strip().splitlines()[-1]))
+        results[mode] = min(timings)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generates the connector manifest used at startup.")
+    parser.add_argument("--benchmark", action="store_true", help="compare the startup time with and without it")
+    parser.add_argument("--runs", type=int, default=3, help="number of runs of the benchmark")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        for mode, seconds in benchmark_startup(args.runs).items():
+            print(f"{mode}: {seconds:.3f}s")
+    else:
+        manifest = write_connector_manifest()
+        print(f"Connector manifest with {len(manifest['connectors'])} connectors written to {CONNECTOR_MANIFEST_PATH}")
+
+
+if __name__ == "__main__":
+    main()
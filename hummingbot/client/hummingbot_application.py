@@ -1,7 +1,9 @@
 #!/usr/bin/env python
 
 import asyncio
+import functools
 import logging
+import sys
 import time
 from collections import deque
 from typing import Deque, Dict, List, Optional, Tuple, Union
@@ -29,6 +31,7 @@ from hummingbot.client.ui.keybindings import load_key_bindings
 from hummingbot.client.ui.parser import ThrowingArgumentParser, load_parser
 from hummingbot.connector.exchange.paper_trade import create_paper_trade_market
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.clock import Clock
 from hummingbot.core.gateway.gateway_status_monitor import GatewayStatusMonitor
@@ -318,6 +321,10 @@ class HummingbotApplication(*commands):
                 )
                 connector_class = get_connector_class(connector_name)
                 connector = connector_class(**init_params)
+                shards = self.client_config_map.connector_shards
+                if shards > 0 and isinstance(connector, ExchangePyBase) and sys.platform != "win32":
+                    connector.enable_sharding(
+                        shards=shards, connector_factory=functools.partial(connector_class, **init_params))
             self.markets[connector_name] = connector
 
         self.markets_recorder = MarketsRecorder(
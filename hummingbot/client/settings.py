@@ -5,11 +5,17 @@ from enum import Enum
 from os import DirEntry, scandir
 from os.path import exists, join, realpath
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Tuple, Union, cast
 
 from pydantic import SecretStr
 
 from hummingbot import get_strategy_list, root_path
+from hummingbot.client.connector_manifest import (
+    build_connector_manifest,
+    load_connector_manifest,
+    save_connector_manifest,
+    trade_fee_schema_from_json,
+)
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 from hummingbot.core.utils.gateway_config_utils import SUPPORTED_CHAINS
 
@@ -166,7 +172,21 @@ class GatewayConnectionSetting:
         GatewayConnectionSetting.save(connectors_conf)
 
 
-class ConnectorSetting(NamedTuple):
+class ConnectorConfigKeysLoader(NamedTuple):
+    """
+    Reference to the config keys of a connector in its utils module, imported the first time they are used.
+    """
+    utils_module_path: str
+    domain: Optional[str] = None
+
+    def load(self) -> Optional["BaseConnectorConfigMap"]:
+        util_module = importlib.import_module(self.utils_module_path)
+        if self.domain is None:
+            return getattr(util_module, "KEYS", None)
+        return getattr(util_module, "OTHER_DOMAINS_KEYS")[self.domain]
+
+
+class _ConnectorSettingFields(NamedTuple):
     name: str
     type: ConnectorType
     example_pair: str
@@ -178,10 +198,24 @@ class ConnectorSetting(NamedTuple):
     parent_name: Optional[str]
     domain_parameter: Optional[str]
     use_eth_gas_lookup: bool
+
+
+class ConnectorSetting(_ConnectorSettingFields):
     """
     This class has metadata data about Exchange connections. The name of the connection and the file path location of
     the connector file.
+
+    The config keys can be given as a `ConnectorConfigKeysLoader`, to import the connector utils module only when
+    they are used.
     """
+    __slots__ = ()
+
+    @property
+    def config_keys(self) -> Optional["BaseConnectorConfigMap"]:
+        config_keys = _ConnectorSettingFields.config_keys.__get__(self)
+        if isinstance(config_keys, ConnectorConfigKeysLoader):
+            config_keys = config_keys.load()
+        return config_keys
 
     def uses_gateway_generic_connector(self) -> bool:
         non_gateway_connectors_types = [ConnectorType.Exchange, ConnectorType.Derivative, ConnectorType.Connector]
@@ -363,11 +397,58 @@ class AllConnectorSettings:
     all_connector_settings: Dict[str, ConnectorSetting] = {}
 
     @classmethod
-    def create_connector_settings(cls):
+    def create_connector_settings(cls, use_manifest: bool = True):
         """
-        Iterate over files in specific Python directories to create a dictionary of exchange names to ConnectorSetting.
+        Create a dictionary of exchange names to ConnectorSetting, from the connector manifest when it is up to date
+        with the connector directories and their utils modules, or else by importing the utils module of every
+        connector and writing the manifest again.
         """
         cls.all_connector_settings = {}  # reset
+        connector_directories = cls._connector_directories()
+        manifest = load_connector_manifest(connector_directories) if use_manifest else None
+        if manifest is not None:
+            cls.all_connector_settings.update(cls._connector_settings_from_manifest(manifest))
+        else:
+            connector_settings = cls._connector_settings_from_utils_modules(connector_directories)
+            cls.all_connector_settings.update(connector_settings)
+            if use_manifest:
+                # The manifest is missing or a connector changed, the next startups can use it again
+                save_connector_manifest(build_connector_manifest(list(connector_settings.values()), connector_directories))
+
+        # add gateway connectors
+        gateway_connections_conf: List[Dict[str, str]] = GatewayConnectionSetting.load()
+        trade_fee_settings: List[float] = [0.0, 0.0]  # we assume no swap fees for now
+        trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema("gateway", trade_fee_settings)
+
+        for connection_spec in gateway_connections_conf:
+            market_name: str = GatewayConnectionSetting.get_market_name_from_connector_spec(connection_spec)
+            cls.all_connector_settings[market_name] = ConnectorSetting(
+                name=market_name,
+                type=ConnectorType[connection_spec["trading_type"]],
+                centralised=False,
+                example_pair="WETH-USDC",
+                use_ethereum_wallet=False,
+                trade_fee_schema=trade_fee_schema,
+                config_keys=None,
+                is_sub_domain=False,
+                parent_name=None,
+                domain_parameter=None,
+                use_eth_gas_lookup=False,
+            )
+
+        return cls.all_connector_settings
+
+    @classmethod
+    def create_connector_manifest(cls) -> Dict[str, Any]:
+        connector_directories = cls._connector_directories()
+        connector_settings = cls._connector_settings_from_utils_modules(connector_directories)
+        return build_connector_manifest(list(connector_settings.values()), connector_directories)
+
+    @staticmethod
+    def _connector_directories() -> List[Tuple[str, str]]:
+        """
+        :return: the (connector type directory, connector directory) of every connector, excluding gateway
+        """
         connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
         # connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade", "injective_v2", "injective_v2_perpetual"]
 
@@ -375,6 +456,7 @@ class AllConnectorSettings:
             cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
             if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES
         ]
+        connector_directories = []
         for type_dir in type_dirs:
             if type_dir.name == 'gateway':
                 continue
@@ -385,73 +467,87 @@ class AllConnectorSettings:
             for connector_dir in connector_dirs:
                 if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
                     continue
-                if connector_dir.name in cls.all_connector_settings:
-                    raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
-                try:
-                    util_module_path: str = f"hummingbot.connector.{type_dir.name}." \
-                                            f"{connector_dir.name}.{connector_dir.name}_utils"
-                    util_module = importlib.import_module(util_module_path)
-                except ModuleNotFoundError:
-                    continue
-                trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
-                trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
-                    connector_dir.name, trade_fee_settings
-                )
-                cls.all_connector_settings[connector_dir.name] = ConnectorSetting(
-                    name=connector_dir.name,
-                    type=ConnectorType[type_dir.name.capitalize()],
-                    centralised=getattr(util_module, "CENTRALIZED", True),
-                    example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
-                    use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
-                    trade_fee_schema=trade_fee_schema,
-                    config_keys=getattr(util_module, "KEYS", None),
-                    is_sub_domain=False,
-                    parent_name=None,
-                    domain_parameter=None,
-                    use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
-                )
-                # Adds other domains of connector
-                other_domains = getattr(util_module, "OTHER_DOMAINS", [])
-                for domain in other_domains:
-                    trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
-                    trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
-                    parent = cls.all_connector_settings[connector_dir.name]
-                    cls.all_connector_settings[domain] = ConnectorSetting(
-                        name=domain,
-                        type=parent.type,
-                        centralised=parent.centralised,
-                        example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
-                        use_ethereum_wallet=parent.use_ethereum_wallet,
-                        trade_fee_schema=trade_fee_schema,
-                        config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
-                        is_sub_domain=True,
-                        parent_name=parent.name,
-                        domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
-                        use_eth_gas_lookup=parent.use_eth_gas_lookup,
-                    )
-
-        # add gateway connectors
-        gateway_connections_conf: List[Dict[str, str]] = GatewayConnectionSetting.load()
-        trade_fee_settings: List[float] = [0.0, 0.0]  # we assume no swap fees for now
-        trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema("gateway", trade_fee_settings)
+                connector_directories.append((type_dir.name, connector_dir.name))
+        return connector_directories
 
-        for connection_spec in gateway_connections_conf:
-            market_name: str = GatewayConnectionSetting.get_market_name_from_connector_spec(connection_spec)
-            cls.all_connector_settings[market_name] = ConnectorSetting(
-                name=market_name,
-                type=ConnectorType[connection_spec["trading_type"]],
-                centralised=False,
-                example_pair="WETH-USDC",
-                use_ethereum_wallet=False,
+    @classmethod
+    def _connector_settings_from_utils_modules(
+        cls, connector_directories: List[Tuple[str, str]]
+    ) -> Dict[str, ConnectorSetting]:
+        connector_settings: Dict[str, ConnectorSetting] = {}
+        for type_dir_name, connector_dir_name in connector_directories:
+            if connector_dir_name in connector_settings:
+                raise Exception(f"Multiple connectors with the same {connector_dir_name} name.")
+            try:
+                util_module_path: str = f"hummingbot.connector.{type_dir_name}." \
+                                        f"{connector_dir_name}.{connector_dir_name}_utils"
+                util_module = importlib.import_module(util_module_path)
+            except ModuleNotFoundError:
+                continue
+            trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
+            trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
+                connector_dir_name, trade_fee_settings
+            )
+            connector_settings[connector_dir_name] = ConnectorSetting(
+                name=connector_dir_name,
+                type=ConnectorType[type_dir_name.capitalize()],
+                centralised=getattr(util_module, "CENTRALIZED", True),
+                example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
+                use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
                 trade_fee_schema=trade_fee_schema,
-                config_keys=None,
+                config_keys=getattr(util_module, "KEYS", None),
                 is_sub_domain=False,
                 parent_name=None,
                 domain_parameter=None,
-                use_eth_gas_lookup=False,
+                use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
             )
+            # Adds other domains of connector
+            other_domains = getattr(util_module, "OTHER_DOMAINS", [])
+            for domain in other_domains:
+                trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
+                trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
+                parent = connector_settings[connector_dir_name]
+                connector_settings[domain] = ConnectorSetting(
+                    name=domain,
+                    type=parent.type,
+                    centralised=parent.centralised,
+                    example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
+                    use_ethereum_wallet=parent.use_ethereum_wallet,
+                    trade_fee_schema=trade_fee_schema,
+                    config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
+                    is_sub_domain=True,
+                    parent_name=parent.name,
+                    domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
+                    use_eth_gas_lookup=parent.use_eth_gas_lookup,
+                )
+        return connector_settings
 
-        return cls.all_connector_settings
+    @staticmethod
+    def _connector_settings_from_manifest(manifest: Dict[str, Any]) -> Dict[str, ConnectorSetting]:
+        connector_settings: Dict[str, ConnectorSetting] = {}
+        for connector in manifest["connectors"]:
+            connector_type = ConnectorType[connector["type"]]
+            config_keys = None
+            if connector["has_config_keys"]:
+                base_name = connector["parent_name"] if connector["is_sub_domain"] else connector["name"]
+                config_keys = ConnectorConfigKeysLoader(
+                    utils_module_path=f"hummingbot.connector.{connector_type.name.lower()}.{base_name}.{base_name}_utils",
+                    domain=connector["name"] if connector["is_sub_domain"] else None,
+                )
+            connector_settings[connector["name"]] = ConnectorSetting(
+                name=connector["name"],
+                type=connector_type,
+                centralised=connector["centralised"],
+                example_pair=connector["example_pair"],
+                use_ethereum_wallet=connector["use_ethereum_wallet"],
+                trade_fee_schema=trade_fee_schema_from_json(connector["trade_fee_schema"]),
+                config_keys=config_keys,
+                is_sub_domain=connector["is_sub_domain"],
+                parent_name=connector["parent_name"],
+                domain_parameter=connector["domain_parameter"],
+                use_eth_gas_lookup=connector["use_eth_gas_lookup"],
+            )
+        return connector_settings
 
     @classmethod
     def initialize_paper_trade_settings(cls, paper_trade_exchanges: List[str]):
@@ -459,18 +555,12 @@ class AllConnectorSettings:
         for e in paper_trade_exchanges:
             base_connector_settings: Optional[ConnectorSetting] = cls.all_connector_settings.get(e, None)
             if base_connector_settings:
-                paper_trade_settings = ConnectorSetting(
+                # _replace keeps the config keys of the base connector unloaded
+                paper_trade_settings = base_connector_settings._replace(
                     name=f"{e}_paper_trade",
-                    type=base_connector_settings.type,
-                    centralised=base_connector_settings.centralised,
-                    example_pair=base_connector_settings.example_pair,
-                    use_ethereum_wallet=base_connector_settings.use_ethereum_wallet,
-                    trade_fee_schema=base_connector_settings.trade_fee_schema,
-                    config_keys=base_connector_settings.config_keys,
                     is_sub_domain=False,
                     parent_name=base_connector_settings.name,
                     domain_parameter=None,
-                    use_eth_gas_lookup=base_connector_settings.use_eth_gas_lookup,
                 )
                 cls.all_connector_settings.update({f"{e}_paper_trade": paper_trade_settings})
 
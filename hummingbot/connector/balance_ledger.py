@@ -0,0 +1,182 @@
+from collections import deque
+from decimal import Decimal
+from typing import TYPE_CHECKING, Deque, Dict, List, NamedTuple, Optional
+
+from hummingbot.connector.constants import s_decimal_0
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.event.event_listener import EventListener
+from hummingbot.core.event.events import (
+    BuyOrderCompletedEvent,
+    BuyOrderCreatedEvent,
+    MarketOrderFailureEvent,
+    OrderAmendedEvent,
+    OrderCancelledEvent,
+    OrderExpiredEvent,
+    OrderFilledEvent,
+    SellOrderCompletedEvent,
+    SellOrderCreatedEvent,
+)
+
+if TYPE_CHECKING:
+    from hummingbot.connector.connector_base import ConnectorBase
+
+
+class _FillBalances(NamedTuple):
+    timestamp: float
+    base: str
+    base_change: Decimal
+    quote: str
+    quote_change: Decimal
+
+
+class _OrderLock:
+    __slots__ = ("currency", "remaining_amount", "unit_value")
+
+    def __init__(self, currency: str, remaining_amount: Decimal, unit_value: Decimal):
+        self.currency = currency
+        self.remaining_amount = remaining_amount
+        # Balance locked for each unit of the remaining base amount
+        self.unit_value = unit_value
+
+
+class BalanceLedger(EventListener):
+    """
+    Per currency balances used by the connector to estimate its available balances, kept up to date with the market
+    events of the connector instead of being recalculated from all its orders and fills for each estimation:
+
+    - the balance locked in the in-flight orders, reduced with each fill and recalculated from the in-flight orders
+      only when an order is created, cancelled, failed, expired, amended or completed
+    - the balance changes of the orders filled since the connector started, updated with each fill
+    - for the connectors without real time balance updates, the balance locked in the orders of the last balance
+      snapshot, calculated once for each snapshot, and the balance changes of the orders filled since the snapshot
+    """
+    ORDERS_CHANGE_EVENTS = (
+        BuyOrderCreatedEvent,
+        SellOrderCreatedEvent,
+        OrderCancelledEvent,
+        MarketOrderFailureEvent,
+        OrderExpiredEvent,
+        OrderAmendedEvent,
+        BuyOrderCompletedEvent,
+        SellOrderCompletedEvent,
+    )
+
+    def __init__(self, connector: "ConnectorBase"):
+        super().__init__()
+        self._connector = connector
+        self._order_locks: Dict[str, _OrderLock] = {}
+        self._locked_balances: Dict[str, Decimal] = {}
+        self._orders_changed = True
+        self._filled_balances: Dict[str, Decimal] = {}
+        self._snapshot_orders: Optional[Dict] = None
+        self._snapshot_timestamp = 0.0
+        self._snapshot_locked_balances: Dict[str, Decimal] = {}
+        self._fills_since_snapshot: Deque[_FillBalances] = deque()
+        self._filled_balances_since_snapshot: Dict[str, Decimal] = {}
+
+    def __call__(self, event_object):
+        if isinstance(event_object, OrderFilledEvent):
+            self._register_fill(event_object)
+        elif isinstance(event_object, self.ORDERS_CHANGE_EVENTS):
+            self._orders_changed = True
+
+    def locked_balance(self, currency: str) -> Decimal:
+        """
+        The balance locked in the in-flight orders, including the estimated fees of the buy orders.
+        """
+        self._update_locked_balances()
+        return self._locked_balances.get(currency, s_decimal_0)
+
+    def filled_balance(self, currency: str) -> Decimal:
+        """
+        The balance change caused by the orders filled since the connector started, not including fees.
+        """
+        return self._filled_balances.get(currency, s_decimal_0)
+
+    def available_balance_since_snapshot(self, currency: str, available_balance: Decimal) -> Decimal:
+        """
+        Same estimation as `ConnectorBase.apply_balance_update_since_snapshot`.
+
+        :param currency: the token symbol
+        :param available_balance: the available balance of the last balance snapshot
+        :return: the available balance, accounting for the changes of the in-flight orders and the fills since the
+        snapshot
+        """
+        self._update_snapshot()
+        self._update_locked_balances()
+        return (available_balance
+                + self._snapshot_locked_balances.get(currency, s_decimal_0)
+                - self._locked_balances.get(currency, s_decimal_0)
+                + self._filled_balances_since_snapshot.get(currency, s_decimal_0))
+
+    def _register_fill(self, fill: OrderFilledEvent):
+        base, quote = fill.trading_pair.split("-")[0], fill.trading_pair.split("-")[1]
+        if fill.trade_type is TradeType.BUY:
+            fill_balances = _FillBalances(
+                timestamp=fill.timestamp,
+                base=base,
+                base_change=fill.amount,
+                quote=quote,
+                quote_change=Decimal("-1") * fill.price * fill.amount)
+        else:
+            fill_balances = _FillBalances(
+                timestamp=fill.timestamp,
+                base=base,
+                base_change=Decimal("-1") * fill.amount,
+                quote=quote,
+                quote_change=fill.price * fill.amount)
+        self._add_fill_balances(self._filled_balances, fill_balances)
+        if (not self._connector.real_time_balance_update
+                and fill.timestamp > self._connector.in_flight_orders_snapshot_timestamp):
+            self._fills_since_snapshot.append(fill_balances)
+            self._add_fill_balances(self._filled_balances_since_snapshot, fill_balances)
+
+        order_lock = self._order_locks.get(fill.order_id)
+        if order_lock is not None:
+            unlocked_amount = min(fill.amount, order_lock.remaining_amount)
+            order_lock.remaining_amount -= unlocked_amount
+            self._locked_balances[order_lock.currency] -= unlocked_amount * order_lock.unit_value
+
+    @staticmethod
+    def _add_fill_balances(balances: Dict[str, Decimal], fill_balances: _FillBalances):
+        balances[fill_balances.base] = balances.get(fill_balances.base, s_decimal_0) + fill_balances.base_change
+        balances[fill_balances.quote] = balances.get(fill_balances.quote, s_decimal_0) + fill_balances.quote_change
+
+    def _update_locked_balances(self):
+        in_flight_orders = self._connector.in_flight_orders
+        # The orders added without an event (e.g. while they are being created, or restored from the saved states)
+        # are detected by the number of orders
+        if not self._orders_changed and len(in_flight_orders) == len(self._order_locks):
+            return
+        fee_multiplier = Decimal(1) + self._connector.estimate_fee_pct(True)
+        self._order_locks = {}
+        self._locked_balances = {}
+        for order_id, order in in_flight_orders.items():
+            if order.is_done or order.is_failure or order.is_cancelled:
+                remaining_amount = s_decimal_0
+            else:
+                remaining_amount = order.amount - order.executed_amount_base
+            if order.trade_type is TradeType.BUY:
+                order_lock = _OrderLock(order.quote_asset, remaining_amount, order.price * fee_multiplier)
+            else:
+                order_lock = _OrderLock(order.base_asset, remaining_amount, Decimal(1))
+            self._order_locks[order_id] = order_lock
+            if remaining_amount != s_decimal_0:
+                self._locked_balances[order_lock.currency] = (self._locked_balances.get(order_lock.currency, s_decimal_0)
+                                                              + remaining_amount * order_lock.unit_value)
+        self._orders_changed = False
+
+    def _update_snapshot(self):
+        snapshot_orders = self._connector.in_flight_orders_snapshot
+        snapshot_timestamp = self._connector.in_flight_orders_snapshot_timestamp
+        if snapshot_orders is self._snapshot_orders and snapshot_timestamp == self._snapshot_timestamp:
+            return
+        self._snapshot_orders = snapshot_orders
+        self._snapshot_timestamp = snapshot_timestamp
+        self._snapshot_locked_balances = self._connector.in_flight_asset_balances(snapshot_orders)
+        # The fills up to the snapshot are already included in its balances
+        fills: List[_FillBalances] = [fill for fill in self._fills_since_snapshot if fill.timestamp > snapshot_timestamp]
+        self._fills_since_snapshot = deque(fills)
+        self._filled_balances_since_snapshot = {}
+        for fill_balances in fills:
+            self._add_fill_balances(self._filled_balances_since_snapshot, fill_balances)
@@ -8,13 +8,20 @@ from typing import TYPE_CHECKING, Callable, Dict, Optional
 from cachetools import TTLCache
 
 from hummingbot.core.data_type.common import TradeType
-from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
+from hummingbot.core.data_type.in_flight_order import (
+    InFlightOrder,
+    OrderAmendment,
+    OrderState,
+    OrderUpdate,
+    TradeUpdate,
+)
 from hummingbot.core.data_type.trade_fee import TradeFeeBase
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     BuyOrderCreatedEvent,
     MarketEvent,
     MarketOrderFailureEvent,
+    OrderAmendedEvent,
     OrderCancelledEvent,
     OrderFilledEvent,
     SellOrderCompletedEvent,
@@ -220,6 +227,16 @@ class ClientOrderTracker:
                     exchange_order_id=trade_update.exchange_order_id,
                 )
 
+    def process_order_amendment(self, amendment: OrderAmendment):
+        tracked_order: Optional[InFlightOrder] = self.fetch_tracked_order(client_order_id=amendment.client_order_id)
+
+        if tracked_order is not None and tracked_order.update_with_amendment(amendment):
+            self.logger().info(
+                f"Order {tracked_order.client_order_id} amended to {tracked_order.amount} {tracked_order.base_asset} "
+                f"at {tracked_order.price} {tracked_order.quote_asset}."
+            )
+            self._trigger_amended_event(tracked_order)
+
     async def process_order_not_found(self, client_order_id: str):
         """
         Increments and checks if the order specified has exceeded the order_not_found_count_limit.
@@ -333,6 +350,19 @@ class ClientOrderTracker:
             ),
         )
 
+    def _trigger_amended_event(self, order: InFlightOrder):
+        self._connector.trigger_event(
+            MarketEvent.OrderAmended,
+            OrderAmendedEvent(
+                timestamp=self.current_timestamp,
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                price=order.price,
+                amount=order.amount,
+                exchange_order_id=order.exchange_order_id,
+            ),
+        )
+
     def _trigger_filled_event(
         self,
         order: InFlightOrder,
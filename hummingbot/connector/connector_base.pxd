@@ -12,11 +12,12 @@ cdef class ConnectorBase(NetworkIterator):
         public bint _real_time_balance_update
         public dict _in_flight_orders_snapshot
         public double _in_flight_orders_snapshot_timestamp
-        public set _current_trade_fills
-        public dict _exchange_order_ids
+        public object _current_trade_fills
+        public object _exchange_order_ids
         public object _trade_fee_schema
         public object _trade_volume_metric_collector
         public object _client_config
+        public object _balance_ledger
 
     cdef str c_buy(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
     cdef str c_sell(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
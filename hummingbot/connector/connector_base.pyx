@@ -1,9 +1,11 @@
 import asyncio
 import time
 from decimal import Decimal
-from typing import Dict, List, Set, Tuple, TYPE_CHECKING, Union
+from typing import Callable, Dict, List, Optional, Set, Tuple, TYPE_CHECKING, Union
 
 from hummingbot.client.config.trade_fee_schema_loader import TradeFeeSchemaLoader
+from hummingbot.connector.balance_ledger import BalanceLedger
+from hummingbot.connector.fill_dedup_index import ExchangeOrderIdIndex, TradeFillIndex
 from hummingbot.connector.in_flight_order_base import InFlightOrderBase
 from hummingbot.connector.utils import split_hb_trading_pair, TradeFillOrderDetails
 from hummingbot.connector.constants import s_decimal_NaN, s_decimal_0
@@ -14,6 +16,7 @@ from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.market_order import MarketOrder
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
+from hummingbot.core.event.fill_history import FillHistory
 from hummingbot.core.network_iterator import NetworkIterator
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.estimate_fee import estimate_fee
@@ -31,6 +34,7 @@ cdef class ConnectorBase(NetworkIterator):
         MarketEvent.WithdrawAsset,
         MarketEvent.OrderCancelled,
         MarketEvent.OrderFilled,
+        MarketEvent.OrderAmended,
         MarketEvent.OrderExpired,
         MarketEvent.OrderFailure,
         MarketEvent.TransactionFailure,
@@ -49,9 +53,11 @@ cdef class ConnectorBase(NetworkIterator):
 
         self._event_reporter = EventReporter(event_source=self.display_name)
         self._event_logger = EventLogger(event_source=self.display_name)
+        self._balance_ledger = BalanceLedger(connector=self)
         for event_tag in self.MARKET_EVENTS:
             self.c_add_listener(event_tag.value, self._event_reporter)
             self.c_add_listener(event_tag.value, self._event_logger)
+            self.c_add_listener(event_tag.value, self._balance_ledger)
 
         self._account_balances = {}  # Dict[asset_name:str, Decimal]
         self._account_available_balances = {}  # Dict[asset_name:str, Decimal]
@@ -62,8 +68,8 @@ cdef class ConnectorBase(NetworkIterator):
         # for _in_flight_orders_snapshot and _in_flight_orders_snapshot_timestamp when the update user balances.
         self._in_flight_orders_snapshot = {}  # Dict[order_id:str, InFlightOrderBase]
         self._in_flight_orders_snapshot_timestamp = 0.0
-        self._current_trade_fills = set()
-        self._exchange_order_ids = dict()
+        self._current_trade_fills = TradeFillIndex()
+        self._exchange_order_ids = ExchangeOrderIdIndex()
         self._trade_fee_schema = None
         self._trade_volume_metric_collector = client_config_map.anonymized_metrics_mode.get_collector(
             connector=self,
@@ -142,8 +148,7 @@ cdef class ConnectorBase(NetworkIterator):
         :param starting_timestamp: The starting timestamp to include filter order filled events
         :returns A dictionary of tokens and their balance
         """
-        order_filled_events = list(filter(lambda e: isinstance(e, OrderFilledEvent), self.event_logs))
-        order_filled_events = [o for o in order_filled_events if o.timestamp > starting_timestamp]
+        order_filled_events = self.fill_history.fills(start_timestamp=starting_timestamp)
         balances = {}
         for event in order_filled_events:
             base, quote = event.trading_pair.split("-")[0], event.trading_pair.split("-")[1]
@@ -187,6 +192,13 @@ cdef class ConnectorBase(NetworkIterator):
     def event_logs(self) -> List[any]:
         return self._event_logger.event_log
 
+    @property
+    def fill_history(self) -> FillHistory:
+        """
+        The history of the order filled events of the connector, with the aggregated volumes and fees per trading pair.
+        """
+        return self._event_logger.fill_history
+
     @property
     def ready(self) -> bool:
         """
@@ -339,6 +351,37 @@ cdef class ConnectorBase(NetworkIterator):
         """
         raise NotImplementedError
 
+    @property
+    def supports_order_amendment(self) -> bool:
+        """
+        True if the connector modifies the price and amount of its active orders in the exchange, keeping their ids.
+        """
+        return False
+
+    def amend_order(self, trading_pair: str, order_id: str, price: Decimal, amount: Decimal) -> Optional[str]:
+        """
+        Modifies the price and amount of an active limit order. The connectors supporting order amendment modify the
+        order in place. The default implementation cancels the order and creates a new limit order, with the same
+        position action, for the amount not filled yet.
+        :param trading_pair: The market (e.g. BTC-USDT) of the order.
+        :param order_id: The internal order id (also called client_order_id)
+        :param price: The new order price
+        :param amount: The new total order amount, including the amount already filled
+        :returns The id of the amended order or of the new order replacing it, None if the order is not active
+        """
+        order = next((o for o in self.limit_orders if o.client_order_id == order_id), None)
+        if order is None:
+            return None
+        filled_amount = order.filled_quantity if order.filled_quantity.is_finite() else s_decimal_0
+        self.cancel(trading_pair, order_id)
+        if amount - filled_amount <= s_decimal_0:
+            return None
+        if order.is_buy:
+            return self.buy(trading_pair, amount - filled_amount, OrderType.LIMIT, price,
+                            position_action=order.position)
+        return self.sell(trading_pair, amount - filled_amount, OrderType.LIMIT, price,
+                         position_action=order.position)
+
     def batch_order_cancel(self, orders_to_cancel: List[LimitOrder]):
         """
         Issues a batch order cancelation as a single API request for exchanges that implement this feature. The default
@@ -386,9 +429,9 @@ cdef class ConnectorBase(NetworkIterator):
         :param limit: The balance limit for the token
         :returns An available balance after the limit has been applied
         """
-        in_flight_balance = self.in_flight_asset_balances(self.in_flight_orders).get(currency, s_decimal_0)
+        in_flight_balance = self._balance_ledger.locked_balance(currency)
         limit -= in_flight_balance
-        filled_balance = self.order_filled_balances().get(currency, s_decimal_0)
+        filled_balance = self._balance_ledger.filled_balance(currency)
         limit += filled_balance
         limit = max(limit, s_decimal_0)
         return min(available_balance, limit)
@@ -396,6 +439,8 @@ cdef class ConnectorBase(NetworkIterator):
     def apply_balance_update_since_snapshot(self, currency: str, available_balance: Decimal) -> Decimal:
         """
         Applies available balance update as followings
+        Recalculates the balances from all the in-flight orders and the logged fill events, the estimation of
+        `get_available_balance` is kept up to date incrementally by the connector balance ledger instead.
         :param currency: the token symbol
         :param available_balance: the current available_balance, this is also the snap balance taken since last
         _update_balances()
@@ -420,7 +465,7 @@ cdef class ConnectorBase(NetworkIterator):
         """
         available_balance = self._account_available_balances.get(currency, s_decimal_0)
         if not self._real_time_balance_update:
-            available_balance = self.apply_balance_update_since_snapshot(currency, available_balance)
+            available_balance = self._balance_ledger.available_balance_since_snapshot(currency, available_balance)
         balance_limits = self.get_exchange_limit_config(self.name)
         if currency in balance_limits:
             balance_limit = Decimal(str(balance_limits[currency]))
@@ -480,6 +525,18 @@ cdef class ConnectorBase(NetworkIterator):
         """
         return self.c_quantize_order_amount(trading_pair, amount)
 
+    def quantize_order_prices(self, trading_pair: str, prices: List[Decimal]) -> List[Decimal]:
+        """
+        Applies trading rule to quantize the prices of several orders, like the levels of an order ladder.
+        """
+        return [self.quantize_order_price(trading_pair, price) for price in prices]
+
+    def quantize_order_amounts(self, trading_pair: str, amounts: List[Decimal]) -> List[Decimal]:
+        """
+        Applies trading rule to quantize the amounts of several orders, like the levels of an order ladder.
+        """
+        return [self.quantize_order_amount(trading_pair, amount) for amount in amounts]
+
     async def get_quote_price(self, trading_pair: str, is_buy: bool, amount: Decimal) -> Decimal:
         """
         Returns a quote price (or exchange rate) for a given amount, like asking how much does it cost to buy 4 apples?
@@ -517,6 +574,16 @@ cdef class ConnectorBase(NetworkIterator):
         """
         self._exchange_order_ids.update(current_exchange_order_ids)
 
+    def set_market_recorder_lookups(self,
+                                    trade_fill_lookup: Optional[Callable[[TradeFillOrderDetails], Optional[bool]]],
+                                    exchange_order_id_lookup: Optional[Callable[[str], Optional[str]]]):
+        """
+        Registers the functions used to look up in the TradeFill and Order tables the trade fills and exchange order
+        ids that are not cached in memory. This is used in method is_confirmed_new_order_filled_event
+        """
+        self._current_trade_fills.set_lookup(trade_fill_lookup)
+        self._exchange_order_ids.set_lookup(exchange_order_id_lookup)
+
     def is_confirmed_new_order_filled_event(self, exchange_trade_id: str, exchange_order_id: str, trading_pair: str):
         """
         Returns True if order to be filled is not already present in TradeFill entries.
@@ -524,7 +591,7 @@ cdef class ConnectorBase(NetworkIterator):
         """
         # Assume (market, exchange_trade_id, trading_pair) are unique. Also order has to be recorded in Order table
         return (not TradeFillOrderDetails(self.display_name, exchange_trade_id, trading_pair) in self._current_trade_fills) and \
-               (exchange_order_id in set(self._exchange_order_ids.keys()))
+               (exchange_order_id in self._exchange_order_ids)
 
     def trade_fee_schema(self):
         if self._trade_fee_schema is None:
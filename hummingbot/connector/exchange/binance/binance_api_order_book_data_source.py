@@ -20,6 +20,8 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
     TRADE_STREAM_ID = 1
     DIFF_STREAM_ID = 2
     ONE_HOUR = 60 * 60
+    # The order books are resynchronized when a gap is detected in the diff update ids, the full reset is a fallback
+    FULL_ORDER_BOOK_RESET_DELTA_SECONDS = 24 * ONE_HOUR
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -102,6 +104,13 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
             )
             raise
 
+    async def _ws_hub_channels(self) -> List[str]:
+        channels = []
+        for trading_pair in self._trading_pairs:
+            symbol = await self._connector.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+            channels.extend([f"{symbol.lower()}@trade", f"{symbol.lower()}@depth@100ms"])
+        return channels
+
     async def _connected_websocket_assistant(self) -> WSAssistant:
         ws: WSAssistant = await self._api_factory.get_ws_assistant()
         await ws.connect(ws_url=CONSTANTS.WSS_URL.format(self._domain),
@@ -118,6 +127,14 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
         )
         return snapshot_msg
 
+    def is_order_book_diff_stale(self, last_update_id: int, diff_message: OrderBookMessage) -> bool:
+        # Each diff event includes the updates from its first update id (U) to its final update id (u)
+        return diff_message.update_id <= last_update_id
+
+    def is_order_book_diff_in_sequence(self, last_update_id: int, diff_message: OrderBookMessage) -> bool:
+        return (not self.is_order_book_diff_stale(last_update_id, diff_message)
+                and diff_message.first_update_id <= last_update_id + 1)
+
     async def _parse_trade_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
         if "result" not in raw_message:
             trading_pair = await self._connector.trading_pair_associated_to_exchange_symbol(symbol=raw_message["s"])
@@ -9,6 +9,8 @@ MAX_ORDER_ID_LEN = 32
 # Base URL
 REST_URL = "https://api.binance.{}/api/"
 WSS_URL = "wss://stream.binance.{}:9443/ws"
+WSS_COMBINED_STREAMS_URL = "wss://stream.binance.{}:9443/stream"
+WSS_API_URL = "wss://ws-api.binance.{}:443/ws-api/v3"
 
 PUBLIC_API_VERSION = "v3"
 PRIVATE_API_VERSION = "v3"
@@ -28,7 +30,14 @@ MY_TRADES_PATH_URL = "/myTrades"
 ORDER_PATH_URL = "/order"
 BINANCE_USER_STREAM_PATH_URL = "/userDataStream"
 
+# Websocket API methods
+WS_API_ORDER_PLACE_METHOD = "order.place"
+WS_API_ORDER_CANCEL_METHOD = "order.cancel"
+
 WS_HEARTBEAT_TIME_INTERVAL = 30
+# Limits of the websocket streams connections
+WS_MAX_STREAMS_PER_CONNECTION = 1024
+WS_MAX_INCOMING_MESSAGES_PER_SECOND = 5
 
 # Binance params
 
@@ -110,6 +119,14 @@ RATE_LIMITS = [
               linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, 4),
                              LinkedLimitWeightPair(ORDERS, 1),
                              LinkedLimitWeightPair(ORDERS_24HR, 1),
+                             LinkedLimitWeightPair(RAW_REQUESTS, 1)]),
+    RateLimit(limit_id=WS_API_ORDER_PLACE_METHOD, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
+              linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, 1),
+                             LinkedLimitWeightPair(ORDERS, 1),
+                             LinkedLimitWeightPair(ORDERS_24HR, 1),
+                             LinkedLimitWeightPair(RAW_REQUESTS, 1)]),
+    RateLimit(limit_id=WS_API_ORDER_CANCEL_METHOD, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
+              linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, 1),
                              LinkedLimitWeightPair(RAW_REQUESTS, 1)])
 ]
 
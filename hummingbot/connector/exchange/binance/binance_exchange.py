@@ -13,7 +13,10 @@ from hummingbot.connector.exchange.binance import (
 from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
 from hummingbot.connector.exchange.binance.binance_api_user_stream_data_source import BinanceAPIUserStreamDataSource
 from hummingbot.connector.exchange.binance.binance_auth import BinanceAuth
+from hummingbot.connector.exchange.binance.binance_order_entry_channel import BinanceWSOrderEntryChannel
+from hummingbot.connector.exchange.binance.binance_ws_hub_adapter import BinanceWSHubAdapter
 from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.order_entry_channel import WSOrderEntryChannel
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import TradeFillOrderDetails, combine_to_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
@@ -25,6 +28,7 @@ from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
 from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.core.web_assistant.ws_hub import WSHub
 
 if TYPE_CHECKING:
     from hummingbot.client.config.config_helpers import ClientConfigAdapter
@@ -42,10 +46,12 @@ class BinanceExchange(ExchangePyBase):
                  trading_pairs: Optional[List[str]] = None,
                  trading_required: bool = True,
                  domain: str = CONSTANTS.DEFAULT_DOMAIN,
+                 binance_ws_order_entry: bool = False,
                  ):
         self.api_key = binance_api_key
         self.secret_key = binance_api_secret
         self._domain = domain
+        self._ws_order_entry = binance_ws_order_entry
         self._trading_required = trading_required
         self._trading_pairs = trading_pairs
         self._last_trades_poll_binance_timestamp = 1.0
@@ -143,12 +149,26 @@ class BinanceExchange(ExchangePyBase):
             domain=self._domain,
             auth=self._auth)
 
+    def _create_order_entry_channel(self) -> Optional[WSOrderEntryChannel]:
+        if not self._ws_order_entry:
+            return None
+        return BinanceWSOrderEntryChannel(
+            auth=self._auth,
+            api_factory=self._web_assistants_factory,
+            throttler=self._throttler,
+            domain=self._domain)
+
     def _create_order_book_data_source(self) -> OrderBookTrackerDataSource:
-        return BinanceAPIOrderBookDataSource(
+        data_source = BinanceAPIOrderBookDataSource(
             trading_pairs=self._trading_pairs,
             connector=self,
             domain=self.domain,
             api_factory=self._web_assistants_factory)
+        # Shares the public streams connections with the other components using them (e.g. candles feeds)
+        data_source.use_ws_hub(WSHub.get_hub(
+            ws_url=CONSTANTS.WSS_COMBINED_STREAMS_URL.format(self.domain),
+            adapter=BinanceWSHubAdapter()))
+        return data_source
 
     def _create_user_stream_data_source(self) -> UserStreamTrackerDataSource:
         return BinanceAPIUserStreamDataSource(
@@ -195,10 +215,14 @@ class BinanceExchange(ExchangePyBase):
             api_params["timeInForce"] = CONSTANTS.TIME_IN_FORCE_GTC
 
         try:
-            order_result = await self._api_post(
-                path_url=CONSTANTS.ORDER_PATH_URL,
-                data=api_params,
-                is_auth_required=True)
+            order_result = await self._order_entry_request(
+                method=CONSTANTS.WS_API_ORDER_PLACE_METHOD,
+                params=api_params,
+                limit_id=CONSTANTS.WS_API_ORDER_PLACE_METHOD,
+                rest_request=lambda: self._api_post(
+                    path_url=CONSTANTS.ORDER_PATH_URL,
+                    data=api_params,
+                    is_auth_required=True))
             o_id = str(order_result["orderId"])
             transact_time = order_result["transactTime"] * 1e-3
         except IOError as e:
@@ -218,10 +242,14 @@ class BinanceExchange(ExchangePyBase):
             "symbol": symbol,
             "origClientOrderId": order_id,
         }
-        cancel_result = await self._api_delete(
-            path_url=CONSTANTS.ORDER_PATH_URL,
+        cancel_result = await self._order_entry_request(
+            method=CONSTANTS.WS_API_ORDER_CANCEL_METHOD,
             params=api_params,
-            is_auth_required=True)
+            limit_id=CONSTANTS.WS_API_ORDER_CANCEL_METHOD,
+            rest_request=lambda: self._api_delete(
+                path_url=CONSTANTS.ORDER_PATH_URL,
+                params=api_params,
+                is_auth_required=True))
         if cancel_result.get("status") == "CANCELED":
             return True
         return False
@@ -0,0 +1,54 @@
+import json
+from typing import Any, Dict, Optional
+
+import hummingbot.connector.exchange.binance.binance_constants as CONSTANTS
+import hummingbot.connector.exchange.binance.binance_web_utils as web_utils
+from hummingbot.connector.exchange.binance.binance_auth import BinanceAuth
+from hummingbot.connector.order_entry_channel import WSOrderEntryChannel
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+
+
+class BinanceWSOrderEntryChannel(WSOrderEntryChannel):
+    """
+    Sends orders through the Binance websocket API. Every request is signed with the API key, since session logon is
+    only available for Ed25519 keys.
+
+    Response example:
+    {
+        "id": "1",
+        "status": 200,
+        "result": {"symbol": "BTCUSDT", "orderId": 12569099453, "transactTime": 1660801715639, ...},
+        "rateLimits": [...]
+    }
+    """
+
+    def __init__(self,
+                 auth: BinanceAuth,
+                 api_factory: WebAssistantsFactory,
+                 throttler: AsyncThrottler,
+                 domain: str = CONSTANTS.DEFAULT_DOMAIN):
+        super().__init__(api_factory=api_factory, throttler=throttler)
+        self._auth = auth
+        self._domain = domain
+
+    def _ws_url(self) -> str:
+        return web_utils.wss_api_url(domain=self._domain)
+
+    def _build_payload(self, request_id: str, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "id": request_id,
+            "method": method,
+            "params": self._auth.add_auth_to_ws_api_params(params=params),
+        }
+
+    def _response_request_id(self, message: Any) -> Optional[str]:
+        return message.get("id") if isinstance(message, dict) else None
+
+    def _process_response(self, response: Any) -> Any:
+        status = response.get("status")
+        if status != 200:
+            # Same format as the REST errors, to be recognized by the error checks of the connector
+            raise IOError(f"Error executing request {response.get('id')}. HTTP status is {status}. "
+                          f"Error: {json.dumps(response.get('error'))}")
+        return response["result"]
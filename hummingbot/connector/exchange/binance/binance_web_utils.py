@@ -29,6 +29,15 @@ def private_rest_url(path_url: str, domain: str = CONSTANTS.DEFAULT_DOMAIN) -> s
     return CONSTANTS.REST_URL.format(domain) + CONSTANTS.PRIVATE_API_VERSION + path_url
 
 
+def wss_api_url(domain: str = CONSTANTS.DEFAULT_DOMAIN) -> str:
+    """
+    Creates the URL of the websocket API, used to send orders through websocket
+    :param domain: the Binance domain to connect to ("com" or "us"). The default value is "com"
+    :return: the full URL of the websocket API
+    """
+    return CONSTANTS.WSS_API_URL.format(domain)
+
+
 def build_api_factory(
         throttler: Optional[AsyncThrottler] = None,
         time_synchronizer: Optional[TimeSynchronizer] = None,
@@ -0,0 +1,34 @@
+from typing import Any, List, Optional, Tuple
+
+from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest, WSRequest
+from hummingbot.core.web_assistant.ws_hub import WSHubAdapter
+
+
+class BinanceWSHubAdapter(WSHubAdapter):
+    """
+    Binance combined streams, where each message includes the name of its stream:
+    {"stream": "btcusdt@kline_1m", "data": {"e": "kline", ...}}
+
+    The subscribers receive the content of the "data" field, the same messages sent by the raw stream endpoints.
+    """
+    max_channels_per_request = 200
+    heartbeat_interval = CONSTANTS.WS_HEARTBEAT_TIME_INTERVAL
+
+    def __init__(self,
+                 max_streams_per_connection: int = CONSTANTS.WS_MAX_STREAMS_PER_CONNECTION,
+                 max_incoming_messages_per_second: int = CONSTANTS.WS_MAX_INCOMING_MESSAGES_PER_SECOND):
+        self.max_channels_per_connection = max_streams_per_connection
+        # Leaves room for the pong messages, that are also counted by the exchange
+        self.subscription_request_interval = 1.0 / max(1, max_incoming_messages_per_second - 1)
+
+    def subscription_request(self, channels: List[str], request_id: int) -> WSRequest:
+        return WSJSONRequest(payload={"method": "SUBSCRIBE", "params": channels, "id": request_id})
+
+    def unsubscription_request(self, channels: List[str], request_id: int) -> WSRequest:
+        return WSJSONRequest(payload={"method": "UNSUBSCRIBE", "params": channels, "id": request_id})
+
+    def route_message(self, message: Any) -> Optional[Tuple[str, Any]]:
+        if isinstance(message, dict) and "stream" in message and "data" in message:
+            return message["stream"], message["data"]
+        return None
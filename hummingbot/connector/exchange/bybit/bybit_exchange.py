@@ -111,6 +111,10 @@ class BybitExchange(ExchangePyBase):
     def is_cancel_request_in_exchange_synchronous(self) -> bool:
         return True
 
+    @property
+    def supports_order_amendment(self) -> bool:
+        return True
+
     @property
     def is_trading_required(self) -> bool:
         return self._trading_required
@@ -276,6 +280,28 @@ class BybitExchange(ExchangePyBase):
             return True
         return False
 
+    async def _place_order_amendment(self,
+                                     order_id: str,
+                                     tracked_order: InFlightOrder,
+                                     price: Decimal,
+                                     amount: Decimal) -> Tuple[Optional[str], float]:
+        api_params = {
+            "category": self._category,
+            "symbol": await self.exchange_symbol_associated_to_pair(trading_pair=tracked_order.trading_pair),
+            "orderLinkId": order_id,
+            "qty": f"{amount:f}",
+            "price": f"{price:f}",
+        }
+        response = await self._api_post(
+            path_url=CONSTANTS.ORDER_AMEND_PATH_URL,
+            data=api_params,
+            is_auth_required=True,
+            headers={"referer": CONSTANTS.HBOT_BROKER_ID},
+        )
+        if response["retCode"] != 0:
+            raise ValueError(f"{response['retMsg']}")
+        return str(response["result"]["orderId"]), int(response["time"]) * 1e-3
+
     async def _format_trading_rules(self, exchange_info_dict: Dict[str, Any]) -> List[TradingRule]:
         trading_pair_rules = exchange_info_dict.get("result", []).get("list", [])
         retval = []
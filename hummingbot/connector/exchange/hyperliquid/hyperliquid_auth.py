@@ -4,7 +4,7 @@ from collections import OrderedDict
 
 import eth_account
 import msgpack
-from eth_account.messages import encode_structured_data
+from eth_account.messages import SignableMessage, encode_structured_data
 from eth_utils import keccak, to_hex
 
 from hummingbot.connector.exchange.hyperliquid import hyperliquid_constants as CONSTANTS
@@ -12,11 +12,14 @@ from hummingbot.connector.exchange.hyperliquid.hyperliquid_web_utils import orde
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, WSRequest
 
+AGENT_TYPE_HASH = keccak(text="Agent(string source,bytes32 connectionId)")
+
 
 class HyperliquidAuth(AuthBase):
     """
     Auth class required by Hyperliquid API
     """
+    _l1_action_domain_separator = None
 
     def __init__(self, api_key: str, api_secret: str, use_vault: bool):
         self._api_key: str = api_key
@@ -47,11 +50,9 @@ class HyperliquidAuth(AuthBase):
     def construct_phantom_agent(self, hash, is_mainnet):
         return {"source": "a" if is_mainnet else "b", "connectionId": hash}
 
-    def sign_l1_action(self, wallet, action, active_pool, nonce, is_mainnet):
-        _hash = self.action_hash(action, active_pool, nonce)
-        phantom_agent = self.construct_phantom_agent(_hash, is_mainnet)
-
-        data = {
+    @classmethod
+    def l1_action_structured_data(cls, phantom_agent):
+        return {
             "domain": {
                 "chainId": 1337,
                 "name": "Exchange",
@@ -73,12 +74,37 @@ class HyperliquidAuth(AuthBase):
             "primaryType": "Agent",
             "message": phantom_agent,
         }
-        return self.sign_inner(wallet, data)
+
+    @classmethod
+    def l1_action_domain_separator(cls) -> bytes:
+        # The domain of the L1 actions is constant, its hash is calculated only once
+        if cls._l1_action_domain_separator is None:
+            phantom_agent = {"source": "a", "connectionId": bytes(32)}
+            cls._l1_action_domain_separator = encode_structured_data(cls.l1_action_structured_data(phantom_agent)).header
+        return cls._l1_action_domain_separator
+
+    @classmethod
+    def l1_action_signable_message(cls, phantom_agent) -> SignableMessage:
+        """
+        The EIP-712 message of an L1 action, equivalent to encode_structured_data(l1_action_structured_data(...))
+        but reusing the hashes of the domain and the Agent type.
+        """
+        struct_hash = keccak(
+            AGENT_TYPE_HASH + keccak(text=phantom_agent["source"]) + bytes(phantom_agent["connectionId"])
+        )
+        return SignableMessage(version=b"\x01", header=cls.l1_action_domain_separator(), body=struct_hash)
+
+    def sign_l1_action(self, wallet, action, active_pool, nonce, is_mainnet):
+        _hash = self.action_hash(action, active_pool, nonce)
+        phantom_agent = self.construct_phantom_agent(_hash, is_mainnet)
+        signed = wallet.sign_message(self.l1_action_signable_message(phantom_agent))
+        return {"r": to_hex(signed["r"]), "s": to_hex(signed["s"]), "v": signed["v"]}
 
     async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
         base_url = request.url
         if request.method == RESTMethod.POST:
-            request.data = self.add_auth_to_params_post(request.data, base_url)
+            # Hashing and signing runs in the signing service, outside of the event loop
+            request.data = await self.signing_service.sign(self.add_auth_to_params_post, request.data, base_url)
         return request
 
     async def ws_authenticate(self, request: WSRequest) -> WSRequest:
@@ -173,6 +173,9 @@ class HyperliquidExchange(ExchangePyBase):
         d_price = Decimal(round(float(f"{price:.5g}"), 6))
         return d_price
 
+    def quantize_order_prices(self, trading_pair: str, prices: List[Decimal]) -> List[Decimal]:
+        return [self.quantize_order_price(trading_pair, price) for price in prices]
+
     async def _update_trading_rules(self):
         exchange_info = await self._api_post(path_url=self.trading_rules_request_path,
                                              data={"type": CONSTANTS.ASSET_CONTEXT_TYPE})
@@ -92,6 +92,10 @@ class OkxExchange(ExchangePyBase):
     def is_cancel_request_in_exchange_synchronous(self) -> bool:
         return False
 
+    @property
+    def supports_order_amendment(self) -> bool:
+        return True
+
     @property
     def is_trading_required(self) -> bool:
         return self._trading_required
@@ -237,6 +241,27 @@ class OkxExchange(ExchangePyBase):
 
         return final_result
 
+    async def _place_order_amendment(self,
+                                     order_id: str,
+                                     tracked_order: InFlightOrder,
+                                     price: Decimal,
+                                     amount: Decimal) -> Tuple[Optional[str], float]:
+        data = {
+            "clOrdId": order_id,
+            "instId": await self.exchange_symbol_associated_to_pair(trading_pair=tracked_order.trading_pair),
+            "newSz": str(amount),
+            "newPx": f"{price:f}",
+        }
+        amend_result = await self._api_post(
+            path_url=CONSTANTS.OKX_AMEND_ORDER_PATH,
+            data=data,
+            is_auth_required=True,
+        )
+        result_data = amend_result["data"][0]
+        if result_data["sCode"] != "0":
+            raise IOError(f"Error amending order {order_id}: {result_data['sMsg']}")
+        return str(result_data["ordId"]), self.current_timestamp
+
     async def get_last_traded_prices(self, trading_pairs: List[str] = None) -> Dict[str, float]:
         params = {"instType": "SPOT"}
 
@@ -1,5 +1,6 @@
 import time
-from typing import Any, Tuple
+from functools import lru_cache
+from typing import Any, Optional, Tuple
 
 import sha3
 from coincurve import PrivateKey
@@ -15,10 +16,17 @@ def keccak_hash(x):
     return sha3.keccak_256(x).digest()
 
 
+@lru_cache(maxsize=64)
+def get_domain(contract: str, chain_id: int):
+    # Domains only depend on the contract and the chain, they are built once and reused for every signature
+    return make_domain(name="Vertex", version=CONSTANTS.VERSION, chainId=chain_id, verifyingContract=contract)
+
+
 class VertexAuth(AuthBase):
     def __init__(self, vertex_arbitrum_address: str, vertex_arbitrum_private_key: str):
         self.sender_address = vertex_arbitrum_address
         self.private_key = vertex_arbitrum_private_key
+        self._signing_key: Optional[PrivateKey] = None
 
     async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
         """
@@ -59,14 +67,15 @@ class VertexAuth(AuthBase):
         :return: a tuple for both a string hex of the signature of the EIP712 payload and a string hex of
         the digest
         """
-        domain = make_domain(name="Vertex", version=CONSTANTS.VERSION, chainId=chain_id, verifyingContract=contract)
+        domain = get_domain(contract, chain_id)
 
         signable_bytes = payload.signable_bytes(domain)
         # Digest for order tracking in Hummingbot
         digest = self.generate_digest(signable_bytes)
 
-        pk = PrivateKey.from_hex(self.private_key)
-        signature = pk.sign_recoverable(signable_bytes, hasher=keccak_hash)
+        if self._signing_key is None:
+            self._signing_key = PrivateKey.from_hex(self.private_key)
+        signature = self._signing_key.sign_recoverable(signable_bytes, hasher=keccak_hash)
 
         v = signature[64] + 27
         r = big_endian_to_int(signature[0:32])
@@ -75,6 +84,12 @@ class VertexAuth(AuthBase):
         final_sig = r.to_bytes(32, "big") + s.to_bytes(32, "big") + v.to_bytes(1, "big")
         return f"0x{final_sig.hex()}", digest
 
+    async def sign_payload_async(self, payload: Any, contract: str, chain_id: int) -> Tuple[str, str]:
+        """
+        Signs the payload like sign_payload, in the signing service instead of the event loop.
+        """
+        return await self.signing_service.sign(self.sign_payload, payload, contract, chain_id)
+
     def generate_digest(self, signable_bytes: bytearray) -> str:
         """
         Generates the digest of the payload for use across Vetext lookups
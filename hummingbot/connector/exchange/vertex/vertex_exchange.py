@@ -228,7 +228,7 @@ class VertexExchange(ExchangePyBase):
             sender=sender, priceX18=int(price_str), amount=int(amount_str), expiration=int(expiration), nonce=nonce
         )
 
-        signature, digest = self.authenticator.sign_payload(order, contract, self._chain_id)
+        signature, digest = await self.authenticator.sign_payload_async(order, contract, self._chain_id)
 
         place_order = {
             "place_order": {
@@ -282,7 +282,7 @@ class VertexExchange(ExchangePyBase):
         cancel = vertex_eip712_structs.Cancellation(
             sender=sender, productIds=[int(product_id)], digests=[order_id_bytes], nonce=nonce
         )
-        signature, digest = self.authenticator.sign_payload(cancel, endpoint_contract, self._chain_id)
+        signature, digest = await self.authenticator.sign_payload_async(cancel, endpoint_contract, self._chain_id)
 
         cancel_orders = {
             "cancel_orders": {
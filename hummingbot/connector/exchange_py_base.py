@@ -4,13 +4,17 @@ import logging
 import math
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from async_timeout import timeout
 
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.constants import MINUTE, TWELVE_HOURS, s_decimal_0, s_decimal_NaN
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.order_entry_channel import OrderEntryChannelUnavailableError, WSOrderEntryChannel
+from hummingbot.connector.sharding.shard_router import ShardRouter
+from hummingbot.connector.sharding.sharded_order_book_tracker import ShardedOrderBookTracker
+from hummingbot.connector.sharding.sharded_user_stream_tracker_data_source import ShardedUserStreamTrackerDataSource
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
@@ -18,7 +22,13 @@ from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.api_throttler.data_types import RateLimit
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
-from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
+from hummingbot.core.data_type.in_flight_order import (
+    InFlightOrder,
+    OrderAmendment,
+    OrderState,
+    OrderUpdate,
+    TradeUpdate,
+)
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
@@ -28,7 +38,12 @@ from hummingbot.core.data_type.user_stream_tracker import UserStreamTracker
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.core.utils.trading_pairs_cache import TradingPairsCache
 from hummingbot.core.web_assistant.auth import AuthBase
+from hummingbot.core.web_assistant.connections.connection_pool_manager import (
+    ConnectionPoolConfig,
+    ConnectionPoolManager,
+)
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.logger import HummingbotLogger
@@ -70,6 +85,9 @@ class ExchangePyBase(ExchangeBase, ABC):
         # init Auth and Api factory
         self._auth: AuthBase = self.authenticator
         self._web_assistants_factory: WebAssistantsFactory = self._create_web_assistants_factory()
+        ConnectionPoolManager.get_instance().register_pool(self.name, self.connection_pool_config)
+        self._web_assistants_factory.set_connection_pool_name(self.name)
+        self._order_entry_channel: Optional[WSOrderEntryChannel] = self._create_order_entry_channel()
 
         # init OrderBook Data Source and Tracker
         self._orderbook_ds: OrderBookTrackerDataSource = self._create_order_book_data_source()
@@ -83,6 +101,9 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         self._order_tracker: ClientOrderTracker = self._create_order_tracker()
 
+        # Set with enable_sharding to track the markets in worker processes
+        self._shard_router: Optional[ShardRouter] = None
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         if cls._logger is None:
@@ -165,6 +186,14 @@ class ExchangePyBase(ExchangeBase, ABC):
     def limit_orders(self) -> List[LimitOrder]:
         return [in_flight_order.to_limit_order() for in_flight_order in self.in_flight_orders.values()]
 
+    @property
+    def connection_pool_config(self) -> ConnectionPoolConfig:
+        """
+        The limits of the connection pool of the exchange, shared by all the connectors of the same exchange. The
+        connectors can override it to match the connection limits of their exchange.
+        """
+        return ConnectionPoolConfig()
+
     @property
     def status_dict(self) -> Dict[str, bool]:
         return {
@@ -175,6 +204,52 @@ class ExchangePyBase(ExchangeBase, ABC):
             "user_stream_initialized": self._is_user_stream_initialized(),
         }
 
+    def queue_depths(self) -> Dict[str, int]:
+        """
+        The number of messages waiting to be processed in the queues of the order book and user stream trackers.
+        """
+        queue_depths = self.order_book_tracker.queue_depths()
+        if self._user_stream_tracker is not None:
+            queue_depths.update(self._user_stream_tracker.queue_depths())
+        return queue_depths
+
+    def enable_sharding(self, shards: int, connector_factory: Callable[..., "ExchangePyBase"]):
+        """
+        Moves the order book tracking and the user stream of the connector to worker processes, each one tracking a
+        share of the trading pairs. The order books are read from the shared memory where the workers publish them,
+        and the order requests are sent by the worker of their trading pair. It has to be called before starting the
+        network.
+
+        The rate limits are divided in equal parts among this connector, which keeps polling the account updates, and
+        the connectors of the workers, which send the orders and request the order book snapshots.
+
+        :param shards: the number of worker processes
+        :param connector_factory: creates the connector of each worker, receiving the trading pairs of the worker as
+        `trading_pairs` keyword argument. It is sent to the workers, so it has to be picklable (e.g. a partial of the
+        connector class with its init parameters)
+        """
+        self._shard_router = ShardRouter(
+            connector_factory=connector_factory,
+            trading_pairs=self.trading_pairs,
+            shards=shards,
+            run_user_stream=self.is_trading_required)
+        self._share_rate_limits(shares=self._shard_router.rate_limits_shares)
+        self._set_order_book_tracker(ShardedOrderBookTracker(
+            data_source=self._orderbook_ds,
+            trading_pairs=self.trading_pairs,
+            router=self._shard_router,
+            domain=self.domain))
+        self._user_stream_tracker = UserStreamTracker(
+            data_source=ShardedUserStreamTrackerDataSource(router=self._shard_router))
+
+    def _share_rate_limits(self, shares: int):
+        """
+        Limits the requests of the connector to its part of the rate limits when they are shared by `shares`
+        connectors (the connector of the strategy process and those of the shard workers).
+        """
+        self._throttler.limits_pct = self._throttler.limits_pct / shares
+        self._throttler.set_rate_limits(self.rate_limits_rules)
+
     @property
     def ready(self) -> bool:
         """
@@ -220,8 +295,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param trading_pair: the trading pair to check for market conditions
         :param price: the starting point price
         """
-        trading_rule = self._trading_rules[trading_pair]
-        return Decimal(trading_rule.min_price_increment)
+        return self._trading_rules[trading_pair].quantizer.price_quantum
 
     def get_order_size_quantum(self, trading_pair: str, order_size: Decimal) -> Decimal:
         """
@@ -231,8 +305,31 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param trading_pair: the trading pair to check for market conditions
         :param order_size: the starting point order price
         """
-        trading_rule = self._trading_rules[trading_pair]
-        return Decimal(trading_rule.min_base_amount_increment)
+        return self._trading_rules[trading_pair].quantizer.size_quantum
+
+    def quantize_order_price(self, trading_pair: str, price: Decimal) -> Decimal:
+        """
+        Applies the trading rule to quantize an order price, with the quantizer of the trading pair rule.
+
+        :param trading_pair: the trading pair of the order
+        :param price: the order price
+        """
+        return self._trading_rules[trading_pair].quantizer.quantize_price(price)
+
+    def quantize_order_amount(self, trading_pair: str, amount: Decimal) -> Decimal:
+        """
+        Applies the trading rule to quantize an order amount, with the quantizer of the trading pair rule.
+
+        :param trading_pair: the trading pair of the order
+        :param amount: the order amount
+        """
+        return self._trading_rules[trading_pair].quantizer.quantize_amount(amount)
+
+    def quantize_order_prices(self, trading_pair: str, prices: List[Decimal]) -> List[Decimal]:
+        return self._trading_rules[trading_pair].quantizer.quantize_prices(prices)
+
+    def quantize_order_amounts(self, trading_pair: str, amounts: List[Decimal]) -> List[Decimal]:
+        return self._trading_rules[trading_pair].quantizer.quantize_amounts(amounts)
 
     def get_order_book(self, trading_pair: str) -> OrderBook:
         """
@@ -357,6 +454,41 @@ class ExchangePyBase(ExchangeBase, ABC):
         safe_ensure_future(self._execute_cancel(trading_pair, client_order_id))
         return client_order_id
 
+    def amend_order(self, trading_pair: str, order_id: str, price: Decimal, amount: Decimal) -> Optional[str]:
+        """
+        Creates a promise to modify the price and amount of an active order in the exchange. The order is amended in
+        place if the connector supports it and the order is open in the exchange. Otherwise it is cancelled and
+        replaced by a new order with the same side, type and position action, for the amount not filled yet.
+
+        :param trading_pair: the trading pair the order to amend operates with
+        :param order_id: the client id of the order to amend
+        :param price: the new order price
+        :param amount: the new total order amount, including the amount already filled
+
+        :return: the client id of the amended order or of the new order replacing it, None if the order is not active
+        """
+        tracked_order = self._order_tracker.fetch_tracked_order(order_id)
+        if tracked_order is None or tracked_order.is_done:
+            return None
+        if (self.supports_order_amendment
+                and tracked_order.current_state in (OrderState.OPEN, OrderState.PARTIALLY_FILLED)
+                and not tracked_order.is_pending_amendment):
+            safe_ensure_future(self._execute_order_amendment(order=tracked_order, price=price, amount=amount))
+            return order_id
+
+        self.cancel(trading_pair, order_id)
+        remaining_amount = amount - tracked_order.executed_amount_base
+        if remaining_amount <= s_decimal_0:
+            return None
+        place_order = self.buy if tracked_order.trade_type is TradeType.BUY else self.sell
+        return place_order(
+            trading_pair=trading_pair,
+            amount=remaining_amount,
+            order_type=tracked_order.order_type,
+            price=price,
+            position_action=tracked_order.position,
+        )
+
     async def cancel_all(self, timeout_seconds: float) -> List[CancellationResult]:
         """
         Cancels all currently active orders. The cancellations are performed in parallel tasks.
@@ -466,7 +598,8 @@ class ExchangePyBase(ExchangeBase, ABC):
             )
 
     async def _place_order_and_process_update(self, order: InFlightOrder, **kwargs) -> str:
-        exchange_order_id, update_timestamp = await self._place_order(
+        place_order = self._place_order if self._shard_router is None else self._shard_router.place_order
+        exchange_order_id, update_timestamp = await place_order(
             order_id=order.client_order_id,
             trading_pair=order.trading_pair,
             amount=order.amount,
@@ -537,7 +670,10 @@ class ExchangePyBase(ExchangeBase, ABC):
                 self.logger().error(f"Failed to cancel order {order.client_order_id}", exc_info=True)
 
     async def _execute_order_cancel_and_process_update(self, order: InFlightOrder) -> bool:
-        cancelled = await self._place_cancel(order.client_order_id, order)
+        if self._shard_router is None:
+            cancelled = await self._place_cancel(order.client_order_id, order)
+        else:
+            cancelled = await self._shard_router.place_cancel(order_id=order.client_order_id, tracked_order=order)
         if cancelled:
             update_timestamp = self.current_timestamp
             if update_timestamp is None or math.isnan(update_timestamp):
@@ -553,6 +689,40 @@ class ExchangePyBase(ExchangeBase, ABC):
             self._order_tracker.process_order_update(order_update)
         return cancelled
 
+    async def _execute_order_amendment(self, order: InFlightOrder, price: Decimal, amount: Decimal):
+        trading_pair = order.trading_pair
+        amendment = OrderAmendment(
+            client_order_id=order.client_order_id,
+            trading_pair=trading_pair,
+            update_timestamp=self.current_timestamp,
+            price=self.quantize_order_price(trading_pair, price),
+            amount=self.quantize_order_amount(trading_pair=trading_pair, amount=amount),
+        )
+        order.pending_amendment = amendment
+        try:
+            exchange_order_id, update_timestamp = await self._place_order_amendment(
+                order_id=order.client_order_id,
+                tracked_order=order,
+                price=amendment.price,
+                amount=amendment.amount,
+            )
+            self._order_tracker.process_order_amendment(amendment._replace(
+                exchange_order_id=exchange_order_id,
+                update_timestamp=update_timestamp,
+            ))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            order.pending_amendment = None
+            self.logger().network(
+                f"Error amending order {order.client_order_id} to {amendment.amount} {trading_pair} "
+                f"{amendment.price}. The order will be cancelled.",
+                exc_info=True,
+                app_warning_msg=f"Failed to amend order on {self.name_cap}. Check API key and network connection."
+            )
+            # The order is not left at a price the strategy no longer expects
+            await self._execute_order_cancel(order=order)
+
     async def _execute_cancel(self, trading_pair: str, order_id: str) -> str:
         """
         Requests the exchange to cancel an active order
@@ -628,6 +798,19 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         raise NotImplementedError
 
+    async def _place_order_amendment(self,
+                                     order_id: str,
+                                     tracked_order: InFlightOrder,
+                                     price: Decimal,
+                                     amount: Decimal) -> Tuple[Optional[str], float]:
+        """
+        Requests the exchange to modify the price and amount of an order. Only called for the connectors supporting
+        order amendment.
+
+        :return: the exchange order id of the amended order and the update timestamp
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def _place_order(self,
                            order_id: str,
@@ -666,6 +849,9 @@ class ExchangePyBase(ExchangeBase, ABC):
         - The background task to process the events received through the user stream tracker (websocket connection)
         """
         self._stop_network()
+        if self._shard_router is not None:
+            await self._shard_router.stop()
+            self._shard_router.start()
         self.order_book_tracker.start()
         if self.is_trading_required:
             self._trading_rules_polling_task = safe_ensure_future(self._trading_rules_polling_loop())
@@ -674,6 +860,9 @@ class ExchangePyBase(ExchangeBase, ABC):
             self._user_stream_tracker_task = self._create_user_stream_tracker_task()
             self._user_stream_event_listener_task = safe_ensure_future(self._user_stream_event_listener())
             self._lost_orders_update_task = safe_ensure_future(self._lost_orders_update_polling_loop())
+            if self._order_entry_channel is not None and self._shard_router is None:
+                # With sharding the orders are sent by the workers
+                self._order_entry_channel.start()
 
     async def stop_network(self):
         """
@@ -681,6 +870,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         tasks that require the connection with the exchange to work.
         """
         self._stop_network()
+        if self._shard_router is not None:
+            await self._shard_router.stop()
 
     async def check_network(self) -> NetworkStatus:
         """
@@ -719,6 +910,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         if self._lost_orders_update_task is not None:
             self._lost_orders_update_task.cancel()
             self._lost_orders_update_task = None
+        if self._order_entry_channel is not None:
+            self._order_entry_channel.stop()
 
     # === loops and sync related methods ===
     #
@@ -851,12 +1044,41 @@ class ExchangePyBase(ExchangeBase, ABC):
     # === Exchange / Trading logic methods that call the API ===
 
     async def _update_trading_rules(self):
+        if len(self._trading_rules) == 0:
+            await self._initialize_trading_rules_from_cache()
         exchange_info = await self._make_trading_rules_request()
         trading_rules_list = await self._format_trading_rules(exchange_info)
         self._trading_rules.clear()
         for trading_rule in trading_rules_list:
             self._trading_rules[trading_rule.trading_pair] = trading_rule
         self._initialize_trading_pair_symbols_from_exchange_info(exchange_info=exchange_info)
+        await self._store_exchange_info_in_cache(request_path=self.trading_rules_request_path,
+                                                 exchange_info=exchange_info)
+
+    async def _initialize_trading_rules_from_cache(self):
+        """
+        Seeds the trading rules with the exchange information stored by a previous run, if it is not expired, so they
+        are available while they are requested from the exchange.
+        """
+        cache = TradingPairsCache.get_instance()
+        entry = await cache.get_async(self._exchange_info_cache_key(self.trading_rules_request_path)) if cache else None
+        if entry is None or not cache.is_fresh(entry):
+            return
+        try:
+            trading_rules_list = await self._format_trading_rules(entry.data)
+            for trading_rule in trading_rules_list:
+                self._trading_rules[trading_rule.trading_pair] = trading_rule
+        except Exception:
+            self.logger().debug("Error loading the trading rules from the cached exchange info.", exc_info=True)
+            self._trading_rules.clear()
+
+    def _exchange_info_cache_key(self, request_path: str) -> str:
+        return f"exchange_info_{self.name}_{request_path}"
+
+    async def _store_exchange_info_in_cache(self, request_path: str, exchange_info: Any):
+        cache = TradingPairsCache.get_instance()
+        if cache is not None:
+            await cache.put_async(self._exchange_info_cache_key(request_path), exchange_info)
 
     async def _api_get(self, *args, **kwargs):
         kwargs["method"] = RESTMethod.GET
@@ -925,6 +1147,34 @@ class ExchangePyBase(ExchangeBase, ABC):
         # Failed even after the last retry
         raise last_exception
 
+    async def _order_entry_request(
+            self,
+            method: str,
+            params: Dict[str, Any],
+            limit_id: str,
+            rest_request: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Sends an order request through the websocket order entry channel when it is connected. If there is no channel,
+        or the request could not be sent through it, the request is sent through REST executing rest_request.
+
+        :param method: the method of the websocket API
+        :param params: the parameters of the websocket request
+        :param limit_id: the rate limit of the websocket request
+        :param rest_request: the function executing the same request through REST
+        """
+        if self._order_entry_channel is not None and self._order_entry_channel.is_connected:
+            try:
+                return await self._order_entry_channel.request(method=method, params=params, limit_id=limit_id)
+            except OrderEntryChannelUnavailableError as channel_error:
+                self.logger().debug(f"Sending the {method} request through REST ({channel_error}).")
+            except IOError as request_exception:
+                if not self._is_request_exception_related_to_time_synchronizer(request_exception=request_exception):
+                    raise
+                # The REST request is retried after synchronizing the time if required
+                await self._update_time_synchronizer()
+        return await rest_request()
+
     async def _status_polling_loop_fetch_updates(self):
         """
         Called by _status_polling_loop, which executes after each tick() is executed
@@ -1065,13 +1315,37 @@ class ExchangePyBase(ExchangeBase, ABC):
     def _initialize_trading_pair_symbols_from_exchange_info(self, exchange_info: Dict[str, Any]):
         raise NotImplementedError
 
+    def _create_order_entry_channel(self) -> Optional[WSOrderEntryChannel]:
+        """
+        Connectors of exchanges with a websocket trading API can return a channel to send the order requests through
+        it with _order_entry_request.
+        """
+        return None
+
     def _create_order_tracker(self) -> ClientOrderTracker:
         return ClientOrderTracker(connector=self)
 
     async def _initialize_trading_pair_symbol_map(self):
+        cache = TradingPairsCache.get_instance()
+        entry = await cache.get_async(self._exchange_info_cache_key(self.trading_pairs_request_path)) if cache else None
+        if entry is not None:
+            try:
+                self._initialize_trading_pair_symbols_from_exchange_info(exchange_info=entry.data)
+            except Exception:
+                self.logger().debug("Error loading the trading pair symbols from the cached exchange info.",
+                                    exc_info=True)
+            if self.trading_pair_symbol_map_ready():
+                if not cache.is_fresh(entry):
+                    safe_ensure_future(self._request_trading_pair_symbol_map())
+                return
+        await self._request_trading_pair_symbol_map()
+
+    async def _request_trading_pair_symbol_map(self):
         try:
             exchange_info = await self._make_trading_pairs_request()
             self._initialize_trading_pair_symbols_from_exchange_info(exchange_info=exchange_info)
+            await self._store_exchange_info_in_cache(request_path=self.trading_pairs_request_path,
+                                                     exchange_info=exchange_info)
         except Exception:
             self.logger().exception("There was an error requesting exchange info.")
 
@@ -0,0 +1,94 @@
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional
+
+from hummingbot.connector.utils import TradeFillOrderDetails
+
+
+class _LookupIndex:
+    """
+    Index of keys persisted by the markets recorder. The most recently used keys are kept in an LRU cache, including
+    the keys known not to be persisted, and the keys not cached are looked up in the database with the lookup function
+    registered by the recorder. The full history is then never loaded in memory.
+    """
+    DEFAULT_MAX_CACHED_KEYS = 100000
+
+    def __init__(self,
+                 max_cached_keys: int = DEFAULT_MAX_CACHED_KEYS,
+                 lookup: Optional[Callable[[Any], Optional[Any]]] = None):
+        self._max_cached_keys = max_cached_keys
+        self._lookup = lookup
+        # The cached value is None for the keys known not to be persisted
+        self._cache: "OrderedDict[Hashable, Optional[Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def set_lookup(self, lookup: Optional[Callable[[Any], Optional[Any]]]):
+        """
+        :param lookup: function returning the value persisted for a key, or None if the key is not persisted
+        """
+        self._lookup = lookup
+        # The keys cached as missing may have been persisted by a previous run
+        for key in [key for key, value in self._cache.items() if value is None]:
+            del self._cache[key]
+
+    def clear(self):
+        self._cache.clear()
+
+    def _get(self, key: Hashable) -> Optional[Any]:
+        if key is None:
+            return None
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        value = self._lookup(key) if self._lookup is not None else None
+        self._store(key, value)
+        return value
+
+    def _store(self, key: Hashable, value: Optional[Any]):
+        self._cache[key] = value
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._max_cached_keys:
+            self._cache.popitem(last=False)
+
+
+class TradeFillIndex(_LookupIndex):
+    """
+    Set of the trade fills already recorded, keyed by (market, exchange trade id, trading pair).
+    """
+
+    def __contains__(self, trade_fill: TradeFillOrderDetails) -> bool:
+        return self._get(trade_fill) is not None
+
+    def add(self, trade_fill: TradeFillOrderDetails):
+        self._store(trade_fill, True)
+
+    def update(self, trade_fills: Iterable[TradeFillOrderDetails]):
+        for trade_fill in trade_fills:
+            self.add(trade_fill)
+
+
+class ExchangeOrderIdIndex(_LookupIndex):
+    """
+    Mapping of the exchange order ids of the recorded orders to their client order ids.
+    """
+
+    def __contains__(self, exchange_order_id: str) -> bool:
+        return self._get(exchange_order_id) is not None
+
+    def __getitem__(self, exchange_order_id: str) -> str:
+        client_order_id = self._get(exchange_order_id)
+        if client_order_id is None:
+            raise KeyError(exchange_order_id)
+        return client_order_id
+
+    def __setitem__(self, exchange_order_id: str, client_order_id: str):
+        self._store(exchange_order_id, client_order_id)
+
+    def get(self, exchange_order_id: str, default: Optional[str] = None) -> Optional[str]:
+        client_order_id = self._get(exchange_order_id)
+        return default if client_order_id is None else client_order_id
+
+    def update(self, exchange_order_ids: Dict[str, str]):
+        for exchange_order_id, client_order_id in exchange_order_ids.items():
+            self[exchange_order_id] = client_order_id
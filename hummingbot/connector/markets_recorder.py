@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import json
 import logging
 import os.path
@@ -86,15 +87,11 @@ class MarketsRecorder:
         self._strategy_name: str = strategy_name
         self._market_data_collection_config: MarketDataCollectionConfigMap = market_data_collection
         self._market_data_collection_task: Optional[asyncio.Task] = None
-        # Internal collection of trade fills in connector will be used for remote/local history reconciliation
+        # The trade fills and orders recorded are looked up by the connectors for remote/local history reconciliation
         for market in self._markets:
-            trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
-            market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(tf.market,
-                                                                               tf.exchange_trade_id,
-                                                                               tf.symbol) for tf in trade_fills})
-
-            exchange_order_ids = self.get_orders_for_config_and_market(self._config_file_path, market, True, 2000)
-            market.add_exchange_order_ids_from_market_recorder({o.exchange_order_id: o.id for o in exchange_order_ids})
+            market.set_market_recorder_lookups(
+                trade_fill_lookup=self.is_trade_fill_recorded,
+                exchange_order_id_lookup=functools.partial(self.get_order_id_for_exchange_order_id, market.display_name))
 
         self._create_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_create_order)
         self._fill_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fill_order)
@@ -261,6 +258,32 @@ class MarketsRecorder:
             else:
                 return query.limit(number_of_rows).all()
 
+    def is_trade_fill_recorded(self, trade_fill: TradeFillOrderDetails) -> Optional[bool]:
+        """
+        :return: True if the trade fill is recorded for the config file, None otherwise
+        """
+        with self._sql_manager.get_new_session() as session:
+            query: Query = (session
+                            .query(TradeFill.exchange_trade_id)
+                            .filter(TradeFill.config_file_path == self._config_file_path,
+                                    TradeFill.market == trade_fill.market,
+                                    TradeFill.exchange_trade_id == trade_fill.exchange_trade_id,
+                                    TradeFill.symbol == trade_fill.symbol))
+            return True if query.first() is not None else None
+
+    def get_order_id_for_exchange_order_id(self, market_name: str, exchange_order_id: str) -> Optional[str]:
+        """
+        :return: the client order id of the order recorded for the config file with the exchange order id
+        """
+        with self._sql_manager.get_new_session() as session:
+            query: Query = (session
+                            .query(Order.id)
+                            .filter(Order.config_file_path == self._config_file_path,
+                                    Order.market == market_name,
+                                    Order.exchange_order_id == exchange_order_id))
+            order = query.first()
+            return order.id if order is not None else None
+
     def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
         market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
         timestamp: int = self.db_timestamp
@@ -0,0 +1,186 @@
+import asyncio
+import itertools
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.logger import HummingbotLogger
+
+
+class OrderEntryChannelUnavailableError(IOError):
+    """
+    Raised when a request is not sent because the channel is not connected. It is safe to send the request through
+    another channel (e.g. REST) since the exchange never received it.
+    """
+    pass
+
+
+class WSOrderEntryChannel(ABC):
+    """
+    Persistent authenticated websocket connection to send order requests (create, cancel) to the exchanges providing
+    a websocket trading API, avoiding the overhead of a REST request for each of them.
+
+    Each request carries an id that the exchange echoes in its response, used to deliver the response to the request
+    waiting for it. The requests are throttled with the throttler of the connector, so they share the rate limits with
+    the REST requests. If the channel is not connected the request is not sent and `OrderEntryChannelUnavailableError`
+    is raised, for the connector to send it through REST instead.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    HEARTBEAT_TIME_INTERVAL = 30.0
+    RECONNECT_DELAY = 5.0
+
+    def __init__(self, api_factory: WebAssistantsFactory, throttler: AsyncThrottler, request_timeout: float = 10.0):
+        self._api_factory = api_factory
+        self._throttler = throttler
+        self._request_timeout = request_timeout
+        self._ws_assistant: Optional[WSAssistant] = None
+        self._connected_event = asyncio.Event()
+        self._pending_requests: Dict[str, asyncio.Future] = {}
+        self._request_ids = itertools.count(1)
+        self._connection_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(HummingbotLogger.logger_name_for_class(cls))
+        return cls._logger
+
+    @property
+    def is_connected(self) -> bool:
+        return self._ws_assistant is not None and self._connected_event.is_set()
+
+    @property
+    def pending_requests_count(self) -> int:
+        return len(self._pending_requests)
+
+    def start(self):
+        if self._connection_task is None:
+            self._connection_task = safe_ensure_future(self._connection_loop())
+
+    def stop(self):
+        if self._connection_task is not None:
+            self._connection_task.cancel()
+            self._connection_task = None
+        self._connected_event.clear()
+        self._fail_pending_requests(OrderEntryChannelUnavailableError("The order entry channel was stopped."))
+
+    async def wait_until_connected(self):
+        await self._connected_event.wait()
+
+    async def request(self, method: str, params: Dict[str, Any], limit_id: str) -> Any:
+        """
+        Sends a request and waits for its response.
+
+        :param method: the method of the websocket API
+        :param params: the parameters of the request, without authentication
+        :param limit_id: the id of the rate limit of the request in the throttler
+        :return: the result of the request, as returned by `_process_response`
+
+        :raises OrderEntryChannelUnavailableError: if the request could not be sent
+        :raises IOError: if the exchange returns an error, or the response is not received
+        """
+        if not self.is_connected:
+            raise OrderEntryChannelUnavailableError("The order entry channel is not connected.")
+
+        request_id = str(next(self._request_ids))
+        response_future = asyncio.get_event_loop().create_future()
+        self._pending_requests[request_id] = response_future
+        try:
+            async with self._throttler.execute_task(limit_id=limit_id):
+                ws_assistant = self._ws_assistant
+                if ws_assistant is None or not self._connected_event.is_set():
+                    raise OrderEntryChannelUnavailableError("The order entry channel was disconnected.")
+                payload = self._build_payload(request_id=request_id, method=method, params=params)
+                try:
+                    await ws_assistant.send(WSJSONRequest(payload=payload))
+                except (ConnectionError, RuntimeError) as send_error:
+                    raise OrderEntryChannelUnavailableError(f"Error sending the request ({send_error}).")
+            try:
+                response = await asyncio.wait_for(response_future, timeout=self._request_timeout)
+            except asyncio.TimeoutError:
+                raise IOError(f"The response to the {method} request {request_id} was not received "
+                              f"after {self._request_timeout} seconds.")
+        finally:
+            self._pending_requests.pop(request_id, None)
+
+        return self._process_response(response)
+
+    async def _connection_loop(self):
+        while True:
+            try:
+                self._ws_assistant = await self._api_factory.get_ws_assistant()
+                await self._ws_assistant.connect(ws_url=self._ws_url(), ping_timeout=self.HEARTBEAT_TIME_INTERVAL)
+                await self._on_connected(ws_assistant=self._ws_assistant)
+                self._connected_event.set()
+                self.logger().info("Connected to the websocket order entry channel.")
+                async for ws_response in self._ws_assistant.iter_messages():
+                    self._process_message(ws_response.data)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().warning(
+                    f"Unexpected error in the websocket order entry channel. Reconnecting in {self.RECONNECT_DELAY} "
+                    f"seconds, orders are sent through REST meanwhile.",
+                    exc_info=True)
+            finally:
+                await self._on_disconnected()
+            await self._sleep(self.RECONNECT_DELAY)
+
+    async def _on_disconnected(self):
+        self._connected_event.clear()
+        self._fail_pending_requests(IOError("The order entry channel was disconnected before receiving the response."))
+        ws_assistant = self._ws_assistant
+        self._ws_assistant = None
+        if ws_assistant is not None:
+            await ws_assistant.disconnect()
+
+    def _process_message(self, message: Any):
+        request_id = self._response_request_id(message)
+        response_future = self._pending_requests.get(request_id) if request_id is not None else None
+        if response_future is not None and not response_future.done():
+            response_future.set_result(message)
+
+    def _fail_pending_requests(self, exception: Exception):
+        for response_future in self._pending_requests.values():
+            if not response_future.done():
+                response_future.set_exception(exception)
+
+    async def _on_connected(self, ws_assistant: WSAssistant):
+        """
+        Called after connecting and before sending any request, e.g. to log in the session.
+        """
+        pass
+
+    async def _sleep(self, delay: float):
+        await asyncio.sleep(delay)
+
+    @abstractmethod
+    def _ws_url(self) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _build_payload(self, request_id: str, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        The message to send for a request, including its id and authentication.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def _response_request_id(self, message: Any) -> Optional[str]:
+        """
+        The id of the request a message responds to, or None if the message is not a response.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def _process_response(self, response: Any) -> Any:
+        """
+        Extracts the result of a response, raising IOError if it is an error response.
+        """
+        raise NotImplementedError
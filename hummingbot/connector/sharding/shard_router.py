@@ -0,0 +1,289 @@
+import asyncio
+import itertools
+import logging
+import multiprocessing
+from decimal import Decimal
+from multiprocessing.connection import Connection
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
+
+from hummingbot.connector.sharding.shard_worker import (
+    STOP_REQUEST,
+    USER_STREAM_EVENT,
+    USER_STREAM_STATUS,
+    run_shard_worker,
+)
+from hummingbot.connector.sharding.shared_order_book_view import SharedOrderBookView
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.connector.exchange_py_base import ExchangePyBase
+
+
+class ShardRouter:
+    """
+    Distributes the trading pairs of a connector among worker processes (shards), each one tracking the order books of
+    its trading pairs with its own event loop. The first shard also runs the user stream of the account.
+
+    The order books are published by the workers in a `SharedOrderBookView`, the user stream events are received
+    through a pipe from the worker running it, and the order requests are routed through a pipe to the worker of the
+    trading pair of the order, which sends them to the exchange.
+
+    The workers are started with forkserver (spawn where it is not available), so they don't inherit the state of the
+    strategy process: the connector factory is pickled and sent to them, and they attach to the shared memory of the
+    order book view by its name. Each worker keeps its time synchronized with the exchange, and the rate limits are
+    divided among the connectors of the workers and the one of the strategy process (see `rate_limits_shares`).
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    REQUEST_TIMEOUT = 30.0
+    WORKER_STOP_TIMEOUT = 5.0
+    WORKER_STOP_POLL_INTERVAL = 0.05
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(HummingbotLogger.logger_name_for_class(cls))
+        return cls._logger
+
+    def __init__(self,
+                 connector_factory: Callable[..., "ExchangePyBase"],
+                 trading_pairs: List[str],
+                 shards: int,
+                 run_user_stream: bool,
+                 order_book_depth: int = 20):
+        """
+        :param connector_factory: creates the connector of each worker, receiving the trading pairs of the shard as
+        `trading_pairs` keyword argument. It has to be picklable
+        :param trading_pairs: the trading pairs of the connector
+        :param shards: the number of worker processes, limited to the number of trading pairs
+        :param run_user_stream: True to run the user stream (required to trade) in the first shard
+        :param order_book_depth: the number of levels of each side of the order books published by the workers
+        """
+        self._connector_factory = connector_factory
+        self._trading_pairs = list(trading_pairs)
+        self._run_user_stream = run_user_stream
+        self._order_book_depth = order_book_depth
+        shards = max(1, min(shards, len(self._trading_pairs)))
+        self._shards_trading_pairs: List[List[str]] = [self._trading_pairs[shard::shards] for shard in range(shards)]
+        self._shard_by_trading_pair: Dict[str, int] = {
+            trading_pair: shard
+            for shard, trading_pairs in enumerate(self._shards_trading_pairs)
+            for trading_pair in trading_pairs
+        }
+        self._order_book_view: Optional[SharedOrderBookView] = None
+        self._processes: List[multiprocessing.Process] = []
+        self._command_connections: List[Connection] = []
+        self._events_connections: List[Connection] = []
+        # Request id -> (shard, response future)
+        self._pending_requests: Dict[int, Tuple[int, asyncio.Future]] = {}
+        self._lost_shards: Set[int] = set()
+        self._request_ids = itertools.count(1)
+        self._user_stream: asyncio.Queue = asyncio.Queue()
+        self._user_stream_last_recv_time = 0.0
+
+    @property
+    def shards_trading_pairs(self) -> List[List[str]]:
+        return self._shards_trading_pairs
+
+    @property
+    def order_book_view(self) -> Optional[SharedOrderBookView]:
+        return self._order_book_view
+
+    @property
+    def user_stream(self) -> asyncio.Queue:
+        """
+        The user stream events received from the worker running the user stream.
+        """
+        return self._user_stream
+
+    @property
+    def user_stream_last_recv_time(self) -> float:
+        return self._user_stream_last_recv_time
+
+    @property
+    def rate_limits_shares(self) -> int:
+        """
+        The number of connectors sharing the rate limits of the account: one per shard and the one of the strategy
+        process.
+        """
+        return len(self._shards_trading_pairs) + 1
+
+    @property
+    def is_running(self) -> bool:
+        return len(self._processes) > 0
+
+    def shard_for_trading_pair(self, trading_pair: str) -> int:
+        return self._shard_by_trading_pair.get(trading_pair, 0)
+
+    def start(self):
+        """
+        Starts the worker processes. A running router must be stopped with `stop` before starting it again.
+        """
+        if self.is_running:
+            self.logger().warning("The shard workers are already running.")
+            return
+        # Forking the strategy process would copy its threads, locks and open connections into the workers
+        start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        context = multiprocessing.get_context(start_method)
+        loop = asyncio.get_event_loop()
+        self._order_book_view = SharedOrderBookView(trading_pairs=self._trading_pairs, depth=self._order_book_depth)
+        for shard, trading_pairs in enumerate(self._shards_trading_pairs):
+            command_connection, worker_command_connection = context.Pipe(duplex=True)
+            events_connection, worker_events_connection = context.Pipe(duplex=False)
+            process = context.Process(
+                target=run_shard_worker,
+                kwargs={
+                    "shard_id": shard,
+                    "connector_factory": self._connector_factory,
+                    "trading_pairs": trading_pairs,
+                    "order_book_view": self._order_book_view,
+                    "command_connection": worker_command_connection,
+                    "events_connection": worker_events_connection,
+                    "run_user_stream": self._run_user_stream and shard == 0,
+                    "rate_limits_shares": self.rate_limits_shares,
+                },
+                name=f"shard-{shard}",
+                daemon=True,
+            )
+            process.start()
+            worker_command_connection.close()
+            worker_events_connection.close()
+            loop.add_reader(command_connection.fileno(), self._on_responses_ready, shard, command_connection)
+            loop.add_reader(events_connection.fileno(), self._on_events_ready, shard, events_connection)
+            self._processes.append(process)
+            self._command_connections.append(command_connection)
+            self._events_connections.append(events_connection)
+        self.logger().info(f"Started {len(self._processes)} shard worker processes for {len(self._trading_pairs)} "
+                           f"trading pairs.")
+
+    async def stop(self):
+        """
+        Asks all the workers to stop and waits for them without blocking the event loop. The workers still running
+        after `WORKER_STOP_TIMEOUT` seconds are terminated.
+        """
+        loop = asyncio.get_event_loop()
+        for connection in self._command_connections + self._events_connections:
+            loop.remove_reader(connection.fileno())
+        for command_connection in self._command_connections:
+            try:
+                command_connection.send(STOP_REQUEST)
+            except (BrokenPipeError, OSError):
+                pass
+        deadline = loop.time() + self.WORKER_STOP_TIMEOUT
+        while any(process.is_alive() for process in self._processes) and loop.time() < deadline:
+            await asyncio.sleep(self.WORKER_STOP_POLL_INTERVAL)
+        for process in self._processes:
+            if process.is_alive():
+                process.terminate()
+        for process in self._processes:
+            # Reaps the process, it has already exited or received SIGTERM
+            await loop.run_in_executor(None, process.join)
+        for connection in self._command_connections + self._events_connections:
+            connection.close()
+        self._processes.clear()
+        self._command_connections.clear()
+        self._events_connections.clear()
+        self._lost_shards.clear()
+        self._fail_pending_requests(IOError("The shard workers were stopped before answering the request."))
+        if self._order_book_view is not None:
+            self._order_book_view.close()
+            self._order_book_view = None
+
+    async def request(self, trading_pair: str, method: str, params: Dict[str, Any]) -> Any:
+        """
+        Sends a request to the worker of the trading pair and waits for its result.
+
+        :raises IOError: if the workers are not running, the worker of the trading pair exits, or the request fails or
+        times out in the worker
+        """
+        if not self.is_running:
+            raise IOError("The shard workers are not running.")
+        shard = self.shard_for_trading_pair(trading_pair)
+        if shard in self._lost_shards:
+            raise IOError(f"The worker of shard {shard} is not running.")
+        request_id = next(self._request_ids)
+        response_future = asyncio.get_event_loop().create_future()
+        self._pending_requests[request_id] = (shard, response_future)
+        try:
+            self._command_connections[shard].send((request_id, method, params))
+            return await asyncio.wait_for(response_future, timeout=self.REQUEST_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise IOError(f"The {method} request {request_id} for {trading_pair} was not answered by its shard "
+                          f"after {self.REQUEST_TIMEOUT} seconds.")
+        finally:
+            self._pending_requests.pop(request_id, None)
+
+    async def place_order(self,
+                          order_id: str,
+                          trading_pair: str,
+                          amount: Decimal,
+                          trade_type: TradeType,
+                          order_type: OrderType,
+                          price: Decimal,
+                          **kwargs) -> Tuple[str, float]:
+        params = {
+            "order_id": order_id,
+            "trading_pair": trading_pair,
+            "amount": amount,
+            "trade_type": trade_type,
+            "order_type": order_type,
+            "price": price,
+        }
+        params.update(kwargs)
+        return await self.request(trading_pair=trading_pair, method="place_order", params=params)
+
+    async def place_cancel(self, order_id: str, tracked_order: InFlightOrder) -> bool:
+        return await self.request(
+            trading_pair=tracked_order.trading_pair,
+            method="place_cancel",
+            params={"order_id": order_id, "tracked_order": tracked_order.to_json()})
+
+    def _on_responses_ready(self, shard: int, connection: Connection):
+        try:
+            request_id, result, error = connection.recv()
+        except (EOFError, OSError):
+            self._on_worker_connection_lost(shard)
+            return
+        _, response_future = self._pending_requests.get(request_id, (None, None))
+        if response_future is not None and not response_future.done():
+            if error is not None:
+                response_future.set_exception(IOError(error))
+            else:
+                response_future.set_result(result)
+
+    def _on_events_ready(self, shard: int, connection: Connection):
+        try:
+            message_type, content = connection.recv()
+        except (EOFError, OSError):
+            self._on_worker_connection_lost(shard)
+            return
+        if message_type == USER_STREAM_EVENT:
+            self._user_stream.put_nowait(content)
+        elif message_type == USER_STREAM_STATUS:
+            self._user_stream_last_recv_time = content
+
+    def _on_worker_connection_lost(self, shard: int):
+        """
+        Called when a connection with the worker of the shard is closed, which happens when the worker exits. The
+        requests waiting for the worker fail immediately, and the new ones for its trading pairs are rejected.
+        """
+        if shard in self._lost_shards:
+            return
+        self._lost_shards.add(shard)
+        loop = asyncio.get_event_loop()
+        loop.remove_reader(self._command_connections[shard].fileno())
+        loop.remove_reader(self._events_connections[shard].fileno())
+        self._fail_pending_requests(
+            IOError(f"The worker of shard {shard} exited before answering the request."), shard=shard)
+        self.logger().error(f"The connection with the worker process of shard {shard} was lost. Restart the connector "
+                            f"to restart its shards.")
+
+    def _fail_pending_requests(self, exception: Exception, shard: Optional[int] = None):
+        """
+        :param shard: the shard of the requests to fail, all the pending requests if None
+        """
+        for request_shard, response_future in self._pending_requests.values():
+            if (shard is None or request_shard == shard) and not response_future.done():
+                response_future.set_exception(exception)
@@ -0,0 +1,200 @@
+import asyncio
+import logging
+import signal
+from multiprocessing.connection import Connection
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from hummingbot.connector.sharding.shared_order_book_view import SharedOrderBookView
+from hummingbot.core.data_type.in_flight_order import InFlightOrder
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.connector.exchange_py_base import ExchangePyBase
+
+# Messages sent by the workers through their events connection
+USER_STREAM_EVENT = "user_stream_event"
+USER_STREAM_STATUS = "user_stream_status"
+# Request sent to the workers through their command connection to stop them
+STOP_REQUEST = "stop"
+
+
+class ShardWorker:
+    """
+    Runs in a worker process the order book tracking of a shard of the trading pairs of a connector and, in one of the
+    shards, the user stream of the account.
+
+    The worker creates its own instance of the connector for the trading pairs of the shard, limited to its share of
+    the rate limits and with its own synchronization of the time with the exchange. The order books are
+    published in the shared order book view, the user stream events are forwarded through the events connection, and
+    the order requests received through the command connection (routed by the `ShardRouter` of the strategy process)
+    are sent with the connector of the worker. Each request is a tuple (request id, method, parameters) and is
+    answered with a tuple (request id, result, error message).
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    PUBLISH_INTERVAL = 0.01
+    USER_STREAM_STATUS_INTERVAL = 1.0
+    TIME_SYNCHRONIZER_UPDATE_INTERVAL = 60.0
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(HummingbotLogger.logger_name_for_class(cls))
+        return cls._logger
+
+    def __init__(self,
+                 shard_id: int,
+                 connector_factory: Callable[..., "ExchangePyBase"],
+                 trading_pairs: List[str],
+                 order_book_view: SharedOrderBookView,
+                 command_connection: Connection,
+                 events_connection: Connection,
+                 run_user_stream: bool,
+                 rate_limits_shares: int):
+        self._shard_id = shard_id
+        self._connector_factory = connector_factory
+        self._trading_pairs = trading_pairs
+        self._order_book_view = order_book_view
+        self._command_connection = command_connection
+        self._events_connection = events_connection
+        self._run_user_stream = run_user_stream
+        self._rate_limits_shares = rate_limits_shares
+        self._connector: Optional["ExchangePyBase"] = None
+        self._published_versions: Dict[str, Tuple[int, int, float, float]] = {}
+        self._stopped: Optional[asyncio.Event] = None
+
+    @property
+    def connector(self) -> Optional["ExchangePyBase"]:
+        return self._connector
+
+    def run(self):
+        # The strategy process handles the interruptions and stops the workers
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self._run())
+        finally:
+            loop.close()
+
+    async def _run(self):
+        self._stopped = asyncio.Event()
+        self._connector = self._connector_factory(trading_pairs=self._trading_pairs)
+        self._connector._share_rate_limits(shares=self._rate_limits_shares)
+        # The orders of the shard are signed with the time of the worker
+        await self._connector._update_time_synchronizer(pass_on_non_cancelled_error=True)
+        self._connector.order_book_tracker.start()
+        if self._connector.is_trading_required and self._connector._order_entry_channel is not None:
+            self._connector._order_entry_channel.start()
+        tasks = [safe_ensure_future(self._publish_order_books_loop()),
+                 safe_ensure_future(self._update_time_synchronizer_loop())]
+        if self._run_user_stream:
+            tasks.append(safe_ensure_future(self._connector._user_stream_tracker.start()))
+            tasks.append(safe_ensure_future(self._forward_user_stream_loop()))
+            tasks.append(safe_ensure_future(self._user_stream_status_loop()))
+        loop = asyncio.get_event_loop()
+        loop.add_reader(self._command_connection.fileno(), self._on_command_connection_ready)
+        self.logger().info(f"Shard {self._shard_id} started tracking {len(self._trading_pairs)} trading pairs.")
+        try:
+            await self._stopped.wait()
+        finally:
+            loop.remove_reader(self._command_connection.fileno())
+            for task in tasks:
+                task.cancel()
+            self._connector.order_book_tracker.stop()
+            if self._connector._order_entry_channel is not None:
+                self._connector._order_entry_channel.stop()
+
+    def _on_command_connection_ready(self):
+        try:
+            request = self._command_connection.recv()
+        except (EOFError, OSError):
+            # The strategy process closed the connection
+            self._stopped.set()
+            return
+        if request == STOP_REQUEST:
+            self._stopped.set()
+        else:
+            safe_ensure_future(self._process_request(request))
+
+    async def _process_request(self, request: Tuple[int, str, Dict[str, Any]]):
+        request_id, method, params = request
+        try:
+            result = await self._execute_request(method=method, params=params)
+            response = (request_id, result, None)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_exception:
+            response = (request_id, None, f"{type(request_exception).__name__}: {request_exception}")
+        self._command_connection.send(response)
+
+    async def _execute_request(self, method: str, params: Dict[str, Any]) -> Any:
+        if method == "place_order":
+            return await self._connector._place_order(**params)
+        if method == "place_cancel":
+            tracked_order = InFlightOrder.from_json(params["tracked_order"])
+            return await self._connector._place_cancel(order_id=params["order_id"], tracked_order=tracked_order)
+        raise ValueError(f"Unknown request method {method}.")
+
+    async def _publish_order_books_loop(self):
+        while True:
+            try:
+                self._publish_order_books()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().exception(f"Unexpected error publishing the order books of shard {self._shard_id}.")
+            await self._sleep(self.PUBLISH_INTERVAL)
+
+    def _publish_order_books(self):
+        for trading_pair, order_book in self._connector.order_books.items():
+            version = (order_book.snapshot_uid,
+                       order_book.last_diff_uid,
+                       order_book.last_applied_trade,
+                       order_book.last_trade_price_rest_updated)
+            if self._published_versions.get(trading_pair) != version:
+                self._order_book_view.publish_order_book(trading_pair=trading_pair, order_book=order_book)
+                self._published_versions[trading_pair] = version
+
+    async def _update_time_synchronizer_loop(self):
+        while True:
+            await self._sleep(self.TIME_SYNCHRONIZER_UPDATE_INTERVAL)
+            await self._connector._update_time_synchronizer(pass_on_non_cancelled_error=True)
+
+    async def _forward_user_stream_loop(self):
+        user_stream: asyncio.Queue = self._connector._user_stream_tracker.user_stream
+        while True:
+            event_message = await user_stream.get()
+            self._events_connection.send((USER_STREAM_EVENT, event_message))
+
+    async def _user_stream_status_loop(self):
+        while True:
+            self._events_connection.send((USER_STREAM_STATUS, self._connector._user_stream_tracker.last_recv_time))
+            await self._sleep(self.USER_STREAM_STATUS_INTERVAL)
+
+    async def _sleep(self, delay: float):
+        await asyncio.sleep(delay)
+
+
+def run_shard_worker(shard_id: int,
+                     connector_factory: Callable[..., "ExchangePyBase"],
+                     trading_pairs: List[str],
+                     order_book_view: SharedOrderBookView,
+                     command_connection: Connection,
+                     events_connection: Connection,
+                     run_user_stream: bool,
+                     rate_limits_shares: int):
+    """
+    Entry point of the worker processes.
+    """
+    ShardWorker(
+        shard_id=shard_id,
+        connector_factory=connector_factory,
+        trading_pairs=trading_pairs,
+        order_book_view=order_book_view,
+        command_connection=command_connection,
+        events_connection=events_connection,
+        run_user_stream=run_user_stream,
+        rate_limits_shares=rate_limits_shares,
+    ).run()
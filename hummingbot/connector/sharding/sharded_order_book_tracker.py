@@ -0,0 +1,75 @@
+import asyncio
+import math
+from typing import Dict, List, Optional
+
+from hummingbot.connector.sharding.shard_router import ShardRouter
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.utils.async_utils import safe_ensure_future
+
+
+class ShardedOrderBookTracker(OrderBookTracker):
+    """
+    Order book tracker of the strategy process when the order books are tracked by shard worker processes.
+
+    The order books are copies of the top levels of the books of the workers, refreshed from the shared order book
+    view of the shard router, so the strategies keep reading them through `get_order_book` and `get_price`. The trades
+    are not forwarded by the workers, only the last trade price of each book.
+    """
+    REFRESH_INTERVAL = 0.05
+
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 router: ShardRouter,
+                 domain: Optional[str] = None):
+        super().__init__(data_source=data_source, trading_pairs=trading_pairs, domain=domain)
+        self._router = router
+        self._refreshed_versions: Dict[str, int] = {}
+        self._refresh_order_books_task: Optional[asyncio.Task] = None
+
+    def start(self):
+        self.stop()
+        self._refresh_order_books_task = safe_ensure_future(self._refresh_order_books_loop())
+
+    def stop(self):
+        if self._refresh_order_books_task is not None:
+            self._refresh_order_books_task.cancel()
+            self._refresh_order_books_task = None
+        self._refreshed_versions.clear()
+        super().stop()
+
+    def refresh_order_books(self):
+        """
+        Copies the order books published by the workers since the last refresh.
+        """
+        order_book_view = self._router.order_book_view
+        if order_book_view is None:
+            return
+        for trading_pair in self._trading_pairs:
+            if order_book_view.version(trading_pair) == self._refreshed_versions.get(trading_pair, 0):
+                continue
+            snapshot = order_book_view.read(trading_pair)
+            if snapshot is None:
+                continue
+            order_book: Optional[OrderBook] = self._order_books.get(trading_pair)
+            if order_book is None:
+                order_book = self._data_source.order_book_create_function()
+                self._order_books[trading_pair] = order_book
+            order_book.apply_numpy_snapshot(snapshot.bids, snapshot.asks)
+            if not math.isnan(snapshot.last_trade_price):
+                order_book.last_trade_price = snapshot.last_trade_price
+            self._refreshed_versions[trading_pair] = snapshot.version
+        if not self._order_books_initialized.is_set() and len(self._order_books) == len(self._trading_pairs):
+            self._order_books_initialized.set()
+
+    async def _refresh_order_books_loop(self):
+        while True:
+            try:
+                self.refresh_order_books()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().exception("Unexpected error refreshing the order books from the shard workers.")
+            await self._sleep(delay=self.REFRESH_INTERVAL)
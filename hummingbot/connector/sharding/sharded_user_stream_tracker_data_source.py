@@ -0,0 +1,24 @@
+import asyncio
+
+from hummingbot.connector.sharding.shard_router import ShardRouter
+from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+
+
+class ShardedUserStreamTrackerDataSource(UserStreamTrackerDataSource):
+    """
+    User stream of the strategy process when the user stream is run by a shard worker process. The events received
+    by the worker are forwarded by the shard router.
+    """
+
+    def __init__(self, router: ShardRouter):
+        super().__init__()
+        self._router = router
+
+    @property
+    def last_recv_time(self) -> float:
+        return self._router.user_stream_last_recv_time
+
+    async def listen_for_user_stream(self, output: asyncio.Queue):
+        while True:
+            event_message = await self._router.user_stream.get()
+            output.put_nowait(event_message)
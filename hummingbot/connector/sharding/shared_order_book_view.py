@@ -0,0 +1,149 @@
+from itertools import islice
+from multiprocessing import shared_memory
+from typing import Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+
+
+class SharedOrderBookSnapshot(NamedTuple):
+    # Incremented with each publication of the order book
+    version: int
+    last_trade_price: float
+    # [price, amount, update_id] of each level, best first
+    bids: np.ndarray
+    asks: np.ndarray
+
+
+class SharedOrderBookView:
+    """
+    Top of book and depth of a set of order books, in a shared memory block written by the shard worker process
+    tracking the books and read by the strategy process.
+
+    Each trading pair has a row with its sequence number, the last trade price, the number of levels of each side and
+    the [price, amount, update_id] of the top `depth` levels of each side. The writer increments the sequence before
+    and after writing a row (seqlock), so the row is being written while the sequence is odd. The reader copies the
+    row and retries if the sequence was odd or changed during the copy.
+
+    The block is created by the strategy process and the view is pickled by name, so the worker processes receiving it
+    attach to the same block. The creator releases it with `close`.
+    """
+    SEQUENCE = 0
+    LAST_TRADE_PRICE = 1
+    BIDS_COUNT = 2
+    ASKS_COUNT = 3
+    HEADER_SIZE = 4
+    LEVEL_SIZE = 3
+    READ_ATTEMPTS = 100
+
+    def __init__(self, trading_pairs: List[str], depth: int = 20):
+        row_size = self.HEADER_SIZE + 2 * depth * self.LEVEL_SIZE
+        self._attach(
+            trading_pairs=trading_pairs,
+            depth=depth,
+            block=shared_memory.SharedMemory(
+                create=True, size=max(1, len(trading_pairs)) * row_size * np.dtype(np.float64).itemsize),
+            created=True)
+        self._buffer[:] = 0
+
+    def __getstate__(self):
+        return {"trading_pairs": self._trading_pairs, "depth": self._depth, "name": self._shared_memory.name}
+
+    def __setstate__(self, state):
+        self._attach(
+            trading_pairs=state["trading_pairs"],
+            depth=state["depth"],
+            block=shared_memory.SharedMemory(name=state["name"]),
+            created=False)
+
+    @property
+    def trading_pairs(self) -> List[str]:
+        return self._trading_pairs
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    def publish(self, trading_pair: str, bids: np.ndarray, asks: np.ndarray, last_trade_price: float):
+        """
+        :param bids: [price, amount, update_id] of the bid levels, best first. Only the top `depth` ones are published
+        :param asks: [price, amount, update_id] of the ask levels, best first. Only the top `depth` ones are published
+        """
+        bids = bids[:self._depth]
+        asks = asks[:self._depth]
+        asks_start = self.HEADER_SIZE + self._depth * self.LEVEL_SIZE
+        row = self._buffer[self._rows[trading_pair]]
+        row[self.SEQUENCE] += 1
+        row[self.LAST_TRADE_PRICE] = last_trade_price
+        row[self.BIDS_COUNT] = len(bids)
+        row[self.ASKS_COUNT] = len(asks)
+        row[self.HEADER_SIZE:self.HEADER_SIZE + bids.size] = bids.ravel()
+        row[asks_start:asks_start + asks.size] = asks.ravel()
+        row[self.SEQUENCE] += 1
+
+    def publish_order_book(self, trading_pair: str, order_book: OrderBook):
+        self.publish(
+            trading_pair=trading_pair,
+            bids=self._levels(order_book.bid_entries()),
+            asks=self._levels(order_book.ask_entries()),
+            last_trade_price=order_book.last_trade_price)
+
+    def version(self, trading_pair: str) -> int:
+        """
+        The number of publications of the order book, 0 if it has not been published yet.
+        """
+        return int(self._buffer[self._rows[trading_pair], self.SEQUENCE]) // 2
+
+    def read(self, trading_pair: str) -> Optional[SharedOrderBookSnapshot]:
+        """
+        :return: a consistent copy of the order book, or None if it has not been published yet or it is being written
+        continuously
+        """
+        row = self._buffer[self._rows[trading_pair]]
+        for _ in range(self.READ_ATTEMPTS):
+            sequence = row[self.SEQUENCE]
+            if sequence % 2 == 1:
+                continue
+            row_copy = row.copy()
+            if row[self.SEQUENCE] != sequence:
+                continue
+            if sequence == 0:
+                return None
+            bids_count = int(row_copy[self.BIDS_COUNT])
+            asks_count = int(row_copy[self.ASKS_COUNT])
+            asks_start = self.HEADER_SIZE + self._depth * self.LEVEL_SIZE
+            return SharedOrderBookSnapshot(
+                version=int(sequence) // 2,
+                last_trade_price=float(row_copy[self.LAST_TRADE_PRICE]),
+                bids=row_copy[self.HEADER_SIZE:self.HEADER_SIZE + bids_count * self.LEVEL_SIZE].reshape(
+                    (bids_count, self.LEVEL_SIZE)),
+                asks=row_copy[asks_start:asks_start + asks_count * self.LEVEL_SIZE].reshape(
+                    (asks_count, self.LEVEL_SIZE)))
+        return None
+
+    def close(self):
+        """
+        Releases the shared memory block of the view, and removes it if the view created it.
+        """
+        if self._shared_memory is not None:
+            # The views of the buffer have to be released before closing it
+            self._buffer = None
+            self._shared_memory.close()
+            if self._created:
+                self._shared_memory.unlink()
+            self._shared_memory = None
+
+    def _attach(self, trading_pairs: List[str], depth: int, block: shared_memory.SharedMemory, created: bool):
+        self._trading_pairs = list(trading_pairs)
+        self._depth = depth
+        self._rows: Dict[str, int] = {trading_pair: row for row, trading_pair in enumerate(self._trading_pairs)}
+        self._row_size = self.HEADER_SIZE + 2 * depth * self.LEVEL_SIZE
+        self._shared_memory: Optional[shared_memory.SharedMemory] = block
+        self._created = created
+        self._buffer: Optional[np.ndarray] = np.ndarray(
+            (len(self._trading_pairs), self._row_size), dtype=np.float64, buffer=self._shared_memory.buf)
+
+    def _levels(self, entries) -> np.ndarray:
+        levels = [[row.price, row.amount, row.update_id] for row in islice(entries, self._depth)]
+        return np.array(levels, dtype=np.float64).reshape((len(levels), self.LEVEL_SIZE))
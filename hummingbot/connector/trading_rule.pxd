@@ -1,3 +1,14 @@
+cdef class OrderQuantizer:
+    cdef:
+        readonly object min_price_increment
+        readonly object min_base_amount_increment
+        readonly object price_quantum
+        readonly object size_quantum
+
+    cdef object c_quantize_price(self, object price)
+    cdef object c_quantize_amount(self, object amount)
+
+
 cdef class TradingRule:
     cdef:
         public str trading_pair
@@ -13,3 +24,4 @@ cdef class TradingRule:
         public bint supports_market_orders             # if market order is allowed for this trading pair
         public object buy_order_collateral_token       # Indicates the collateral token used for buy orders
         public object sell_order_collateral_token      # Indicates the collateral token used for sell orders
+        OrderQuantizer _quantizer
@@ -1,5 +1,5 @@
 from decimal import Decimal
-from typing import Optional
+from typing import List, Optional
 
 from hummingbot.connector.utils import split_hb_trading_pair
 
@@ -8,6 +8,46 @@ s_decimal_max = Decimal("1e56")
 s_decimal_min = Decimal(1) / s_decimal_max
 
 
+cdef class OrderQuantizer:
+    """
+    Quantizes the order prices and amounts of a trading pair to the increments of its trading rule, with the quanta
+    parsed once instead of at every call. The quantized values are the same as the ones of
+    `ConnectorBase.quantize_order_price` and `ConnectorBase.quantize_order_amount` with the trading rule increments.
+    """
+
+    def __init__(self, min_price_increment: Decimal, min_base_amount_increment: Decimal):
+        self.min_price_increment = min_price_increment
+        self.min_base_amount_increment = min_base_amount_increment
+        self.price_quantum = Decimal(min_price_increment)
+        self.size_quantum = Decimal(min_base_amount_increment)
+
+    cdef object c_quantize_price(self, object price):
+        if price.is_nan():
+            return price
+        return (price // self.price_quantum) * self.price_quantum
+
+    cdef object c_quantize_amount(self, object amount):
+        return (amount // self.size_quantum) * self.size_quantum
+
+    def quantize_price(self, price: Decimal) -> Decimal:
+        return self.c_quantize_price(price)
+
+    def quantize_amount(self, amount: Decimal) -> Decimal:
+        return self.c_quantize_amount(amount)
+
+    def quantize_prices(self, prices: List[Decimal]) -> List[Decimal]:
+        """
+        Quantizes the prices of several orders, like the levels of an order ladder.
+        """
+        return [self.c_quantize_price(price) for price in prices]
+
+    def quantize_amounts(self, amounts: List[Decimal]) -> List[Decimal]:
+        """
+        Quantizes the amounts of several orders, like the levels of an order ladder.
+        """
+        return [self.c_quantize_amount(amount) for amount in amounts]
+
+
 cdef class TradingRule:
     def __init__(self,
                  trading_pair: str,
@@ -38,6 +78,17 @@ cdef class TradingRule:
         self.buy_order_collateral_token = buy_order_collateral_token or quote_token
         self.sell_order_collateral_token = sell_order_collateral_token or quote_token
 
+    @property
+    def quantizer(self) -> OrderQuantizer:
+        """
+        The quantizer of the order prices and amounts. It is created again if the increments of the rule change.
+        """
+        if (self._quantizer is None
+                or self._quantizer.min_price_increment is not self.min_price_increment
+                or self._quantizer.min_base_amount_increment is not self.min_base_amount_increment):
+            self._quantizer = OrderQuantizer(self.min_price_increment, self.min_base_amount_increment)
+        return self._quantizer
+
     def __repr__(self) -> str:
         return f"TradingRule(trading_pair='{self.trading_pair}', " \
                f"min_order_size={self.min_order_size}, " \
@@ -45,6 +45,15 @@ class OrderUpdate(NamedTuple):
     misc_updates: Optional[Dict[str, Any]] = None
 
 
+class OrderAmendment(NamedTuple):
+    trading_pair: str
+    update_timestamp: float  # seconds
+    price: Decimal
+    amount: Decimal  # total order amount, including the amount already filled
+    client_order_id: Optional[str] = None
+    exchange_order_id: Optional[str] = None
+
+
 class TradeUpdate(NamedTuple):
     trade_id: str
     client_order_id: str
@@ -124,6 +133,9 @@ class InFlightOrder:
 
         self.order_fills: Dict[str, TradeUpdate] = {}  # Dict[trade_id, TradeUpdate]
 
+        # The amendment requested to the exchange and not confirmed yet
+        self.pending_amendment: Optional[OrderAmendment] = None
+
         self.exchange_order_id_update_event = asyncio.Event()
         if self.exchange_order_id:
             self.exchange_order_id_update_event.set()
@@ -177,6 +189,10 @@ class InFlightOrder:
     def is_pending_cancel_confirmation(self) -> bool:
         return self.current_state == OrderState.PENDING_CANCEL
 
+    @property
+    def is_pending_amendment(self) -> bool:
+        return self.pending_amendment is not None
+
     @property
     def is_open(self) -> bool:
         return self.current_state in {
@@ -351,6 +367,30 @@ class InFlightOrder:
 
         return updated
 
+    def update_with_amendment(self, amendment: OrderAmendment) -> bool:
+        """
+        Updates the in flight order with the new price and amount of an amendment accepted by the exchange
+        :return: True if the order gets updated otherwise False
+        """
+        if (amendment.client_order_id != self.client_order_id
+                and amendment.exchange_order_id != self.exchange_order_id):
+            return False
+
+        self.pending_amendment = None
+        prev_data = (self.price, self.amount, self.exchange_order_id)
+
+        if amendment.exchange_order_id is not None and amendment.exchange_order_id != self.exchange_order_id:
+            self.update_exchange_order_id(amendment.exchange_order_id)
+        self.price = amendment.price
+        self.amount = amendment.amount
+
+        updated: bool = prev_data != (self.price, self.amount, self.exchange_order_id)
+
+        if updated:
+            self.last_update_timestamp = amendment.update_timestamp
+
+        return updated
+
     def update_with_trade_update(self, trade_update: TradeUpdate) -> bool:
         """
         Updates the in flight order with a trade update (from REST API or WS API)
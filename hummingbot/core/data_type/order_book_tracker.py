@@ -3,7 +3,7 @@ import logging
 import time
 from collections import defaultdict, deque
 from enum import Enum
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import Deque, Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 
@@ -23,6 +23,10 @@ class OrderBookTrackerDataSourceType(Enum):
 
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    RESYNC_DIFFS_BUFFER_SIZE: int = 1000
+    # Minimum delay between the snapshot requests to resynchronize order books, to spread them when several books
+    # need a resync at the same time (e.g. after a reconnection)
+    RESYNC_SNAPSHOT_REQUEST_INTERVAL: float = 1.0
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -45,6 +49,10 @@ class OrderBookTracker:
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._out_of_sync_trading_pairs: Set[str] = set()
+        self._resync_diffs: Dict[str, Deque[OrderBookMessage]] = defaultdict(
+            lambda: deque(maxlen=self.RESYNC_DIFFS_BUFFER_SIZE))
+        self._order_book_resync_queue: asyncio.Queue = asyncio.Queue()
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -55,6 +63,7 @@ class OrderBookTracker:
         self._order_book_snapshot_router_task: Optional[asyncio.Task] = None
         self._update_last_trade_prices_task: Optional[asyncio.Task] = None
         self._order_book_stream_listener_task: Optional[asyncio.Task] = None
+        self._order_book_resync_task: Optional[asyncio.Task] = None
 
     @property
     def data_source(self) -> OrderBookTrackerDataSource:
@@ -68,6 +77,24 @@ class OrderBookTracker:
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def out_of_sync_trading_pairs(self) -> Set[str]:
+        return set(self._out_of_sync_trading_pairs)
+
+    def queue_depths(self) -> Dict[str, int]:
+        """
+        The number of messages waiting to be processed in each queue of the tracker and its data source.
+        """
+        queue_depths = self._data_source.queue_depths()
+        queue_depths.update({
+            "order_book_diff_stream": self._order_book_diff_stream.qsize(),
+            "order_book_snapshot_stream": self._order_book_snapshot_stream.qsize(),
+            "order_book_trade_stream": self._order_book_trade_stream.qsize(),
+            "order_book_resyncs": self._order_book_resync_queue.qsize(),
+            "order_book_tracking": sum(queue.qsize() for queue in self._tracking_message_queues.values()),
+        })
+        return queue_depths
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -104,6 +131,9 @@ class OrderBookTracker:
         self._update_last_trade_prices_task = safe_ensure_future(
             self._update_last_trade_prices_loop()
         )
+        self._order_book_resync_task = safe_ensure_future(
+            self._order_book_resync_loop()
+        )
 
     def stop(self):
         if self._init_order_books_task is not None:
@@ -133,6 +163,9 @@ class OrderBookTracker:
             self._update_last_trade_prices_task = None
         if self._order_book_stream_listener_task is not None:
             self._order_book_stream_listener_task.cancel()
+        if self._order_book_resync_task is not None:
+            self._order_book_resync_task.cancel()
+            self._order_book_resync_task = None
         if len(self._tracking_tasks) > 0:
             for _, task in self._tracking_tasks.items():
                 task.cancel()
@@ -272,9 +305,27 @@ class OrderBookTracker:
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
+                    if trading_pair in self._out_of_sync_trading_pairs:
+                        # Kept to be replayed on top of the snapshot requested to resynchronize the book
+                        self._resync_diffs[trading_pair].append(message)
+                        continue
+                    last_update_id = max(order_book.snapshot_uid, order_book.last_diff_uid)
+                    if self._data_source.is_order_book_diff_stale(last_update_id, message):
+                        # Already included in the order book, e.g. a diff saved before the first snapshot
+                        continue
+                    if not self._data_source.is_order_book_diff_in_sequence(last_update_id, message):
+                        self._schedule_order_book_resync(
+                            trading_pair=trading_pair,
+                            reason=f"missing updates between {last_update_id} and {message.first_update_id}")
+                        self._resync_diffs[trading_pair].append(message)
+                        continue
                     order_book.apply_diffs(message.bids, message.asks, message.update_id)
                     past_diffs_window.append(message)
                     diff_messages_accepted += 1
+                    if not self._data_source.is_order_book_consistent(order_book, message):
+                        self._schedule_order_book_resync(
+                            trading_pair=trading_pair,
+                            reason=f"inconsistent order book after update {message.update_id}")
 
                     # Output some statistics periodically.
                     now: float = time.time()
@@ -283,8 +334,11 @@ class OrderBookTracker:
                         diff_messages_accepted = 0
                     last_message_timestamp = now
                 elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[OrderBookMessage] = list(past_diffs_window)
-                    order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                    if trading_pair in self._out_of_sync_trading_pairs:
+                        self._resync_order_book(trading_pair=trading_pair, snapshot=message)
+                    else:
+                        past_diffs: List[OrderBookMessage] = list(past_diffs_window)
+                        order_book.restore_from_snapshot_and_diffs(message, past_diffs)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -295,6 +349,67 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    def _schedule_order_book_resync(self, trading_pair: str, reason: str):
+        """
+        Stops applying diffs to the order book until it is restored from a new snapshot. The diffs received meanwhile
+        are buffered to be replayed on top of the snapshot.
+        """
+        if trading_pair not in self._out_of_sync_trading_pairs:
+            self.logger().warning(f"The order book for {trading_pair} is out of sync ({reason}). "
+                                  f"Requesting a new snapshot.")
+            self._out_of_sync_trading_pairs.add(trading_pair)
+            self._resync_diffs[trading_pair].clear()
+            self._order_book_resync_queue.put_nowait(trading_pair)
+
+    def _resync_order_book(self, trading_pair: str, snapshot: OrderBookMessage):
+        order_book: OrderBook = self._order_books[trading_pair]
+        resync_diffs: Deque[OrderBookMessage] = self._resync_diffs[trading_pair]
+        replay_diffs: List[OrderBookMessage] = [diff for diff in resync_diffs if diff.update_id > snapshot.update_id]
+
+        last_update_id = snapshot.update_id
+        for diff in replay_diffs:
+            if not self._data_source.is_order_book_diff_in_sequence(last_update_id, diff):
+                # The buffered diffs don't continue the snapshot, a newer snapshot is required
+                resync_diffs.clear()
+                resync_diffs.extend(replay_diffs)
+                self._order_book_resync_queue.put_nowait(trading_pair)
+                return
+            last_update_id = diff.update_id
+
+        order_book.restore_from_snapshot_and_diffs(snapshot, replay_diffs)
+        self._past_diffs_windows[trading_pair].extend(replay_diffs)
+        resync_diffs.clear()
+        self._out_of_sync_trading_pairs.discard(trading_pair)
+        self.logger().info(f"Resynchronized the order book for {trading_pair}.")
+
+        if len(replay_diffs) > 0 and not self._data_source.is_order_book_consistent(order_book, replay_diffs[-1]):
+            self._schedule_order_book_resync(
+                trading_pair=trading_pair,
+                reason=f"inconsistent order book after update {replay_diffs[-1].update_id}")
+
+    async def _order_book_resync_loop(self):
+        """
+        Requests the snapshots for the order books that are out of sync, one at a time.
+        """
+        while True:
+            trading_pair: str = await self._order_book_resync_queue.get()
+            if trading_pair not in self._out_of_sync_trading_pairs:
+                continue
+            try:
+                snapshot: OrderBookMessage = await self._data_source.get_order_book_snapshot(trading_pair)
+                self._tracking_message_queues[trading_pair].put_nowait(snapshot)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error requesting the order book snapshot for {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg=f"Unexpected error requesting the order book snapshot for {trading_pair}. "
+                                    f"Retrying after {self.RESYNC_SNAPSHOT_REQUEST_INTERVAL} seconds."
+                )
+                self._order_book_resync_queue.put_nowait(trading_pair)
+            await self._sleep(delay=self.RESYNC_SNAPSHOT_REQUEST_INTERVAL)
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
@@ -8,6 +8,7 @@ from typing import Any, Callable, Dict, List, Optional
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.core.web_assistant.ws_hub import WSHub
 from hummingbot.logger import HummingbotLogger
 
 
@@ -24,6 +25,7 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         self._trading_pairs: List[str] = trading_pairs
         self._order_book_create_function = lambda: OrderBook()
         self._message_queue: Dict[str, asyncio.Queue] = defaultdict(asyncio.Queue)
+        self._ws_hub: Optional[WSHub] = None
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -39,6 +41,19 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
     def order_book_create_function(self, func: Callable[[], OrderBook]):
         self._order_book_create_function = func
 
+    def queue_depths(self) -> Dict[str, int]:
+        """
+        The number of messages waiting to be processed in each message queue, for diagnostics.
+        """
+        return {f"{queue_key}_messages": queue.qsize() for queue_key, queue in self._message_queue.items()}
+
+    def use_ws_hub(self, ws_hub: WSHub):
+        """
+        Receives the public channels through the shared connections of the hub instead of a dedicated connection.
+        The data source has to implement `_ws_hub_channels`.
+        """
+        self._ws_hub = ws_hub
+
     @abstractmethod
     async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
         """
@@ -67,11 +82,62 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
         return order_book
 
+    async def get_order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        """
+        Requests the full order book from the exchange, used by the order book tracker to resynchronize an order book
+
+        :param trading_pair: the trading pair for which the snapshot has to be retrieved
+
+        :return: a snapshot message with the current order book in the exchange
+        """
+        return await self._order_book_snapshot(trading_pair=trading_pair)
+
+    def is_order_book_diff_in_sequence(self, last_update_id: int, diff_message: OrderBookMessage) -> bool:
+        """
+        Checks that no update was missed between the last update applied to an order book and a diff message.
+        Exchanges that provide the first and last update ids of each diff should implement it, so that the order
+        book tracker requests a new snapshot only when a gap is detected.
+
+        :param last_update_id: the update id of the last snapshot or diff applied to the order book
+        :param diff_message: the next diff message to apply
+
+        :return: True if the diff continues the sequence of updates (always True by default)
+        """
+        return True
+
+    def is_order_book_diff_stale(self, last_update_id: int, diff_message: OrderBookMessage) -> bool:
+        """
+        Checks if all the updates of a diff message were already applied to an order book, e.g. a diff received
+        before the snapshot the order book was built from. Stale diffs are dropped by the order book tracker, since
+        applying them would overwrite newer levels with older ones.
+
+        :param last_update_id: the update id of the last snapshot or diff applied to the order book
+        :param diff_message: the next diff message to apply
+
+        :return: True if the diff has to be dropped (always False by default)
+        """
+        return False
+
+    def is_order_book_consistent(self, order_book: OrderBook, diff_message: OrderBookMessage) -> bool:
+        """
+        Validates an order book after applying a diff message, e.g. with the checksum of the top levels sent by the
+        exchange in the message. An inconsistent order book is resynchronized with a new snapshot.
+
+        :param order_book: the order book after applying the diff
+        :param diff_message: the diff message just applied
+
+        :return: True if the order book matches the exchange (always True by default)
+        """
+        return True
+
     async def listen_for_subscriptions(self):
         """
         Connects to the trade events and order diffs websocket endpoints and listens to the messages sent by the
         exchange. Each message is stored in its own queue.
         """
+        if self._ws_hub is not None:
+            await self._listen_for_subscriptions_through_hub()
+            return
         ws: Optional[WSAssistant] = None
         while True:
             try:
@@ -90,6 +156,23 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
             finally:
                 await self._on_order_stream_interruption(websocket_assistant=ws)
 
+    async def _listen_for_subscriptions_through_hub(self):
+        hub_messages_queue = asyncio.Queue()
+        channels = await self._ws_hub_channels()
+        self._ws_hub.subscribe(channels=channels, queue=hub_messages_queue)
+        self.logger().info("Subscribed to public order book and trade channels through the shared connection...")
+        try:
+            while True:
+                data = await hub_messages_queue.get()
+                if data is None:
+                    # The hub notifies disconnections with None, and subscribes again once reconnected
+                    continue
+                channel: str = self._channel_originating_message(event_message=data)
+                if channel in self._get_messages_queue_keys():
+                    self._message_queue[channel].put_nowait(data)
+        finally:
+            self._ws_hub.unsubscribe(channels=channels, queue=hub_messages_queue)
+
     async def listen_for_order_book_diffs(self, ev_loop: asyncio.AbstractEventLoop, output: asyncio.Queue):
         """
         Reads the order diffs events queue. For each event creates a diff message instance and adds it to the
@@ -207,6 +290,12 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    async def _ws_hub_channels(self) -> List[str]:
+        """
+        The channels of the trade events and diff orders events in the websocket hub, when using it.
+        """
+        raise NotImplementedError
+
     def _channel_originating_message(self, event_message: Dict[str, Any]) -> str:
         """
         Identifies the channel for a particular event message. Used to find the correct queue to add the message in
@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from typing import Optional
+from typing import Dict, Optional
 
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
@@ -38,3 +38,9 @@ class UserStreamTracker:
     @property
     def user_stream(self) -> asyncio.Queue:
         return self._user_stream
+
+    def queue_depths(self) -> Dict[str, int]:
+        """
+        The number of user stream messages waiting to be processed, for diagnostics.
+        """
+        return {"user_stream": self._user_stream.qsize()}
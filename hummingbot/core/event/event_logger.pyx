@@ -9,22 +9,30 @@ from typing import (
 
 from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderFilledEvent
+from hummingbot.core.event.fill_history import FillHistory
 
 cdef class EventLogger(EventListener):
-    def __init__(self, event_source: Optional[str] = None):
+    def __init__(self, event_source: Optional[str] = None, fill_history: Optional[FillHistory] = None):
         super().__init__()
         self._event_source = event_source
         # We limit the amount of events we keep reference to the most recent ones
-        # But we keep all references to order fill events, because they are required for PnL calculation
+        # The order fill events required for PnL calculation are kept in the fill history, that keeps the most recent
+        # ones in memory and spills the older ones to disk
         self._generic_logged_events = deque(maxlen=50)
-        self._order_filled_logged_events = deque()
-        self._logged_events = {OrderFilledEvent: self._order_filled_logged_events}
+        self._fill_history = fill_history if fill_history is not None else FillHistory()
         self._waiting = {}
         self._wait_returns = {}
 
     @property
     def event_log(self) -> List[any]:
-        return list(self._generic_logged_events) + list(self._order_filled_logged_events)
+        """
+        The most recent events, including the order fill events kept in memory by the fill history.
+        """
+        return list(self._generic_logged_events) + self._fill_history.recent_fills
+
+    @property
+    def fill_history(self) -> FillHistory:
+        return self._fill_history
 
     @property
     def event_source(self) -> str:
@@ -32,7 +40,7 @@ cdef class EventLogger(EventListener):
 
     def clear(self):
         self._generic_logged_events.clear()
-        self._order_filled_logged_events.clear()
+        self._fill_history.clear()
 
     async def wait_for(self, event_type, timeout_seconds: float = 180):
         notifier = asyncio.Event()
@@ -51,8 +59,11 @@ cdef class EventLogger(EventListener):
         self.c_call(event_object)
 
     cdef c_call(self, object event_object):
-        self._logged_events.get(type(event_object), self._generic_logged_events).append(event_object)
         event_object_type = type(event_object)
+        if event_object_type is OrderFilledEvent:
+            self._fill_history.add(event_object)
+        else:
+            self._generic_logged_events.append(event_object)
 
         should_notify = []
         for notifier, waiting_event_type in self._waiting.items():
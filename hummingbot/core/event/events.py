@@ -21,6 +21,7 @@ class MarketEvent(Enum):
     OrderExpired = 108
     OrderUpdate = 109
     TradeUpdate = 110
+    OrderAmended = 111
     OrderFailure = 198
     TransactionFailure = 199
     BuyOrderCreated = 200
@@ -111,6 +112,16 @@ class OrderCancelledEvent:
     exchange_order_id: Optional[str] = None
 
 
+@dataclass
+class OrderAmendedEvent:
+    timestamp: float
+    order_id: str
+    trading_pair: str
+    price: Decimal
+    amount: Decimal
+    exchange_order_id: Optional[str] = None
+
+
 class OrderExpiredEvent(NamedTuple):
     timestamp: float
     order_id: str
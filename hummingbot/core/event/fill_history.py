@@ -0,0 +1,198 @@
+import csv
+import json
+import os
+import tempfile
+import weakref
+from collections import deque
+from decimal import Decimal
+from typing import Deque, Dict, List, Optional
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import TradeFeeBase
+from hummingbot.core.event.events import OrderFilledEvent
+
+s_decimal_0 = Decimal(0)
+s_decimal_NaN = Decimal("nan")
+
+
+class FillAggregates:
+    """
+    Running totals of the fills of a trading pair, updated with each fill so they cover all the fills of the history,
+    including the ones no longer kept in memory.
+    """
+    __slots__ = ("fill_count", "buy_amount", "buy_quote_amount", "sell_amount", "sell_quote_amount", "fees")
+
+    def __init__(self):
+        self.fill_count = 0
+        self.buy_amount = s_decimal_0
+        self.buy_quote_amount = s_decimal_0
+        self.sell_amount = s_decimal_0
+        self.sell_quote_amount = s_decimal_0
+        # Fees paid, per token. The percentage fees are valued in the percent fee token or in the quote token.
+        self.fees: Dict[str, Decimal] = {}
+
+    @property
+    def volume(self) -> Decimal:
+        return self.buy_amount + self.sell_amount
+
+    @property
+    def quote_volume(self) -> Decimal:
+        return self.buy_quote_amount + self.sell_quote_amount
+
+    @property
+    def vwap(self) -> Decimal:
+        return self.quote_volume / self.volume if self.volume > s_decimal_0 else s_decimal_NaN
+
+    @property
+    def buy_vwap(self) -> Decimal:
+        return self.buy_quote_amount / self.buy_amount if self.buy_amount > s_decimal_0 else s_decimal_NaN
+
+    @property
+    def sell_vwap(self) -> Decimal:
+        return self.sell_quote_amount / self.sell_amount if self.sell_amount > s_decimal_0 else s_decimal_NaN
+
+    def add(self, fill: OrderFilledEvent):
+        quote_amount = fill.price * fill.amount
+        self.fill_count += 1
+        if fill.trade_type is TradeType.BUY:
+            self.buy_amount += fill.amount
+            self.buy_quote_amount += quote_amount
+        else:
+            self.sell_amount += fill.amount
+            self.sell_quote_amount += quote_amount
+        trade_fee = fill.trade_fee
+        if isinstance(trade_fee, TradeFeeBase):
+            if trade_fee.percent != s_decimal_0:
+                fee_token = trade_fee.percent_token or fill.trading_pair.split("-")[1]
+                self.fees[fee_token] = self.fees.get(fee_token, s_decimal_0) + quote_amount * trade_fee.percent
+            for flat_fee in trade_fee.flat_fees:
+                self.fees[flat_fee.token] = self.fees.get(flat_fee.token, s_decimal_0) + flat_fee.amount
+
+
+class FillHistory:
+    """
+    History of the order filled events of an event logger.
+
+    Only the most recent fills are kept in memory. When the window grows over `max_in_memory_fills` by
+    `spill_batch_size` fills, the oldest batch is appended to a temporary file that is read back only by the queries
+    reaching beyond the fills in memory. The per trading pair aggregates cover all the fills.
+    """
+    DEFAULT_MAX_IN_MEMORY_FILLS = 10000
+    DEFAULT_SPILL_BATCH_SIZE = 1000
+
+    def __init__(self,
+                 max_in_memory_fills: int = DEFAULT_MAX_IN_MEMORY_FILLS,
+                 spill_batch_size: int = DEFAULT_SPILL_BATCH_SIZE):
+        self._max_in_memory_fills = max_in_memory_fills
+        self._spill_batch_size = spill_batch_size
+        self._fills: Deque[OrderFilledEvent] = deque()
+        self._aggregates: Dict[str, FillAggregates] = {}
+        self._spill_file_path: Optional[str] = None
+        self._spill_file_finalizer: Optional[weakref.finalize] = None
+        self._spilled_fills_count = 0
+        self._spilled_max_timestamp = float("-inf")
+
+    def __len__(self) -> int:
+        return self._spilled_fills_count + len(self._fills)
+
+    @property
+    def recent_fills(self) -> List[OrderFilledEvent]:
+        """
+        The fills kept in memory, in the order they were added.
+        """
+        return list(self._fills)
+
+    @property
+    def spilled_fills_count(self) -> int:
+        return self._spilled_fills_count
+
+    @property
+    def trading_pairs(self) -> List[str]:
+        return list(self._aggregates.keys())
+
+    def aggregates(self, trading_pair: str) -> FillAggregates:
+        return self._aggregates.get(trading_pair) or FillAggregates()
+
+    def add(self, fill: OrderFilledEvent):
+        self._fills.append(fill)
+        aggregates = self._aggregates.get(fill.trading_pair)
+        if aggregates is None:
+            aggregates = FillAggregates()
+            self._aggregates[fill.trading_pair] = aggregates
+        aggregates.add(fill)
+        if len(self._fills) >= self._max_in_memory_fills + self._spill_batch_size:
+            self._spill([self._fills.popleft() for _ in range(self._spill_batch_size)])
+
+    def fills(self,
+              start_timestamp: float = float("-inf"),
+              end_timestamp: float = float("inf")) -> List[OrderFilledEvent]:
+        """
+        The fills with a timestamp after `start_timestamp` and up to `end_timestamp`, in the order they were added.
+        The spilled fills are read back from the file only when the window starts before the last of them.
+        """
+        fills = []
+        if self._spilled_fills_count > 0 and start_timestamp < self._spilled_max_timestamp:
+            fills.extend(fill for fill in self._read_spilled_fills()
+                         if start_timestamp < fill.timestamp <= end_timestamp)
+        fills.extend(fill for fill in self._fills if start_timestamp < fill.timestamp <= end_timestamp)
+        return fills
+
+    def clear(self):
+        self._fills.clear()
+        self._aggregates.clear()
+        self._spilled_fills_count = 0
+        self._spilled_max_timestamp = float("-inf")
+        if self._spill_file_finalizer is not None:
+            self._spill_file_finalizer()
+            self._spill_file_finalizer = None
+            self._spill_file_path = None
+
+    def _spill(self, fills: List[OrderFilledEvent]):
+        if self._spill_file_path is None:
+            file_descriptor, self._spill_file_path = tempfile.mkstemp(prefix="hummingbot_fills_", suffix=".csv")
+            os.close(file_descriptor)
+            self._spill_file_finalizer = weakref.finalize(self, _remove_file, self._spill_file_path)
+        with open(self._spill_file_path, "a", newline="") as spill_file:
+            writer = csv.writer(spill_file)
+            writer.writerows(self._fill_to_row(fill) for fill in fills)
+        self._spilled_fills_count += len(fills)
+        self._spilled_max_timestamp = max(self._spilled_max_timestamp, max(fill.timestamp for fill in fills))
+
+    def _read_spilled_fills(self) -> List[OrderFilledEvent]:
+        with open(self._spill_file_path, "r", newline="") as spill_file:
+            return [self._fill_from_row(row) for row in csv.reader(spill_file)]
+
+    @staticmethod
+    def _fill_to_row(fill: OrderFilledEvent) -> List[str]:
+        trade_fee = json.dumps(fill.trade_fee.to_json()) if isinstance(fill.trade_fee, TradeFeeBase) else ""
+        return [
+            repr(fill.timestamp), fill.order_id, fill.trading_pair, fill.trade_type.name, fill.order_type.name,
+            str(fill.price), str(fill.amount), trade_fee, fill.exchange_trade_id, fill.exchange_order_id,
+            "" if fill.leverage is None else str(fill.leverage), "" if fill.position is None else fill.position,
+        ]
+
+    @staticmethod
+    def _fill_from_row(row: List[str]) -> OrderFilledEvent:
+        (timestamp, order_id, trading_pair, trade_type, order_type, price, amount, trade_fee, exchange_trade_id,
+         exchange_order_id, leverage, position) = row
+        return OrderFilledEvent(
+            timestamp=float(timestamp),
+            order_id=order_id,
+            trading_pair=trading_pair,
+            trade_type=TradeType[trade_type],
+            order_type=OrderType[order_type],
+            price=Decimal(price),
+            amount=Decimal(amount),
+            trade_fee=TradeFeeBase.from_json(json.loads(trade_fee)) if trade_fee else None,
+            exchange_trade_id=exchange_trade_id,
+            exchange_order_id=exchange_order_id,
+            leverage=int(leverage) if leverage else None,
+            position=position or None,
+        )
+
+
+def _remove_file(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
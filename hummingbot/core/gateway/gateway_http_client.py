@@ -12,11 +12,17 @@ from hummingbot.client.config.security import Security
 from hummingbot.core.data_type.common import OrderType, PositionSide
 from hummingbot.core.data_type.in_flight_order import InFlightOrder
 from hummingbot.core.event.events import TradeType
+from hummingbot.core.web_assistant.connections.connection_pool_manager import (
+    ConnectionPoolConfig,
+    ConnectionPoolManager,
+)
 from hummingbot.logger import HummingbotLogger
 
 if TYPE_CHECKING:
     from hummingbot.client.config.config_helpers import ClientConfigAdapter
 
+GATEWAY_CONNECTION_POOL_NAME = "gateway"
+
 
 class GatewayError(Enum):
     """
@@ -84,8 +90,9 @@ class GatewayHttpClient:
             ssl_ctx.load_cert_chain(certfile=f"{cert_path}/client_cert.pem",
                                     keyfile=f"{cert_path}/client_key.pem",
                                     password=Security.secrets_manager.password.get_secret_value())
-            conn = aiohttp.TCPConnector(ssl_context=ssl_ctx)
-            cls._shared_client = aiohttp.ClientSession(connector=conn)
+            pool_manager = ConnectionPoolManager.get_instance()
+            pool_manager.configure_pool(GATEWAY_CONNECTION_POOL_NAME, ConnectionPoolConfig(ssl_context=ssl_ctx))
+            cls._shared_client = pool_manager.get_client_session(GATEWAY_CONNECTION_POOL_NAME)
         return cls._shared_client
 
     @classmethod
@@ -29,8 +29,7 @@ class MockWebSocketServerFactory:
     '''
     Attributes
     ----------
-    _ws_session : The aiohttp client session.
-    _orig_ws_connect : web servers connection
+    _orig_ws_connect : the original ws_connect method of the aiohttp client sessions
     _ws_servers : web servers dictionary
     host : host
     url_host_only : if it's url hosted only
@@ -45,8 +44,8 @@ class MockWebSocketServerFactory:
     send_json(url, data, delay=0)
     send_json_threadsafe(url, data, delay=0)
     """
-    _ws_session = aiohttp.ClientSession()
-    _orig_ws_connect = _ws_session.ws_connect
+    # Creating a client session requires a running event loop, so the original method is kept instead of a session
+    _orig_ws_connect = aiohttp.ClientSession.ws_connect
     _ws_servers = {}
     host = "localhost"
     # url_host_only is used for creating one HummingWSServer to handle all websockets requests and responses for
@@ -89,9 +88,10 @@ class MockWebSocketServerFactory:
         """
         ws_server = MockWebSocketServerFactory.get_ws_server(url)
         if ws_server is None:
-            return MockWebSocketServerFactory._orig_ws_connect(url, **kwargs)
+            return MockWebSocketServerFactory._orig_ws_connect(client_session_instance, url, **kwargs)
         kwargs.clear()
-        return MockWebSocketServerFactory._orig_ws_connect(f"ws://{ws_server.host}:{ws_server.port}", **kwargs)
+        return MockWebSocketServerFactory._orig_ws_connect(
+            client_session_instance, f"ws://{ws_server.host}:{ws_server.port}", **kwargs)
 
     @staticmethod
     async def send_str(url, message, delay=0):
@@ -184,7 +184,8 @@ class MockWebSocketServer:
         """
         Stock the json response
         :param request: web socket request
-               json response: json response
+               json response: json response, or a function receiving the request message and returning the response
+                              (e.g. to include the id of the request in the response)
         """
         self.stock_responses[request] = json_response
 
@@ -199,9 +200,15 @@ class MockWebSocketServer:
         await self.websocket.prepare(request)
         self._websocket_initialized_event.set()
         async for msg in self.websocket:
-            stock_responses = [v for k, v in self.stock_responses.items() if k in msg]
+            stock_responses = [
+                v for k, v in self.stock_responses.items()
+                if k in msg or (isinstance(msg.data, str) and k in msg.data)
+            ]
             if len(stock_responses) > 0:
-                await self.websocket.send_json(stock_responses[0])
+                response = stock_responses[0]
+                if callable(response):
+                    response = response(msg.json())
+                await self.websocket.send_json(response)
         return self.websocket
 
     @property
@@ -246,7 +253,8 @@ class MockWebSocketServer:
         self._thread.start()
 
     async def _on_shutdown(self, _: web.Application):
-        await self.websocket.close()
+        if self.websocket is not None:
+            await self.websocket.close()
 
     def stop(self):
         """
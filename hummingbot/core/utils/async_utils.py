@@ -1,7 +1,15 @@
 import asyncio
 import inspect
 import logging
+import sys
 import time
+import weakref
+from collections import Counter
+from typing import Dict, Optional
+
+# Origin (call site and coroutine) of the tasks created with safe_ensure_future, tracked by the event loop profiler
+_task_origins: "weakref.WeakKeyDictionary[asyncio.Future, str]" = weakref.WeakKeyDictionary()
+_track_task_origins: bool = False
 
 
 async def safe_wrapper(c):
@@ -14,7 +22,41 @@ async def safe_wrapper(c):
 
 
 def safe_ensure_future(coro, *args, **kwargs):
-    return asyncio.ensure_future(safe_wrapper(coro), *args, **kwargs)
+    future = asyncio.ensure_future(safe_wrapper(coro), *args, **kwargs)
+    if _track_task_origins:
+        caller = sys._getframe(1)
+        _task_origins[future] = (f"{caller.f_globals.get('__name__')}:{caller.f_lineno} "
+                                 f"{getattr(coro, '__qualname__', type(coro).__name__)}")
+    return future
+
+
+def track_task_origins(enabled: bool):
+    """
+    Enables recording the call site of the tasks created with safe_ensure_future.
+    """
+    global _track_task_origins
+    _track_task_origins = enabled
+    if not enabled:
+        _task_origins.clear()
+
+
+def live_tasks_by_origin() -> Dict[str, int]:
+    return dict(Counter(origin for task, origin in list(_task_origins.items()) if not task.done()))
+
+
+def task_description(task: asyncio.Future) -> str:
+    """
+    :return: the origin of the task if tracked, otherwise the name of its coroutine
+    """
+    origin: Optional[str] = _task_origins.get(task)
+    if origin is not None:
+        return origin
+    coro = task.get_coro() if isinstance(task, asyncio.Task) else None
+    frame = getattr(coro, "cr_frame", None)
+    if frame is not None and frame.f_code is safe_wrapper.__code__:
+        # The tasks created with safe_ensure_future run the wrapped coroutine
+        coro = frame.f_locals.get("c", coro)
+    return getattr(coro, "__qualname__", repr(task))
 
 
 async def safe_gather(*args, **kwargs):
@@ -0,0 +1,243 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, NamedTuple, Optional
+
+from hummingbot.core.utils import async_utils
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+
+class SlowCallback(NamedTuple):
+    timestamp: float
+    duration: float
+    description: str
+
+
+class EventLoopMonitor:
+    """
+    Diagnostics of the event loop running the client, shared by all its components (order book trackers, user streams,
+    polling loops, the clock, the UI...).
+
+    The lag of the loop is measured continuously, as the delay of a periodic sleep. With the task profiler enabled
+    every callback run by the loop is timed, keeping the slow ones with the name of their coroutine, and the live
+    tasks are counted by the `safe_ensure_future` call site creating them. Timing the callbacks adds some overhead to
+    each of them, so the profiler is disabled by default.
+
+    When the lag exceeds the warning threshold a warning is logged with the slow callbacks that caused it.
+    """
+    _shared_instance: Optional["EventLoopMonitor"] = None
+    _logger: Optional[HummingbotLogger] = None
+
+    SAMPLE_INTERVAL = 0.5
+    LAG_SAMPLES_SIZE = 120
+    SLOW_CALLBACKS_SIZE = 50
+    LAG_WARNING_LOG_INTERVAL = 60.0
+    REPORTED_ORIGINS_LIMIT = 20
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    @classmethod
+    def get_instance(cls) -> "EventLoopMonitor":
+        if cls._shared_instance is None:
+            cls._shared_instance = EventLoopMonitor()
+        return cls._shared_instance
+
+    @classmethod
+    def initialize(cls,
+                   lag_warning_threshold: float,
+                   slow_callback_threshold: float,
+                   profile_tasks: bool) -> "EventLoopMonitor":
+        """
+        Configures and starts the shared monitor. A lag warning threshold of 0 disables it.
+        """
+        monitor = cls.get_instance()
+        monitor.stop()
+        monitor._lag_warning_threshold = lag_warning_threshold
+        monitor._slow_callback_threshold = slow_callback_threshold
+        monitor._profile_tasks = profile_tasks
+        if lag_warning_threshold > 0:
+            monitor.start()
+        return monitor
+
+    def __init__(self,
+                 lag_warning_threshold: float = 0.5,
+                 slow_callback_threshold: float = 0.1,
+                 profile_tasks: bool = False):
+        self._lag_warning_threshold = lag_warning_threshold
+        self._slow_callback_threshold = slow_callback_threshold
+        self._profile_tasks = profile_tasks
+        self._lag_samples: Deque[float] = deque(maxlen=self.LAG_SAMPLES_SIZE)
+        self._max_lag = 0.0
+        self._slow_callbacks: Deque[SlowCallback] = deque(maxlen=self.SLOW_CALLBACKS_SIZE)
+        self._last_lag_warning_timestamp = 0.0
+        self._monitor_task: Optional[asyncio.Task] = None
+        self._original_handle_run = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._monitor_task is not None
+
+    @property
+    def is_profiling(self) -> bool:
+        return self._original_handle_run is not None
+
+    @property
+    def current_lag(self) -> float:
+        return self._lag_samples[-1] if len(self._lag_samples) > 0 else 0.0
+
+    @property
+    def mean_lag(self) -> float:
+        return sum(self._lag_samples) / len(self._lag_samples) if len(self._lag_samples) > 0 else 0.0
+
+    @property
+    def max_lag(self) -> float:
+        return self._max_lag
+
+    @property
+    def slow_callbacks(self) -> List[SlowCallback]:
+        return list(self._slow_callbacks)
+
+    def start(self):
+        if self._monitor_task is None:
+            self._monitor_task = safe_ensure_future(self._monitor_loop())
+        if self._profile_tasks:
+            self._start_profiler()
+
+    def stop(self):
+        if self._monitor_task is not None:
+            self._monitor_task.cancel()
+            self._monitor_task = None
+        self._stop_profiler()
+
+    def report(self, queue_depths: Optional[Dict[str, Dict[str, int]]] = None) -> Dict[str, Any]:
+        """
+        :param queue_depths: the number of messages waiting in the queues of each component (e.g. connector)
+
+        :return: the current diagnostics, as a JSON serializable dictionary
+        """
+        loop = asyncio.get_event_loop()
+        live_tasks = [task for task in asyncio.all_tasks(loop) if not task.done()]
+        tasks_by_origin = async_utils.live_tasks_by_origin()
+        top_origins = sorted(tasks_by_origin.items(), key=lambda item: item[1], reverse=True)
+        return {
+            "event_loop": {
+                "lag": self.current_lag,
+                "mean_lag": self.mean_lag,
+                "max_lag": self.max_lag,
+                # Callbacks ready to run, including the ones scheduled from other threads (e.g. the recorder events)
+                "ready_callbacks": len(getattr(loop, "_ready", ())),
+                "scheduled_callbacks": len(getattr(loop, "_scheduled", ())),
+            },
+            "tasks": {
+                "live": len(live_tasks),
+                "by_origin": dict(top_origins[:self.REPORTED_ORIGINS_LIMIT]),
+            },
+            "slow_callbacks": [
+                {"timestamp": slow_callback.timestamp,
+                 "duration": slow_callback.duration,
+                 "callback": slow_callback.description}
+                for slow_callback in sorted(self._slow_callbacks, key=lambda cb: cb.duration, reverse=True)
+            ],
+            "queues": queue_depths or {},
+        }
+
+    def format_report(self, report: Dict[str, Any]) -> str:
+        event_loop = report["event_loop"]
+        lines = [
+            "\n  Event loop:",
+            f"    Lag: {event_loop['lag'] * 1e3:.1f} ms (mean {event_loop['mean_lag'] * 1e3:.1f} ms, "
+            f"max {event_loop['max_lag'] * 1e3:.1f} ms)",
+            f"    Callbacks: {event_loop['ready_callbacks']} ready, {event_loop['scheduled_callbacks']} scheduled",
+            f"    Live tasks: {report['tasks']['live']}",
+        ]
+        if not self.is_running:
+            lines.append("    The event loop monitor is not running.")
+        if self.is_profiling:
+            lines.append("\n  Live tasks by origin:")
+            if len(report["tasks"]["by_origin"]) == 0:
+                lines.append("    None")
+            lines.extend(f"    {count:>5}  {origin}" for origin, count in report["tasks"]["by_origin"].items())
+            lines.append(f"\n  Slow callbacks (over {self._slow_callback_threshold * 1e3:.0f} ms):")
+            if len(report["slow_callbacks"]) == 0:
+                lines.append("    None")
+            lines.extend(f"    {slow_callback['duration'] * 1e3:>8.1f} ms  {slow_callback['callback']}"
+                         for slow_callback in report["slow_callbacks"])
+        if len(report["queues"]) > 0:
+            lines.append("\n  Queues:")
+            for component, depths in report["queues"].items():
+                lines.append(f"    {component}:")
+                lines.extend(f"      {queue_name}: {depth}" for queue_name, depth in depths.items())
+        return "\n".join(lines)
+
+    async def _monitor_loop(self):
+        loop = asyncio.get_event_loop()
+        while True:
+            expected_time = loop.time() + self.SAMPLE_INTERVAL
+            await self._sleep(self.SAMPLE_INTERVAL)
+            self._register_lag(lag=max(0.0, loop.time() - expected_time))
+
+    def _register_lag(self, lag: float):
+        self._lag_samples.append(lag)
+        self._max_lag = max(self._max_lag, lag)
+        now = time.time()
+        if lag >= self._lag_warning_threshold and now - self._last_lag_warning_timestamp >= self.LAG_WARNING_LOG_INTERVAL:
+            self._last_lag_warning_timestamp = now
+            message = f"The event loop was blocked for {lag:.3f} seconds."
+            recent_slow_callbacks = [slow_callback for slow_callback in self._slow_callbacks
+                                     if slow_callback.timestamp >= now - self.SAMPLE_INTERVAL - lag]
+            if len(recent_slow_callbacks) > 0:
+                slowest = sorted(recent_slow_callbacks, key=lambda cb: cb.duration, reverse=True)[:3]
+                message += " Slowest callbacks: " + ", ".join(
+                    f"{slow_callback.description} ({slow_callback.duration:.3f}s)" for slow_callback in slowest)
+            self.logger().warning(message)
+
+    def _start_profiler(self):
+        if self._original_handle_run is not None:
+            return
+        if not isinstance(asyncio.get_event_loop(), asyncio.BaseEventLoop):
+            # Other implementations (e.g. uvloop) don't run the callbacks through asyncio handles
+            self.logger().warning("The task profiler is only available with the default asyncio event loop.")
+            return
+        original_handle_run = asyncio.events.Handle._run
+        monitor = self
+
+        def profiled_handle_run(handle: asyncio.Handle):
+            start = time.perf_counter()
+            original_handle_run(handle)
+            duration = time.perf_counter() - start
+            if duration >= monitor._slow_callback_threshold:
+                monitor._register_slow_callback(handle=handle, duration=duration)
+
+        asyncio.events.Handle._run = profiled_handle_run
+        self._original_handle_run = original_handle_run
+        async_utils.track_task_origins(True)
+
+    def _stop_profiler(self):
+        if self._original_handle_run is not None:
+            asyncio.events.Handle._run = self._original_handle_run
+            self._original_handle_run = None
+            async_utils.track_task_origins(False)
+
+    def _register_slow_callback(self, handle: asyncio.Handle, duration: float):
+        self._slow_callbacks.append(SlowCallback(
+            timestamp=time.time(),
+            duration=duration,
+            description=self._callback_description(handle)))
+
+    @staticmethod
+    def _callback_description(handle: asyncio.Handle) -> str:
+        callback = getattr(handle, "_callback", None)
+        # The steps of the tasks are methods of the task
+        owner = getattr(callback, "__self__", None)
+        if isinstance(owner, asyncio.Task):
+            return async_utils.task_description(owner)
+        return getattr(callback, "__qualname__", repr(callback))
+
+    async def _sleep(self, delay: float):
+        await asyncio.sleep(delay)
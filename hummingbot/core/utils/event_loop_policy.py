@@ -0,0 +1,51 @@
+import asyncio
+import logging
+import os
+from typing import Optional
+
+# Enables uvloop in the processes not configured from the client configuration (e.g. the tests)
+USE_UVLOOP_ENV_VAR = "HUMMINGBOT_USE_UVLOOP"
+
+
+def is_uvloop_available() -> bool:
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def use_uvloop_from_env(default: bool = False) -> bool:
+    value = os.environ.get(USE_UVLOOP_ENV_VAR)
+    if value is None or value == "":
+        return default
+    return value.lower() in ("1", "true", "yes", "y")
+
+
+def install_event_loop_policy(use_uvloop: bool) -> bool:
+    """
+    Sets the policy creating the event loops of the process, using uvloop if requested and installed. It has to be
+    called before creating the event loop.
+
+    :return: True if the event loops are created by uvloop
+    """
+    if use_uvloop:
+        if is_uvloop_available():
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            return True
+        logging.getLogger(__name__).warning("uvloop is not installed. Using the default asyncio event loop.")
+    asyncio.set_event_loop_policy(None)
+    return False
+
+
+def new_event_loop(use_uvloop: bool) -> Optional[asyncio.AbstractEventLoop]:
+    """
+    :return: a new event loop of the requested implementation, or None if uvloop is requested and not installed
+    """
+    if use_uvloop:
+        if not is_uvloop_available():
+            return None
+        import uvloop
+        return uvloop.new_event_loop()
+    return asyncio.DefaultEventLoopPolicy().new_event_loop()
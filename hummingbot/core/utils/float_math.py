@@ -0,0 +1,20 @@
+from decimal import Decimal
+
+# Float results are converted back to Decimal with this many significant digits. A float64 carries 15 to 17, so the
+# rounding drops the binary representation error accumulated by a few tens of float operations.
+FLOAT_SIGNIFICANT_DIGITS = 14
+
+_DECIMAL_FORMAT = f"%.{FLOAT_SIGNIFICANT_DIGITS}g"
+
+
+def to_decimal(value: float) -> Decimal:
+    """
+    Converts the float result of intermediate math to Decimal, to quantize it at an order boundary or to report it.
+    When the exact result of the same computation has at most `FLOAT_SIGNIFICANT_DIGITS` significant digits, the
+    returned Decimal is that exact result, so quantizing it gives the same order price or amount as the Decimal math.
+    NaN and infinite values are kept.
+
+    :param value: the float result
+    :return: the result rounded to `FLOAT_SIGNIFICANT_DIGITS` significant digits
+    """
+    return Decimal(_DECIMAL_FORMAT % value)
@@ -1,8 +1,10 @@
+import asyncio
 import logging
 from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.client.settings import AllConnectorSettings, ConnectorSetting
+from hummingbot.core.utils.trading_pairs_cache import TradingPairsCache
 from hummingbot.logger import HummingbotLogger
 
 from ...client.config.security import Security
@@ -13,6 +15,8 @@ class TradingPairFetcher:
     _sf_shared_instance: "TradingPairFetcher" = None
     _tpf_logger: Optional[HummingbotLogger] = None
 
+    MAX_CONCURRENT_FETCHES = 8
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         if cls._tpf_logger is None:
@@ -30,15 +34,25 @@ class TradingPairFetcher:
         self.ready = False
         self.trading_pairs: Dict[str, Any] = {}
         self.fetch_pairs_from_all_exchanges = client_config_map.fetch_pairs_from_all_exchanges
+        self._fetch_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FETCHES)
         self._fetch_task = safe_ensure_future(self.fetch_all(client_config_map))
 
-    def _fetch_pairs_from_connector_setting(
+    async def _fetch_pairs_from_connector_setting(
             self,
             connector_setting: ConnectorSetting,
             connector_name: Optional[str] = None):
         connector_name = connector_name or connector_setting.name
+        cache = TradingPairsCache.get_instance()
+        if cache is not None:
+            # The cached pairs are available right away, and only refreshed from the exchange once expired
+            entry = await cache.get_async(self._cache_key(connector_setting.name))
+            if entry is not None:
+                self.trading_pairs[connector_name] = entry.data
+                if cache.is_fresh(entry):
+                    return
         connector = connector_setting.non_trading_connector_instance_with_default_configuration()
-        safe_ensure_future(self.call_fetch_pairs(connector.all_trading_pairs(), connector_name))
+        safe_ensure_future(self.call_fetch_pairs(
+            connector.all_trading_pairs(), connector_name, cache_key=self._cache_key(connector_setting.name)))
 
     async def fetch_all(self, client_config_map: ClientConfigAdapter):
         await Security.wait_til_decryption_done()
@@ -48,15 +62,15 @@ class TradingPairFetcher:
             # data source module for them.
             try:
                 if conn_setting.base_name().endswith("paper_trade"):
-                    self._fetch_pairs_from_connector_setting(
+                    await self._fetch_pairs_from_connector_setting(
                         connector_setting=connector_settings[conn_setting.parent_name],
                         connector_name=conn_setting.name
                     )
                 elif not self.fetch_pairs_from_all_exchanges:
                     if conn_setting.connector_connected():
-                        self._fetch_pairs_from_connector_setting(connector_setting=conn_setting)
+                        await self._fetch_pairs_from_connector_setting(connector_setting=conn_setting)
                 else:
-                    self._fetch_pairs_from_connector_setting(connector_setting=conn_setting)
+                    await self._fetch_pairs_from_connector_setting(connector_setting=conn_setting)
             except ModuleNotFoundError:
                 continue
             except Exception:
@@ -64,15 +78,31 @@ class TradingPairFetcher:
                                         "Please check the logs")
         self.ready = True
 
-    async def call_fetch_pairs(self, fetch_fn: Callable[[], Awaitable[List[str]]], exchange_name: str):
+    async def call_fetch_pairs(self,
+                               fetch_fn: Callable[[], Awaitable[List[str]]],
+                               exchange_name: str,
+                               cache_key: Optional[str] = None):
         try:
-            pairs = await fetch_fn
+            # Bounded, to avoid opening connections to every exchange at the same time when fetching from all of them
+            async with self._fetch_semaphore:
+                pairs = await fetch_fn
             self.trading_pairs[exchange_name] = pairs
+            cache = TradingPairsCache.get_instance()
+            if cache is not None and cache_key is not None and len(pairs) > 0:
+                await cache.put_async(cache_key, pairs)
         except Exception:
-            self.logger().error(f"Connector {exchange_name} failed to retrieve its trading pairs. "
-                                f"Trading pairs autocompletion won't work.", exc_info=True)
-            # In case of error just assign empty list, this is st. the bot won't stop working
-            self.trading_pairs[exchange_name] = []
+            if exchange_name in self.trading_pairs:
+                self.logger().warning(f"Connector {exchange_name} failed to refresh its trading pairs. "
+                                      f"Using the cached trading pairs.", exc_info=True)
+            else:
+                self.logger().error(f"Connector {exchange_name} failed to retrieve its trading pairs. "
+                                    f"Trading pairs autocompletion won't work.", exc_info=True)
+                # In case of error just assign empty list, this is st. the bot won't stop working
+                self.trading_pairs[exchange_name] = []
+
+    @staticmethod
+    def _cache_key(connector_name: str) -> str:
+        return f"trading_pairs_{connector_name}"
 
     def _all_connector_settings(self) -> Dict[str, ConnectorSetting]:
         # Method created to enabling patching in unit tests
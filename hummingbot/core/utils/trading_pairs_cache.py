@@ -0,0 +1,144 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional
+
+from hummingbot import data_path
+from hummingbot.logger import HummingbotLogger
+
+TRADING_PAIRS_CACHE_DIR_NAME = "trading_pairs_cache"
+
+
+class TradingPairsCacheEntry(NamedTuple):
+    data: Any
+    content_hash: str
+    timestamp: float
+
+
+class TradingPairsCache:
+    """
+    On-disk cache of the trading pairs and exchange information requested by the connectors at startup.
+
+    Each entry is stored as a JSON file with the hash of its content, validated when the entry is read, so a
+    truncated or edited file is treated as a missing entry. The last modification time of the file is the time the
+    content was last confirmed by the exchange: storing an entry with the same content only updates it, without
+    rewriting the file. Entries older than the TTL are still returned, to be used while they are revalidated.
+
+    The hash of the last content read or written for each key is kept in memory, so storing an entry doesn't read the
+    file back to find out if its content changed. The coroutines `get_async` and `put_async` do the file IO in the
+    default executor, to be used from the event loop.
+
+    The cache is disabled unless it is initialized, which is done by the client at startup.
+    """
+    _shared_instance: Optional["TradingPairsCache"] = None
+    _logger: Optional[HummingbotLogger] = None
+
+    DEFAULT_TTL = 60 * 60 * 24
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    @classmethod
+    def get_instance(cls) -> Optional["TradingPairsCache"]:
+        return cls._shared_instance
+
+    @classmethod
+    def initialize(cls, ttl: float = DEFAULT_TTL, cache_dir: Optional[Path] = None) -> Optional["TradingPairsCache"]:
+        """
+        Enables the shared cache. A TTL of 0 disables it.
+        """
+        if ttl > 0:
+            cls._shared_instance = TradingPairsCache(
+                cache_dir=cache_dir or Path(data_path()) / TRADING_PAIRS_CACHE_DIR_NAME,
+                ttl=ttl,
+            )
+        else:
+            cls._shared_instance = None
+        return cls._shared_instance
+
+    def __init__(self, cache_dir: Path, ttl: float = DEFAULT_TTL):
+        self._cache_dir = Path(cache_dir)
+        self._ttl = ttl
+        self._content_hashes: Dict[str, str] = {}
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    @staticmethod
+    def content_hash(data: Any) -> str:
+        serialized = json.dumps(data, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[TradingPairsCacheEntry]:
+        """
+        :return: the entry stored for the key, or None if there is no valid entry
+        """
+        path = self._entry_path(key)
+        try:
+            timestamp = path.stat().st_mtime
+            with open(path) as entry_file:
+                stored = json.load(entry_file)
+            data = stored["data"]
+            content_hash = stored["hash"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError):
+            self.logger().warning(f"Ignoring the invalid trading pairs cache file {path}.")
+            return None
+        if self.content_hash(data) != content_hash:
+            self.logger().warning(f"Ignoring the trading pairs cache file {path} since its content was modified.")
+            return None
+        self._content_hashes[key] = content_hash
+        return TradingPairsCacheEntry(data=data, content_hash=content_hash, timestamp=timestamp)
+
+    def is_fresh(self, entry: TradingPairsCacheEntry) -> bool:
+        return time.time() - entry.timestamp < self._ttl
+
+    def put(self, key: str, data: Any) -> bool:
+        """
+        Stores the data for the key.
+
+        :return: True if the content of the entry changed
+        """
+        path = self._entry_path(key)
+        try:
+            content_hash = self.content_hash(data)
+        except (TypeError, ValueError):
+            self.logger().debug(f"The data for {key} can't be stored in the trading pairs cache.", exc_info=True)
+            return False
+        try:
+            if key not in self._content_hashes and path.exists():
+                # The file is only read back once, when the key was not read or written before
+                self.get(key)
+            if self._content_hashes.get(key) == content_hash and path.exists():
+                os.utime(path)
+                return False
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            with open(temp_path, "w") as entry_file:
+                json.dump({"hash": content_hash, "data": data}, entry_file, separators=(",", ":"))
+            os.replace(temp_path, path)
+        except OSError:
+            self.logger().warning(f"Error writing the trading pairs cache file {path}.", exc_info=True)
+            return False
+        self._content_hashes[key] = content_hash
+        return True
+
+    async def get_async(self, key: str) -> Optional[TradingPairsCacheEntry]:
+        return await asyncio.get_running_loop().run_in_executor(None, self.get, key)
+
+    async def put_async(self, key: str, data: Any) -> bool:
+        return await asyncio.get_running_loop().run_in_executor(None, self.put, key, data)
+
+    def _entry_path(self, key: str) -> Path:
+        return self._cache_dir / f"{re.sub(r'[^A-Za-z0-9_.-]', '_', key)}.json"
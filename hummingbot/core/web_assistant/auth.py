@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from hummingbot.core.web_assistant.connections.data_types import RESTRequest, WSRequest
+from hummingbot.core.web_assistant.signing_service import SigningService
 
 
 class AuthBase(ABC):
@@ -9,7 +11,19 @@ class AuthBase(ABC):
     Hint: If the authentication requires a simple REST request to acquire information from the
     server that is required in the message signature, this class can be passed a `RESTConnection`
     object that it can use to that end.
+
+    Authenticators that sign requests with expensive cryptography should run the signature through the
+    `signing_service`, that executes it outside of the event loop.
     """
+    _signing_service: Optional[SigningService] = None
+
+    @property
+    def signing_service(self) -> SigningService:
+        return self._signing_service or SigningService.get_instance()
+
+    @signing_service.setter
+    def signing_service(self, signing_service: SigningService):
+        self._signing_service = signing_service
 
     @abstractmethod
     async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
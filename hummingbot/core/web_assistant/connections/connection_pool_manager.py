@@ -0,0 +1,245 @@
+import asyncio
+import ssl
+import time
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Dict, Optional
+
+import aiohttp
+
+DEFAULT_POOL_NAME = "default"
+
+
+@dataclass(frozen=True)
+class ConnectionPoolConfig:
+    """
+    Limits of a connection pool.
+
+    :param limit: maximum number of simultaneous connections of the pool, 0 for no limit
+    :param limit_per_host: maximum number of simultaneous connections to the same host (same host, port and scheme),
+        so that a burst of requests to one exchange can't take all the connections of the pool
+    :param keepalive_timeout: seconds an idle connection is kept open to be reused
+    :param ttl_dns_cache: seconds a resolved host address is cached, None to cache it forever
+    :param ssl_context: custom SSL context for the connections, e.g. to use client certificates
+    """
+    limit: int = 500
+    limit_per_host: int = 50
+    keepalive_timeout: float = 30
+    ttl_dns_cache: Optional[int] = 300
+    ssl_context: Optional[ssl.SSLContext] = None
+
+
+@dataclass
+class ConnectionPoolMetrics:
+    limit: int = 0
+    limit_per_host: int = 0
+    requests_in_flight: int = 0
+    requests_total: int = 0
+    requests_queued: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+    queue_wait_count: int = 0
+    queue_wait_time_total: float = 0
+    queue_wait_time_max: float = 0
+    dns_cache_hits: int = 0
+    dns_cache_misses: int = 0
+
+    @property
+    def utilization(self) -> float:
+        """Requests in flight relative to the connection limit of the pool"""
+        return self.requests_in_flight / self.limit if self.limit > 0 else 0
+
+    @property
+    def connection_reuse_ratio(self) -> float:
+        acquired = self.connections_created + self.connections_reused
+        return self.connections_reused / acquired if acquired > 0 else 0
+
+    @property
+    def queue_wait_time_avg(self) -> float:
+        return self.queue_wait_time_total / self.queue_wait_count if self.queue_wait_count > 0 else 0
+
+
+@dataclass
+class _ConnectionPool:
+    config: ConnectionPoolConfig
+    metrics: ConnectionPoolMetrics
+    trace_config: aiohttp.TraceConfig
+    connectors: Dict[asyncio.AbstractEventLoop, aiohttp.TCPConnector] = field(default_factory=dict)
+    ws_connectors: Dict[asyncio.AbstractEventLoop, aiohttp.TCPConnector] = field(default_factory=dict)
+
+
+class ConnectionPoolManager:
+    """
+    Keeps one `aiohttp.TCPConnector` per named pool, shared by the client sessions of every REST connection that uses
+    the pool, so that connections, TLS sessions and resolved addresses are reused across connectors, candle feeds and
+    data feeds instead of each of them keeping its own connection pool. Exchange connectors use a pool named after
+    the exchange, so the limits of one exchange don't hold back the requests to the others.
+
+    WebSocket connections hold their connection for as long as they are open, so they use a second connector of the
+    pool without limits. Otherwise the long lived WebSockets to an exchange would take the connections available for
+    the REST requests and the new WebSockets to the same host.
+
+    Every session created by the manager shares the connector without owning it (closing the session does not close
+    the pooled connections). The REST sessions trace their requests to keep the utilization and wait time metrics of
+    the pool.
+
+    Note: aiohttp only supports HTTP/1.1, HTTP/2 is not available with this transport.
+    """
+    _instance: Optional["ConnectionPoolManager"] = None
+
+    @classmethod
+    def get_instance(cls) -> "ConnectionPoolManager":
+        if cls._instance is None:
+            cls._instance = ConnectionPoolManager()
+        return cls._instance
+
+    def __init__(self):
+        self._pools: Dict[str, _ConnectionPool] = {}
+
+    def configure_pool(self, pool_name: str, config: ConnectionPoolConfig):
+        """
+        Sets the limits of a pool. If the pool already has a connector it is replaced by a new one for the sessions
+        created from now on, the sessions already created keep using the previous one.
+        """
+        if pool_name in self._pools:
+            pool = self._pools[pool_name]
+            pool.config = config
+            pool.connectors.clear()
+            pool.ws_connectors.clear()
+            pool.metrics.limit = config.limit
+            pool.metrics.limit_per_host = config.limit_per_host
+        else:
+            self._pools[pool_name] = self._create_pool(config)
+
+    def register_pool(self, pool_name: str, config: ConnectionPoolConfig):
+        """
+        Adds a pool with the given limits if it doesn't exist yet. An existing pool keeps its limits, so the limits set
+        with `configure_pool` are not overridden by the connectors registering their pool when they are created.
+        """
+        if pool_name not in self._pools:
+            self._pools[pool_name] = self._create_pool(config)
+
+    def get_connector(self, pool_name: str = DEFAULT_POOL_NAME) -> aiohttp.TCPConnector:
+        """
+        The connector of the pool for the current event loop. It must be called with an event loop in the current
+        thread, since aiohttp connectors are bound to the loop that creates them.
+        """
+        pool = self._get_pool(pool_name)
+        return self._get_loop_connector(pool.connectors, pool.config, limited=True)
+
+    def get_ws_connector(self, pool_name: str = DEFAULT_POOL_NAME) -> aiohttp.TCPConnector:
+        """
+        The connector without connection limits used by the WebSocket connections of the pool, for the current event
+        loop.
+        """
+        pool = self._get_pool(pool_name)
+        return self._get_loop_connector(pool.ws_connectors, pool.config, limited=False)
+
+    def get_client_session(self, pool_name: str = DEFAULT_POOL_NAME, **kwargs) -> aiohttp.ClientSession:
+        pool = self._get_pool(pool_name)
+        trace_configs = list(kwargs.pop("trace_configs", [])) + [pool.trace_config]
+        return aiohttp.ClientSession(
+            connector=self.get_connector(pool_name),
+            connector_owner=False,
+            trace_configs=trace_configs,
+            **kwargs,
+        )
+
+    def get_ws_client_session(self, pool_name: str = DEFAULT_POOL_NAME, **kwargs) -> aiohttp.ClientSession:
+        return aiohttp.ClientSession(connector=self.get_ws_connector(pool_name), connector_owner=False, **kwargs)
+
+    def get_metrics(self, pool_name: str = DEFAULT_POOL_NAME) -> ConnectionPoolMetrics:
+        return self._get_pool(pool_name).metrics
+
+    def get_all_metrics(self) -> Dict[str, ConnectionPoolMetrics]:
+        return {pool_name: pool.metrics for pool_name, pool in self._pools.items()}
+
+    async def close(self):
+        for pool in self._pools.values():
+            for connector in list(pool.connectors.values()) + list(pool.ws_connectors.values()):
+                await connector.close()
+            pool.connectors.clear()
+            pool.ws_connectors.clear()
+
+    def _get_pool(self, pool_name: str) -> _ConnectionPool:
+        if pool_name not in self._pools:
+            self._pools[pool_name] = self._create_pool(ConnectionPoolConfig())
+        return self._pools[pool_name]
+
+    def _create_pool(self, config: ConnectionPoolConfig) -> _ConnectionPool:
+        metrics = ConnectionPoolMetrics(limit=config.limit, limit_per_host=config.limit_per_host)
+        return _ConnectionPool(config=config, metrics=metrics, trace_config=self._create_trace_config(metrics))
+
+    def _get_loop_connector(self,
+                            connectors: Dict[asyncio.AbstractEventLoop, aiohttp.TCPConnector],
+                            config: ConnectionPoolConfig,
+                            limited: bool) -> aiohttp.TCPConnector:
+        loop = asyncio.get_event_loop()
+        connector = connectors.get(loop)
+        if connector is None or connector.closed:
+            # Connectors of loops that were closed can't be used anymore
+            for stale_loop in [stale_loop for stale_loop in connectors if stale_loop.is_closed()]:
+                del connectors[stale_loop]
+            connector = self._create_connector(config, limited)
+            connectors[loop] = connector
+        return connector
+
+    @staticmethod
+    def _create_connector(config: ConnectionPoolConfig, limited: bool = True) -> aiohttp.TCPConnector:
+        kwargs = {}
+        if config.ssl_context is not None:
+            kwargs["ssl"] = config.ssl_context
+        return aiohttp.TCPConnector(
+            limit=config.limit if limited else 0,
+            limit_per_host=config.limit_per_host if limited else 0,
+            keepalive_timeout=config.keepalive_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=config.ttl_dns_cache,
+            **kwargs,
+        )
+
+    @staticmethod
+    def _create_trace_config(metrics: ConnectionPoolMetrics) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_start(session, context: SimpleNamespace, params):
+            metrics.requests_total += 1
+            metrics.requests_in_flight += 1
+
+        async def on_request_done(session, context: SimpleNamespace, params):
+            metrics.requests_in_flight -= 1
+
+        async def on_connection_queued_start(session, context: SimpleNamespace, params):
+            metrics.requests_queued += 1
+            context.queued_timestamp = time.perf_counter()
+
+        async def on_connection_queued_end(session, context: SimpleNamespace, params):
+            wait_time = time.perf_counter() - context.queued_timestamp
+            metrics.requests_queued -= 1
+            metrics.queue_wait_count += 1
+            metrics.queue_wait_time_total += wait_time
+            metrics.queue_wait_time_max = max(metrics.queue_wait_time_max, wait_time)
+
+        async def on_connection_create_end(session, context: SimpleNamespace, params):
+            metrics.connections_created += 1
+
+        async def on_connection_reuseconn(session, context: SimpleNamespace, params):
+            metrics.connections_reused += 1
+
+        async def on_dns_cache_hit(session, context: SimpleNamespace, params):
+            metrics.dns_cache_hits += 1
+
+        async def on_dns_cache_miss(session, context: SimpleNamespace, params):
+            metrics.dns_cache_misses += 1
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_end.append(on_request_done)
+        trace_config.on_request_exception.append(on_request_done)
+        trace_config.on_connection_queued_start.append(on_connection_queued_start)
+        trace_config.on_connection_queued_end.append(on_connection_queued_end)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(on_dns_cache_miss)
+        trace_config.freeze()
+        return trace_config
@@ -2,6 +2,7 @@ from typing import Optional
 
 import aiohttp
 
+from hummingbot.core.web_assistant.connections.connection_pool_manager import DEFAULT_POOL_NAME, ConnectionPoolManager
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
@@ -16,13 +17,31 @@ class ConnectionsFactory:
     `WebAssistantsFactory` to accommodate cases such as Bittrex that uses a specific WebSocket technology requiring
     a separate third-party library. In that case, a factory can be created that returns `RESTConnection`s using
     `aiohttp` and `WSConnection`s using `signalr_aio`.
+
+    The client sessions are backed by the connectors of a `ConnectionPoolManager` pool, shared with every other
+    factory using the same pool. The WebSocket connections use the connector of the pool without connection limits.
     """
 
-    def __init__(self):
+    def __init__(self, connection_pool_name: str = DEFAULT_POOL_NAME):
         # _ws_independent_session is intended to be used only in unit tests
         self._ws_independent_session: Optional[aiohttp.ClientSession] = None
 
         self._shared_client: Optional[aiohttp.ClientSession] = None
+        self._ws_shared_client: Optional[aiohttp.ClientSession] = None
+        self._connection_pool_name = connection_pool_name
+
+    @property
+    def connection_pool_name(self) -> str:
+        return self._connection_pool_name
+
+    def set_connection_pool_name(self, connection_pool_name: str):
+        """
+        Changes the pool of the connections created from now on. The connections already created keep their pool.
+        """
+        if connection_pool_name != self._connection_pool_name:
+            self._connection_pool_name = connection_pool_name
+            self._shared_client = None
+            self._ws_shared_client = None
 
     async def get_rest_connection(self) -> RESTConnection:
         shared_client = await self._get_shared_client()
@@ -30,10 +49,17 @@ class ConnectionsFactory:
         return connection
 
     async def get_ws_connection(self) -> WSConnection:
-        shared_client = self._ws_independent_session or await self._get_shared_client()
+        shared_client = self._ws_independent_session or await self._get_ws_shared_client()
         connection = WSConnection(aiohttp_client_session=shared_client)
         return connection
 
     async def _get_shared_client(self) -> aiohttp.ClientSession:
-        self._shared_client = self._shared_client or aiohttp.ClientSession()
+        if self._shared_client is None or self._shared_client.closed:
+            self._shared_client = ConnectionPoolManager.get_instance().get_client_session(self._connection_pool_name)
         return self._shared_client
+
+    async def _get_ws_shared_client(self) -> aiohttp.ClientSession:
+        if self._ws_shared_client is None or self._ws_shared_client.closed:
+            self._ws_shared_client = ConnectionPoolManager.get_instance().get_ws_client_session(
+                self._connection_pool_name)
+        return self._ws_shared_client
@@ -0,0 +1,76 @@
+import asyncio
+import functools
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class SigningMetrics:
+    """
+    Latency of the signatures run by a `SigningService`. The latency is measured from the request to the result,
+    the execution time is the time spent signing in the executor, the difference is the time waiting for a worker.
+    """
+    signatures: int = 0
+    latency_total: float = 0
+    latency_max: float = 0
+    execution_time_total: float = 0
+
+    @property
+    def latency_avg(self) -> float:
+        return self.latency_total / self.signatures if self.signatures > 0 else 0
+
+    @property
+    def execution_time_avg(self) -> float:
+        return self.execution_time_total / self.signatures if self.signatures > 0 else 0
+
+    def add(self, latency: float, execution_time: float):
+        self.signatures += 1
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+        self.execution_time_total += execution_time
+
+
+def _timed_call(function: Callable[[], T]) -> Tuple[T, float]:
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+class SigningService:
+    """
+    Runs the signature of requests (ECDSA, EIP-712 hashing, transaction building) in an executor instead of the event
+    loop, so that signing many orders at once does not block the processing of market data.
+
+    A thread pool is used by default. A process pool can be provided as executor, in which case the signing functions
+    and their arguments must be picklable.
+    """
+    _shared_instance: Optional["SigningService"] = None
+
+    @classmethod
+    def get_instance(cls) -> "SigningService":
+        if cls._shared_instance is None:
+            cls._shared_instance = SigningService()
+        return cls._shared_instance
+
+    def __init__(self, executor: Optional[Executor] = None, max_workers: int = 2):
+        self._executor = executor or ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="signing")
+        self._metrics = SigningMetrics()
+
+    @property
+    def metrics(self) -> SigningMetrics:
+        return self._metrics
+
+    async def sign(self, sign_function: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        start = time.perf_counter()
+        result, execution_time = await asyncio.get_running_loop().run_in_executor(
+            self._executor, _timed_call, functools.partial(sign_function, *args, **kwargs)
+        )
+        self._metrics.add(latency=time.perf_counter() - start, execution_time=execution_time)
+        return result
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
@@ -2,6 +2,11 @@ from typing import List, Optional
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.web_assistant.auth import AuthBase
+from hummingbot.core.web_assistant.connections.connection_pool_manager import (
+    DEFAULT_POOL_NAME,
+    ConnectionPoolManager,
+    ConnectionPoolMetrics,
+)
 from hummingbot.core.web_assistant.connections.connections_factory import ConnectionsFactory
 from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
@@ -19,6 +24,9 @@ class WebAssistantsFactory:
     lists. Consult the documentation of the relevant assistant and/or pre-/post-processor class for
     additional information.
 
+    The connections are created from the `connection_pool_name` pool of the `ConnectionPoolManager`, shared by
+    every factory using the same pool name.
+
     todo: integrate AsyncThrottler
     """
     def __init__(
@@ -29,8 +37,9 @@ class WebAssistantsFactory:
         ws_pre_processors: Optional[List[WSPreProcessorBase]] = None,
         ws_post_processors: Optional[List[WSPostProcessorBase]] = None,
         auth: Optional[AuthBase] = None,
+        connection_pool_name: str = DEFAULT_POOL_NAME,
     ):
-        self._connections_factory = ConnectionsFactory()
+        self._connections_factory = ConnectionsFactory(connection_pool_name=connection_pool_name)
         self._rest_pre_processors = rest_pre_processors or []
         self._rest_post_processors = rest_post_processors or []
         self._ws_pre_processors = ws_pre_processors or []
@@ -46,6 +55,17 @@ class WebAssistantsFactory:
     def auth(self) -> Optional[AuthBase]:
         return self._auth
 
+    @property
+    def connection_pool_name(self) -> str:
+        return self._connections_factory.connection_pool_name
+
+    def set_connection_pool_name(self, connection_pool_name: str):
+        self._connections_factory.set_connection_pool_name(connection_pool_name)
+
+    @property
+    def connection_pool_metrics(self) -> ConnectionPoolMetrics:
+        return ConnectionPoolManager.get_instance().get_metrics(self._connections_factory.connection_pool_name)
+
     async def get_rest_assistant(self) -> RESTAssistant:
         connection = await self._connections_factory.get_rest_connection()
         assistant = RESTAssistant(
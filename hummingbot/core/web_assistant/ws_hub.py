@@ -0,0 +1,264 @@
+import asyncio
+import itertools
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.connections.data_types import WSRequest
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.logger import HummingbotLogger
+
+
+class WSHubAdapter(ABC):
+    """
+    Exchange specific part of a websocket hub: the requests to subscribe to channels, how to identify the channel of
+    each message and the limits of the exchange for each connection.
+    """
+    max_channels_per_connection: int = 100
+    max_channels_per_request: int = 100
+    # Minimum delay between the subscription requests sent through a connection
+    subscription_request_interval: float = 0.0
+    heartbeat_interval: Optional[float] = None
+
+    @abstractmethod
+    def subscription_request(self, channels: List[str], request_id: int) -> WSRequest:
+        raise NotImplementedError
+
+    @abstractmethod
+    def unsubscription_request(self, channels: List[str], request_id: int) -> WSRequest:
+        raise NotImplementedError
+
+    @abstractmethod
+    def route_message(self, message: Any) -> Optional[Tuple[str, Any]]:
+        """
+        :param message: a message received through a connection of the hub
+
+        :return: the channel of the message and the data to deliver to the channel subscribers, or None if the
+        message does not belong to a channel (e.g. the responses to the subscription requests)
+        """
+        raise NotImplementedError
+
+
+class WSHub:
+    """
+    Shares the websocket connections to an exchange between all the components subscribing to its public channels
+    (order book data sources, candles feeds...), instead of opening a connection for each of them.
+
+    The subscribers provide a queue where the messages of their channels are delivered. The channels are distributed
+    among as many connections as required by the per connection limit of the exchange. When a connection is lost
+    `None` is delivered to the subscribers of its channels, and the channels are subscribed again once reconnected.
+    """
+    RECONNECT_DELAY = 5.0
+
+    _logger: Optional[HummingbotLogger] = None
+    _hubs: Dict[str, "WSHub"] = {}
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(HummingbotLogger.logger_name_for_class(cls))
+        return cls._logger
+
+    @classmethod
+    def get_hub(cls, ws_url: str, adapter: WSHubAdapter) -> "WSHub":
+        """
+        :return: the hub shared by all the components connecting to the URL
+        """
+        if ws_url not in cls._hubs:
+            cls._hubs[ws_url] = WSHub(ws_url=ws_url, adapter=adapter)
+        return cls._hubs[ws_url]
+
+    def __init__(self, ws_url: str, adapter: WSHubAdapter, api_factory: Optional[WebAssistantsFactory] = None):
+        self._ws_url = ws_url
+        self._adapter = adapter
+        self._api_factory = api_factory or WebAssistantsFactory(throttler=AsyncThrottler(rate_limits=[]))
+        self._subscribers: Dict[str, List[asyncio.Queue]] = {}
+        self._connections: List[_WSHubConnection] = []
+        self._connection_by_channel: Dict[str, _WSHubConnection] = {}
+        self._request_ids = itertools.count(1)
+
+    @property
+    def ws_url(self) -> str:
+        return self._ws_url
+
+    @property
+    def adapter(self) -> WSHubAdapter:
+        return self._adapter
+
+    @property
+    def connections_count(self) -> int:
+        return len(self._connections)
+
+    @property
+    def channels(self) -> List[str]:
+        return list(self._subscribers.keys())
+
+    def subscribe(self, channels: List[str], queue: asyncio.Queue):
+        """
+        Delivers the messages of the channels to the queue
+        """
+        for channel in channels:
+            queues = self._subscribers.setdefault(channel, [])
+            if queue not in queues:
+                queues.append(queue)
+            if channel not in self._connection_by_channel:
+                connection = self._connection_with_capacity()
+                connection.add_channel(channel)
+                self._connection_by_channel[channel] = connection
+
+    def unsubscribe(self, channels: List[str], queue: asyncio.Queue):
+        for channel in channels:
+            queues = self._subscribers.get(channel, [])
+            if queue in queues:
+                queues.remove(queue)
+            if len(queues) == 0 and channel in self._subscribers:
+                del self._subscribers[channel]
+                connection = self._connection_by_channel.pop(channel)
+                connection.remove_channel(channel)
+                if len(connection.channels) == 0:
+                    connection.stop()
+                    self._connections.remove(connection)
+
+    def next_request_id(self) -> int:
+        return next(self._request_ids)
+
+    def deliver(self, channel: str, data: Any):
+        for queue in self._subscribers.get(channel, []):
+            queue.put_nowait(data)
+
+    def notify_disconnection(self, channels: Set[str]):
+        notified_queues: List[asyncio.Queue] = []
+        for channel in channels:
+            for queue in self._subscribers.get(channel, []):
+                if queue not in notified_queues:
+                    queue.put_nowait(None)
+                    notified_queues.append(queue)
+
+    async def connected_websocket_assistant(self) -> WSAssistant:
+        ws: WSAssistant = await self._api_factory.get_ws_assistant()
+        await ws.connect(ws_url=self._ws_url, ping_timeout=self._adapter.heartbeat_interval)
+        return ws
+
+    def _connection_with_capacity(self) -> "_WSHubConnection":
+        for connection in self._connections:
+            if len(connection.channels) < self._adapter.max_channels_per_connection:
+                return connection
+        connection = _WSHubConnection(hub=self)
+        self._connections.append(connection)
+        connection.start()
+        return connection
+
+    async def _sleep(self, delay: float):
+        await asyncio.sleep(delay)
+
+
+class _WSHubConnection:
+    """
+    One of the connections of a hub, with the channels assigned to it. The channel changes are sent in batches, to
+    respect the limit of requests per connection of the exchanges.
+    """
+
+    def __init__(self, hub: WSHub):
+        self._hub = hub
+        self.channels: Set[str] = set()
+        self._pending_subscriptions: List[str] = []
+        self._pending_unsubscriptions: List[str] = []
+        self._ws_assistant: Optional[WSAssistant] = None
+        self._connection_task: Optional[asyncio.Task] = None
+        self._requests_task: Optional[asyncio.Task] = None
+
+    @property
+    def is_connected(self) -> bool:
+        return self._ws_assistant is not None
+
+    def start(self):
+        self._connection_task = safe_ensure_future(self._connection_loop())
+
+    def stop(self):
+        if self._requests_task is not None:
+            self._requests_task.cancel()
+            self._requests_task = None
+        if self._connection_task is not None:
+            self._connection_task.cancel()
+            self._connection_task = None
+
+    def add_channel(self, channel: str):
+        self.channels.add(channel)
+        if channel in self._pending_unsubscriptions:
+            # Still subscribed in the exchange
+            self._pending_unsubscriptions.remove(channel)
+        elif self.is_connected:
+            self._pending_subscriptions.append(channel)
+            self._schedule_requests()
+
+    def remove_channel(self, channel: str):
+        self.channels.discard(channel)
+        if channel in self._pending_subscriptions:
+            self._pending_subscriptions.remove(channel)
+        elif self.is_connected:
+            self._pending_unsubscriptions.append(channel)
+            self._schedule_requests()
+
+    async def _connection_loop(self):
+        while True:
+            try:
+                self._ws_assistant = await self._hub.connected_websocket_assistant()
+                self._pending_subscriptions = sorted(self.channels)
+                self._pending_unsubscriptions = []
+                self._schedule_requests()
+                async for ws_response in self._ws_assistant.iter_messages():
+                    routed_message = self._hub.adapter.route_message(ws_response.data)
+                    if routed_message is not None:
+                        self._hub.deliver(*routed_message)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self._hub.logger().warning(
+                    f"Unexpected error in the websocket connection to {self._hub.ws_url}. "
+                    f"Reconnecting in {self._hub.RECONNECT_DELAY} seconds.",
+                    exc_info=True)
+            finally:
+                await self._on_disconnected()
+            await self._hub._sleep(self._hub.RECONNECT_DELAY)
+
+    async def _on_disconnected(self):
+        if self._requests_task is not None:
+            self._requests_task.cancel()
+            self._requests_task = None
+        ws_assistant = self._ws_assistant
+        self._ws_assistant = None
+        self._hub.notify_disconnection(self.channels)
+        if ws_assistant is not None:
+            await ws_assistant.disconnect()
+
+    def _schedule_requests(self):
+        if self._requests_task is None:
+            self._requests_task = safe_ensure_future(self._send_pending_requests())
+
+    async def _send_pending_requests(self):
+        adapter = self._hub.adapter
+        try:
+            # Lets the subscribers registering in the same iteration of the event loop share the requests
+            await asyncio.sleep(0)
+            while self.is_connected and (len(self._pending_subscriptions) > 0 or len(self._pending_unsubscriptions) > 0):
+                if len(self._pending_unsubscriptions) > 0:
+                    channels = self._pending_unsubscriptions[:adapter.max_channels_per_request]
+                    del self._pending_unsubscriptions[:adapter.max_channels_per_request]
+                    request = adapter.unsubscription_request(channels=channels, request_id=self._hub.next_request_id())
+                else:
+                    channels = self._pending_subscriptions[:adapter.max_channels_per_request]
+                    del self._pending_subscriptions[:adapter.max_channels_per_request]
+                    request = adapter.subscription_request(channels=channels, request_id=self._hub.next_request_id())
+                await self._ws_assistant.send(request)
+                if adapter.subscription_request_interval > 0:
+                    await self._hub._sleep(adapter.subscription_request_interval)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self._hub.logger().exception(f"Error sending the subscription requests to {self._hub.ws_url}.")
+        finally:
+            if self._requests_task is asyncio.current_task():
+                self._requests_task = None
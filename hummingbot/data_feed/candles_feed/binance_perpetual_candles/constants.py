@@ -7,6 +7,9 @@ HEALTH_CHECK_ENDPOINT = "/fapi/v1/ping"
 CANDLES_ENDPOINT = "/fapi/v1/klines"
 
 WSS_URL = "wss://fstream.binance.com/ws"
+WSS_COMBINED_STREAMS_URL = "wss://fstream.binance.com/stream"
+WS_MAX_STREAMS_PER_CONNECTION = 200
+WS_MAX_INCOMING_MESSAGES_PER_SECOND = 10
 
 INTERVALS = bidict({
     "1s": 1,
@@ -1,7 +1,9 @@
 import logging
 from typing import List, Optional
 
+from hummingbot.connector.exchange.binance.binance_ws_hub_adapter import BinanceWSHubAdapter
 from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.core.web_assistant.ws_hub import WSHubAdapter
 from hummingbot.data_feed.candles_feed.binance_spot_candles import constants as CONSTANTS
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
 from hummingbot.logger import HummingbotLogger
@@ -31,6 +33,14 @@ class BinanceSpotCandles(CandlesBase):
     def wss_url(self):
         return CONSTANTS.WSS_URL
 
+    @property
+    def ws_hub_url(self) -> Optional[str]:
+        return CONSTANTS.WSS_COMBINED_STREAMS_URL
+
+    @property
+    def ws_hub_adapter(self) -> Optional[WSHubAdapter]:
+        return BinanceWSHubAdapter()
+
     @property
     def health_check_url(self):
         return self.rest_url + CONSTANTS.HEALTH_CHECK_ENDPOINT
@@ -84,6 +94,9 @@ class BinanceSpotCandles(CandlesBase):
             for row in data
         ]
 
+    def ws_hub_channels(self) -> List[str]:
+        return [f"{self._ex_trading_pair.lower()}@kline_{self.interval}"]
+
     def ws_subscription_payload(self):
         candle_params = [f"{self._ex_trading_pair.lower()}@kline_{self.interval}"]
         payload = {
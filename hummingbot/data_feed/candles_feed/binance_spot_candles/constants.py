@@ -7,6 +7,7 @@ HEALTH_CHECK_ENDPOINT = "/api/v3/ping"
 CANDLES_ENDPOINT = "/api/v3/klines"
 
 WSS_URL = "wss://stream.binance.com:9443/ws"
+WSS_COMBINED_STREAMS_URL = "wss://stream.binance.com:9443/stream"
 
 INTERVALS = bidict({
     "1s": "1s",
@@ -15,6 +15,7 @@ from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.core.web_assistant.ws_hub import WSHub, WSHubAdapter
 from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
 
 
@@ -57,6 +58,7 @@ class CandlesBase(NetworkBase):
         self._ex_trading_pair = self.get_exchange_trading_pair(trading_pair)
         self._ws_candle_available = asyncio.Event()
         self._ping_timeout = None
+        self._ws_hub: Optional[WSHub] = None
         if interval in self.intervals.keys():
             self.interval = interval
         else:
@@ -127,6 +129,30 @@ class CandlesBase(NetworkBase):
     def rate_limits(self):
         raise NotImplementedError
 
+    @property
+    def ws_hub_url(self) -> Optional[str]:
+        """
+        The URL of the websocket hub to share the connections with other feeds of the exchange, or None if the feed
+        does not support it.
+        """
+        return None
+
+    @property
+    def ws_hub_adapter(self) -> Optional[WSHubAdapter]:
+        return None
+
+    def ws_hub_channels(self) -> List[str]:
+        """
+        The channels of the candles in the websocket hub.
+        """
+        raise NotImplementedError
+
+    def use_ws_hub(self, ws_hub: WSHub):
+        """
+        Receives the candles through the shared connections of the hub instead of a dedicated connection.
+        """
+        self._ws_hub = ws_hub
+
     @property
     def intervals(self):
         raise NotImplementedError
@@ -347,6 +373,9 @@ class CandlesBase(NetworkBase):
         Connects to the candlestick websocket endpoint and listens to the messages sent by the
         exchange.
         """
+        if self._ws_hub is not None:
+            await self._listen_for_subscriptions_through_hub()
+            return
         ws: Optional[WSAssistant] = None
         while True:
             try:
@@ -365,6 +394,24 @@ class CandlesBase(NetworkBase):
             finally:
                 await self._on_order_stream_interruption(websocket_assistant=ws)
 
+    async def _listen_for_subscriptions_through_hub(self):
+        hub_messages_queue = asyncio.Queue()
+        channels = self.ws_hub_channels()
+        self._ws_hub.subscribe(channels=channels, queue=hub_messages_queue)
+        self.logger().info("Subscribed to public klines...")
+        try:
+            while True:
+                data = await hub_messages_queue.get()
+                if data is None:
+                    # The hub notifies disconnections with None, and subscribes again once reconnected
+                    self._candles.clear()
+                    continue
+                parsed_message = self._parse_websocket_message(data)
+                if isinstance(parsed_message, dict):
+                    self._update_candles(parsed_message)
+        finally:
+            self._ws_hub.unsubscribe(channels=channels, queue=hub_messages_queue)
+
     async def _connected_websocket_assistant(self) -> WSAssistant:
         ws: WSAssistant = await self._api_factory.get_ws_assistant()
         await ws.connect(ws_url=self.wss_url, ping_timeout=self._ping_timeout)
@@ -407,27 +454,30 @@ class CandlesBase(NetworkBase):
             if isinstance(parsed_message, WSJSONRequest):
                 await websocket_assistant.send(request=parsed_message)
             elif isinstance(parsed_message, dict):
-                candles_row = np.array([parsed_message["timestamp"],
-                                        parsed_message["open"],
-                                        parsed_message["high"],
-                                        parsed_message["low"],
-                                        parsed_message["close"],
-                                        parsed_message["volume"],
-                                        parsed_message["quote_asset_volume"],
-                                        parsed_message["n_trades"],
-                                        parsed_message["taker_buy_base_volume"],
-                                        parsed_message["taker_buy_quote_volume"]]).astype(float)
-                if len(self._candles) == 0:
-                    self._candles.append(candles_row)
-                    self._ws_candle_available.set()
-                    safe_ensure_future(self.fill_historical_candles())
-                else:
-                    latest_timestamp = int(self._candles[-1][0])
-                    current_timestamp = int(parsed_message["timestamp"])
-                    if current_timestamp > latest_timestamp:
-                        self._candles.append(candles_row)
-                    elif current_timestamp == latest_timestamp:
-                        self._candles[-1] = candles_row
+                self._update_candles(parsed_message)
+
+    def _update_candles(self, parsed_message: dict):
+        candles_row = np.array([parsed_message["timestamp"],
+                                parsed_message["open"],
+                                parsed_message["high"],
+                                parsed_message["low"],
+                                parsed_message["close"],
+                                parsed_message["volume"],
+                                parsed_message["quote_asset_volume"],
+                                parsed_message["n_trades"],
+                                parsed_message["taker_buy_base_volume"],
+                                parsed_message["taker_buy_quote_volume"]]).astype(float)
+        if len(self._candles) == 0:
+            self._candles.append(candles_row)
+            self._ws_candle_available.set()
+            safe_ensure_future(self.fill_historical_candles())
+        else:
+            latest_timestamp = int(self._candles[-1][0])
+            current_timestamp = int(parsed_message["timestamp"])
+            if current_timestamp > latest_timestamp:
+                self._candles.append(candles_row)
+            elif current_timestamp == latest_timestamp:
+                self._candles[-1] = candles_row
 
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
         while True:
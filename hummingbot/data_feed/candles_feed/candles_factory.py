@@ -1,5 +1,6 @@
 from typing import Dict, Type
 
+from hummingbot.core.web_assistant.ws_hub import WSHub
 from hummingbot.data_feed.candles_feed.ascend_ex_spot_candles.ascend_ex_spot_candles import AscendExSpotCandles
 from hummingbot.data_feed.candles_feed.binance_perpetual_candles import BinancePerpetualCandles
 from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
@@ -66,10 +67,14 @@ class CandlesFactory:
         """
         connector_class = cls._candles_map.get(candles_config.connector)
         if connector_class:
-            return connector_class(
+            candles = connector_class(
                 candles_config.trading_pair,
                 candles_config.interval,
                 candles_config.max_records
             )
+            if candles.ws_hub_url is not None:
+                # The feeds of the exchange share the websocket connections
+                candles.use_ws_hub(WSHub.get_hub(ws_url=candles.ws_hub_url, adapter=candles.ws_hub_adapter))
+            return candles
         else:
             raise UnsupportedConnectorException(candles_config.connector)
@@ -1,12 +1,15 @@
 import asyncio
-import aiohttp
 import logging
+from decimal import Decimal
 from typing import Optional
+
+import aiohttp
+
 from hummingbot.core.network_base import NetworkBase
 from hummingbot.core.network_iterator import NetworkStatus
-from hummingbot.logger import HummingbotLogger
 from hummingbot.core.utils.async_utils import safe_ensure_future
-from decimal import Decimal
+from hummingbot.core.web_assistant.connections.connection_pool_manager import ConnectionPoolManager
+from hummingbot.logger import HummingbotLogger
 
 
 class CustomAPIDataFeed(NetworkBase):
@@ -39,7 +42,7 @@ class CustomAPIDataFeed(NetworkBase):
 
     def _http_client(self) -> aiohttp.ClientSession:
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = ConnectionPoolManager.get_instance().get_client_session()
         return self._shared_client
 
     async def check_network(self) -> NetworkStatus:
@@ -6,6 +6,7 @@ import aiohttp
 
 from hummingbot.core.network_base import NetworkBase
 from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.core.web_assistant.connections.connection_pool_manager import ConnectionPoolManager
 from hummingbot.logger import HummingbotLogger
 
 
@@ -44,7 +45,7 @@ class DataFeedBase(NetworkBase):
 
     async def _http_client(self) -> aiohttp.ClientSession:
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = ConnectionPoolManager.get_instance().get_client_session()
         return self._shared_client
 
     async def get_ready(self):
@@ -65,11 +66,11 @@ class DataFeedBase(NetworkBase):
 
     async def check_network(self) -> NetworkStatus:
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.health_check_endpoint) as resp:
-                    status_text = await resp.text()
-                    if resp.status != 200:
-                        raise Exception(f"Data feed {self.name} server is down. Status is {status_text}")
+            session = await self._http_client()
+            async with session.get(self.health_check_endpoint) as resp:
+                status_text = await resp.text()
+                if resp.status != 200:
+                    raise Exception(f"Data feed {self.name} server is down. Status is {status_text}")
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -75,6 +75,11 @@ class SQLConnectionManager(TransactionBase):
             self._engine: Engine = create_engine(client_config_map.db_mode.get_url(self.db_path))
             self._metadata: MetaData = self.get_declarative_base().metadata
             self._metadata.create_all(self._engine)
+            # create_all only creates the indexes of the tables it creates, the indexes added to existing tables are
+            # created here
+            for table in self._metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(bind=self._engine, checkfirst=True)
 
             # SQLite does not enforce foreign key constraint, but for others engines, we need to drop it.
             # See: `hummingbot/market/markets_recorder.py`, at line 213.
@@ -20,7 +20,9 @@ class TradeFill(HummingbotBase):
                       Index("tf_market_base_asset_timestamp_index",
                             "market", "base_asset", "timestamp"),
                       Index("tf_market_quote_asset_timestamp_index",
-                            "market", "quote_asset", "timestamp")
+                            "market", "quote_asset", "timestamp"),
+                      Index("tf_market_exchange_trade_id_index",
+                            "market", "exchange_trade_id")
                       )
 
     config_file_path = Column(Text, nullable=False)
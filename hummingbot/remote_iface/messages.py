@@ -97,6 +97,7 @@ class ImportCommandMessage(RPCMessage):
 class StatusCommandMessage(RPCMessage):
     class Request(RPCMessage.Request):
         async_backend: Optional[bool] = True
+        diagnostics: Optional[bool] = False
 
     class Response(RPCMessage.Response):
         status: Optional[int] = MQTT_STATUS_CODE.SUCCESS
@@ -286,6 +286,13 @@ class MQTTCommands:
         response = StatusCommandMessage.Response()
         timeout = 30  # seconds
         try:
+            if msg.diagnostics:
+                response.data = call_sync(
+                    self._event_loop_diagnostics(),
+                    loop=self._ev_loop,
+                    timeout=timeout
+                )
+                return response
             if self._hb_app.strategy is None:
                 response.status = MQTT_STATUS_CODE.ERROR
                 response.msg = 'No strategy is currently running!'
@@ -309,6 +316,9 @@ class MQTTCommands:
             response.msg = str(e)
         return response
 
+    async def _event_loop_diagnostics(self) -> Dict[str, Any]:
+        return self._hb_app.event_loop_diagnostics()
+
     def _on_cmd_history(self, msg: HistoryCommandMessage.Request):
         response = HistoryCommandMessage.Response()
         try:
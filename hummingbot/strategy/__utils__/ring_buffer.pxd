@@ -8,13 +8,24 @@ cdef class RingBuffer:
         int64_t _delimiter
         int64_t _length
         bint _is_full
+        double _mean
+        double _m2
+        double _diff_sum_squares
 
-    cdef void c_add_value(self, float val)
+    cdef void c_add_value(self, double val)
     cdef void c_increment_delimiter(self)
+    cdef void c_update_stats(self, double val)
+    cdef void c_recalculate_stats(self)
+    cdef int64_t c_count(self)
+    cdef double c_first_value(self)
     cdef double c_get_last_value(self)
     cdef bint c_is_full(self)
     cdef bint c_is_empty(self)
     cdef double c_mean_value(self)
     cdef double c_variance(self)
     cdef double c_std_dev(self)
+    cdef double c_running_mean(self)
+    cdef double c_running_variance(self)
+    cdef double c_diff_sum_squares(self)
+    cdef double c_diff_variance(self)
     cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self)
@@ -1,11 +1,20 @@
 import numpy as np
 import logging
 cimport numpy as np
+from libc.math cimport sqrt
 
 
 pmm_logger = None
 
 cdef class RingBuffer:
+    """
+    Fixed length circular buffer of float values.
+
+    The mean, the sum of squared deviations and the sum of squared differences between consecutive values are updated
+    on every insert and eviction (Welford's algorithm), so the window statistics are O(1). They are recalculated from
+    the buffer every time it wraps around to bound the accumulated rounding error; c_get_as_numpy_array is still
+    available to calculate any statistic over the full window.
+    """
     @classmethod
     def logger(cls):
         global pmm_logger
@@ -18,13 +27,60 @@ cdef class RingBuffer:
         self._buffer = np.zeros(length, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self._mean = 0
+        self._m2 = 0
+        self._diff_sum_squares = 0
 
     def __dealloc__(self):
         self._buffer = None
 
-    cdef void c_add_value(self, float val):
+    cdef void c_add_value(self, double val):
+        self.c_update_stats(val)
         self._buffer[self._delimiter] = val
         self.c_increment_delimiter()
+        if self._delimiter == 0:
+            self.c_recalculate_stats()
+
+    cdef void c_update_stats(self, double val):
+        cdef:
+            int64_t count = self.c_count()
+            double evicted
+            double new_mean
+
+        if count == 0:
+            self._mean = val
+            self._m2 = 0
+            self._diff_sum_squares = 0
+            return
+
+        if self._is_full:
+            # The oldest value is evicted, together with its difference to the next one
+            evicted = self._buffer[self._delimiter]
+            if self._length > 1:
+                self._diff_sum_squares -= (self._buffer[(self._delimiter + 1) % self._length] - evicted) ** 2
+                self._diff_sum_squares += (val - self._buffer[(self._delimiter - 1) % self._length]) ** 2
+            new_mean = self._mean + (val - evicted) / count
+            self._m2 += (val - evicted) * (val - new_mean + evicted - self._mean)
+            self._mean = new_mean
+        else:
+            self._diff_sum_squares += (val - self._buffer[self._delimiter - 1]) ** 2
+            new_mean = self._mean + (val - self._mean) / (count + 1)
+            self._m2 += (val - self._mean) * (val - new_mean)
+            self._mean = new_mean
+        self._m2 = max(self._m2, 0)
+        self._diff_sum_squares = max(self._diff_sum_squares, 0)
+
+    cdef void c_recalculate_stats(self):
+        cdef np.ndarray[np.double_t, ndim=1] values = self.c_get_as_numpy_array()
+
+        if values.size == 0:
+            self._mean = 0
+            self._m2 = 0
+            self._diff_sum_squares = 0
+        else:
+            self._mean = np.mean(values)
+            self._m2 = np.sum(np.square(values - self._mean))
+            self._diff_sum_squares = np.sum(np.square(np.diff(values)))
 
     cdef void c_increment_delimiter(self):
         self._delimiter = (self._delimiter + 1) % self._length
@@ -39,42 +95,73 @@ cdef class RingBuffer:
             return np.nan
         return self._buffer[self._delimiter-1]
 
+    cdef double c_first_value(self):
+        if self.c_is_empty():
+            return np.nan
+        return self._buffer[self._delimiter if self._is_full else 0]
+
     cdef bint c_is_full(self):
         return self._is_full
 
+    cdef int64_t c_count(self):
+        return self._length if self._is_full else self._delimiter
+
     cdef double c_mean_value(self):
         result = np.nan
         if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
+            result = self._mean
         return result
 
     cdef double c_variance(self):
         result = np.nan
         if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
+            result = self._m2 / self._length
         return result
 
     cdef double c_std_dev(self):
         result = np.nan
         if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
+            result = sqrt(self._m2 / self._length)
         return result
 
-    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
+    cdef double c_running_mean(self):
+        if self.c_is_empty():
+            return np.nan
+        return self._mean
+
+    cdef double c_running_variance(self):
+        if self.c_is_empty():
+            return np.nan
+        return self._m2 / self.c_count()
+
+    cdef double c_diff_sum_squares(self):
+        return self._diff_sum_squares
 
+    cdef double c_diff_variance(self):
+        cdef:
+            int64_t diff_count = self.c_count() - 1
+            double diff_mean
+
+        if diff_count < 1:
+            return np.nan
+        # The differences telescope, their sum is the last value minus the first one
+        diff_mean = (self.c_get_last_value() - self.c_first_value()) / diff_count
+        return max(self._diff_sum_squares / diff_count - diff_mean ** 2, 0)
+
+    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
+        buffer = np.asarray(self._buffer)
         if not self._is_full:
-            indexes = np.arange(0, stop=self._delimiter, dtype=np.int16)
-        else:
-            indexes = np.arange(self._delimiter, stop=self._delimiter + self._length,
-                                dtype=np.int16) % self._length
-        return np.asarray(self._buffer)[indexes]
+            return buffer[:self._delimiter].copy()
+        return np.concatenate((buffer[self._delimiter:], buffer[:self._delimiter]))
 
     def __init__(self, length):
         self._length = length
         self._buffer = np.zeros(length, dtype=np.double)
         self._delimiter = 0
         self._is_full = False
+        self._mean = 0
+        self._m2 = 0
+        self._diff_sum_squares = 0
 
     def add_value(self, val):
         self.c_add_value(val)
@@ -85,10 +172,17 @@ cdef class RingBuffer:
     def get_last_value(self):
         return self.c_get_last_value()
 
+    def recalculate_stats(self):
+        self.c_recalculate_stats()
+
     @property
     def is_full(self):
         return self.c_is_full()
 
+    @property
+    def count(self) -> int:
+        return self.c_count()
+
     @property
     def mean_value(self):
         return self.c_mean_value()
@@ -101,6 +195,26 @@ cdef class RingBuffer:
     def variance(self):
         return self.c_variance()
 
+    @property
+    def running_mean(self):
+        """Mean of the values in the buffer, even when it is not full"""
+        return self.c_running_mean()
+
+    @property
+    def running_variance(self):
+        """Population variance of the values in the buffer, even when it is not full"""
+        return self.c_running_variance()
+
+    @property
+    def diff_sum_squares(self):
+        """Sum of the squared differences between consecutive values in the buffer"""
+        return self.c_diff_sum_squares()
+
+    @property
+    def diff_variance(self):
+        """Population variance of the differences between consecutive values in the buffer"""
+        return self.c_diff_variance()
+
     @property
     def length(self) -> int:
         return self._length
@@ -113,6 +227,9 @@ cdef class RingBuffer:
         self._buffer = np.zeros(value, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self._mean = 0
+        self._m2 = 0
+        self._diff_sum_squares = 0
 
         for val in data[-value:]:
             self.add_value(val)
@@ -6,11 +6,20 @@ class HistoricalVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
 
+    def add_sample(self, value: float):
+        # The sampling buffer stores log prices, the variance of their differences is the log returns variance
+        super().add_sample(np.log(float(value)))
+
     def _indicator_calculation(self) -> float:
-        prices = self._sampling_buffer.get_as_numpy_array()
-        if prices.size > 0:
-            log_returns = np.diff(np.log(prices))
-            return np.var(log_returns)
+        # Maintained by the sampling buffer, so this is O(1)
+        return self._sampling_buffer.diff_variance
+
+    def _full_indicator_calculation(self) -> float:
+        # Same calculation over the whole sampling buffer, used to verify the incremental one
+        log_prices = self._sampling_buffer.get_as_numpy_array()
+        if log_prices.size > 1:
+            return np.var(np.diff(log_prices))
+        return np.nan
 
     def _processing_calculation(self) -> float:
         processing_array = self._processing_buffer.get_as_numpy_array()
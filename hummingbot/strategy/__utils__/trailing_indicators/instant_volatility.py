@@ -10,6 +10,14 @@ class InstantVolatilityIndicator(BaseTrailingIndicator):
         # The standard deviation should be calculated between ticks and not with a mean of the whole buffer
         # Otherwise if the asset is trending, changing the length of the buffer would result in a greater volatility as more ticks would be further away from the mean
         # which is a nonsense result. If volatility of the underlying doesn't change in fact, changing the length of the buffer shouldn't change the result.
+        # The sum of squared differences between ticks is maintained by the sampling buffer, so this is O(1).
+        samples_count = self._sampling_buffer.count
+        if samples_count == 0:
+            return np.nan
+        return np.sqrt(self._sampling_buffer.diff_sum_squares / samples_count)
+
+    def _full_indicator_calculation(self) -> float:
+        # Same calculation over the whole sampling buffer, used to verify the incremental one
         np_sampling_buffer = self._sampling_buffer.get_as_numpy_array()
         vol = np.sqrt(np.sum(np.square(np.diff(np_sampling_buffer))) / np_sampling_buffer.size)
         return vol
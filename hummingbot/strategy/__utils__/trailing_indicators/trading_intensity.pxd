@@ -13,17 +13,32 @@ cdef class TradingIntensityIndicator:
         double _alpha
         double _kappa
         dict _trade_samples
+        list _sample_timestamps
+        dict _trades_consolidated
+        dict _price_level_counts
+        double _total_amount
+        double _last_fit_total_amount
+        bint _samples_changed
+        int _ticks_since_fit
+        int _refit_interval
+        double _refit_threshold
+        str _fit_method
         list _current_trade_sample
         object _trades_forwarder
         OrderBook _order_book
         object _price_delegate
-        list _last_quotes
+        list _quote_timestamps
+        list _quote_prices
         int _sampling_length
         int _samples_length
 
     cdef c_calculate(self, timestamp)
     cdef c_register_trade(self, object trade)
+    cdef c_add_trade_sample(self, object sample_timestamp, double price_level, double amount)
+    cdef c_evict_samples(self)
+    cdef bint c_should_refit(self)
     cdef c_estimate_intensity(self)
+    cdef c_estimate_intensity_log_linear(self, list price_levels, list lambdas)
 
 cdef class TradesForwarder(EventListener):
     cdef:
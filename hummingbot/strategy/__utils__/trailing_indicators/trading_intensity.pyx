@@ -2,8 +2,10 @@
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
 import warnings
+from bisect import bisect_left, insort
 from decimal import Decimal
-from typing import Tuple
+from math import exp
+from typing import Dict, Tuple
 
 import numpy as np
 from scipy.optimize import curve_fit
@@ -26,11 +28,45 @@ cdef class TradesForwarder(EventListener):
 
 
 cdef class TradingIntensityIndicator:
-
-    def __init__(self, order_book: OrderBook, price_delegate: AssetPriceDelegate, sampling_length: int = 30):
+    """
+    Estimates the order book liquidity parameters alpha and kappa of the Avellaneda-Stoikov model, fitting
+    lambda(d) = alpha * exp(-kappa * d) to the traded amount by distance d from the mid price.
+
+    Quotes are kept in ascending timestamp order and every trade is aligned to the last quote before it with a binary
+    search. The traded amount per price level is aggregated incrementally over the sampling window, adding new trade
+    samples and subtracting the evicted ones, so only the fit depends on the number of price levels.
+
+    :param refit_interval: minimum number of ticks between two fits, the fit only runs when the samples changed
+    :param refit_threshold: relative change of the total traded amount in the window that triggers a fit before
+        refit_interval ticks have elapsed, 0 to disable
+    :param fit_method: "curve_fit" for a non linear least squares fit or "log_linear" for the closed form least squares
+        fit of log(lambda) = log(alpha) - kappa * d, much faster but weighting the levels differently
+    """
+    FIT_METHODS = ("curve_fit", "log_linear")
+
+    def __init__(self,
+                 order_book: OrderBook,
+                 price_delegate: AssetPriceDelegate,
+                 sampling_length: int = 30,
+                 refit_interval: int = 1,
+                 refit_threshold: float = 0,
+                 fit_method: str = "curve_fit"):
+        if fit_method not in self.FIT_METHODS:
+            raise ValueError(f"Invalid fit method {fit_method}, valid methods are {self.FIT_METHODS}.")
         self._alpha = 0
         self._kappa = 0
         self._trade_samples = {}
+        self._sample_timestamps = []
+        self._trades_consolidated = {}
+        self._price_level_counts = {}
+        self._total_amount = 0
+        self._last_fit_total_amount = 0
+        self._samples_changed = False
+        self._refit_interval = max(1, refit_interval)
+        # The first estimate is fitted as soon as the sampling buffer is full
+        self._ticks_since_fit = self._refit_interval
+        self._refit_threshold = refit_threshold
+        self._fit_method = fit_method
         self._current_trade_sample = []
         self._trades_forwarder = TradesForwarder(self)
         self._order_book = order_book
@@ -38,7 +74,8 @@ cdef class TradingIntensityIndicator:
         self._price_delegate = price_delegate
         self._sampling_length = sampling_length
         self._samples_length = 0
-        self._last_quotes = []
+        self._quote_timestamps = []
+        self._quote_prices = []
 
         warnings.simplefilter("ignore", OptimizeWarning)
 
@@ -48,12 +85,12 @@ cdef class TradingIntensityIndicator:
 
     @property
     def is_sampling_buffer_full(self) -> bool:
-        return len(self._trade_samples.keys()) == self._sampling_length
+        return len(self._trade_samples) == self._sampling_length
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        is_changed = self._samples_length != len(self._trade_samples.keys())
-        self._samples_length = len(self._trade_samples.keys())
+        is_changed = self._samples_length != len(self._trade_samples)
+        self._samples_length = len(self._trade_samples)
         return is_changed
 
     @property
@@ -64,56 +101,83 @@ cdef class TradingIntensityIndicator:
     def sampling_length(self, new_len: int):
         self._sampling_length = new_len
 
+    @property
+    def refit_interval(self) -> int:
+        return self._refit_interval
+
+    @refit_interval.setter
+    def refit_interval(self, value: int):
+        self._refit_interval = max(1, value)
+
+    @property
+    def refit_threshold(self) -> float:
+        return self._refit_threshold
+
+    @refit_threshold.setter
+    def refit_threshold(self, value: float):
+        self._refit_threshold = value
+
+    @property
+    def fit_method(self) -> str:
+        return self._fit_method
+
+    @fit_method.setter
+    def fit_method(self, value: str):
+        if value not in self.FIT_METHODS:
+            raise ValueError(f"Invalid fit method {value}, valid methods are {self.FIT_METHODS}.")
+        self._fit_method = value
+
+    @property
+    def trades_consolidated(self) -> Dict[float, float]:
+        """Traded amount by price level in the sampling window"""
+        return dict(self._trades_consolidated)
+
     @property
     def last_quotes(self) -> list:
         """A helper method to be used in unit tests"""
-        return self._last_quotes
+        return [{"timestamp": timestamp, "price": price}
+                for timestamp, price in zip(reversed(self._quote_timestamps), reversed(self._quote_prices))]
 
     @last_quotes.setter
     def last_quotes(self, value):
         """A helper method to be used in unit tests"""
-        self._last_quotes = value
+        # Quotes are given in descending timestamp order
+        self._quote_timestamps = [quote["timestamp"] for quote in reversed(value)]
+        self._quote_prices = [quote["price"] for quote in reversed(value)]
 
     def calculate(self, timestamp):
         """A helper method to be used in unit tests"""
         self.c_calculate(timestamp)
 
     cdef c_calculate(self, timestamp):
+        cdef:
+            int quote_idx
+            int latest_processed_quote_idx = -1
+
         price = self._price_delegate.get_price_by_type(PriceType.MidPrice)
-        # Descending order of price-timestamp quotes
-        self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
+        self._quote_timestamps.append(timestamp)
+        self._quote_prices.append(price)
 
-        latest_processed_quote_idx = None
         for trade in self._current_trade_sample:
-            for i, quote in enumerate(self._last_quotes):
-                if quote["timestamp"] < trade.timestamp:
-                    if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
-                        latest_processed_quote_idx = i
-                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
-
-                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
-                        self._trade_samples[quote["timestamp"] + 1] = []
-
-                    self._trade_samples[quote["timestamp"] + 1] += [trade]
-                    break
-
-        # THere are no trades left to process
+            # Last quote strictly before the trade
+            quote_idx = bisect_left(self._quote_timestamps, trade.timestamp) - 1
+            if quote_idx >= 0:
+                latest_processed_quote_idx = max(latest_processed_quote_idx, quote_idx)
+                self.c_add_trade_sample(self._quote_timestamps[quote_idx] + 1,
+                                        abs(trade.price - float(self._quote_prices[quote_idx])),
+                                        trade.amount)
+
+        # There are no trades left to process
         self._current_trade_sample = []
         # Store quotes that happened after the latest trade + one before
-        if latest_processed_quote_idx is not None:
-            self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
-
-        if len(self._trade_samples.keys()) > self._sampling_length:
-            timestamps = list(self._trade_samples.keys())
-            timestamps.sort()
-            timestamps = timestamps[-self._sampling_length:]
+        if latest_processed_quote_idx > 0:
+            del self._quote_timestamps[:latest_processed_quote_idx]
+            del self._quote_prices[:latest_processed_quote_idx]
 
-            trade_samples = {}
-            for timestamp in timestamps:
-                trade_samples[timestamp] = self._trade_samples[timestamp]
-            self._trade_samples = trade_samples
+        self.c_evict_samples()
 
-        if self.is_sampling_buffer_full:
+        self._ticks_since_fit += 1
+        if self.is_sampling_buffer_full and self.c_should_refit():
             self.c_estimate_intensity()
 
     def register_trade(self, trade):
@@ -123,33 +187,57 @@ cdef class TradingIntensityIndicator:
     cdef c_register_trade(self, object trade):
         self._current_trade_sample.append(trade)
 
+    cdef c_add_trade_sample(self, object sample_timestamp, double price_level, double amount):
+        if sample_timestamp not in self._trade_samples:
+            self._trade_samples[sample_timestamp] = []
+            insort(self._sample_timestamps, sample_timestamp)
+        self._trade_samples[sample_timestamp].append((price_level, amount))
+        self._trades_consolidated[price_level] = self._trades_consolidated.get(price_level, 0) + amount
+        self._price_level_counts[price_level] = self._price_level_counts.get(price_level, 0) + 1
+        self._total_amount += amount
+        self._samples_changed = True
+
+    cdef c_evict_samples(self):
+        # Keep only the latest sampling_length samples, subtracting the evicted trades from the aggregates
+        while len(self._sample_timestamps) > self._sampling_length:
+            sample_timestamp = self._sample_timestamps.pop(0)
+            for price_level, amount in self._trade_samples.pop(sample_timestamp):
+                self._price_level_counts[price_level] -= 1
+                if self._price_level_counts[price_level] == 0:
+                    del self._price_level_counts[price_level]
+                    del self._trades_consolidated[price_level]
+                else:
+                    self._trades_consolidated[price_level] -= amount
+                self._total_amount -= amount
+            self._samples_changed = True
+
+    cdef bint c_should_refit(self):
+        if not self._samples_changed:
+            return False
+        if self._ticks_since_fit >= self._refit_interval:
+            return True
+        return (self._refit_threshold > 0
+                and abs(self._total_amount - self._last_fit_total_amount)
+                >= self._refit_threshold * self._last_fit_total_amount)
+
     cdef c_estimate_intensity(self):
         cdef:
-            dict trades_consolidated
             list lambdas
             list price_levels
 
-        # Calculate lambdas / trading intensities
-        lambdas = []
+        self._samples_changed = False
+        self._ticks_since_fit = 0
+        self._last_fit_total_amount = self._total_amount
 
-        trades_consolidated = {}
-        price_levels = []
-        for timestamp in self._trade_samples.keys():
-            tick = self._trade_samples[timestamp]
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
-
-                trades_consolidated[trade['price_level']] += trade['amount']
-
-        price_levels = sorted(price_levels, reverse=True)
-
-        for price_level in price_levels:
-            lambdas += [trades_consolidated[price_level]]
+        price_levels = sorted(self._trades_consolidated.keys(), reverse=True)
+        lambdas = [self._trades_consolidated[price_level] for price_level in price_levels]
 
         # Adjust to be able to calculate log
-        lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
+        lambdas_adj = [10**-10 if x <= 0 else x for x in lambdas]
+
+        if self._fit_method == "log_linear":
+            self.c_estimate_intensity_log_linear(price_levels, lambdas_adj)
+            return
 
         # Fit the probability density function; reuse previously calculated parameters as initial values
         try:
@@ -164,3 +252,28 @@ cdef class TradingIntensityIndicator:
             self._alpha = Decimal(str(params[0][0]))
         except (RuntimeError, ValueError) as e:
             pass
+
+    cdef c_estimate_intensity_log_linear(self, list price_levels, list lambdas):
+        cdef:
+            int n = len(price_levels)
+            double mean_x
+            double mean_y
+            double var_x
+
+        if n < 2:
+            return
+        x = np.asarray(price_levels, dtype=np.float64)
+        y = np.log(np.asarray(lambdas, dtype=np.float64))
+        mean_x = x.mean()
+        mean_y = y.mean()
+        var_x = ((x - mean_x) ** 2).sum()
+        if var_x == 0:
+            return
+        slope = ((x - mean_x) * (y - mean_y)).sum() / var_x
+        if slope > 0:
+            # Intensity growing with the distance to the mid price, fall back to a flat intensity
+            self._kappa = 0
+            self._alpha = exp(mean_y)
+        else:
+            self._kappa = -slope
+            self._alpha = exp(mean_y - slope * mean_x)
@@ -3,7 +3,7 @@ import logging
 import os
 import time
 from decimal import Decimal
-from math import ceil, floor, isnan
+from math import ceil, floor, isnan, log
 from typing import Dict, List, Tuple, Union
 
 import numpy as np
@@ -23,6 +23,7 @@ from hummingbot.core.data_type.limit_order cimport LimitOrder
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils import map_df_to_str
+from hummingbot.core.utils.float_math import to_decimal
 from hummingbot.strategy.__utils__.trailing_indicators.instant_volatility import InstantVolatilityIndicator
 from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import TradingIntensityIndicator
 from hummingbot.strategy.avellaneda_market_making.avellaneda_market_making_config_map_pydantic import (
@@ -424,12 +425,22 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
             if self._trading_intensity is not None:
                 self._trading_intensity.sampling_length = trading_intensity_buffer_size
 
+        refit_interval = self._config_map.trading_intensity_refit_interval
+        refit_threshold = float(self._config_map.trading_intensity_refit_threshold)
+        fit_method = self._config_map.trading_intensity_fit_method
         if self._trading_intensity is None and self.market_info.market.ready:
             self._trading_intensity = TradingIntensityIndicator(
                 order_book=self.market_info.order_book,
                 price_delegate=self._price_delegate,
                 sampling_length=self._trading_intensity_buffer_size,
+                refit_interval=refit_interval,
+                refit_threshold=refit_threshold,
+                fit_method=fit_method,
             )
+        elif self._trading_intensity is not None:
+            self._trading_intensity.refit_interval = refit_interval
+            self._trading_intensity.refit_threshold = refit_threshold
+            self._trading_intensity.fit_method = fit_method
 
         self._ticks_to_be_ready += (ticks_to_be_ready_after - ticks_to_be_ready_before)
         if self._ticks_to_be_ready < 0:
@@ -713,28 +724,41 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
     cdef c_calculate_reservation_price_and_optimal_spread(self):
         cdef:
             ExchangeBase market = self._market_info.market
+            double price
+            double inventory
+            double q
+            double vol
+            double gamma
+            double kappa
+            double time_left_fraction
+            double reservation_price
+            double optimal_spread
+            double min_spread
+
+        # The intermediate math is done with floats, the results are converted to Decimal for the order proposal
 
         # Current mid price
-        price = self.get_price()
+        price = float(self.get_price())
 
         # The amount of stocks owned - q - has to be in relative units, not absolute, because changing the portfolio size shouldn't change the reservation price
         # The reservation price should concern itself only with the strategy performance, i.e. amount of stocks relative to the target
-        inventory = Decimal(str(self.c_calculate_inventory()))
+        inventory = float(self.c_calculate_inventory())
         if inventory == 0:
             return
 
-        q_target = Decimal(str(self.c_calculate_target_inventory()))
-        q = (market.get_balance(self.base_asset) - q_target) / (inventory)
+        q = (float(market.get_balance(self.base_asset)) - float(self.c_calculate_target_inventory())) / inventory
         # Volatility has to be in absolute values (prices) because in calculation of reservation price it's not multiplied by the current price, therefore
         # it can't be a percentage. The result of the multiplication has to be an absolute price value because it's being subtracted from the current price
-        vol = self.get_volatility()
+        vol = float(self._avg_vol.current_value)
 
         # order book liquidity - kappa and alpha have to represent absolute values because the second member of the optimal spread equation has to be an absolute price
         # and from the reservation price calculation we know that gamma's unit is not absolute price
         if all((self.gamma, self._kappa)) and self._alpha != 0 and self._kappa > 0 and vol != 0:
+            gamma = float(self.gamma)
+            kappa = float(self._kappa)
             if self._execution_state.time_left is not None and self._execution_state.closing_time is not None:
                 # Avellaneda-Stoikov for a fixed timespan
-                time_left_fraction = Decimal(str(self._execution_state.time_left / self._execution_state.closing_time))
+                time_left_fraction = self._execution_state.time_left / self._execution_state.closing_time
             else:
                 # Avellaneda-Stoikov for an infinite timespan
                 # The equations in the paper for this contain a few mistakes
@@ -752,18 +776,20 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
             # current mid price
             # This leads to normalization of the risk_factor and will guaranetee consistent behavior on all price ranges of the asset, and across assets
 
-            self._reservation_price = price - (q * self.gamma * vol * time_left_fraction)
+            reservation_price = price - (q * gamma * vol * time_left_fraction)
 
-            self._optimal_spread = self.gamma * vol * time_left_fraction
-            self._optimal_spread += 2 * Decimal(1 + self.gamma / self._kappa).ln() / self.gamma
+            optimal_spread = gamma * vol * time_left_fraction
+            optimal_spread += 2 * log(1 + gamma / kappa) / gamma
 
-            min_spread = price / 100 * Decimal(str(self._config_map.min_spread))
+            min_spread = price / 100 * float(self._config_map.min_spread)
 
             max_limit_bid = price - min_spread / 2
             min_limit_ask = price + min_spread / 2
 
-            self._optimal_ask = max(self._reservation_price + self._optimal_spread / 2, min_limit_ask)
-            self._optimal_bid = min(self._reservation_price - self._optimal_spread / 2, max_limit_bid)
+            self._reservation_price = to_decimal(reservation_price)
+            self._optimal_spread = to_decimal(optimal_spread)
+            self._optimal_ask = to_decimal(max(reservation_price + optimal_spread / 2, min_limit_ask))
+            self._optimal_bid = to_decimal(min(reservation_price - optimal_spread / 2, max_limit_bid))
 
             # This is not what the algorithm will use as proposed bid and ask. This is just the raw output.
             # Optimal bid and optimal ask prices will be used
@@ -771,10 +797,10 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
                 self.logger().info(f"q={q:.4f} | "
                                    f"vol={vol:.10f}")
                 self.logger().info(f"mid_price={price:.10f} | "
-                                   f"reservation_price={self._reservation_price:.10f} | "
-                                   f"optimal_spread={self._optimal_spread:.10f}")
-                self.logger().info(f"optimal_bid={(price-(self._reservation_price - self._optimal_spread / 2)) / price * 100:.4f}% | "
-                                   f"optimal_ask={((self._reservation_price + self._optimal_spread / 2) - price) / price * 100:.4f}%")
+                                   f"reservation_price={reservation_price:.10f} | "
+                                   f"optimal_spread={optimal_spread:.10f}")
+                self.logger().info(f"optimal_bid={(price-(reservation_price - optimal_spread / 2)) / price * 100:.4f}% | "
+                                   f"optimal_ask={((reservation_price + optimal_spread / 2) - price) / price * 100:.4f}%")
 
     def calculate_reservation_price_and_optimal_spread(self):
         return self.c_calculate_reservation_price_and_optimal_spread()
@@ -175,6 +175,8 @@ HANGING_ORDER_MODELS = {
     IgnoreHangingOrdersModel.Config.title: IgnoreHangingOrdersModel,
 }
 
+TRADING_INTENSITY_FIT_METHODS = ("curve_fit", "log_linear")
+
 
 class AvellanedaMarketMakingConfigMap(BaseTradingStrategyConfigMap):
     strategy: str = Field(default="avellaneda_market_making", client_data=None)
@@ -311,6 +313,38 @@ class AvellanedaMarketMakingConfigMap(BaseTradingStrategyConfigMap):
             prompt=lambda mi: "Enter amount of ticks that will be stored to estimate order book liquidity",
         ),
     )
+    trading_intensity_refit_interval: int = Field(
+        default=1,
+        description="The minimum number of ticks between two estimations of the order book liquidity.",
+        ge=1,
+        client_data=ClientFieldData(
+            prompt=lambda mi: "Enter the minimum amount of ticks between two estimations of order book liquidity",
+        ),
+    )
+    trading_intensity_refit_threshold: Decimal = Field(
+        default=Decimal("0"),
+        description=(
+            "The relative change of the traded amount in the liquidity buffer that triggers an estimation"
+            " before the refit interval has elapsed. 0 disables it."
+        ),
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda mi: (
+                "Enter the relative change of the traded amount that triggers an early estimation of order book"
+                " liquidity (Enter 0.1 to indicate 10%, 0 to disable)"
+            ),
+        ),
+    )
+    trading_intensity_fit_method: str = Field(
+        default="curve_fit",
+        description=(
+            "The method fitting the order book liquidity, curve_fit (non linear least squares) or log_linear"
+            " (closed form, faster)."
+        ),
+        client_data=ClientFieldData(
+            prompt=lambda mi: f"Select the order book liquidity fit method ({'/'.join(TRADING_INTENSITY_FIT_METHODS)})",
+        ),
+    )
     order_levels_mode: Union[SingleOrderLevelModel, MultiOrderLevelModel] = Field(
         default=SingleOrderLevelModel.construct(),
         description="Allows activating multi-order levels.",
@@ -390,6 +424,30 @@ class AvellanedaMarketMakingConfigMap(BaseTradingStrategyConfigMap):
             raise ValueError(ret)
         return v
 
+    @validator("trading_intensity_refit_interval", pre=True)
+    def validate_refit_interval(cls, v: str):
+        """Used for client-friendly error output."""
+        ret = validate_int(v, min_value=1)
+        if ret is not None:
+            raise ValueError(ret)
+        return v
+
+    @validator("trading_intensity_refit_threshold", pre=True)
+    def validate_refit_threshold(cls, v: str):
+        """Used for client-friendly error output."""
+        ret = validate_decimal(v, min_value=Decimal("0"), inclusive=True)
+        if ret is not None:
+            raise ValueError(ret)
+        return v
+
+    @validator("trading_intensity_fit_method", pre=True)
+    def validate_fit_method(cls, v: str):
+        if v not in TRADING_INTENSITY_FIT_METHODS:
+            raise ValueError(
+                f"Invalid fit method, please choose value from {list(TRADING_INTENSITY_FIT_METHODS)}."
+            )
+        return v
+
     @validator("order_levels_mode", pre=True)
     def validate_order_levels_mode(cls, v: Union[str, SingleOrderLevelModel, MultiOrderLevelModel]):
         if isinstance(v, (SingleOrderLevelModel, MultiOrderLevelModel, Dict)):
@@ -0,0 +1,89 @@
+from decimal import Decimal
+from typing import List, NamedTuple, Tuple
+
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.strategy.pure_market_making.data_types import PriceSize, Proposal
+
+
+class ProposalDiff(NamedTuple):
+    """
+    Operations turning the active orders of the strategy into the orders of a proposal:
+    - the active orders with a proposed price within the refresh tolerance are kept
+    - the other active orders are replaced, level by level, by the remaining proposed orders of the same side
+    - the active orders left are cancelled and the proposed orders left are created
+    """
+    orders_to_keep: List[LimitOrder]
+    orders_to_replace: List[Tuple[LimitOrder, PriceSize]]
+    orders_to_cancel: List[LimitOrder]
+    buys_to_create: List[PriceSize]
+    sells_to_create: List[PriceSize]
+
+    @property
+    def is_empty(self) -> bool:
+        return (len(self.orders_to_replace) == 0
+                and len(self.orders_to_cancel) == 0
+                and len(self.buys_to_create) == 0
+                and len(self.sells_to_create) == 0)
+
+    @property
+    def buys_to_submit(self) -> List[PriceSize]:
+        """
+        The buy orders to submit, replacing active orders or new.
+        """
+        return [price_size for order, price_size in self.orders_to_replace if order.is_buy] + self.buys_to_create
+
+    @property
+    def sells_to_submit(self) -> List[PriceSize]:
+        """
+        The sell orders to submit, replacing active orders or new.
+        """
+        return [price_size for order, price_size in self.orders_to_replace if not order.is_buy] + self.sells_to_create
+
+
+def is_within_tolerance(current_price: Decimal, proposed_price: Decimal, tolerance_pct: Decimal) -> bool:
+    return tolerance_pct >= 0 and abs(proposed_price - current_price) / current_price <= tolerance_pct
+
+
+def diff_proposal(active_orders: List[LimitOrder], proposal: Proposal, tolerance_pct: Decimal) -> ProposalDiff:
+    """
+    Computes the operations with the least orders cancelled and created to move from the active orders to the
+    proposal. A negative tolerance replaces all the active orders, like the refresh without tolerance of the strategy.
+
+    :param active_orders: the active orders of the strategy, not being cancelled
+    :param proposal: the orders proposal
+    :param tolerance_pct: the order refresh tolerance, as a ratio of the order price
+    """
+    orders_to_keep = []
+    orders_to_replace = []
+    orders_to_cancel = []
+    proposed_by_side = []
+    for is_buy, proposed in ((True, proposal.buys), (False, proposal.sells)):
+        # Levels from the best price
+        side_orders = sorted((o for o in active_orders if o.is_buy == is_buy), key=lambda o: o.price, reverse=is_buy)
+        side_proposed = sorted(proposed, key=lambda p: p.price, reverse=is_buy)
+        unmatched_orders = []
+        for order in side_orders:
+            match_index = -1
+            match_distance = None
+            for index, price_size in enumerate(side_proposed):
+                distance = abs(price_size.price - order.price)
+                if (is_within_tolerance(order.price, price_size.price, tolerance_pct)
+                        and (match_distance is None or distance < match_distance)):
+                    match_index = index
+                    match_distance = distance
+            if match_index >= 0:
+                orders_to_keep.append(order)
+                side_proposed.pop(match_index)
+            else:
+                unmatched_orders.append(order)
+        replaced_count = min(len(unmatched_orders), len(side_proposed))
+        orders_to_replace.extend(zip(unmatched_orders[:replaced_count], side_proposed[:replaced_count]))
+        orders_to_cancel.extend(unmatched_orders[replaced_count:])
+        proposed_by_side.append(side_proposed[replaced_count:])
+    return ProposalDiff(
+        orders_to_keep=orders_to_keep,
+        orders_to_replace=orders_to_replace,
+        orders_to_cancel=orders_to_cancel,
+        buys_to_create=proposed_by_side[0],
+        sells_to_create=proposed_by_side[1],
+    )
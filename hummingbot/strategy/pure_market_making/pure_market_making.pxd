@@ -58,6 +58,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         bint _should_wait_order_cancel_confirmation
 
         object _moving_price_band
+        bint _differential_order_refresh_enabled
 
     cdef object c_get_mid_price(self)
     cdef object c_create_base_proposal(self)
@@ -79,5 +80,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     cdef c_cancel_active_orders_on_max_age_limit(self)
     cdef bint c_to_create_orders(self, object proposal)
     cdef c_execute_orders_proposal(self, object proposal)
+    cdef c_execute_proposal_diff(self, object proposal)
+    cdef bint c_create_proposal_orders(self, list buys, list sells)
     cdef set_timers(self)
     cdef c_apply_moving_price_band(self, object proposal)
@@ -26,12 +26,15 @@ from .inventory_cost_price_delegate import InventoryCostPriceDelegate
 from .inventory_skew_calculator cimport c_calculate_bid_ask_ratios_from_base_asset_ratio
 from .inventory_skew_calculator import calculate_total_order_size
 from .pure_market_making_order_tracker import PureMarketMakingOrderTracker
+from .proposal_diff import diff_proposal
 from .moving_price_band import MovingPriceBand
 
 
 NaN = float("nan")
 s_decimal_zero = Decimal(0)
+s_decimal_one = Decimal(1)
 s_decimal_neg_one = Decimal(-1)
+s_decimal_100 = Decimal(100)
 pmm_logger = None
 
 
@@ -85,7 +88,8 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     bid_order_level_spreads: List[Decimal] = None,
                     ask_order_level_spreads: List[Decimal] = None,
                     should_wait_order_cancel_confirmation: bool = True,
-                    moving_price_band: Optional[MovingPriceBand] = None
+                    moving_price_band: Optional[MovingPriceBand] = None,
+                    differential_order_refresh_enabled: bool = False
                     ):
         if order_override is None:
             order_override = {}
@@ -144,6 +148,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         self._last_own_trade_price = Decimal('nan')
         self._should_wait_order_cancel_confirmation = should_wait_order_cancel_confirmation
         self._moving_price_band = moving_price_band
+        self._differential_order_refresh_enabled = differential_order_refresh_enabled
         self.c_add_markets([market_info.market])
 
     def all_markets_ready(self):
@@ -359,6 +364,10 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     def split_order_levels_enabled(self):
         return self._split_order_levels_enabled
 
+    @property
+    def differential_order_refresh_enabled(self):
+        return self._differential_order_refresh_enabled
+
     @property
     def bid_order_level_spreads(self):
         return self._bid_order_level_spreads
@@ -756,10 +765,14 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             self._hanging_orders_tracker.process_tick()
 
             self.c_cancel_active_orders_on_max_age_limit()
-            self.c_cancel_active_orders(proposal)
-            self.c_cancel_orders_below_min_spread()
-            if self.c_to_create_orders(proposal):
-                self.c_execute_orders_proposal(proposal)
+            if self._differential_order_refresh_enabled and not self._hanging_orders_enabled:
+                self.c_cancel_orders_below_min_spread()
+                self.c_execute_proposal_diff(proposal)
+            else:
+                self.c_cancel_active_orders(proposal)
+                self.c_cancel_orders_below_min_spread()
+                if self.c_to_create_orders(proposal):
+                    self.c_execute_orders_proposal(proposal)
         finally:
             self._last_timestamp = timestamp
 
@@ -788,36 +801,42 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             for key, value in order_override.items():
                 if str(value[0]) in ["buy", "sell"]:
                     if str(value[0]) == "buy" and not buy_reference_price.is_nan():
-                        price = buy_reference_price * (Decimal("1") - Decimal(str(value[1])) / Decimal("100"))
+                        price = buy_reference_price * (s_decimal_one - Decimal(str(value[1])) / s_decimal_100)
                         price = market.c_quantize_order_price(self.trading_pair, price)
                         size = Decimal(str(value[2]))
                         size = market.c_quantize_order_amount(self.trading_pair, size)
                         if size > 0 and price > 0:
                             buys.append(PriceSize(price, size))
                     elif str(value[0]) == "sell" and not sell_reference_price.is_nan():
-                        price = sell_reference_price * (Decimal("1") + Decimal(str(value[1])) / Decimal("100"))
+                        price = sell_reference_price * (s_decimal_one + Decimal(str(value[1])) / s_decimal_100)
                         price = market.c_quantize_order_price(self.trading_pair, price)
                         size = Decimal(str(value[2]))
                         size = market.c_quantize_order_amount(self.trading_pair, size)
                         if size > 0 and price > 0:
                             sells.append(PriceSize(price, size))
         else:
+            # The spread factors not depending on the level are computed once per proposal, and the levels of each
+            # side are quantized together
             if not buy_reference_price.is_nan():
-                for level in range(0, self._buy_levels):
-                    price = buy_reference_price * (Decimal("1") - self._bid_spread - (level * self._order_level_spread))
-                    price = market.c_quantize_order_price(self.trading_pair, price)
-                    size = self._order_amount + (self._order_level_amount * level)
-                    size = market.c_quantize_order_amount(self.trading_pair, size)
-                    if size > 0:
-                        buys.append(PriceSize(price, size))
+                bid_factor = s_decimal_one - self._bid_spread
+                prices = market.quantize_order_prices(
+                    self.trading_pair,
+                    [buy_reference_price * (bid_factor - (level * self._order_level_spread))
+                     for level in range(0, self._buy_levels)])
+                sizes = market.quantize_order_amounts(
+                    self.trading_pair,
+                    [self._order_amount + (self._order_level_amount * level) for level in range(0, self._buy_levels)])
+                buys = [PriceSize(price, size) for price, size in zip(prices, sizes) if size > 0]
             if not sell_reference_price.is_nan():
-                for level in range(0, self._sell_levels):
-                    price = sell_reference_price * (Decimal("1") + self._ask_spread + (level * self._order_level_spread))
-                    price = market.c_quantize_order_price(self.trading_pair, price)
-                    size = self._order_amount + (self._order_level_amount * level)
-                    size = market.c_quantize_order_amount(self.trading_pair, size)
-                    if size > 0:
-                        sells.append(PriceSize(price, size))
+                ask_factor = s_decimal_one + self._ask_spread
+                prices = market.quantize_order_prices(
+                    self.trading_pair,
+                    [sell_reference_price * (ask_factor + (level * self._order_level_spread))
+                     for level in range(0, self._sell_levels)])
+                sizes = market.quantize_order_amounts(
+                    self.trading_pair,
+                    [self._order_amount + (self._order_level_amount * level) for level in range(0, self._sell_levels)])
+                sells = [PriceSize(price, size) for price, size in zip(prices, sizes) if size > 0]
 
         return Proposal(buys, sells)
 
@@ -1300,6 +1319,98 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         if orders_created:
             self.set_timers()
 
+    cdef c_execute_proposal_diff(self, object proposal):
+        """
+        Refreshes only the order levels that differ from the proposal: the active orders with a proposed price within
+        the refresh tolerance are kept, the others are cancelled and the missing proposed orders are created.
+        """
+        if proposal is None or self._cancel_timestamp > self._current_timestamp:
+            return
+
+        cdef:
+            ExchangeBase market = self._market_info.market
+            object in_flight_cancels = self._sb_order_tracker.in_flight_cancels
+            list active_orders = [o for o in self.active_non_hanging_orders
+                                  if o.client_order_id not in in_flight_cancels]
+            object diff = diff_proposal(active_orders, proposal, self._order_refresh_tolerance_pct)
+            bint orders_amended = False
+
+        for order in diff.orders_to_cancel:
+            self.c_cancel_order(self._market_info, order.client_order_id)
+        if market.supports_order_amendment:
+            for order, price_size in diff.orders_to_replace:
+                self.c_amend_order(self._market_info, order.client_order_id, price_size.price, price_size.size,
+                                   self._limit_order_type)
+                orders_amended = True
+            buys, sells = diff.buys_to_create, diff.sells_to_create
+        else:
+            # The replaced orders are cancelled and created again
+            for order, _ in diff.orders_to_replace:
+                self.c_cancel_order(self._market_info, order.client_order_id)
+            buys, sells = diff.buys_to_submit, diff.sells_to_submit
+
+        if self._should_wait_order_cancel_confirmation and len(in_flight_cancels) > 0:
+            # The diff runs again on the next ticks, and the orders are created once the cancels are confirmed
+            return
+        if self._create_timestamp >= self._current_timestamp:
+            return
+        if self.c_create_proposal_orders(buys, sells) or orders_amended:
+            self.set_timers()
+
+    cdef bint c_create_proposal_orders(self, list buys, list sells):
+        """
+        Creates the buy and sell orders, in a single batch when the connector can create them with the limit order
+        type of the strategy.
+
+        :return: True if any order was created
+        """
+        cdef:
+            ExchangeBase market = self._market_info.market
+            list orders_to_create
+
+        if self._logging_options & self.OPTION_LOG_CREATE_ORDER:
+            for side, price_sizes in (("bid", buys), ("ask", sells)):
+                if len(price_sizes) > 0:
+                    price_quote_str = [f"{price_size.size.normalize()} {self.base_asset}, "
+                                       f"{price_size.price.normalize()} {self.quote_asset}"
+                                       for price_size in price_sizes]
+                    self.logger().info(
+                        f"({self.trading_pair}) Creating {len(price_sizes)} {side} orders "
+                        f"at (Size, Price): {price_quote_str}"
+                    )
+
+        if len(buys) + len(sells) > 1 and self._limit_order_type is OrderType.LIMIT:
+            # The default batch creation of the connectors creates limit orders one by one
+            orders_to_create = [
+                LimitOrder(client_order_id="",
+                           trading_pair=self.trading_pair,
+                           is_buy=is_buy,
+                           base_currency=self.base_asset,
+                           quote_currency=self.quote_asset,
+                           price=price_size.price,
+                           quantity=price_size.size)
+                for is_buy, price_sizes in ((True, buys), (False, sells))
+                for price_size in price_sizes
+            ]
+            for order in market.batch_order_create(orders_to_create=orders_to_create):
+                self.c_start_tracking_limit_order(self._market_info,
+                                                  order.client_order_id,
+                                                  order.is_buy,
+                                                  order.price,
+                                                  order.quantity)
+        else:
+            for buy in buys:
+                self.c_buy_with_specific_market(self._market_info,
+                                                buy.size,
+                                                order_type=self._limit_order_type,
+                                                price=buy.price)
+            for sell in sells:
+                self.c_sell_with_specific_market(self._market_info,
+                                                 sell.size,
+                                                 order_type=self._limit_order_type,
+                                                 price=sell.price)
+        return len(buys) + len(sells) > 0
+
     cdef set_timers(self):
         cdef double next_cycle = self._current_timestamp + self._order_refresh_time
         if self._create_timestamp <= self._current_timestamp:
@@ -393,6 +393,14 @@ pure_market_making_config_map = {
                   type_str="bool",
                   default=True,
                   validator=validate_bool),
+    "differential_order_refresh_enabled":
+        ConfigVar(key="differential_order_refresh_enabled",
+                  prompt="Do you want to refresh only the order levels that changed, keeping the orders within the "
+                         "refresh tolerance? (Not applied when hanging orders are enabled) (Yes/No) >>> ",
+                  required_if=lambda: False,
+                  type_str="bool",
+                  default=False,
+                  validator=validate_bool),
     "split_order_levels_enabled":
         ConfigVar(key="split_order_levels_enabled",
                   prompt="Do you want bid and ask orders to be placed at multiple defined spread and amount? "
@@ -144,6 +144,30 @@ class ScriptStrategyBase(StrategyPyBase):
         market_pair = self._market_trading_pair_tuple(connector_name, trading_pair)
         self.cancel_order(market_trading_pair_tuple=market_pair, order_id=order_id)
 
+    def amend(self,
+              connector_name: str,
+              trading_pair: str,
+              order_id: str,
+              price: Decimal,
+              amount: Decimal,
+              order_type: OrderType = OrderType.LIMIT,
+              position_action: PositionAction = PositionAction.OPEN) -> Optional[str]:
+        """
+        A wrapper function to amend_order.
+
+        :param connector_name: The name of the connector
+        :param trading_pair: The market trading pair
+        :param order_id: The identifier assigned by the client of the order to be amended
+        :param price: The new order price
+        :param amount: The new total order amount, including the amount already filled
+        :param order_type: The type of the order replacing it, if the connector does not support order amendment
+        :param position_action: The position action of the order replacing it (for perpetual market only)
+
+        :return: The client assigned id of the amended order or of the new order replacing it
+        """
+        market_pair = self._market_trading_pair_tuple(connector_name, trading_pair)
+        return self.amend_order(market_pair, order_id, price, amount, order_type, position_action)
+
     def get_active_orders(self, connector_name: str) -> List[LimitOrder]:
         """
         Returns a list of active orders for a connector.
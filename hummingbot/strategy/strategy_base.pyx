@@ -2,7 +2,8 @@ from decimal import Decimal
 import logging
 import pandas as pd
 from typing import (
-    List)
+    List,
+    Optional)
 
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.event.events import MarketEvent, AccountEvent
@@ -189,26 +190,40 @@ cdef class StrategyBase(TimeIterator):
     @property
     def trades(self) -> List[Trade]:
         """
-        Returns a list of all completed trades from the market.
-        The trades are taken from the market event logs.
+        Returns the most recent completed trades from the markets, the ones kept in memory by the market fill
+        histories. The older trades spilled to disk are only returned by trades_since.
         """
-        def event_to_trade(order_filled_event: OrderFilledEvent, market_name: str):
-            return Trade(order_filled_event.trading_pair,
-                         order_filled_event.trade_type,
-                         order_filled_event.price,
-                         order_filled_event.amount,
-                         order_filled_event.order_type,
-                         market_name,
-                         order_filled_event.timestamp,
-                         order_filled_event.trade_fee)
         past_trades = []
         for market in self.active_markets:
-            event_logs = market.event_logs
-            order_filled_events = list(filter(lambda e: isinstance(e, OrderFilledEvent), event_logs))
-            past_trades += list(map(lambda ofe: event_to_trade(ofe, market.display_name), order_filled_events))
+            past_trades.extend(self._fill_to_trade(order_filled_event, market.display_name)
+                               for order_filled_event in market.fill_history.recent_fills)
+        return sorted(past_trades, key=lambda x: x.timestamp)
+
+    def trades_since(self, start_timestamp: float = float("-inf"), end_timestamp: float = float("inf")) -> List[Trade]:
+        """
+        Returns the completed trades from the markets with a timestamp after start_timestamp and up to end_timestamp.
+        The fills spilled to disk by the market fill histories are only read when the window reaches them.
+        """
+        past_trades = []
+        for market in self.active_markets:
+            order_filled_events = market.fill_history.fills(start_timestamp=start_timestamp,
+                                                            end_timestamp=end_timestamp)
+            past_trades.extend(self._fill_to_trade(order_filled_event, market.display_name)
+                               for order_filled_event in order_filled_events)
 
         return sorted(past_trades, key=lambda x: x.timestamp)
 
+    @staticmethod
+    def _fill_to_trade(order_filled_event: OrderFilledEvent, market_name: str) -> Trade:
+        return Trade(order_filled_event.trading_pair,
+                     order_filled_event.trade_type,
+                     order_filled_event.price,
+                     order_filled_event.amount,
+                     order_filled_event.order_type,
+                     market_name,
+                     order_filled_event.timestamp,
+                     order_filled_event.trade_fee)
+
     def market_status_data_frame(self, market_trading_pair_tuples: List[MarketTradingPairTuple]) -> pd.DataFrame:
         cdef:
             ConnectorBase market
@@ -597,6 +612,60 @@ cdef class StrategyBase(TimeIterator):
 
     def cancel_order(self, market_trading_pair_tuple: MarketTradingPairTuple, order_id: str):
         self.c_cancel_order(market_trading_pair_tuple, order_id)
+
+    def amend_order(self,
+                    market_trading_pair_tuple: MarketTradingPairTuple,
+                    order_id: str,
+                    price: Decimal,
+                    amount: Decimal,
+                    order_type: OrderType = OrderType.LIMIT,
+                    position_action: PositionAction = PositionAction.OPEN) -> Optional[str]:
+        return self.c_amend_order(market_trading_pair_tuple, order_id, price, amount, order_type, position_action)
+
+    cdef str c_amend_order(self, object market_trading_pair_tuple, str order_id, object price, object amount,
+                           object order_type=OrderType.LIMIT, object position_action=PositionAction.OPEN):
+        """
+        Modifies the price and amount of an active limit order. The connectors supporting order amendment modify the
+        order in place, the orders of the other connectors are cancelled and replaced by a new order of `order_type`
+        for the amount not filled yet. The replacement order is placed with `position_action`, so the amended orders
+        closing a position on perpetual connectors must pass PositionAction.CLOSE.
+
+        :return: the id of the amended order or of the new order replacing it, None if the order is not active
+        """
+        cdef:
+            ConnectorBase market = market_trading_pair_tuple.market
+            object order = self._sb_order_tracker.c_get_limit_order(market_trading_pair_tuple, order_id)
+            object market_order
+            object remaining_amount
+            str amended_order_id
+
+        if order is None or self._sb_order_tracker.c_has_in_flight_cancel(order_id):
+            return None
+
+        if not market.supports_order_amendment:
+            market_order = next((o for o in market.limit_orders if o.client_order_id == order_id), None)
+            remaining_amount = amount
+            if market_order is not None and market_order.filled_quantity.is_finite():
+                remaining_amount = amount - market_order.filled_quantity
+            self.c_cancel_order(market_trading_pair_tuple, order_id)
+            if remaining_amount <= s_decimal_0:
+                return None
+            if order.is_buy:
+                return self.c_buy_with_specific_market(market_trading_pair_tuple, remaining_amount,
+                                                       order_type=order_type, price=price, expiration_seconds=NaN,
+                                                       position_action=position_action)
+            return self.c_sell_with_specific_market(market_trading_pair_tuple, remaining_amount,
+                                                    order_type=order_type, price=price, expiration_seconds=NaN,
+                                                    position_action=position_action)
+
+        self.log_with_clock(
+            logging.INFO,
+            f"({market_trading_pair_tuple.trading_pair}) Amending the limit order {order_id} to {amount} at {price}."
+        )
+        amended_order_id = market.amend_order(market_trading_pair_tuple.trading_pair, order_id, price, amount)
+        if amended_order_id is not None:
+            self.c_start_tracking_limit_order(market_trading_pair_tuple, amended_order_id, order.is_buy, price, amount)
+        return amended_order_id
     # ----------------------------------------------------------------------------------------------------------
     # </editor-fold>
 
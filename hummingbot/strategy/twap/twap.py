@@ -73,6 +73,7 @@ class TwapTradeStrategy(StrategyPyBase):
         self._target_asset_amount = target_asset_amount
         self._order_step_size = order_step_size
         self._first_order = True
+        self._start_timestamp = 0
         self._previous_timestamp = 0
         self._last_timestamp = 0
         self._order_price = order_price
@@ -127,12 +128,12 @@ class TwapTradeStrategy(StrategyPyBase):
     def filled_trades(self):
         """
         Returns a list of all filled trades generated from limit orders with the same trade type the strategy
-        has in its configuration
+        has in its configuration, since the strategy started
         """
         trade_type = TradeType.BUY if self._is_buy else TradeType.SELL
         return [trade
                 for trade
-                in self.trades
+                in self.trades_since(self._start_timestamp)
                 if trade.trade_type == trade_type.name and trade.order_type == OrderType.LIMIT]
 
     def format_status(self) -> str:
@@ -295,6 +296,7 @@ class TwapTradeStrategy(StrategyPyBase):
 
     def start(self, clock: Clock, timestamp: float):
         self.logger().info(f"Waiting for {self._order_delay_time} to place orders")
+        self._start_timestamp = timestamp
         self._previous_timestamp = timestamp
         self._last_timestamp = timestamp
 
@@ -144,8 +144,7 @@ class BacktestingDataProvider(MarketDataProvider):
         :return: Quantized amount.
         """
         trading_rules = self.get_trading_rules(connector_name, trading_pair)
-        order_size_quantum = trading_rules.min_base_amount_increment
-        return (amount // order_size_quantum) * order_size_quantum
+        return trading_rules.quantizer.quantize_amount(amount)
 
     def quantize_order_price(self, connector_name: str, trading_pair: str, price: Decimal):
         """
@@ -156,5 +155,4 @@ class BacktestingDataProvider(MarketDataProvider):
         :return: Quantized price.
         """
         trading_rules = self.get_trading_rules(connector_name, trading_pair)
-        price_quantum = trading_rules.min_price_increment
-        return (price // price_quantum) * price_quantum
+        return trading_rules.quantizer.quantize_price(price)
@@ -14,7 +14,11 @@ from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.exceptions import InvalidController
 from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
 from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulation
+from hummingbot.strategy_v2.backtesting.executors_simulator.batch_position_executor_simulator import (
+    BatchPositionExecutorSimulator,
+)
 from hummingbot.strategy_v2.backtesting.executors_simulator.dca_executor_simulator import DCAExecutorSimulator
+from hummingbot.strategy_v2.backtesting.executors_simulator.grid_executor_simulator import GridExecutorSimulator
 from hummingbot.strategy_v2.backtesting.executors_simulator.position_executor_simulator import PositionExecutorSimulator
 from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
 from hummingbot.strategy_v2.controllers.directional_trading_controller_base import (
@@ -22,6 +26,7 @@ from hummingbot.strategy_v2.controllers.directional_trading_controller_base impo
 )
 from hummingbot.strategy_v2.controllers.market_making_controller_base import MarketMakingControllerConfigBase
 from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
+from hummingbot.strategy_v2.executors.grid_executor.data_types import GridExecutorConfig
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
 from hummingbot.strategy_v2.models.base import RunnableStatus
 from hummingbot.strategy_v2.models.executor_actions import CreateExecutorAction, StopExecutorAction
@@ -36,6 +41,8 @@ class BacktestingEngineBase:
         self.backtesting_data_provider = BacktestingDataProvider(connectors={})
         self.position_executor_simulator = PositionExecutorSimulator()
         self.dca_executor_simulator = DCAExecutorSimulator()
+        self.batch_position_executor_simulator = BatchPositionExecutorSimulator()
+        self.grid_executor_simulator = GridExecutorSimulator()
 
     @classmethod
     def load_controller_config(cls,
@@ -120,6 +127,8 @@ class BacktestingEngineBase:
             List[ExecutorInfo]: List of executor information objects detailing the simulation results.
         """
         processed_features = self.prepare_market_data()
+        self.batch_position_executor_simulator.set_market_data(processed_features)
+        self.grid_executor_simulator.set_market_data(processed_features)
         self.active_executor_simulations: List[ExecutorSimulation] = []
         self.stopped_executors_info: List[ExecutorInfo] = []
         for i, row in processed_features.iterrows():
@@ -194,13 +203,14 @@ class BacktestingEngineBase:
         self.controller.processed_data["features"] = backtesting_candles
         return backtesting_candles
 
-    def simulate_executor(self, config: Union[PositionExecutorConfig, DCAExecutorConfig], df: pd.DataFrame,
-                          trade_cost: float) -> Optional[ExecutorSimulation]:
+    def simulate_executor(self, config: Union[PositionExecutorConfig, DCAExecutorConfig, GridExecutorConfig],
+                          df: pd.DataFrame, trade_cost: float) -> Optional[ExecutorSimulation]:
         """
         Simulates the execution of a trading strategy given a configuration.
 
         Args:
-            config (PositionExecutorConfig): The configuration of the executor.
+            config (Union[PositionExecutorConfig, DCAExecutorConfig, GridExecutorConfig]): The configuration of the
+                executor.
             df (pd.DataFrame): DataFrame containing the market data from the start time.
             trade_cost (float): The cost per trade.
 
@@ -210,7 +220,11 @@ class BacktestingEngineBase:
         if isinstance(config, DCAExecutorConfig):
             return self.dca_executor_simulator.simulate(df, config, trade_cost)
         elif isinstance(config, PositionExecutorConfig):
-            return self.position_executor_simulator.simulate(df, config, trade_cost)
+            return self.batch_position_executor_simulator.simulate(df, config, trade_cost)
+        elif isinstance(config, GridExecutorConfig):
+            trading_rule = self.backtesting_data_provider.trading_rules.get(config.connector_name, {}).get(
+                config.trading_pair)
+            return self.grid_executor_simulator.simulate(df, config, trade_cost, trading_rule=trading_rule)
         return None
 
     def manage_active_executors(self, simulation: ExecutorSimulation):
@@ -1,10 +1,13 @@
 from decimal import Decimal
-from typing import Union
+from typing import Optional, Union
 
+import numpy as np
 import pandas as pd
 from pydantic import BaseModel, validator
 
+from hummingbot.strategy_v2.backtesting.executors_simulator.price_arrays import PriceArrays
 from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
+from hummingbot.strategy_v2.executors.grid_executor.data_types import GridExecutorConfig
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
 from hummingbot.strategy_v2.models.base import RunnableStatus
 from hummingbot.strategy_v2.models.executors import CloseType
@@ -12,7 +15,7 @@ from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 
 
 class ExecutorSimulation(BaseModel):
-    config: Union[PositionExecutorConfig, DCAExecutorConfig]
+    config: Union[PositionExecutorConfig, DCAExecutorConfig, GridExecutorConfig]
     executor_simulation: pd.DataFrame
     close_type: CloseType
 
@@ -79,3 +82,37 @@ class ExecutorSimulatorBase:
         """Simulates trading based on provided configuration and market data."""
         # This method should be generic enough to handle various trading strategies.
         raise NotImplementedError
+
+
+class VectorizedExecutorSimulatorBase(ExecutorSimulatorBase):
+    """
+    Base class for simulators that work over numpy price arrays shared by all the executors of a backtest.
+    """
+    def __init__(self):
+        self._market_data: Optional[pd.DataFrame] = None
+        self._price_arrays: Optional[PriceArrays] = None
+
+    @property
+    def price_arrays(self) -> Optional[PriceArrays]:
+        return self._price_arrays
+
+    def set_market_data(self, df: pd.DataFrame):
+        """
+        Sets the market data shared by all the following simulations, the price arrays are extracted only once.
+        """
+        self._market_data = df
+        self._price_arrays = PriceArrays(df)
+
+    def get_start_index(self, df: pd.DataFrame) -> int:
+        """
+        Returns the row of the shared market data where df starts. df is expected to be a tail of the market data set
+        with set_market_data, otherwise it becomes the new market data.
+        """
+        if self._market_data is not None:
+            start = len(self._price_arrays) - len(df)
+            if start >= 0 and np.array_equal(df["timestamp"].to_numpy(dtype=np.float64),
+                                             self._price_arrays.timestamps[start:]) and \
+                    np.array_equal(df["close"].to_numpy(dtype=np.float64), self._price_arrays.close[start:]):
+                return start
+        self.set_market_data(df)
+        return 0
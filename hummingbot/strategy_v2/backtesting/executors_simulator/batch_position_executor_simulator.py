@@ -0,0 +1,259 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy_v2.backtesting.executor_simulator_base import (
+    ExecutorSimulation,
+    VectorizedExecutorSimulatorBase,
+)
+from hummingbot.strategy_v2.backtesting.executors_simulator.price_arrays import PriceArrays, first_trailing_stop_hit
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
+from hummingbot.strategy_v2.models.executors import CloseType
+
+
+@dataclass
+class BatchSimulationResult:
+    """
+    Outcome of a batch of position executors. Every attribute is an array with one element per executor, indexes
+    refer to rows of the PriceArrays used in the simulation and are -1 when the event didn't happen.
+    """
+    start_index: np.ndarray
+    entry_index: np.ndarray
+    close_index: np.ndarray
+    close_type: np.ndarray
+    side: np.ndarray
+    entry_price: np.ndarray
+    close_price: np.ndarray
+    net_pnl_pct: np.ndarray
+    filled_amount_quote: np.ndarray
+
+    @property
+    def net_pnl_quote(self) -> np.ndarray:
+        return self.net_pnl_pct * self.filled_amount_quote
+
+    def __len__(self):
+        return len(self.start_index)
+
+
+class BatchPositionExecutorSimulator(VectorizedExecutorSimulatorBase):
+    """
+    Simulates many position executors at once over shared numpy price arrays.
+
+    Reproduces the triple barrier logic of PositionExecutorSimulator, but the entry fill, take profit, stop loss,
+    trailing stop and time limit first-hit times of all the executors are resolved in a single vectorized pass,
+    without copying the market data per executor. The per-bar DataFrame of an executor is only materialized when
+    an ExecutorSimulation is requested, and only for the rows the executor was alive.
+    """
+    # Order of precedence when two barriers are hit in the same bar, same as PositionExecutorSimulator
+    CLOSE_TYPES_PRIORITY = [CloseType.TAKE_PROFIT, CloseType.STOP_LOSS, CloseType.TRAILING_STOP, CloseType.TIME_LIMIT]
+
+    def simulate_batch(self,
+                       prices: PriceArrays,
+                       start_indexes: np.ndarray,
+                       sides: np.ndarray,
+                       amounts: np.ndarray,
+                       trade_cost: float,
+                       entry_prices: Optional[np.ndarray] = None,
+                       take_profits: Optional[np.ndarray] = None,
+                       stop_losses: Optional[np.ndarray] = None,
+                       time_limit_timestamps: Optional[np.ndarray] = None,
+                       trailing_activation_pcts: Optional[np.ndarray] = None,
+                       trailing_deltas: Optional[np.ndarray] = None) -> BatchSimulationResult:
+        """
+        Simulates a batch of position executors.
+
+        :param prices: shared price arrays of the market data
+        :param start_indexes: row where each executor is created
+        :param sides: 1 for long executors and -1 for short executors
+        :param amounts: amount in base asset of each executor
+        :param trade_cost: cost per trade as a fraction of the notional
+        :param entry_prices: limit price of the open order, NaN for market orders (None means all market)
+        :param take_profits: take profit pct, NaN to disable
+        :param stop_losses: stop loss pct, NaN to disable
+        :param time_limit_timestamps: timestamp when the time limit is reached, NaN to disable
+        :param trailing_activation_pcts: trailing stop activation pct, NaN to disable
+        :param trailing_deltas: trailing stop delta pct, NaN to disable
+        :return: BatchSimulationResult with the outcome of each executor
+        """
+        start = np.asarray(start_indexes, dtype=np.int64)
+        size = len(start)
+        side = np.asarray(sides, dtype=np.float64)
+        is_long = side > 0
+        amounts = np.asarray(amounts, dtype=np.float64)
+        entry_prices = self._param(entry_prices, size)
+        take_profits = self._param(take_profits, size)
+        stop_losses = self._param(stop_losses, size)
+        trailing_activation_pcts = self._param(trailing_activation_pcts, size)
+        trailing_deltas = self._param(trailing_deltas, size)
+        time_limit_timestamps = self._param(time_limit_timestamps, size)
+
+        last_index = len(prices) - 1
+        end = np.where(np.isnan(time_limit_timestamps), last_index,
+                       prices.last_index_before(np.nan_to_num(time_limit_timestamps, nan=0.0)))
+        end = np.clip(end, start, last_index)
+
+        # Entry fill: market orders fill on the creation bar, limit orders when the close crosses the entry price
+        entry = start.copy()
+        is_limit = ~np.isnan(entry_prices)
+        if is_limit.any():
+            limit_prices = np.nan_to_num(entry_prices)
+            long_limit = is_limit & is_long
+            short_limit = is_limit & ~is_long
+            entry[long_limit] = prices.first_cross_below("close", start[long_limit], end[long_limit],
+                                                         limit_prices[long_limit], inclusive=True)
+            entry[short_limit] = prices.first_cross_above("close", start[short_limit], end[short_limit],
+                                                          limit_prices[short_limit], inclusive=True)
+        filled = (entry >= 0) & (entry <= end)
+        entry_price = np.where(filled, prices.close[np.maximum(entry, 0)], np.nan)
+
+        candidates = np.full((len(self.CLOSE_TYPES_PRIORITY), size), -1, dtype=np.int64)
+
+        # Take profit, evaluated on the close with the trade cost included as in the net pnl pct
+        tp_mask = filled & ~np.isnan(take_profits)
+        tp_distance = np.nan_to_num(take_profits) + trade_cost
+        self._cross(prices, "close", candidates[0], tp_mask, is_long, entry, end,
+                    entry_price * (1 + tp_distance), entry_price * (1 - tp_distance), inclusive=False)
+
+        # Stop loss, evaluated on the low for longs and on the high for shorts
+        sl_mask = filled & ~np.isnan(stop_losses)
+        sl_distance = np.nan_to_num(stop_losses)
+        long_sl = sl_mask & is_long
+        short_sl = sl_mask & ~is_long
+        candidates[1][long_sl] = prices.first_cross_below("low", entry[long_sl], end[long_sl],
+                                                          (entry_price * (1 - sl_distance))[long_sl], inclusive=True)
+        candidates[1][short_sl] = prices.first_cross_above("high", entry[short_sl], end[short_sl],
+                                                           (entry_price * (1 + sl_distance))[short_sl], inclusive=True)
+
+        # Trailing stop: activated when the net pnl pct crosses the activation pct, then triggered when the net pnl
+        # pct falls trailing_delta below its running maximum, searched only up to the earliest barrier found so far
+        ts_mask = filled & ~np.isnan(trailing_activation_pcts) & ~np.isnan(trailing_deltas)
+        if ts_mask.any():
+            activation_distance = np.nan_to_num(trailing_activation_pcts) + trade_cost
+            activation = np.full(size, -1, dtype=np.int64)
+            self._cross(prices, "close", activation, ts_mask, is_long, entry, end,
+                        entry_price * (1 + activation_distance), entry_price * (1 - activation_distance),
+                        inclusive=False)
+            earliest = np.where(candidates[:2] >= 0, candidates[:2], last_index + 1).min(axis=0)
+            search_end = np.minimum(end, earliest)
+            activated = ts_mask & (activation >= 0)
+            price_delta = np.nan_to_num(trailing_deltas) * np.nan_to_num(entry_price)
+            for side_mask, signed_prices in ((activated & is_long, prices.close),
+                                             (activated & ~is_long, -prices.close)):
+                if side_mask.any():
+                    candidates[2][side_mask] = first_trailing_stop_hit(
+                        signed_prices, activation[side_mask], search_end[side_mask], price_delta[side_mask])
+
+        candidates[3] = end
+        ranked = np.where(candidates >= 0, candidates, last_index + 1)
+        close_index = ranked.min(axis=0)
+        close_type_index = ranked.argmin(axis=0)
+        close_type = np.array(self.CLOSE_TYPES_PRIORITY, dtype=object)[close_type_index]
+
+        close_price = prices.close[close_index]
+        net_pnl_pct = np.where(filled, side * (close_price / np.where(filled, entry_price, 1.0) - 1) - trade_cost, 0.0)
+        filled_amount_quote = np.where(filled, amounts * np.nan_to_num(entry_price), 0.0)
+        return BatchSimulationResult(
+            start_index=start,
+            entry_index=np.where(filled, entry, -1),
+            close_index=close_index,
+            close_type=close_type,
+            side=side,
+            entry_price=entry_price,
+            close_price=close_price,
+            net_pnl_pct=net_pnl_pct,
+            filled_amount_quote=filled_amount_quote,
+        )
+
+    def simulate_configs(self, df: pd.DataFrame, configs: List[PositionExecutorConfig],
+                         trade_cost: float) -> List[ExecutorSimulation]:
+        """
+        Simulates a list of position executor configs over the same market data, each one starting at the first
+        bar with timestamp greater or equal to the config timestamp.
+        """
+        if self._market_data is not df:
+            self.set_market_data(df)
+        start_indexes = self._price_arrays.index_of_timestamp([config.timestamp for config in configs])
+        return self._simulate_configs(configs, start_indexes, trade_cost)
+
+    def simulate(self, df: pd.DataFrame, config: PositionExecutorConfig, trade_cost: float) -> ExecutorSimulation:
+        """
+        Simulates a single executor starting at the first row of df. When the full market data was set with
+        set_market_data, df is expected to be a tail of it and the shared price arrays are reused.
+        """
+        if df.empty:
+            return ExecutorSimulation(config=config, executor_simulation=df, close_type=CloseType.TIME_LIMIT)
+        start_index = self.get_start_index(df)
+        return self._simulate_configs([config], np.array([start_index]), trade_cost)[0]
+
+    def _simulate_configs(self, configs: List[PositionExecutorConfig], start_indexes: np.ndarray,
+                          trade_cost: float) -> List[ExecutorSimulation]:
+        def optional_float(value):
+            return float(value) if value is not None else np.nan
+
+        barriers = [config.triple_barrier_config for config in configs]
+        result = self.simulate_batch(
+            prices=self._price_arrays,
+            start_indexes=start_indexes,
+            sides=np.array([1.0 if config.side == TradeType.BUY else -1.0 for config in configs]),
+            amounts=np.array([float(config.amount) for config in configs]),
+            trade_cost=trade_cost,
+            entry_prices=np.array([optional_float(config.entry_price) if barrier.open_order_type.is_limit_type()
+                                   else np.nan for config, barrier in zip(configs, barriers)]),
+            take_profits=np.array([optional_float(barrier.take_profit) for barrier in barriers]),
+            stop_losses=np.array([optional_float(barrier.stop_loss) for barrier in barriers]),
+            time_limit_timestamps=np.array([config.timestamp + barrier.time_limit if barrier.time_limit else np.nan
+                                            for config, barrier in zip(configs, barriers)]),
+            trailing_activation_pcts=np.array([optional_float(barrier.trailing_stop.activation_price)
+                                               if barrier.trailing_stop else np.nan for barrier in barriers]),
+            trailing_deltas=np.array([optional_float(barrier.trailing_stop.trailing_delta)
+                                      if barrier.trailing_stop else np.nan for barrier in barriers]),
+        )
+        return [self.to_executor_simulation(result, i, config, trade_cost) for i, config in enumerate(configs)]
+
+    def to_executor_simulation(self, result: BatchSimulationResult, i: int, config: PositionExecutorConfig,
+                               trade_cost: float) -> ExecutorSimulation:
+        """
+        Materializes the per-bar DataFrame of the i-th executor of a batch, limited to the rows it was alive.
+        """
+        start = int(result.start_index[i])
+        close = int(result.close_index[i])
+        entry = int(result.entry_index[i])
+        df = self._market_data.iloc[start:close + 1].copy()
+        close_prices = self._price_arrays.close[start:close + 1]
+        net_pnl_pct = np.zeros(len(df))
+        filled_amount_quote = np.zeros(len(df))
+        if entry >= 0:
+            alive = slice(entry - start, None)
+            entry_price = result.entry_price[i]
+            net_pnl_pct[alive] = result.side[i] * (close_prices[alive] / entry_price - 1) - trade_cost
+            filled_amount_quote[alive] = result.filled_amount_quote[i]
+        df["net_pnl_pct"] = net_pnl_pct
+        df["filled_amount_quote"] = filled_amount_quote
+        df["net_pnl_quote"] = net_pnl_pct * filled_amount_quote
+        df["cum_fees_quote"] = trade_cost * filled_amount_quote
+        df["current_position_average_price"] = float(config.entry_price) if config.entry_price is not None \
+            else result.entry_price[i]
+        if not df.empty:
+            df.loc[df.index[-1], "filled_amount_quote"] = df["filled_amount_quote"].iloc[-1] * 2
+        return ExecutorSimulation(config=config, executor_simulation=df, close_type=result.close_type[i])
+
+    @staticmethod
+    def _param(values: Optional[np.ndarray], size: int) -> np.ndarray:
+        if values is None:
+            return np.full(size, np.nan)
+        return np.asarray(values, dtype=np.float64)
+
+    @staticmethod
+    def _cross(prices: PriceArrays, column: str, out: np.ndarray, mask: np.ndarray, is_long: np.ndarray,
+               start: np.ndarray, end: np.ndarray, long_thresholds: np.ndarray, short_thresholds: np.ndarray,
+               inclusive: bool):
+        """Fills out with the first index where longs cross above and shorts cross below their thresholds."""
+        long_mask = mask & is_long
+        short_mask = mask & ~is_long
+        out[long_mask] = prices.first_cross_above(column, start[long_mask], end[long_mask],
+                                                  long_thresholds[long_mask], inclusive=inclusive)
+        out[short_mask] = prices.first_cross_below(column, start[short_mask], end[short_mask],
+                                                   short_thresholds[short_mask], inclusive=inclusive)
@@ -0,0 +1,276 @@
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy_v2.backtesting.executor_simulator_base import (
+    ExecutorSimulation,
+    VectorizedExecutorSimulatorBase,
+)
+from hummingbot.strategy_v2.backtesting.executors_simulator.price_arrays import PriceArrays
+from hummingbot.strategy_v2.executors.grid_executor.data_types import GridExecutorConfig
+from hummingbot.strategy_v2.models.executors import CloseType
+from hummingbot.strategy_v2.utils.order_ladder import OrderLadder
+
+
+class GridExecutorSimulator(VectorizedExecutorSimulatorBase):
+    """
+    Simulates a GridExecutor over candles.
+
+    Each grid level cycles through the same states as in GridExecutor: the open order is placed when the level is
+    inside the activation bounds, filled when the low (high for sell grids) crosses its price, then the take profit
+    order is placed when inside the activation bounds and filled when the high (low) crosses the take profit price,
+    after which the level is available again. Every cycle is resolved for all the levels at once with first-hit
+    queries over the shared price arrays, so the cost grows with the number of cycles of the busiest level and not
+    with the number of levels times candles.
+
+    The grid is closed with the same precedence as GridExecutor.control_triple_barrier: stop loss (position pnl or
+    limit price), time limit, trailing stop and take profit (price leaving the grid range).
+
+    Not modeled: max_open_orders, max_orders_per_batch and order_frequency, open orders are assumed to be placed in
+    the same candle the level becomes eligible.
+    """
+
+    def simulate(self, df: pd.DataFrame, config: GridExecutorConfig, trade_cost: float,
+                 trading_rule: Optional[TradingRule] = None) -> ExecutorSimulation:
+        if df.empty:
+            return ExecutorSimulation(config=config, executor_simulation=df, close_type=CloseType.TIME_LIMIT)
+        start = self.get_start_index(df)
+        prices = self._price_arrays
+        level_prices, amounts_quote = self.generate_grid_levels(config, prices.close[start], trading_rule)
+        if len(level_prices) == 0:
+            return ExecutorSimulation(config=config, executor_simulation=df.iloc[0:0], close_type=CloseType.FAILED)
+
+        side = 1 if config.side == TradeType.BUY else -1
+        barrier = config.triple_barrier_config
+        end = len(prices) - 1
+        if barrier.time_limit:
+            end = int(np.clip(prices.last_index_before([config.timestamp + barrier.time_limit])[0], start, end))
+        stop_loss_index, take_profit_index = self.get_price_exits(prices, config, start, end)
+        search_end = min([index for index in [stop_loss_index, take_profit_index, end] if index >= 0])
+
+        open_fill, open_price, close_fill, close_price, amount_base = self.simulate_levels(
+            prices, config, level_prices, amounts_quote, start, search_end)
+
+        metrics = self.get_position_metrics(prices, side, trade_cost, start, search_end, open_fill, open_price,
+                                            close_fill, close_price, amount_base)
+
+        # Position barriers, evaluated over the position pnl pct as GridExecutor does
+        position_pnl_pct = metrics["position_pnl_pct"]
+        if barrier.stop_loss:
+            hits = np.flatnonzero((metrics["position_size_quote"] > 0) &
+                                  (position_pnl_pct <= -float(barrier.stop_loss)))
+            if len(hits) > 0 and (stop_loss_index < 0 or start + hits[0] < stop_loss_index):
+                stop_loss_index = start + hits[0]
+        trailing_stop_index = -1
+        if barrier.trailing_stop:
+            trailing_stop_index = self.get_trailing_stop_index(position_pnl_pct,
+                                                               float(barrier.trailing_stop.activation_price),
+                                                               float(barrier.trailing_stop.trailing_delta))
+            trailing_stop_index = start + trailing_stop_index if trailing_stop_index >= 0 else -1
+
+        close_index = len(prices)
+        close_type = CloseType.TIME_LIMIT
+        for index, index_close_type in [(stop_loss_index, CloseType.STOP_LOSS), (end, CloseType.TIME_LIMIT),
+                                        (trailing_stop_index, CloseType.TRAILING_STOP),
+                                        (take_profit_index, CloseType.TAKE_PROFIT)]:
+            if 0 <= index < close_index:
+                close_index = index
+                close_type = index_close_type
+
+        executor_simulation = self._market_data.iloc[start:close_index + 1].copy()
+        rows = close_index - start + 1
+        for column, values in metrics.items():
+            executor_simulation[column] = values[:rows]
+        # The remaining position is closed with a market order in the last candle
+        closing_amount_quote = metrics["position_size_base"][rows - 1] * prices.close[close_index]
+        last_row = executor_simulation.index[-1]
+        executor_simulation.loc[last_row, "filled_amount_quote"] += closing_amount_quote
+        executor_simulation.loc[last_row, "cum_fees_quote"] += closing_amount_quote * trade_cost
+        executor_simulation.loc[last_row, "net_pnl_quote"] -= closing_amount_quote * trade_cost
+        filled_amount_quote = executor_simulation["filled_amount_quote"]
+        executor_simulation["net_pnl_pct"] = np.where(filled_amount_quote > 0,
+                                                      executor_simulation["net_pnl_quote"] / filled_amount_quote, 0.0)
+        executor_simulation.drop(columns=["position_size_base", "position_size_quote", "position_pnl_pct"],
+                                 inplace=True)
+        return ExecutorSimulation(config=config, executor_simulation=executor_simulation, close_type=close_type)
+
+    @staticmethod
+    def generate_grid_levels(config: GridExecutorConfig, mid_price: float,
+                             trading_rule: Optional[TradingRule] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Computes the level prices and amounts in quote the same way GridExecutor._generate_grid_levels does.
+        """
+        min_price_increment = float(trading_rule.min_price_increment) if trading_rule else 0.0
+        min_notional_size = float(trading_rule.min_notional_size) if trading_rule else 0.0
+        start_price = float(config.start_price)
+        end_price = float(config.end_price)
+        total_amount_quote = float(config.total_amount_quote)
+        step_proposed = max(float(config.min_spread_between_orders), min_price_increment / mid_price)
+        amount_proposed = max(float(config.min_order_amount_quote), min_notional_size)
+        grid_range = (end_price - start_price) / start_price
+        orders = int(min(grid_range // step_proposed if step_proposed > 0 else np.inf,
+                         total_amount_quote // amount_proposed if amount_proposed > 0 else np.inf))
+        if orders <= 0:
+            return np.array([]), np.array([])
+        ladder = OrderLadder.from_price_range(config.side, start_price, end_price, orders, total_amount_quote)
+        return ladder.prices, ladder.amounts_quote
+
+    @staticmethod
+    def get_price_exits(prices: PriceArrays, config: GridExecutorConfig, start: int, end: int) -> Tuple[int, int]:
+        """
+        Returns the first candle where the limit price is crossed and the first candle where the price leaves the
+        grid range on the profitable side, -1 if they don't happen before end.
+        """
+        start_array = np.array([start])
+        end_array = np.array([end])
+        stop_loss_index = -1
+        if config.limit_price:
+            if config.side == TradeType.BUY:
+                stop_loss_index = prices.first_cross_below("close", start_array, end_array,
+                                                           float(config.limit_price), inclusive=True)[0]
+            else:
+                stop_loss_index = prices.first_cross_above("close", start_array, end_array,
+                                                           float(config.limit_price), inclusive=True)[0]
+        if config.side == TradeType.BUY:
+            take_profit_index = prices.first_cross_above("close", start_array, end_array, float(config.end_price))[0]
+        else:
+            take_profit_index = prices.first_cross_below("close", start_array, end_array, float(config.start_price))[0]
+        return int(stop_loss_index), int(take_profit_index)
+
+    @staticmethod
+    def simulate_levels(prices: PriceArrays, config: GridExecutorConfig, level_prices: np.ndarray,
+                        amounts_quote: np.ndarray, start: int, end: int) -> Tuple[np.ndarray, ...]:
+        """
+        Runs the open / close cycles of every level up to end.
+
+        :return: arrays with one element per cycle: open fill index, open price, close fill index (-1 if the take
+        profit was not filled), take profit price and amount in base.
+        """
+        is_buy = config.side == TradeType.BUY
+        activation_bounds = float(config.activation_bounds) if config.activation_bounds else None
+        safe_extra_spread = float(config.safe_extra_spread)
+        take_profit = config.triple_barrier_config.take_profit
+        take_profit_prices = None
+        if take_profit is not None:
+            take_profit_prices = level_prices * (1 + float(take_profit)) if is_buy else \
+                level_prices * (1 - float(take_profit))
+        last_index = len(prices) - 1
+
+        def first_cross(column: str, upwards: bool, from_index: np.ndarray, thresholds: np.ndarray,
+                        inclusive: bool = True) -> np.ndarray:
+            from_index = np.minimum(from_index, last_index + 1)
+            to_index = np.full(len(from_index), end)
+            if upwards:
+                return prices.first_cross_above(column, from_index, to_index, thresholds, inclusive=inclusive)
+            return prices.first_cross_below(column, from_index, to_index, thresholds, inclusive=inclusive)
+
+        levels = np.arange(len(level_prices))
+        available_since = np.full(len(level_prices), start, dtype=np.int64)
+        cycles = []
+        while len(levels) > 0:
+            # Open order placement, only while the level is inside the activation bounds
+            placed = available_since[levels]
+            if activation_bounds:
+                bound_prices = level_prices[levels] / (1 - activation_bounds) if is_buy else \
+                    level_prices[levels] / (1 + activation_bounds)
+                placed = first_cross("close", not is_buy, placed, bound_prices)
+            valid = placed >= 0
+            levels, placed = levels[valid], placed[valid]
+            reference_price = prices.close[placed]
+            # Levels already crossed by the price are placed at the current quote with the safe extra spread
+            open_price = np.minimum(level_prices[levels], reference_price * (1 - safe_extra_spread)) if is_buy else \
+                np.maximum(level_prices[levels], reference_price * (1 + safe_extra_spread))
+            open_fill = first_cross("low" if is_buy else "high", not is_buy, placed + 1, open_price)
+            valid = open_fill >= 0
+            levels, open_fill, open_price = levels[valid], open_fill[valid], open_price[valid]
+            amount_base = amounts_quote[levels] / reference_price[valid]
+            if take_profit_prices is None:
+                cycles.append((open_fill, open_price, np.full(len(levels), -1), np.full(len(levels), np.nan),
+                               amount_base))
+                break
+
+            # Take profit placement, only while the take profit price is inside the activation bounds
+            close_price = take_profit_prices[levels]
+            close_placed = open_fill
+            if activation_bounds:
+                bound_prices = close_price / (1 + activation_bounds) if is_buy else \
+                    close_price / (1 - activation_bounds)
+                close_placed = first_cross("close", is_buy, open_fill, bound_prices, inclusive=False)
+            close_reference = prices.close[np.maximum(close_placed, 0)]
+            crossed = (close_price <= close_reference) if is_buy else (close_price >= close_reference)
+            close_price = np.where(crossed, close_reference * (1 + safe_extra_spread) if is_buy else
+                                   close_reference * (1 - safe_extra_spread), close_price)
+            close_fill = np.where(close_placed >= 0,
+                                  first_cross("high" if is_buy else "low", is_buy, close_placed + 1, close_price),
+                                  -1)
+            cycles.append((open_fill, open_price, close_fill, close_price, amount_base))
+
+            completed = close_fill >= 0
+            levels = levels[completed]
+            available_since[levels] = close_fill[completed]
+
+        if len(cycles) == 0:
+            return tuple(np.array([]) for _ in range(5))
+        return tuple(np.concatenate(values) for values in zip(*cycles))
+
+    @staticmethod
+    def get_position_metrics(prices: PriceArrays, side: int, trade_cost: float, start: int, end: int,
+                             open_fill: np.ndarray, open_price: np.ndarray, close_fill: np.ndarray,
+                             close_price: np.ndarray, amount_base: np.ndarray) -> dict:
+        """
+        Builds the per candle position and realized metrics of the grid between start and end from the fills.
+        """
+        rows = end - start + 1
+        open_fill = open_fill.astype(np.int64)
+        close_fill = close_fill.astype(np.int64)
+        open_quote = amount_base * open_price
+        closed = close_fill >= 0
+        close_quote = amount_base[closed] * close_price[closed]
+
+        def accumulate(indexes: np.ndarray, values: np.ndarray) -> np.ndarray:
+            series = np.zeros(rows)
+            np.add.at(series, indexes - start, values)
+            return np.cumsum(series)
+
+        position_size_base = accumulate(open_fill, amount_base) - accumulate(close_fill[closed], amount_base[closed])
+        position_size_quote = accumulate(open_fill, open_quote) - accumulate(close_fill[closed], open_quote[closed])
+        opened_quote = accumulate(close_fill[closed], open_quote[closed])
+        closed_quote = accumulate(close_fill[closed], close_quote)
+        buy_quote, sell_quote = (opened_quote, closed_quote) if side == 1 else (closed_quote, opened_quote)
+        realized_fees_quote = trade_cost * (opened_quote + closed_quote)
+        realized_pnl_quote = sell_quote - buy_quote - realized_fees_quote
+
+        mid_prices = prices.close[start:end + 1]
+        position_fees_quote = trade_cost * position_size_quote
+        position_pnl_quote = side * (mid_prices * position_size_base - position_size_quote) - position_fees_quote
+        has_position = position_size_quote > 1e-12
+        position_pnl_pct = np.where(has_position, position_pnl_quote / np.where(has_position, position_size_quote, 1),
+                                    0.0)
+        break_even_price = pd.Series(np.where(has_position, position_size_quote /
+                                              np.where(has_position, position_size_base, 1), np.nan))
+        return {
+            "net_pnl_pct": np.zeros(rows),
+            "net_pnl_quote": realized_pnl_quote + position_pnl_quote,
+            "cum_fees_quote": realized_fees_quote + position_fees_quote,
+            "filled_amount_quote": position_size_quote + buy_quote + sell_quote,
+            "current_position_average_price": break_even_price.ffill().fillna(0).to_numpy(),
+            "position_size_base": position_size_base,
+            "position_size_quote": position_size_quote,
+            "position_pnl_pct": position_pnl_pct,
+        }
+
+    @staticmethod
+    def get_trailing_stop_index(pnl_pct: np.ndarray, activation_pct: float, trailing_delta: float) -> int:
+        """
+        First position where the pnl pct drops trailing_delta below its maximum since the activation, -1 if none.
+        """
+        activated = np.flatnonzero(pnl_pct > activation_pct)
+        if len(activated) == 0:
+            return -1
+        activation = activated[0]
+        trailing_pnl = pnl_pct[activation:]
+        hits = np.flatnonzero(trailing_pnl < np.maximum.accumulate(trailing_pnl) - trailing_delta)
+        return int(activation + hits[0]) if len(hits) > 0 else -1
@@ -0,0 +1,126 @@
+from typing import Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+
+class PriceArrays:
+    """
+    Shared numpy view of a candles DataFrame used by the vectorized simulators.
+
+    The arrays are extracted once per DataFrame and the range-extrema tables (sparse tables over powers of two)
+    are built lazily, so every executor simulated over the same market data answers its "first bar where the price
+    crosses X" questions with O(log n) vectorized lookups instead of boolean scans over a copied DataFrame.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.timestamps = df["timestamp"].to_numpy(dtype=np.float64)
+        self.open = df["open"].to_numpy(dtype=np.float64) if "open" in df else None
+        self.high = df["high"].to_numpy(dtype=np.float64)
+        self.low = df["low"].to_numpy(dtype=np.float64)
+        self.close = df["close"].to_numpy(dtype=np.float64)
+        self._tables: Dict[str, List[np.ndarray]] = {}
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def index_of_timestamp(self, timestamps) -> np.ndarray:
+        """Positional index of the first bar with timestamp greater or equal to each of the given timestamps."""
+        return np.searchsorted(self.timestamps, np.asarray(timestamps, dtype=np.float64), side="left")
+
+    def last_index_before(self, timestamps) -> np.ndarray:
+        """Positional index of the last bar with timestamp lower or equal to each of the given timestamps."""
+        return np.searchsorted(self.timestamps, np.asarray(timestamps, dtype=np.float64), side="right") - 1
+
+    def table(self, column: str, op: str) -> List[np.ndarray]:
+        key = f"{column}_{op}"
+        if key not in self._tables:
+            reducer = np.maximum if op == "max" else np.minimum
+            self._tables[key] = build_sparse_table(getattr(self, column), reducer)
+        return self._tables[key]
+
+    def first_cross_above(self, column: str, start: np.ndarray, end: np.ndarray, threshold: np.ndarray,
+                          inclusive: bool = False) -> np.ndarray:
+        """First index in [start, end] where column > threshold (>= if inclusive), -1 when never crossed."""
+        hit = np.greater_equal if inclusive else np.greater
+        return first_hit(self.table(column, "max"), start, end, threshold, hit)
+
+    def first_cross_below(self, column: str, start: np.ndarray, end: np.ndarray, threshold: np.ndarray,
+                          inclusive: bool = False) -> np.ndarray:
+        """First index in [start, end] where column < threshold (<= if inclusive), -1 when never crossed."""
+        hit = np.less_equal if inclusive else np.less
+        return first_hit(self.table(column, "min"), start, end, threshold, hit)
+
+
+def build_sparse_table(values: np.ndarray, reducer: Callable) -> List[np.ndarray]:
+    """
+    Builds a sparse table where level k holds the reduction of values over every window [i, i + 2 ** k).
+    """
+    table = [values]
+    k = 1
+    while (1 << k) <= len(values):
+        previous = table[-1]
+        half = 1 << (k - 1)
+        table.append(reducer(previous[:-half], previous[half:]))
+        k += 1
+    return table
+
+
+def first_hit(table: List[np.ndarray], start: np.ndarray, end: np.ndarray, threshold: np.ndarray,
+              hit: Callable) -> np.ndarray:
+    """
+    Vectorized binary lifting over a sparse table: for every query returns the first index j in [start, end]
+    where hit(values[j], threshold) is True, or -1 if there is none. The table must be built with the reducer that
+    matches the comparison (max for greater, min for less).
+    """
+    start = np.asarray(start, dtype=np.int64)
+    end = np.asarray(end, dtype=np.int64)
+    threshold = np.broadcast_to(np.asarray(threshold, dtype=np.float64), start.shape)
+    position = start.copy()
+    for k in range(len(table) - 1, -1, -1):
+        step = 1 << k
+        level = table[k]
+        fits = position + step - 1 <= end
+        block = level[np.where(fits, position, 0)]
+        skip = fits & ~hit(block, threshold)
+        position = np.where(skip, position + step, position)
+    return np.where(position <= end, position, -1)
+
+
+def first_trailing_stop_hit(values: np.ndarray, start: np.ndarray, end: np.ndarray, trailing_delta: np.ndarray,
+                            max_cells: int = 2 ** 22) -> np.ndarray:
+    """
+    First index j in [start, end] where values[j] < max(values[start:j + 1]) - trailing_delta, or -1 if none.
+
+    The running maximum depends on each query's start, so it can't be answered from a shared table; the queries are
+    evaluated in chunks of a 2D (queries x horizon) window over the shared array instead, bounded by max_cells.
+    Pass the negated prices (and keep trailing_delta positive) to evaluate a short position.
+    """
+    start = np.asarray(start, dtype=np.int64)
+    end = np.asarray(end, dtype=np.int64)
+    trailing_delta = np.broadcast_to(np.asarray(trailing_delta, dtype=np.float64), start.shape)
+    result = np.full(start.shape, -1, dtype=np.int64)
+    pending = np.flatnonzero((start >= 0) & (start <= end))
+    if len(pending) == 0:
+        return result
+    horizons = end[pending] - start[pending] + 1
+    pending = pending[np.argsort(horizons, kind="stable")]
+    horizons = end[pending] - start[pending] + 1
+    last_index = len(values) - 1
+    i = 0
+    while i < len(pending):
+        # Horizons are sorted, so the cells used by a chunk ending at j are (j - i + 1) * horizons[j]
+        cells = np.arange(1, len(pending) - i + 1) * horizons[i:]
+        rows = max(1, int(np.searchsorted(cells, max_cells, side="right")))
+        chunk = pending[i:i + rows]
+        horizon = int(horizons[i + len(chunk) - 1])
+        offsets = np.arange(horizon)
+        indexes = start[chunk, None] + offsets[None, :]
+        in_range = indexes <= end[chunk, None]
+        window = values[np.minimum(indexes, last_index)]
+        running_max = np.maximum.accumulate(window, axis=1)
+        hits = (window < running_max - trailing_delta[chunk, None]) & in_range
+        has_hit = hits.any(axis=1)
+        result[chunk[has_hit]] = start[chunk[has_hit]] + hits[has_hit].argmax(axis=1)
+        i += rows
+    return result
@@ -15,6 +15,7 @@ from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.data_feed.market_data_provider import MarketDataProvider
 from hummingbot.strategy_v2.models.base import RunnableStatus
 from hummingbot.strategy_v2.models.executor_actions import ExecutorAction
+from hummingbot.strategy_v2.models.executor_registry import ExecutorRegistry
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 from hummingbot.strategy_v2.runnable_base import RunnableBase
 from hummingbot.strategy_v2.utils.common import generate_unique_id
@@ -126,13 +127,27 @@ class ControllerBase(RunnableBase):
                  actions_queue: asyncio.Queue, update_interval: float = 1.0):
         super().__init__(update_interval=update_interval)
         self.config = config
-        self.executors_info: List[ExecutorInfo] = []
+        self.executors_registry = ExecutorRegistry()
+        self._executors_info: List[ExecutorInfo] = []
         self.market_data_provider: MarketDataProvider = market_data_provider
         self.actions_queue: asyncio.Queue = actions_queue
         self.processed_data = {}
         self.executors_update_event = asyncio.Event()
         self.executors_info_queue = asyncio.Queue()
 
+    @property
+    def executors_info(self) -> List[ExecutorInfo]:
+        """
+        The executors info reported for the controller. Setting them updates the indexes of the executors registry,
+        used to query the executors without scanning the whole list.
+        """
+        return self._executors_info
+
+    @executors_info.setter
+    def executors_info(self, executors_info: List[ExecutorInfo]):
+        self._executors_info = executors_info
+        self.executors_registry.update(executors_info)
+
     def start(self):
         """
         Allow controllers to be restarted after being stopped.=
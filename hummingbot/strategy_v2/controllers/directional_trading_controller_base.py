@@ -194,9 +194,8 @@ class DirectionalTradingControllerBase(ControllerBase):
         """
         Check if an executor can be created based on the signal, the quantity of active executors and the cooldown time.
         """
-        active_executors_by_signal_side = self.filter_executors(
-            executors=self.executors_info,
-            filter_func=lambda x: x.is_active and (x.side == TradeType.BUY if signal > 0 else TradeType.SELL))
+        active_executors_by_signal_side = self.executors_registry.get_executors(
+            is_active=True, side=TradeType.BUY if signal > 0 else TradeType.SELL)
         max_timestamp = max([executor.timestamp for executor in active_executors_by_signal_side], default=0)
         active_executors_condition = len(active_executors_by_signal_side) < self.config.max_executors_per_side
         cooldown_condition = self.market_data_provider.time() - max_timestamp > self.config.cooldown_time
@@ -11,6 +11,7 @@ from hummingbot.strategy_v2.executors.data_types import ConnectorPair
 from hummingbot.strategy_v2.executors.position_executor.data_types import TrailingStop, TripleBarrierConfig
 from hummingbot.strategy_v2.models.executor_actions import CreateExecutorAction, ExecutorAction, StopExecutorAction
 from hummingbot.strategy_v2.models.executors import CloseType
+from hummingbot.strategy_v2.utils.order_ladder import LadderLevel, OrderLadder
 
 
 class MarketMakingControllerConfigBase(ControllerConfigBase):
@@ -240,10 +241,9 @@ class MarketMakingControllerBase(ControllerBase):
         Create actions proposal based on the current state of the controller.
         """
         create_actions = []
-        levels_to_execute = self.get_levels_to_execute()
-        for level_id in levels_to_execute:
-            price, amount = self.get_price_and_amount(level_id)
-            executor_config = self.get_executor_config(level_id, price, amount)
+        levels_to_execute = self.get_ladder_levels(self.get_levels_to_execute())
+        for level in levels_to_execute:
+            executor_config = self.get_executor_config(level.level_id, level.price, level.amount)
             if executor_config is not None:
                 create_actions.append(CreateExecutorAction(
                     controller_id=self.config.id,
@@ -252,11 +252,13 @@ class MarketMakingControllerBase(ControllerBase):
         return create_actions
 
     def get_levels_to_execute(self) -> List[str]:
-        working_levels = self.filter_executors(
-            executors=self.executors_info,
-            filter_func=lambda x: x.is_active or (x.close_type == CloseType.STOP_LOSS and self.market_data_provider.time() - x.close_timestamp < self.config.cooldown_time)
+        current_time = self.market_data_provider.time()
+        active_executors = self.executors_registry.get_executors(is_active=True)
+        executors_in_cooldown = self.filter_executors(
+            executors=self.executors_registry.get_executors(is_active=False, close_type=CloseType.STOP_LOSS),
+            filter_func=lambda x: current_time - x.close_timestamp < self.config.cooldown_time
         )
-        working_levels_ids = [executor.custom_info["level_id"] for executor in working_levels]
+        working_levels_ids = [executor.custom_info["level_id"] for executor in active_executors + executors_in_cooldown]
         return self.get_not_active_levels_ids(working_levels_ids)
 
     def stop_actions_proposal(self) -> List[ExecutorAction]:
@@ -270,8 +272,8 @@ class MarketMakingControllerBase(ControllerBase):
 
     def executors_to_refresh(self) -> List[ExecutorAction]:
         executors_to_refresh = self.filter_executors(
-            executors=self.executors_info,
-            filter_func=lambda x: not x.is_trading and x.is_active and self.market_data_provider.time() - x.timestamp > self.config.executor_refresh_time)
+            executors=self.executors_registry.get_executors(is_active=True),
+            filter_func=lambda x: not x.is_trading and self.market_data_provider.time() - x.timestamp > self.config.executor_refresh_time)
 
         return [StopExecutorAction(
             controller_id=self.config.id,
@@ -300,18 +302,38 @@ class MarketMakingControllerBase(ControllerBase):
         """
         raise NotImplementedError
 
-    def get_price_and_amount(self, level_id: str) -> Tuple[Decimal, Decimal]:
+    def get_order_ladder(self, trade_type: TradeType) -> OrderLadder:
         """
-        Get the spread and amount in quote for a given level id.
+        Get the prices and amounts of all the levels of a side, computed at once from the spreads and amounts of the
+        config, the reference price and the spread multiplier.
         """
-        level = self.get_level_from_level_id(level_id)
-        trade_type = self.get_trade_type_from_level_id(level_id)
         spreads, amounts_quote = self.config.get_spreads_and_amounts_in_quote(trade_type)
-        reference_price = Decimal(self.processed_data["reference_price"])
-        spread_in_pct = Decimal(spreads[int(level)]) * Decimal(self.processed_data["spread_multiplier"])
-        side_multiplier = Decimal("-1") if trade_type == TradeType.BUY else Decimal("1")
-        order_price = reference_price * (1 + side_multiplier * spread_in_pct)
-        return order_price, Decimal(amounts_quote[int(level)]) / order_price
+        return OrderLadder.from_spreads(trade_type=trade_type,
+                                        reference_price=self.processed_data["reference_price"],
+                                        spreads=spreads,
+                                        amounts_quote=amounts_quote,
+                                        spread_multiplier=self.processed_data["spread_multiplier"])
+
+    def get_ladder_levels(self, level_ids: List[str]) -> List[LadderLevel]:
+        """
+        Get the price and amount of the given level ids, computing the ladder of each side only once.
+        """
+        ladders = {}
+        levels = []
+        for level_id in level_ids:
+            trade_type = self.get_trade_type_from_level_id(level_id)
+            ladder = ladders.get(trade_type)
+            if ladder is None:
+                ladder = ladders[trade_type] = self.get_order_ladder(trade_type)
+            levels.append(ladder.get_level(self.get_level_from_level_id(level_id), level_id))
+        return levels
+
+    def get_price_and_amount(self, level_id: str) -> Tuple[Decimal, Decimal]:
+        """
+        Get the price and amount in base for a given level id.
+        """
+        level = self.get_ladder_levels([level_id])[0]
+        return level.price, level.amount
 
     def get_level_id_from_side(self, trade_type: TradeType, level: int) -> str:
         """
@@ -329,6 +351,7 @@ class MarketMakingControllerBase(ControllerBase):
         """
         Get the levels to execute based on the current state of the controller.
         """
+        active_levels_ids = set(active_levels_ids)
         buy_ids_missing = [self.get_level_id_from_side(TradeType.BUY, level) for level in range(len(self.config.buy_spreads))
                            if self.get_level_id_from_side(TradeType.BUY, level) not in active_levels_ids]
         sell_ids_missing = [self.get_level_id_from_side(TradeType.SELL, level) for level in range(len(self.config.sell_spreads))
@@ -1,6 +1,6 @@
 from decimal import Decimal
 from functools import lru_cache
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.connector_base import ConnectorBase
@@ -43,18 +43,20 @@ class ExecutorBase(RunnableBase):
         self.config = config
         self.close_type: Optional[CloseType] = None
         self.close_timestamp: Optional[float] = None
+        self._executor_info: Optional[ExecutorInfo] = None
+        self._executor_info_state: Optional[Tuple] = None
         self._strategy: ScriptStrategyBase = strategy
         self.connectors = {connector_name: connector for connector_name, connector in strategy.connectors.items() if
                            connector_name in connectors}
 
         # Event forwarders for different order events
-        self._create_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._create_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._fill_order_forwarder = SourceInfoEventForwarder(self.process_order_filled_event)
-        self._complete_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._complete_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._cancel_order_forwarder = SourceInfoEventForwarder(self.process_order_canceled_event)
-        self._failed_order_forwarder = SourceInfoEventForwarder(self.process_order_failed_event)
+        self._create_buy_order_forwarder = SourceInfoEventForwarder(self._invalidating_executor_info(self.process_order_created_event))
+        self._create_sell_order_forwarder = SourceInfoEventForwarder(self._invalidating_executor_info(self.process_order_created_event))
+        self._fill_order_forwarder = SourceInfoEventForwarder(self._invalidating_executor_info(self.process_order_filled_event))
+        self._complete_buy_order_forwarder = SourceInfoEventForwarder(self._invalidating_executor_info(self.process_order_completed_event))
+        self._complete_sell_order_forwarder = SourceInfoEventForwarder(self._invalidating_executor_info(self.process_order_completed_event))
+        self._cancel_order_forwarder = SourceInfoEventForwarder(self._invalidating_executor_info(self.process_order_canceled_event))
+        self._failed_order_forwarder = SourceInfoEventForwarder(self._invalidating_executor_info(self.process_order_failed_event))
 
         # Pairs of market events and their corresponding event forwarders
         self._event_pairs: List[Tuple[MarketEvent, SourceInfoEventForwarder]] = [
@@ -105,30 +107,71 @@ class ExecutorBase(RunnableBase):
     @property
     def executor_info(self) -> ExecutorInfo:
         """
-        Returns the executor info.
-        """
-        ei = ExecutorInfo(
+        Returns a snapshot of the executor info. The snapshot is replaced only when the state of the executor changes:
+        when it starts or stops, after each order event, and after a control task that changed its status, PnL, fees,
+        filled amount or custom info. The same snapshot is returned while the executor state doesn't change.
+        """
+        if self._executor_info is None:
+            self._refresh_executor_info(self._get_executor_info_state())
+        return self._executor_info
+
+    def _get_executor_info_state(self) -> Tuple:
+        return (
+            self.status,
+            self.close_type,
+            self.close_timestamp,
+            self._decimal_or_zero(self.net_pnl_pct),
+            self._decimal_or_zero(self.net_pnl_quote),
+            self._decimal_or_zero(self.cum_fees_quote),
+            self._decimal_or_zero(self.filled_amount_quote),
+            self.is_active,
+            self.is_trading,
+            self.get_custom_info(),
+        )
+
+    def _refresh_executor_info(self, state: Tuple):
+        (status, close_type, close_timestamp, net_pnl_pct, net_pnl_quote, cum_fees_quote, filled_amount_quote,
+         is_active, is_trading, custom_info) = state
+        self._executor_info_state = state
+        # The values come from the executor and its validated config, so the pydantic validation is skipped
+        self._executor_info = ExecutorInfo.construct(
             id=self.config.id,
             timestamp=self.config.timestamp,
             type=self.config.type,
-            status=self.status,
-            close_type=self.close_type,
-            close_timestamp=self.close_timestamp,
+            status=status,
+            close_type=close_type,
+            close_timestamp=close_timestamp,
             config=self.config,
-            net_pnl_pct=self.net_pnl_pct,
-            net_pnl_quote=self.net_pnl_quote,
-            cum_fees_quote=self.cum_fees_quote,
-            filled_amount_quote=self.filled_amount_quote,
-            is_active=self.is_active,
-            is_trading=self.is_trading,
-            custom_info=self.get_custom_info(),
+            net_pnl_pct=net_pnl_pct,
+            net_pnl_quote=net_pnl_quote,
+            cum_fees_quote=cum_fees_quote,
+            filled_amount_quote=filled_amount_quote,
+            is_active=is_active,
+            is_trading=is_trading,
+            custom_info=custom_info,
             controller_id=self.config.controller_id,
         )
-        ei.filled_amount_quote = ei.filled_amount_quote if not ei.filled_amount_quote.is_nan() else Decimal("0")
-        ei.net_pnl_quote = ei.net_pnl_quote if not ei.net_pnl_quote.is_nan() else Decimal("0")
-        ei.cum_fees_quote = ei.cum_fees_quote if not ei.cum_fees_quote.is_nan() else Decimal("0")
-        ei.net_pnl_pct = ei.net_pnl_pct if not ei.net_pnl_pct.is_nan() else Decimal("0")
-        return ei
+
+    @staticmethod
+    def _decimal_or_zero(value: Union[Decimal, float, int]) -> Decimal:
+        if not isinstance(value, Decimal):
+            value = Decimal(str(value))
+        return value if not value.is_nan() else Decimal("0")
+
+    def invalidate_executor_info(self):
+        """
+        Discards the snapshot of the executor info, so it is built again with the current state at the next call.
+        Subclasses that change their state outside of the control task and the order events should call it.
+        """
+        self._executor_info = None
+
+    def _invalidating_executor_info(self, event_handler: Callable[[int, Any, Any], None]) -> Callable[[int, Any, Any], None]:
+        def process_event(event_tag: int, market: Any, event: Any):
+            try:
+                event_handler(event_tag, market, event)
+            finally:
+                self.invalidate_executor_info()
+        return process_event
 
     def get_custom_info(self) -> Dict:
         """
@@ -160,6 +203,7 @@ class ExecutorBase(RunnableBase):
         """
         super().start()
         self.register_events()
+        self.invalidate_executor_info()
 
     def stop(self):
         """
@@ -168,6 +212,18 @@ class ExecutorBase(RunnableBase):
         self.close_timestamp = self._strategy.current_timestamp
         super().stop()
         self.unregister_events()
+        self.invalidate_executor_info()
+
+    def after_control_task(self):
+        """
+        Replaces the snapshot of the executor info if the control task changed the executor state. The values that
+        depend on the market, like the PnL of an open position, are compared too, so they are never stale.
+        """
+        if self._executor_info is None:
+            return
+        state = self._get_executor_info_state()
+        if state != self._executor_info_state:
+            self._refresh_executor_info(state)
 
     async def on_start(self):
         """
@@ -290,6 +346,30 @@ class ExecutorBase(RunnableBase):
         else:
             return self._strategy.sell(connector_name, trading_pair, amount, order_type, price, position_action)
 
+    def amend_order(self,
+                    connector_name: str,
+                    trading_pair: str,
+                    order_id: str,
+                    price: Decimal,
+                    amount: Decimal,
+                    order_type: OrderType = OrderType.LIMIT,
+                    position_action: PositionAction = PositionAction.OPEN,
+                    ) -> Optional[str]:
+        """
+        Modifies the price and amount of an active limit order, in place if the connector supports order amendment,
+        otherwise by cancelling it and placing a new order.
+
+        :param connector_name: The name of the connector.
+        :param trading_pair: The trading pair of the order.
+        :param order_id: The client id of the order to amend.
+        :param price: The new price of the order.
+        :param amount: The new total amount of the order, including the amount already filled.
+        :param order_type: The type of the new order, if the order is replaced.
+        :param position_action: The position action of the new order, if the order is replaced.
+        :return: The id of the amended order or of the new order replacing it, None if the order is not active.
+        """
+        return self._strategy.amend(connector_name, trading_pair, order_id, price, amount, order_type, position_action)
+
     def get_price(self, connector_name: str, trading_pair: str, price_type: PriceType = PriceType.MidPrice):
         """
         Retrieves the price for the specified trading pair from the specified connector.
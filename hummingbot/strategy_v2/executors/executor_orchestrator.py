@@ -80,6 +80,7 @@ class ExecutorOrchestrator:
             for executor in executors_list:
                 if not executor.is_closed:
                     executor.early_stop()
+                    executor.invalidate_executor_info()
 
     def store_all_executors(self):
         for controller_id, executors_list in self.active_executors.items():
@@ -153,6 +154,7 @@ class ExecutorOrchestrator:
             self.logger().error(f"Executor ID {executor_id} not found for controller {controller_id}.")
             return
         executor.early_stop()
+        executor.invalidate_executor_info()
 
     def store_executor(self, action: StoreExecutorAction):
         """
@@ -15,13 +15,14 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.core.utils.float_math import to_decimal
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
 from hummingbot.strategy_v2.executors.grid_executor.data_types import GridExecutorConfig, GridLevel, GridLevelStates
 from hummingbot.strategy_v2.models.base import RunnableStatus
 from hummingbot.strategy_v2.models.executors import CloseType, TrackedOrder
-from hummingbot.strategy_v2.utils.distributions import Distributions
+from hummingbot.strategy_v2.utils.order_ladder import OrderLadder
 
 
 class GridExecutor(ExecutorBase):
@@ -124,7 +125,6 @@ class GridExecutor(ExecutorBase):
             self.stop()
 
     def _generate_grid_levels(self):
-        grid_levels = []
         price = self.get_price(self.config.connector_name, self.config.trading_pair, PriceType.MidPrice)
         step_proposed = max(self.config.min_spread_between_orders, self.trading_rules.min_price_increment / price)
         amount_proposed = max(self.config.min_order_amount_quote, self.trading_rules.min_notional_size)
@@ -133,19 +133,23 @@ class GridExecutor(ExecutorBase):
         theoretical_orders_by_step = grid_range // step_proposed
         theoretical_orders_by_amount = total_amount // amount_proposed
         orders = int(min(theoretical_orders_by_step, theoretical_orders_by_amount))
-        prices = Distributions.linear(orders, float(self.config.start_price), float(self.config.end_price))
         self.step = (self.config.end_price - self.config.start_price) / self.config.end_price / orders
         amount_quote = total_amount / orders
-        for i, price in enumerate(prices):
-            grid_levels.append(GridLevel(id=f"L{i}",
-                                         price=price,
-                                         amount_quote=amount_quote,
-                                         take_profit=self.config.triple_barrier_config.take_profit,
-                                         side=self.config.side,
-                                         open_order_type=self.config.triple_barrier_config.open_order_type,
-                                         take_profit_order_type=self.config.triple_barrier_config.take_profit_order_type,
-                                         ))
-        return grid_levels
+        ladder = OrderLadder.from_price_range(trade_type=self.config.side,
+                                              start_price=self.config.start_price,
+                                              end_price=self.config.end_price,
+                                              n_levels=orders,
+                                              total_amount_quote=total_amount,
+                                              level_id_prefix="L")
+        # The levels are built from values of the right types, so the pydantic validation is skipped
+        return [GridLevel.construct(id=level.level_id,
+                                    price=level.price,
+                                    amount_quote=amount_quote,
+                                    take_profit=self.config.triple_barrier_config.take_profit,
+                                    side=self.config.side,
+                                    open_order_type=self.config.triple_barrier_config.open_order_type,
+                                    take_profit_order_type=self.config.triple_barrier_config.take_profit_order_type)
+                for level in ladder.get_levels()]
 
     @property
     def end_time(self) -> Optional[float]:
@@ -727,8 +731,10 @@ class GridExecutor(ExecutorBase):
         """
         open_filled_levels = self.levels_by_state[GridLevelStates.OPEN_ORDER_FILLED] + self.levels_by_state[GridLevelStates.CLOSE_ORDER_PLACED]
         side_multiplier = 1 if self.config.side == TradeType.BUY else -1
-        executed_amount_base = Decimal(sum([level.active_open_order.order.amount for level in open_filled_levels]))
-        if executed_amount_base == Decimal("0"):
+        # The sums over the levels are done with floats, only the position metrics are converted to Decimal
+        open_orders = [level.active_open_order for level in open_filled_levels]
+        executed_amount_base = sum([float(order.order.amount) for order in open_orders])
+        if executed_amount_base == 0:
             self.position_size_base = Decimal("0")
             self.position_size_quote = Decimal("0")
             self.position_fees_quote = Decimal("0")
@@ -736,16 +742,21 @@ class GridExecutor(ExecutorBase):
             self.position_pnl_pct = Decimal("0")
             self.close_liquidity_placed = Decimal("0")
         else:
-            self.position_break_even_price = sum([level.active_open_order.order.price * level.active_open_order.order.amount
-                                                  for level in open_filled_levels]) / executed_amount_base
+            break_even_price = sum([float(order.order.price) * float(order.order.amount)
+                                    for order in open_orders]) / executed_amount_base
             if self._open_fee_in_base:
-                executed_amount_base -= sum([level.active_open_order.cum_fees_base for level in open_filled_levels])
-            close_order_size_base = self._close_order.executed_amount_base if self._close_order and self._close_order.is_done else Decimal("0")
-            self.position_size_base = executed_amount_base - close_order_size_base
-            self.position_size_quote = self.position_size_base * self.position_break_even_price
-            self.position_fees_quote = Decimal(sum([level.active_open_order.cum_fees_quote for level in open_filled_levels]))
-            self.position_pnl_quote = side_multiplier * ((self.mid_price - self.position_break_even_price) / self.position_break_even_price) * self.position_size_quote - self.position_fees_quote
-            self.position_pnl_pct = self.position_pnl_quote / self.position_size_quote if self.position_size_quote > 0 else Decimal("0")
+                executed_amount_base -= sum([float(order.cum_fees_base) for order in open_orders])
+            close_order_size_base = float(self._close_order.executed_amount_base) if self._close_order and self._close_order.is_done else 0
+            position_size_base = executed_amount_base - close_order_size_base
+            position_size_quote = position_size_base * break_even_price
+            position_fees_quote = sum([float(order.cum_fees_quote) for order in open_orders])
+            position_pnl_quote = side_multiplier * ((float(self.mid_price) - break_even_price) / break_even_price) * position_size_quote - position_fees_quote
+            self.position_break_even_price = to_decimal(break_even_price)
+            self.position_size_base = to_decimal(position_size_base)
+            self.position_size_quote = to_decimal(position_size_quote)
+            self.position_fees_quote = to_decimal(position_fees_quote)
+            self.position_pnl_quote = to_decimal(position_pnl_quote)
+            self.position_pnl_pct = to_decimal(position_pnl_quote / position_size_quote) if position_size_quote > 0 else Decimal("0")
             self.close_liquidity_placed = sum([level.amount_quote for level in self.levels_by_state[GridLevelStates.CLOSE_ORDER_PLACED] if level.active_close_order and level.active_close_order.executed_amount_base == Decimal("0")])
         if len(self.levels_by_state[GridLevelStates.OPEN_ORDER_PLACED]) > 0:
             self.open_liquidity_placed = sum([level.amount_quote for level in self.levels_by_state[GridLevelStates.OPEN_ORDER_PLACED] if level.active_open_order and level.active_open_order.executed_amount_base == Decimal("0")])
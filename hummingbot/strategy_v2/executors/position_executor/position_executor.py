@@ -563,12 +563,26 @@ class PositionExecutor(ExecutorBase):
 
     def renew_take_profit_order(self):
         """
-        This method is responsible for renewing the take profit order.
+        This method is responsible for renewing the take profit order, amending it to the current take profit price and
+        amount to close.
 
         :return: None
         """
-        self.cancel_take_profit()
-        self.place_take_profit_limit_order()
+        order_id = self.amend_order(
+            connector_name=self.config.connector_name,
+            trading_pair=self.config.trading_pair,
+            order_id=self._take_profit_limit_order.order_id,
+            price=self.take_profit_price,
+            amount=self._take_profit_limit_order.executed_amount_base + self.amount_to_close,
+            order_type=self.config.triple_barrier_config.take_profit_order_type,
+            position_action=PositionAction.CLOSE,
+        )
+        if order_id is None:
+            # The take profit was not found active, or its cancellation is already in flight
+            self.cancel_take_profit()
+            self.place_take_profit_limit_order()
+        elif order_id != self._take_profit_limit_order.order_id:
+            self._take_profit_limit_order = TrackedOrder(order_id=order_id)
         self.logger().debug("Renewing take profit order")
 
     def cancel_take_profit(self):
@@ -16,6 +16,11 @@ class ExecutorAction(BaseModel):
     """
     controller_id: Optional[str] = "main"
 
+    class Config:
+        # Executor configs that are already validated are kept as they are, instead of being validated again against
+        # every type of the union
+        smart_union = True
+
 
 class CreateExecutorAction(ExecutorAction):
     """
@@ -0,0 +1,146 @@
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executors import CloseType
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+
+
+class ExecutorRegistry:
+    """
+    Keeps the executors info of a controller indexed by controller id, level id, side, status, activity, close type
+    and trading pair, so the executors matching a query are found without scanning all of them.
+
+    The registry is synchronized with the list of executors info reported on every update. The running executors
+    report a new snapshot on every control loop, but only their status, activity and close type can change: the
+    other keys come from the executor config and are computed once. So a new snapshot only costs the comparison of
+    the state keys, and the indexes are only updated when the state of the executor changes.
+    """
+
+    _config_index_keys: Dict[str, Callable[[ExecutorInfo], Any]] = {
+        "controller_id": lambda executor: executor.controller_id,
+        "level_id": lambda executor: executor.custom_info.get("level_id"),
+        "side": lambda executor: executor.side,
+        "trading_pair": lambda executor: getattr(executor.config, "trading_pair", None),
+    }
+    _state_index_keys: Dict[str, Callable[[ExecutorInfo], Any]] = {
+        "status": lambda executor: executor.status,
+        "is_active": lambda executor: executor.is_active,
+        "close_type": lambda executor: executor.close_type,
+    }
+    _index_keys: Dict[str, Callable[[ExecutorInfo], Any]] = {**_config_index_keys, **_state_index_keys}
+
+    def __init__(self):
+        self._executors: Dict[str, ExecutorInfo] = {}
+        self._reported: List[ExecutorInfo] = []
+        self._keys: Dict[str, Dict[str, Any]] = {}
+        self._indexes: Dict[str, Dict[Any, Dict[str, None]]] = {index: {} for index in self._index_keys}
+
+    def __len__(self) -> int:
+        return len(self._executors)
+
+    def __iter__(self) -> Iterator[ExecutorInfo]:
+        return iter(self._executors.values())
+
+    def __contains__(self, executor_id: str) -> bool:
+        return executor_id in self._executors
+
+    def get(self, executor_id: str) -> Optional[ExecutorInfo]:
+        return self._executors.get(executor_id)
+
+    def update(self, executors_info: List[ExecutorInfo]):
+        """
+        Synchronizes the registry with the reported executors info. The executors with a new snapshot are indexed
+        again, and the executors that are not reported anymore are removed.
+        """
+        reported = self._reported
+        self._reported = list(executors_info)
+        if len(reported) == len(executors_info) == len(self._executors):
+            # Usually the same executors are reported in the same order, and only some of them have a new snapshot
+            changed = [(previous, executor) for previous, executor in zip(reported, executors_info)
+                       if previous is not executor]
+            if all(previous.id == executor.id for previous, executor in changed):
+                for _, executor in changed:
+                    self._index(executor)
+                return
+        executors = self._executors
+        for executor in [executor for executor in executors_info if executors.get(executor.id) is not executor]:
+            self._index(executor)
+        if len(executors_info) != len(executors):
+            reported_ids = {executor.id for executor in executors_info}
+            for executor_id in [executor_id for executor_id in executors if executor_id not in reported_ids]:
+                self._unindex(executor_id)
+
+    def add(self, executor: ExecutorInfo):
+        """
+        Adds the executor info, or replaces the previous snapshot of the same executor.
+        """
+        self._index(executor)
+        self._reported = []
+
+    def remove(self, executor_id: str):
+        """
+        Removes the executor info, if present.
+        """
+        self._unindex(executor_id)
+        self._reported = []
+
+    def get_executors(self,
+                      controller_id: Optional[str] = None,
+                      level_id: Optional[str] = None,
+                      side: Optional[TradeType] = None,
+                      status: Optional[RunnableStatus] = None,
+                      is_active: Optional[bool] = None,
+                      close_type: Optional[CloseType] = None,
+                      trading_pair: Optional[str] = None) -> List[ExecutorInfo]:
+        """
+        Returns the executors info matching all the given values, in the order they got them. The arguments left as
+        None are not used to filter the executors.
+        """
+        filters = {
+            "controller_id": controller_id,
+            "level_id": level_id,
+            "side": side,
+            "status": status,
+            "is_active": is_active,
+            "close_type": close_type,
+            "trading_pair": trading_pair,
+        }
+        buckets = [self._indexes[index].get(key, {}) for index, key in filters.items() if key is not None]
+        if not buckets:
+            return list(self._executors.values())
+        buckets.sort(key=len)
+        executor_ids = buckets[0]
+        for bucket in buckets[1:]:
+            executor_ids = [executor_id for executor_id in executor_ids if executor_id in bucket]
+        return [self._executors[executor_id] for executor_id in executor_ids]
+
+    def _index(self, executor: ExecutorInfo):
+        keys = self._keys.get(executor.id)
+        if keys is None:
+            keys = {index: key_function(executor) for index, key_function in self._index_keys.items()}
+            for index, key in keys.items():
+                self._indexes[index].setdefault(key, {})[executor.id] = None
+            self._keys[executor.id] = keys
+        else:
+            # Only the state of the executor changes between its snapshots
+            for index, key_function in self._state_index_keys.items():
+                key = key_function(executor)
+                if keys[index] != key:
+                    self._remove_from_index(index, keys[index], executor.id)
+                    self._indexes[index].setdefault(key, {})[executor.id] = None
+                    keys[index] = key
+        self._executors[executor.id] = executor
+
+    def _unindex(self, executor_id: str):
+        if executor_id not in self._executors:
+            return
+        for index, key in self._keys.pop(executor_id).items():
+            self._remove_from_index(index, key, executor_id)
+        del self._executors[executor_id]
+
+    def _remove_from_index(self, index: str, key: Any, executor_id: str):
+        bucket = self._indexes[index][key]
+        del bucket[executor_id]
+        if not bucket:
+            del self._indexes[index][key]
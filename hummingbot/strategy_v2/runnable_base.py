@@ -70,6 +70,7 @@ class RunnableBase(ABC):
             except Exception as e:
                 self.logger().error(e, exc_info=True)
             finally:
+                self.after_control_task()
                 await asyncio.sleep(self.update_interval)
         self.on_stop()
 
@@ -93,3 +94,10 @@ class RunnableBase(ABC):
         This method should be overridden in subclasses to provide specific behavior.
         """
         pass
+
+    def after_control_task(self):
+        """
+        Method to be executed after each control task, even if it failed.
+        This method should be overridden in subclasses to provide specific behavior.
+        """
+        pass
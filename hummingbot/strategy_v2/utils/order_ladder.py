@@ -0,0 +1,120 @@
+from decimal import Decimal
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.utils.float_math import to_decimal
+
+
+class LadderLevel(NamedTuple):
+    level_id: str
+    trade_type: TradeType
+    level: int
+    price: Decimal
+    amount: Decimal
+    amount_quote: Decimal
+
+
+class OrderLadder:
+    """
+    The levels of one side of an order ladder. The prices and the amounts of all the levels are computed at once as
+    numpy arrays, and converted to Decimal level records only for the levels requested, so a controller that refreshes
+    a few levels of a large ladder doesn't pay for the others.
+    """
+
+    def __init__(self,
+                 trade_type: TradeType,
+                 prices: np.ndarray,
+                 amounts_quote: np.ndarray,
+                 level_id_prefix: str = ""):
+        """
+        :param trade_type: the side of the ladder
+        :param prices: the price of each level
+        :param amounts_quote: the amount in quote of each level
+        :param level_id_prefix: the prefix of the ids of the levels, followed by the level number
+        """
+        if len(prices) != len(amounts_quote):
+            raise ValueError(f"The ladder has {len(prices)} prices and {len(amounts_quote)} amounts.")
+        self.trade_type = trade_type
+        self.prices = prices
+        self.amounts_quote = amounts_quote
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.amounts = np.where(prices > 0, amounts_quote / prices, 0.0)
+        self.level_id_prefix = level_id_prefix
+
+    @classmethod
+    def from_spreads(cls,
+                     trade_type: TradeType,
+                     reference_price: Union[Decimal, float],
+                     spreads: Sequence[Union[Decimal, float]],
+                     amounts_quote: Sequence[Union[Decimal, float]],
+                     spread_multiplier: Union[Decimal, float] = 1.0,
+                     level_id_prefix: str = "") -> "OrderLadder":
+        """
+        Creates a ladder with the levels placed at a spread from the reference price, below it for buy orders and above
+        it for sell orders.
+
+        :param trade_type: the side of the ladder
+        :param reference_price: the price the spreads are applied to
+        :param spreads: the spread of each level, as a fraction of the reference price
+        :param amounts_quote: the amount in quote of each level
+        :param spread_multiplier: the factor applied to all the spreads
+        :param level_id_prefix: the prefix of the ids of the levels, followed by the level number
+        """
+        side_multiplier = -1.0 if trade_type == TradeType.BUY else 1.0
+        spreads_array = np.asarray(spreads, dtype=float) * float(spread_multiplier)
+        prices = float(reference_price) * (1.0 + side_multiplier * spreads_array)
+        return cls(trade_type, prices, np.asarray(amounts_quote, dtype=float), level_id_prefix)
+
+    @classmethod
+    def from_price_range(cls,
+                         trade_type: TradeType,
+                         start_price: Union[Decimal, float],
+                         end_price: Union[Decimal, float],
+                         n_levels: int,
+                         total_amount_quote: Union[Decimal, float],
+                         level_id_prefix: str = "") -> "OrderLadder":
+        """
+        Creates a ladder with the levels evenly spaced from the start price to the end price, both included, and the
+        total amount split evenly between them.
+
+        :param trade_type: the side of the ladder
+        :param start_price: the price of the first level
+        :param end_price: the price of the last level
+        :param n_levels: the number of levels
+        :param total_amount_quote: the amount in quote of all the levels
+        :param level_id_prefix: the prefix of the ids of the levels, followed by the level number
+        """
+        prices = np.linspace(float(start_price), float(end_price), n_levels)
+        amounts_quote = np.full(n_levels, float(total_amount_quote) / n_levels)
+        return cls(trade_type, prices, amounts_quote, level_id_prefix)
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def get_level(self, level: int, level_id: Optional[str] = None) -> LadderLevel:
+        """
+        Returns the record of a level, with the price and the amounts converted to Decimal.
+
+        :param level: the level number, starting from 0
+        :param level_id: the id of the level, the prefix of the ladder followed by the level number by default
+        """
+        return LadderLevel(
+            level_id=level_id if level_id is not None else f"{self.level_id_prefix}{level}",
+            trade_type=self.trade_type,
+            level=level,
+            price=to_decimal(self.prices[level]),
+            amount=to_decimal(self.amounts[level]),
+            amount_quote=to_decimal(self.amounts_quote[level]),
+        )
+
+    def get_levels(self, levels: Optional[Iterable[int]] = None) -> List[LadderLevel]:
+        """
+        Returns the records of the levels, all of them by default.
+
+        :param levels: the level numbers of the records to return
+        """
+        if levels is None:
+            levels = range(len(self))
+        return [self.get_level(level) for level in levels]
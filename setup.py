@@ -91,6 +91,7 @@ def main():
         "prompt-toolkit",
         "protobuf",
         "psutil",
+        "pycryptodome",
         "pydantic",
         "pyjwt",
         "pyperclip",
@@ -115,6 +116,11 @@ def main():
         "xrpl-py==4.0.0b3",
     ]
 
+    # Optional dependencies, e.g. pip install -e ".[uvloop]". The client falls back to asyncio without them.
+    extras_require = {
+        "uvloop": ["uvloop; sys_platform != 'win32'"],
+    }
+
     cython_kwargs = {
         "language": "c++",
         "language_level": 3,
@@ -154,6 +160,7 @@ def main():
           packages=packages,
           package_data=package_data,
           install_requires=install_requires,
+          extras_require=extras_require,
           ext_modules=cythonize(cython_sources, compiler_directives=compiler_directives, **cython_kwargs),
           include_dirs=[
               np.get_include()
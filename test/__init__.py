@@ -0,0 +1,5 @@
+from hummingbot.core.utils.event_loop_policy import install_event_loop_policy, use_uvloop_from_env
+
+# Runs the tests on uvloop with HUMMINGBOT_USE_UVLOOP=1
+if use_uvloop_from_env():
+    install_event_loop_policy(use_uvloop=True)
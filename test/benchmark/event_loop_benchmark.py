@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+"""
+Throughput of the hot paths of the client on each available event loop implementation (the default asyncio event
+loop and uvloop, if installed):
+
+- order book diff ingestion: diffs routed by the OrderBookTracker and applied to the order book
+- throttler: requests going through the AsyncThrottler
+- user stream dispatch: user stream events going through the UserStreamTracker queue to their handler
+
+Usage: python test/benchmark/event_loop_benchmark.py [--messages N] [--repeat N]
+"""
+import argparse
+import asyncio
+import sys
+import time
+from decimal import Decimal
+from os.path import abspath, dirname, join
+from typing import Awaitable, Callable, Dict, List, Optional
+
+sys.path.insert(0, abspath(join(dirname(__file__), "..", "..")))
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler  # noqa: E402
+from hummingbot.core.api_throttler.data_types import RateLimit  # noqa: E402
+from hummingbot.core.data_type.order_book import OrderBook  # noqa: E402
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType  # noqa: E402
+from hummingbot.core.data_type.order_book_row import OrderBookRow  # noqa: E402
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker  # noqa: E402
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource  # noqa: E402
+from hummingbot.core.data_type.user_stream_tracker import UserStreamTracker  # noqa: E402
+from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource  # noqa: E402
+from hummingbot.core.utils.async_utils import safe_ensure_future  # noqa: E402
+from hummingbot.core.utils.event_loop_policy import is_uvloop_available, new_event_loop  # noqa: E402
+
+TRADING_PAIR = "COINALPHA-HBOT"
+
+
+class BenchmarkOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {}
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        raise NotImplementedError
+
+    def is_order_book_diff_in_sequence(self, last_update_id: int, diff_message: OrderBookMessage) -> bool:
+        return diff_message.first_update_id <= last_update_id + 1
+
+
+class BenchmarkUserStreamTrackerDataSource(UserStreamTrackerDataSource):
+    def __init__(self, events: List[Dict]):
+        super().__init__()
+        self._events = events
+
+    async def listen_for_user_stream(self, output: asyncio.Queue):
+        for index, event in enumerate(self._events):
+            output.put_nowait(event)
+            if index % 10 == 0:
+                # Several events are usually received in each websocket frame
+                await asyncio.sleep(0)
+
+    async def _connected_websocket_assistant(self):
+        raise NotImplementedError
+
+    async def _subscribe_channels(self, websocket_assistant):
+        raise NotImplementedError
+
+
+async def order_book_diff_ingestion(messages: int) -> float:
+    data_source = BenchmarkOrderBookTrackerDataSource(trading_pairs=[TRADING_PAIR])
+    tracker = OrderBookTracker(data_source=data_source, trading_pairs=[TRADING_PAIR])
+    order_book = OrderBook()
+    order_book.apply_snapshot([OrderBookRow(100, 1, 0)], [OrderBookRow(101, 1, 0)], 0)
+    tracker._order_books[TRADING_PAIR] = order_book
+    tracker._tracking_message_queues[TRADING_PAIR] = asyncio.Queue()
+    diffs = [
+        OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": TRADING_PAIR,
+            "first_update_id": update_id,
+            "update_id": update_id,
+            "bids": [[100 - (update_id % 50) * 0.01, update_id % 7]],
+            "asks": [[101 + (update_id % 50) * 0.01, update_id % 5]],
+        }, timestamp=1640000000)
+        for update_id in range(1, messages + 1)
+    ]
+    tasks = [safe_ensure_future(tracker._order_book_diff_router()),
+             safe_ensure_future(tracker._track_single_book(TRADING_PAIR))]
+    try:
+        start = time.perf_counter()
+        for diff in diffs:
+            tracker._order_book_diff_stream.put_nowait(diff)
+        while order_book.last_diff_uid < messages:
+            await asyncio.sleep(0)
+        return messages / (time.perf_counter() - start)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def throttler(messages: int) -> float:
+    # The throttler checks the log of the requests of the last interval in each request, so its runs are shorter
+    messages = messages // 10
+    limit_id = "benchmark"
+    async_throttler = AsyncThrottler(
+        rate_limits=[RateLimit(limit_id=limit_id, limit=messages * 10, time_interval=1)],
+        limits_share_percentage=Decimal("100"))
+
+    async def requests_worker(requests: int):
+        for _ in range(requests):
+            async with async_throttler.execute_task(limit_id=limit_id):
+                await asyncio.sleep(0)
+
+    # The requests are sent by concurrent workers, as the polling loops of the connectors do
+    workers = 20
+    start = time.perf_counter()
+    await asyncio.gather(*[requests_worker(messages // workers) for _ in range(workers)])
+    return messages / (time.perf_counter() - start)
+
+
+async def user_stream_dispatch(messages: int) -> float:
+    events = [{"e": "executionReport" if index % 3 else "outboundAccountPosition", "i": index}
+              for index in range(messages)]
+    tracker = UserStreamTracker(data_source=BenchmarkUserStreamTrackerDataSource(events=events))
+    processed = {"executionReport": 0, "outboundAccountPosition": 0}
+
+    def on_event(event: Dict):
+        processed[event["e"]] += 1
+
+    handlers: Dict[str, Callable[[Dict], None]] = {event_type: on_event for event_type in processed}
+
+    start = time.perf_counter()
+    tracker_task = safe_ensure_future(tracker.start())
+    try:
+        for _ in range(messages):
+            event = await tracker.user_stream.get()
+            handlers[event["e"]](event)
+        return messages / (time.perf_counter() - start)
+    finally:
+        tracker_task.cancel()
+
+
+BENCHMARKS: Dict[str, Callable[[int], Awaitable[float]]] = {
+    "order_book_diff_ingestion": order_book_diff_ingestion,
+    "throttler": throttler,
+    "user_stream_dispatch": user_stream_dispatch,
+}
+
+
+def run_benchmark(benchmark: Callable[[int], Awaitable[float]], use_uvloop: bool, messages: int, repeat: int) -> float:
+    """
+    :return: the best throughput (operations per second) of the runs, each on a new event loop
+    """
+    results = []
+    for _ in range(repeat):
+        loop = new_event_loop(use_uvloop=use_uvloop)
+        asyncio.set_event_loop(loop)
+        try:
+            results.append(loop.run_until_complete(benchmark(messages)))
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+    return max(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark of the client hot paths on each event loop")
+    parser.add_argument("--messages", type=int, default=20000, help="Operations in each run")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs of each benchmark, the best one is reported")
+    args = parser.parse_args()
+
+    implementations = {"asyncio": False}
+    if is_uvloop_available():
+        implementations["uvloop"] = True
+    else:
+        print("uvloop is not installed, only the asyncio event loop is benchmarked.\n")
+
+    header = f"{'benchmark':<28}" + "".join(f"{name + ' (ops/s)':>18}" for name in implementations)
+    if len(implementations) > 1:
+        header += f"{'speedup':>10}"
+    print(header)
+    for name, benchmark in BENCHMARKS.items():
+        results = [run_benchmark(benchmark, use_uvloop, args.messages, args.repeat)
+                   for use_uvloop in implementations.values()]
+        line = f"{name:<28}" + "".join(f"{result:>18,.0f}" for result in results)
+        if len(results) > 1:
+            line += f"{results[1] / results[0]:>9.2f}x"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
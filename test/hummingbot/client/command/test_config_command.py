@@ -93,6 +93,12 @@ class ConfigCommandTest(unittest.TestCase):
                            "    | commands_timeout                  |                      |\n"
                            "    | ∟ create_command_timeout          | 10                   |\n"
                            "    | ∟ other_commands_timeout          | 30                   |\n"
+                           "    | use_uvloop                        | False                |\n"
+                           "    | event_loop_monitor                |                      |\n"
+                           "    | ∟ lag_warning_threshold           | 0.5                  |\n"
+                           "    | ∟ slow_callback_threshold         | 0.1                  |\n"
+                           "    | ∟ profile_tasks                   | False                |\n"
+                           "    | connector_shards                  | 0                    |\n"
                            "    | tables_format                     | psql                 |\n"
                            "    | tick_size                         | 1.0                  |\n"
                            "    | market_data_collection            |                      |\n"
@@ -7,6 +7,8 @@ from unittest.mock import MagicMock, patch
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
 from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.core.utils.event_loop_monitor import EventLoopMonitor
 
 
 class StatusCommandTest(unittest.TestCase):
@@ -74,3 +76,17 @@ class StatusCommandTest(unittest.TestCase):
                 msg="\nA network error prevented the connection check to complete. See logs for more details."
             )
         )
+
+    def test_status_with_diagnostics_reports_the_connector_queues(self):
+        connector = MagicMock(spec=ExchangePyBase)
+        connector.queue_depths.return_value = {"order_book_diff_stream": 4, "user_stream": 1}
+        self.app.markets = {"binance": connector}
+
+        diagnostics = self.app.event_loop_diagnostics()
+        self.app.status(diagnostics=True)
+
+        self.assertEqual({"binance": {"order_book_diff_stream": 4, "user_stream": 1}}, diagnostics["queues"])
+        self.assertIn("lag", diagnostics["event_loop"])
+        self.assertIn("live", diagnostics["tasks"])
+        self.assertTrue(self.cli_mock_assistant.check_log_called_with(
+            msg=EventLoopMonitor.get_instance().format_report(diagnostics)))
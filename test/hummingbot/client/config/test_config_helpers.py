@@ -1,4 +1,5 @@
 import asyncio
+import pickle
 import unittest
 from decimal import Decimal
 from pathlib import Path
@@ -185,3 +186,13 @@ class ReadOnlyClientAdapterTest(unittest.TestCase):
 
         self.assertEqual("Cannot set an attribute on a read-only client adapter", str(context.exception))
         self.assertEqual(initial_instance_id, read_only_adapter.instance_id)
+
+    def test_read_only_adapter_can_be_pickled(self):
+        read_only_adapter = ReadOnlyClientConfigAdapter.lock_config(ClientConfigAdapter(ClientConfigMap()))
+
+        unpickled_adapter = pickle.loads(pickle.dumps(read_only_adapter))
+
+        self.assertIsInstance(unpickled_adapter, ReadOnlyClientConfigAdapter)
+        self.assertEqual(read_only_adapter.hb_config, unpickled_adapter.hb_config)
+        with self.assertRaises(AttributeError):
+            unpickled_adapter.instance_id = "newInstanceID"
@@ -1,8 +1,11 @@
 import asyncio
+import binascii
+import json
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Awaitable
+from unittest.mock import patch
 
 from hummingbot.client.config import config_crypt, config_helpers, security
 from hummingbot.client.config.config_crypt import ETHKeyFileSecretManger, store_password_verification, validate_password
@@ -150,3 +153,52 @@ class SecurityTest(unittest.TestCase):
         binance_loaded_config = Security.decrypted_value(binance_config.connector)
 
         self.assertEqual(binance_config, binance_loaded_config)
+
+    def test_derived_keys_are_cached(self):
+        secrets_manager = ETHKeyFileSecretManger("som-password")
+        values = ["first", "second", "third"]
+        encrypted_values = [secrets_manager.encrypt_secret_value("attr", value) for value in values]
+
+        secrets_manager.derive_keys(encrypted_values + ["invalid"], max_workers=2)
+
+        with patch("hummingbot.client.config.config_crypt._derive_key") as derive_key_mock:
+            decrypted_values = [secrets_manager.decrypt_secret_value("attr", value) for value in encrypted_values]
+
+        derive_key_mock.assert_not_called()
+        self.assertEqual(values, decrypted_values)
+
+        another_secrets_manager = ETHKeyFileSecretManger("another-password")
+        with self.assertRaises(ValueError):
+            another_secrets_manager.decrypt_secret_value("attr", encrypted_values[0])
+
+    def test_derive_keys_of_scrypt_keyfiles_in_processes_not_forked_from_the_client(self):
+        secrets_manager = ETHKeyFileSecretManger("som-password")
+        values = ["first", "second"]
+        encrypted_values = []
+        for value in values:
+            keyfile_json = config_crypt._create_v3_keyfile_json(value.encode(), b"som-password", kdf="scrypt")
+            encrypted_values.append(binascii.hexlify(json.dumps(keyfile_json).encode()).decode())
+
+        with patch("hummingbot.client.config.config_crypt.ProcessPoolExecutor",
+                   wraps=config_crypt.ProcessPoolExecutor) as pool_mock:
+            secrets_manager.derive_keys(encrypted_values, max_workers=2)
+
+        self.assertNotEqual("fork", pool_mock.call_args.kwargs["mp_context"].get_start_method())
+        with patch("hummingbot.client.config.config_crypt._derive_key") as derive_key_mock:
+            decrypted_values = [secrets_manager.decrypt_secret_value("attr", value) for value in encrypted_values]
+
+        derive_key_mock.assert_not_called()
+        self.assertEqual(values, decrypted_values)
+
+    def test_decrypt_all_derives_the_keys_before_loading_the_configs(self):
+        password = "som-password"
+        secrets_manager = ETHKeyFileSecretManger(password)
+        store_password_verification(secrets_manager)
+        Security.secrets_manager = secrets_manager
+        self.store_binance_config()
+
+        with patch.object(secrets_manager, "derive_keys", wraps=secrets_manager.derive_keys) as derive_keys_mock:
+            Security.decrypt_all()
+
+        self.assertEqual(2, len(derive_keys_mock.call_args[0][0]))
+        self.assertEqual(self.api_key, Security.api_keys(self.connector)["binance_api_key"])
@@ -0,0 +1,134 @@
+import json
+import unittest
+from decimal import Decimal
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from hummingbot.client.connector_manifest import (
+    build_connector_manifest,
+    load_connector_manifest,
+    save_connector_manifest,
+    trade_fee_schema_from_json,
+    trade_fee_schema_to_json,
+)
+from hummingbot.client.settings import AllConnectorSettings, ConnectorConfigKeysLoader, ConnectorSetting, ConnectorType
+from hummingbot.connector.exchange.binance import binance_utils
+from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeSchema
+
+
+class ConnectorManifestTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = TemporaryDirectory()
+        self.manifest_path = Path(self.temp_dir.name) / "connector_manifest.json"
+        self.connector_directories = [("exchange", "binance"), ("derivative", "binance_perpetual")]
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        AllConnectorSettings.all_connector_settings = {}
+        super().tearDown()
+
+    def write_manifest(self, manifest):
+        with open(self.manifest_path, "w") as manifest_file:
+            json.dump(manifest, manifest_file)
+
+    def test_trade_fee_schema_json_round_trip(self):
+        schema = TradeFeeSchema(
+            percent_fee_token="BNB",
+            maker_percent_fee_decimal=Decimal("0.001"),
+            taker_percent_fee_decimal=Decimal("0.002"),
+            maker_fixed_fees=[TokenAmount("ETH", Decimal("0.01"))],
+        )
+
+        self.assertEqual(schema, trade_fee_schema_from_json(json.loads(json.dumps(trade_fee_schema_to_json(schema)))))
+
+    def test_load_manifest_rejects_stale_manifests(self):
+        manifest = build_connector_manifest([], self.connector_directories)
+        self.write_manifest(manifest)
+
+        self.assertEqual(manifest, load_connector_manifest(self.connector_directories, self.manifest_path))
+        self.assertIsNone(load_connector_manifest([("exchange", "binance")], self.manifest_path))
+
+        self.write_manifest(dict(manifest, hummingbot_version="0.0.1"))
+        self.assertIsNone(load_connector_manifest(self.connector_directories, self.manifest_path))
+
+        self.assertIsNone(load_connector_manifest(self.connector_directories, Path(self.temp_dir.name) / "missing"))
+
+    def test_load_manifest_rejects_manifests_of_changed_utils_modules(self):
+        manifest = build_connector_manifest([], self.connector_directories)
+        self.assertIsNotNone(manifest["utils_module_hashes"]["exchange/binance"])
+        changed_hashes = dict(manifest["utils_module_hashes"], **{"exchange/binance": "0" * 64})
+        self.write_manifest(dict(manifest, utils_module_hashes=changed_hashes))
+
+        self.assertIsNone(load_connector_manifest(self.connector_directories, self.manifest_path))
+
+    def test_save_manifest(self):
+        manifest = build_connector_manifest([], self.connector_directories)
+
+        self.assertTrue(save_connector_manifest(manifest, self.manifest_path))
+        self.assertEqual(manifest, load_connector_manifest(self.connector_directories, self.manifest_path))
+        self.assertFalse(save_connector_manifest(manifest, Path(self.temp_dir.name) / "missing" / "manifest.json"))
+        self.assertEqual([self.manifest_path.name], [path.name for path in Path(self.temp_dir.name).iterdir()])
+
+    def test_connector_settings_from_manifest_load_config_keys_lazily(self):
+        binance_setting = ConnectorSetting(
+            name="binance",
+            type=ConnectorType.Exchange,
+            example_pair="ZRX-ETH",
+            centralised=True,
+            use_ethereum_wallet=False,
+            trade_fee_schema=TradeFeeSchema(maker_percent_fee_decimal=Decimal("0.001")),
+            config_keys=binance_utils.KEYS,
+            is_sub_domain=False,
+            parent_name=None,
+            domain_parameter=None,
+            use_eth_gas_lookup=False,
+        )
+        binance_us_setting = binance_setting._replace(
+            name="binance_us",
+            config_keys=binance_utils.OTHER_DOMAINS_KEYS["binance_us"],
+            is_sub_domain=True,
+            parent_name="binance",
+            domain_parameter="us",
+        )
+        manifest = build_connector_manifest([binance_setting, binance_us_setting], [("exchange", "binance")])
+
+        settings = AllConnectorSettings._connector_settings_from_manifest(json.loads(json.dumps(manifest)))
+
+        self.assertEqual(binance_setting.trade_fee_schema, settings["binance"].trade_fee_schema)
+        self.assertEqual(
+            ConnectorConfigKeysLoader("hummingbot.connector.exchange.binance.binance_utils"),
+            settings["binance"]._asdict()["config_keys"],
+        )
+        self.assertIs(binance_utils.KEYS, settings["binance"].config_keys)
+        self.assertIs(binance_utils.OTHER_DOMAINS_KEYS["binance_us"], settings["binance_us"].config_keys)
+        self.assertEqual("us", settings["binance_us"].domain_parameter)
+
+    def test_create_connector_settings_uses_the_manifest(self):
+        binance_setting = AllConnectorSettings._connector_settings_from_utils_modules([("exchange", "binance")])
+        manifest = build_connector_manifest(list(binance_setting.values()), [("exchange", "binance")])
+
+        with patch.object(AllConnectorSettings, "_connector_directories", return_value=[("exchange", "binance")]):
+            with patch("hummingbot.client.settings.load_connector_manifest", return_value=manifest):
+                with patch.object(AllConnectorSettings, "_connector_settings_from_utils_modules") as scan_mock:
+                    settings = AllConnectorSettings.create_connector_settings()
+                    AllConnectorSettings.initialize_paper_trade_settings(["binance"])
+
+        scan_mock.assert_not_called()
+        self.assertIn("binance", settings)
+        self.assertIn("binance_us", settings)
+        # The paper trade settings keep the config keys of the connector unloaded
+        self.assertIsInstance(settings["binance_paper_trade"]._asdict()["config_keys"], ConnectorConfigKeysLoader)
+        self.assertEqual("binance", settings["binance_paper_trade"].parent_name)
+
+    def test_create_connector_settings_writes_the_manifest_again_when_it_is_stale(self):
+        with patch.object(AllConnectorSettings, "_connector_directories", return_value=[("exchange", "binance")]):
+            with patch("hummingbot.client.settings.load_connector_manifest", return_value=None):
+                with patch("hummingbot.client.settings.save_connector_manifest") as save_mock:
+                    settings = AllConnectorSettings.create_connector_settings()
+
+        self.assertIn("binance", settings)
+        manifest = save_mock.call_args[0][0]
+        self.assertEqual(["binance", "binance_us"], [connector["name"] for connector in manifest["connectors"]])
+        self.assertEqual(["exchange/binance"], list(manifest["utils_module_hashes"]))
@@ -707,6 +707,34 @@ class BinancePerpetualDerivativeUnitTest(unittest.TestCase):
         self.assertEqual(margin_asset, self.exchange.get_buy_collateral_token(self.trading_pair))
         self.assertEqual(margin_asset, self.exchange.get_sell_collateral_token(self.trading_pair))
 
+    def test_amend_order_replaces_the_order_keeping_its_position_action(self):
+        self.assertFalse(self.exchange.supports_order_amendment)
+        self.exchange.start_tracking_order(
+            order_id="OID1",
+            exchange_order_id="8886774",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.SELL,
+            price=Decimal("10000"),
+            amount=Decimal("1"),
+            order_type=OrderType.LIMIT,
+            leverage=1,
+            position_action=PositionAction.CLOSE,
+        )
+        self.exchange.cancel = MagicMock()
+        self.exchange.sell = MagicMock(return_value="OID2")
+
+        new_order_id = self.exchange.amend_order(self.trading_pair, "OID1", Decimal("10100"), Decimal("1"))
+
+        self.assertEqual("OID2", new_order_id)
+        self.exchange.cancel.assert_called_once_with(self.trading_pair, "OID1")
+        self.exchange.sell.assert_called_once_with(
+            trading_pair=self.trading_pair,
+            amount=Decimal("1"),
+            order_type=OrderType.LIMIT,
+            price=Decimal("10100"),
+            position_action=PositionAction.CLOSE,
+        )
+
     def test_buy_order_fill_event_takes_fee_from_update_event(self):
         self.exchange.start_tracking_order(
             order_id="OID1",
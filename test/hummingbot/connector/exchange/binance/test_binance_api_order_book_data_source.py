@@ -13,6 +13,7 @@ from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS, binance_web_utils as web_utils
 from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
 from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.connector.exchange.binance.binance_order_book import BinanceOrderBook
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
@@ -409,3 +410,15 @@ class BinanceAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         msg: OrderBookMessage = self.async_run_with_timeout(msg_queue.get())
 
         self.assertEqual(1027024, msg.update_id)
+
+    def test_diff_sequence_follows_the_update_ids(self):
+        diff = BinanceOrderBook.diff_message_from_exchange(
+            self._order_diff_event(), 1640000000, {"trading_pair": self.trading_pair})
+
+        # The diff has the updates 157 to 160
+        self.assertTrue(self.data_source.is_order_book_diff_stale(160, diff))
+        self.assertFalse(self.data_source.is_order_book_diff_in_sequence(160, diff))
+        self.assertFalse(self.data_source.is_order_book_diff_stale(158, diff))
+        self.assertTrue(self.data_source.is_order_book_diff_in_sequence(158, diff))
+        self.assertTrue(self.data_source.is_order_book_diff_in_sequence(156, diff))
+        self.assertFalse(self.data_source.is_order_book_diff_in_sequence(155, diff))
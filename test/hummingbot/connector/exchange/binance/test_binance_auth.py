@@ -49,3 +49,30 @@ class BinanceAuthTests(TestCase):
         self.assertEqual(now * 1e3, configured_request.params["timestamp"])
         self.assertEqual(expected_signature, configured_request.params["signature"])
         self.assertEqual({"X-MBX-APIKEY": self._api_key}, configured_request.headers)
+
+    def test_add_auth_to_ws_api_params(self):
+        now = 1234567890.000
+        mock_time_provider = MagicMock()
+        mock_time_provider.time.return_value = now
+
+        params = {
+            "symbol": "LTCBTC",
+            "side": "BUY",
+            "type": "LIMIT",
+            "quantity": "1",
+        }
+
+        auth = BinanceAuth(api_key=self._api_key, secret_key=self._secret, time_provider=mock_time_provider)
+        auth_params = auth.add_auth_to_ws_api_params(params=params)
+
+        sorted_params = dict(params, apiKey=self._api_key, timestamp=1234567890000)
+        encoded_params = "&".join([f"{key}={sorted_params[key]}" for key in sorted(sorted_params)])
+        expected_signature = hmac.new(
+            self._secret.encode("utf-8"),
+            encoded_params.encode("utf-8"),
+            hashlib.sha256).hexdigest()
+        self.assertEqual(self._api_key, auth_params["apiKey"])
+        self.assertEqual(1234567890000, auth_params["timestamp"])
+        self.assertEqual(expected_signature, auth_params["signature"])
+        self.assertEqual("signature", list(auth_params.keys())[-1])
+        self.assertNotIn("apiKey", params)
@@ -2,16 +2,20 @@ import asyncio
 import json
 import re
 from decimal import Decimal
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from typing import Any, Callable, Dict, List, Optional, Tuple
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from aioresponses import aioresponses
 from aioresponses.core import RequestCall
+from bidict import bidict
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS, binance_web_utils as web_utils
 from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.connector.order_entry_channel import OrderEntryChannelUnavailableError
 from hummingbot.connector.test_support.exchange_connector_test import AbstractExchangeConnectorTests
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
@@ -19,6 +23,7 @@ from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
 from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.event.events import MarketOrderFailureEvent, OrderFilledEvent
+from hummingbot.core.utils.trading_pairs_cache import TradingPairsCache
 
 
 class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
@@ -1157,6 +1162,117 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
                 price=Decimal("2"),
             ))
 
+    def _create_exchange_with_connected_order_entry_channel(self) -> BinanceExchange:
+        exchange = BinanceExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=[self.trading_pair],
+            binance_ws_order_entry=True,
+        )
+        exchange._set_trading_pair_symbol_map(
+            bidict({self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset): self.trading_pair}))
+        order_entry_channel = exchange._order_entry_channel
+        order_entry_channel._ws_assistant = MagicMock()
+        order_entry_channel._connected_event.set()
+        order_entry_channel.request = AsyncMock()
+        return exchange
+
+    def test_no_order_entry_channel_by_default(self):
+        self.assertIsNone(self.exchange._order_entry_channel)
+
+    def test_place_order_through_order_entry_channel(self):
+        exchange = self._create_exchange_with_connected_order_entry_channel()
+        exchange._order_entry_channel.request.return_value = {"orderId": 28, "transactTime": 1640780000000}
+
+        o_id, transact_time = self.async_run_with_timeout(exchange._place_order(
+            order_id="OID1",
+            trading_pair=self.trading_pair,
+            amount=Decimal("1"),
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal("2"),
+        ))
+
+        self.assertEqual("28", o_id)
+        self.assertEqual(1640780000, transact_time)
+        request_kwargs = exchange._order_entry_channel.request.call_args.kwargs
+        self.assertEqual(CONSTANTS.WS_API_ORDER_PLACE_METHOD, request_kwargs["method"])
+        self.assertEqual(CONSTANTS.WS_API_ORDER_PLACE_METHOD, request_kwargs["limit_id"])
+        self.assertEqual("OID1", request_kwargs["params"]["newClientOrderId"])
+        self.assertEqual("2", request_kwargs["params"]["price"])
+
+    @aioresponses()
+    def test_place_cancel_falls_back_to_rest_when_the_order_entry_channel_is_unavailable(self, mock_api):
+        exchange = self._create_exchange_with_connected_order_entry_channel()
+        exchange._order_entry_channel.request.side_effect = OrderEntryChannelUnavailableError("Not connected")
+        order = InFlightOrder(
+            client_order_id="OID1",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1"),
+            creation_timestamp=1640780000,
+            price=Decimal("2"),
+        )
+        url = web_utils.private_rest_url(CONSTANTS.ORDER_PATH_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        mock_api.delete(regex_url, body=json.dumps({"status": "CANCELED"}))
+
+        cancelled = self.async_run_with_timeout(exchange._place_cancel(order.client_order_id, order))
+
+        self.assertTrue(cancelled)
+        self.assertEqual(
+            CONSTANTS.WS_API_ORDER_CANCEL_METHOD, exchange._order_entry_channel.request.call_args.kwargs["method"])
+
+    def test_place_cancel_through_order_entry_channel_raises_exchange_errors(self):
+        exchange = self._create_exchange_with_connected_order_entry_channel()
+        exchange._order_entry_channel.request.side_effect = IOError(
+            "Error executing request 1. HTTP status is 400. Error: {\"code\": -2011, \"msg\": \"Unknown order sent.\"}")
+        order = InFlightOrder(
+            client_order_id="OID1",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1"),
+            creation_timestamp=1640780000,
+            price=Decimal("2"),
+        )
+
+        with self.assertRaises(IOError) as context:
+            self.async_run_with_timeout(exchange._place_cancel(order.client_order_id, order))
+
+        self.assertTrue(exchange._is_order_not_found_during_cancelation_error(context.exception))
+
+    def test_enable_sharding_divides_the_rate_limits_with_the_shards(self):
+        exchange = self.create_exchange_instance()
+
+        exchange.enable_sharding(shards=2, connector_factory=BinanceExchange)
+
+        # With a single trading pair there is one shard, sharing the limits with the strategy process connector
+        self.assertEqual(2, exchange._shard_router.rate_limits_shares)
+        self.assertEqual(3000, exchange._throttler._id_to_limit_map[CONSTANTS.REQUEST_WEIGHT].limit)
+        self.assertEqual(50, exchange._throttler._id_to_limit_map[CONSTANTS.ORDERS].limit)
+
+    def test_symbol_map_and_trading_rules_are_seeded_from_the_cache(self):
+        exchange = self.create_exchange_instance()
+        with TemporaryDirectory() as cache_dir:
+            cache = TradingPairsCache.initialize(ttl=60, cache_dir=Path(cache_dir))
+            self.addCleanup(TradingPairsCache.initialize, ttl=0)
+            cache.put(f"exchange_info_{exchange.name}_{CONSTANTS.EXCHANGE_INFO_PATH_URL}",
+                      self.trading_rules_request_mock_response)
+
+            # No request is mocked, the exchange info is only read from the cache
+            self.async_run_with_timeout(exchange._initialize_trading_pair_symbol_map())
+            self.async_run_with_timeout(exchange._initialize_trading_rules_from_cache())
+
+        self.assertTrue(exchange.trading_pair_symbol_map_ready())
+        self.assertEqual(
+            self.trading_pair,
+            self.async_run_with_timeout(exchange.trading_pair_associated_to_exchange_symbol(
+                self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset))))
+        self.assertIn(self.trading_pair, exchange.trading_rules)
+
     def test_format_trading_rules__min_notional_present(self):
         trading_rules = [{
             "symbol": "COINALPHAHBOT",
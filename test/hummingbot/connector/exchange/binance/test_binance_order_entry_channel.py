@@ -0,0 +1,133 @@
+import asyncio
+import unittest
+from typing import Any, Awaitable, Dict
+from unittest.mock import MagicMock, patch
+
+from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS, binance_web_utils as web_utils
+from hummingbot.connector.exchange.binance.binance_auth import BinanceAuth
+from hummingbot.connector.exchange.binance.binance_order_entry_channel import BinanceWSOrderEntryChannel
+from hummingbot.connector.order_entry_channel import OrderEntryChannelUnavailableError
+from hummingbot.core.mock_api.mock_web_socket_server import MockWebSocketServer, detect_available_port
+
+
+class BinanceWSOrderEntryChannelTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ws_server = MockWebSocketServer("localhost", detect_available_port(8211))
+        self.ws_server.start()
+        self.async_run_with_timeout(self.ws_server.wait_til_started())
+        self.received_requests = []
+
+        time_provider = MagicMock()
+        time_provider.time.return_value = 1640780000
+        self.auth = BinanceAuth(api_key="testAPIKey", secret_key="testSecret", time_provider=time_provider)
+        throttler = web_utils.create_throttler()
+        self.channel = BinanceWSOrderEntryChannel(
+            auth=self.auth,
+            api_factory=web_utils.build_api_factory(throttler=throttler),
+            throttler=throttler,
+        )
+        self.ws_url_patch = patch.object(
+            self.channel, "_ws_url", return_value=f"ws://{self.ws_server.host}:{self.ws_server.port}/")
+        self.ws_url_patch.start()
+
+    def tearDown(self) -> None:
+        self.channel.stop()
+        self.async_run_with_timeout(asyncio.sleep(0.1))  # lets the channel close the connection
+        self.ws_url_patch.stop()
+        asyncio.run_coroutine_threadsafe(self.ws_server._runner.cleanup(), self.ws_server.ev_loop).result(timeout=5)
+        self.ws_server.ev_loop.call_soon_threadsafe(self.ws_server.ev_loop.stop)
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 5):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def _order_place_response(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        self.received_requests.append(request)
+        return {
+            "id": request["id"],
+            "status": 200,
+            "result": {
+                "symbol": request["params"]["symbol"],
+                "orderId": 28,
+                "clientOrderId": request["params"]["newClientOrderId"],
+                "transactTime": 1507725176595,
+            },
+        }
+
+    def _order_cancel_error_response(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "id": request["id"],
+            "status": 400,
+            "error": {"code": CONSTANTS.UNKNOWN_ORDER_ERROR_CODE, "msg": "Unknown order sent."},
+        }
+
+    def _connect(self):
+        self.channel.start()
+        self.async_run_with_timeout(self.channel.wait_until_connected())
+
+    def test_request_is_rejected_when_not_connected(self):
+        self.assertFalse(self.channel.is_connected)
+
+        with self.assertRaises(OrderEntryChannelUnavailableError):
+            self.async_run_with_timeout(self.channel.request(
+                method=CONSTANTS.WS_API_ORDER_PLACE_METHOD,
+                params={"symbol": "BTCUSDT"},
+                limit_id=CONSTANTS.WS_API_ORDER_PLACE_METHOD))
+
+    def test_responses_are_matched_to_their_requests(self):
+        self.ws_server.add_stock_response(CONSTANTS.WS_API_ORDER_PLACE_METHOD, self._order_place_response)
+        self._connect()
+
+        async def place_orders():
+            return await asyncio.gather(*[
+                self.channel.request(
+                    method=CONSTANTS.WS_API_ORDER_PLACE_METHOD,
+                    params={"symbol": "BTCUSDT", "side": "BUY", "newClientOrderId": f"OID{i}"},
+                    limit_id=CONSTANTS.WS_API_ORDER_PLACE_METHOD)
+                for i in range(3)
+            ])
+
+        results = self.async_run_with_timeout(place_orders())
+
+        self.assertEqual(["OID0", "OID1", "OID2"], [result["clientOrderId"] for result in results])
+        self.assertEqual(3, len({request["id"] for request in self.received_requests}))
+        self.assertEqual(0, self.channel.pending_requests_count)
+        request_params = self.received_requests[0]["params"]
+        self.assertEqual(CONSTANTS.WS_API_ORDER_PLACE_METHOD, self.received_requests[0]["method"])
+        self.assertEqual("testAPIKey", request_params["apiKey"])
+        self.assertEqual(1640780000000, request_params["timestamp"])
+        self.assertIn("signature", request_params)
+
+    def test_error_responses_raise_io_error(self):
+        self.ws_server.add_stock_response(CONSTANTS.WS_API_ORDER_CANCEL_METHOD, self._order_cancel_error_response)
+        self._connect()
+
+        with self.assertRaises(IOError) as context:
+            self.async_run_with_timeout(self.channel.request(
+                method=CONSTANTS.WS_API_ORDER_CANCEL_METHOD,
+                params={"symbol": "BTCUSDT", "origClientOrderId": "OID1"},
+                limit_id=CONSTANTS.WS_API_ORDER_CANCEL_METHOD))
+
+        self.assertNotIsInstance(context.exception, OrderEntryChannelUnavailableError)
+        self.assertIn(str(CONSTANTS.UNKNOWN_ORDER_ERROR_CODE), str(context.exception))
+        self.assertIn(CONSTANTS.UNKNOWN_ORDER_MESSAGE, str(context.exception))
+
+    def test_request_times_out_without_response(self):
+        self._connect()
+        self.channel._request_timeout = 0.1
+
+        with self.assertRaises(IOError) as context:
+            self.async_run_with_timeout(self.channel.request(
+                method=CONSTANTS.WS_API_ORDER_PLACE_METHOD,
+                params={"symbol": "BTCUSDT"},
+                limit_id=CONSTANTS.WS_API_ORDER_PLACE_METHOD))
+
+        self.assertNotIsInstance(context.exception, OrderEntryChannelUnavailableError)
+        self.assertEqual(0, self.channel.pending_requests_count)
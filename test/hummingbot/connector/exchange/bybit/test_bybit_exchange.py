@@ -24,6 +24,7 @@ from hummingbot.core.event.events import (
     BuyOrderCreatedEvent,
     MarketEvent,
     MarketOrderFailureEvent,
+    OrderAmendedEvent,
     OrderCancelledEvent,
     OrderFilledEvent,
     SellOrderCreatedEvent,
@@ -84,6 +85,7 @@ class TestBybitExchange(unittest.TestCase):
     def _initialize_event_loggers(self):
         self.buy_order_completed_logger = EventLogger()
         self.buy_order_created_logger = EventLogger()
+        self.order_amended_logger = EventLogger()
         self.order_cancelled_logger = EventLogger()
         self.order_failure_logger = EventLogger()
         self.order_filled_logger = EventLogger()
@@ -93,6 +95,7 @@ class TestBybitExchange(unittest.TestCase):
         events_and_loggers = [
             (MarketEvent.BuyOrderCompleted, self.buy_order_completed_logger),
             (MarketEvent.BuyOrderCreated, self.buy_order_created_logger),
+            (MarketEvent.OrderAmended, self.order_amended_logger),
             (MarketEvent.OrderCancelled, self.order_cancelled_logger),
             (MarketEvent.OrderFailure, self.order_failure_logger),
             (MarketEvent.OrderFilled, self.order_filled_logger),
@@ -780,6 +783,63 @@ class TestBybitExchange(unittest.TestCase):
             )
         )
 
+    @aioresponses()
+    def test_amend_order_successfully(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_trading_pair_symbol_map(bidict({self.ex_trading_pair: self.trading_pair}))
+        self.exchange._set_current_timestamp(1640780000)
+
+        self.exchange.start_tracking_order(
+            order_id="OID1",
+            exchange_order_id="4",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            price=Decimal("10000"),
+            amount=Decimal("100"),
+            order_type=OrderType.LIMIT,
+        )
+        order = self.exchange.in_flight_orders["OID1"]
+        order.update_exchange_order_id("4")
+        order.current_state = OrderState.OPEN
+
+        url = web_utils.rest_url(CONSTANTS.ORDER_AMEND_PATH_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+
+        response = {
+            "retCode": 0,
+            "retMsg": "OK",
+            "result": {
+                "orderId": order.exchange_order_id,
+                "orderLinkId": order.client_order_id
+            },
+            "retExtInfo": {},
+            "time": 1640780001000
+        }
+
+        mock_api.post(regex_url, body=json.dumps(response))
+
+        amended_order_id = self.exchange.amend_order(
+            trading_pair=self.trading_pair, order_id="OID1", price=Decimal("10100"), amount=Decimal("90"))
+        self.async_run_with_timeout(self.order_amended_logger.wait_for(OrderAmendedEvent))
+
+        self.assertEqual("OID1", amended_order_id)
+        amend_request = next(((key, value) for key, value in mock_api.requests.items()
+                              if key[1].human_repr().startswith(url)))
+        self._validate_auth_credentials_present(amend_request[1][0])
+        request_data = json.loads(amend_request[1][0].kwargs["data"])
+        self.assertEqual(self.ex_trading_pair, request_data["symbol"])
+        self.assertEqual(order.client_order_id, request_data["orderLinkId"])
+        self.assertEqual(Decimal("90"), Decimal(request_data["qty"]))
+        self.assertEqual(Decimal("10100"), Decimal(request_data["price"]))
+
+        amended_event: OrderAmendedEvent = self.order_amended_logger.event_log[0]
+        self.assertEqual(order.client_order_id, amended_event.order_id)
+        self.assertEqual(Decimal("10100"), amended_event.price)
+        self.assertEqual(Decimal("90"), amended_event.amount)
+        self.assertEqual(Decimal("10100"), order.price)
+        self.assertEqual(Decimal("90"), order.amount)
+        self.assertFalse(order.is_pending_amendment)
+
     @aioresponses()
     def test_cancel_orders_with_cancel_all(self, mock_api):
         self.exchange._set_current_timestamp(1640780000)
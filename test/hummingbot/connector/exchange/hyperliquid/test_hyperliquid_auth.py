@@ -4,6 +4,8 @@ from typing import Awaitable
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
+from eth_account.messages import encode_structured_data
+
 from hummingbot.connector.exchange.hyperliquid.hyperliquid_auth import HyperliquidAuth
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest
 
@@ -54,3 +56,18 @@ class HyperliquidAuthTests(TestCase):
         self.assertEqual(4, len(params))
         self.assertEqual(None, params.get("vaultAddress"))
         self.assertEqual("order", params.get("action")["type"])
+
+    def test_l1_action_signable_message_matches_structured_data_encoding(self):
+        phantom_agent = self.auth.construct_phantom_agent(bytes(range(32)), True)
+
+        expected = encode_structured_data(self.auth.l1_action_structured_data(phantom_agent))
+        message = self.auth.l1_action_signable_message(phantom_agent)
+
+        self.assertEqual(expected, message)
+
+        action = {"type": "cancelByCloid", "cancels": [{"asset": 4, "cloid": "0x000000000000000000000000000ee056"}]}
+        action_agent = self.auth.construct_phantom_agent(self.auth.action_hash(action, None, 1678974447926), False)
+        self.assertEqual(
+            self.auth.sign_inner(self.auth.wallet, self.auth.l1_action_structured_data(action_agent)),
+            self.auth.sign_l1_action(self.auth.wallet, action, None, 1678974447926, False),
+        )
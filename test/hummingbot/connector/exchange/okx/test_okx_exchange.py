@@ -15,9 +15,17 @@ from hummingbot.connector.exchange.okx.okx_exchange import OkxExchange
 from hummingbot.connector.test_support.exchange_connector_test import AbstractExchangeConnectorTests
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
-from hummingbot.core.data_type.in_flight_order import InFlightOrder
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
-from hummingbot.core.event.events import BuyOrderCreatedEvent, OrderCancelledEvent, OrderType, TradeType
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    BuyOrderCreatedEvent,
+    MarketEvent,
+    OrderAmendedEvent,
+    OrderCancelledEvent,
+    OrderType,
+    TradeType,
+)
 
 
 class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
@@ -1243,6 +1251,92 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
                 self.assertIn(order.client_order_id, self.exchange.in_flight_orders)
                 self.assertTrue(order.is_pending_cancel_confirmation)
 
+    @aioresponses()
+    def test_amend_order_successfully(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        order_amended_logger = EventLogger()
+        self.exchange.add_listener(MarketEvent.OrderAmended, order_amended_logger)
+        self.exchange._set_current_timestamp(1640780000)
+
+        self.exchange.start_tracking_order(
+            order_id="11",
+            exchange_order_id="4",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            price=Decimal("10000"),
+            amount=Decimal("100"),
+            order_type=OrderType.LIMIT,
+        )
+        order: InFlightOrder = self.exchange.in_flight_orders["11"]
+        order.current_state = OrderState.OPEN
+
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_AMEND_ORDER_PATH)
+        response = {
+            "code": "0",
+            "msg": "",
+            "data": [{"clOrdId": "11", "ordId": "4", "reqId": "", "sCode": "0", "sMsg": ""}],
+        }
+        mock_api.post(url, body=json.dumps(response))
+
+        amended_order_id = self.exchange.amend_order(
+            trading_pair=self.trading_pair, order_id="11", price=Decimal("10100"), amount=Decimal("50"))
+        self.async_run_with_timeout(order_amended_logger.wait_for(OrderAmendedEvent))
+
+        self.assertEqual("11", amended_order_id)
+        amend_request = self._all_executed_requests(mock_api, url)[0]
+        self.validate_auth_credentials_present(amend_request)
+        request_data = json.loads(amend_request.kwargs["data"])
+        self.assertEqual(self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset), request_data["instId"])
+        self.assertEqual("11", request_data["clOrdId"])
+        self.assertEqual(Decimal("50"), Decimal(request_data["newSz"]))
+        self.assertEqual(Decimal("10100"), Decimal(request_data["newPx"]))
+
+        self.assertEqual(Decimal("10100"), order.price)
+        self.assertEqual(Decimal("50"), order.amount)
+        self.assertFalse(order.is_pending_amendment)
+        amended_event: OrderAmendedEvent = order_amended_logger.event_log[0]
+        self.assertEqual("11", amended_event.order_id)
+        self.assertEqual(Decimal("10100"), amended_event.price)
+
+    @aioresponses()
+    def test_amend_order_failure_cancels_the_order(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        request_sent_event = asyncio.Event()
+        self.exchange._set_current_timestamp(1640780000)
+
+        self.exchange.start_tracking_order(
+            order_id="11",
+            exchange_order_id="4",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            price=Decimal("10000"),
+            amount=Decimal("100"),
+            order_type=OrderType.LIMIT,
+        )
+        order: InFlightOrder = self.exchange.in_flight_orders["11"]
+        order.current_state = OrderState.OPEN
+
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_AMEND_ORDER_PATH)
+        response = {
+            "code": "1",
+            "msg": "",
+            "data": [{"clOrdId": "11", "ordId": "4", "reqId": "", "sCode": "51503", "sMsg": "Order modification failed"}],
+        }
+        mock_api.post(url, body=json.dumps(response))
+        cancel_url = self.configure_successful_cancelation_response(
+            order=order,
+            mock_api=mock_api,
+            callback=lambda *args, **kwargs: request_sent_event.set())
+
+        self.exchange.amend_order(
+            trading_pair=self.trading_pair, order_id="11", price=Decimal("10100"), amount=Decimal("50"))
+        self.async_run_with_timeout(request_sent_event.wait())
+
+        self.assertEqual(Decimal("10000"), order.price)
+        self.assertFalse(order.is_pending_amendment)
+        cancel_request = self._all_executed_requests(mock_api, cancel_url)[0]
+        self.validate_order_cancelation_request(order=order, request_call=cancel_request)
+
     @aioresponses()
     def test_create_buy_market_order_successfully(self, mock_api):
         self._simulate_trading_rules_initialized()
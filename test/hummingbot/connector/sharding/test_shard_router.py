@@ -0,0 +1,242 @@
+import asyncio
+import os
+import time
+import unittest
+from decimal import Decimal
+from typing import Awaitable, Callable, List
+from unittest.mock import MagicMock
+
+from hummingbot.connector.sharding.shard_router import ShardRouter
+from hummingbot.connector.sharding.sharded_order_book_tracker import ShardedOrderBookTracker
+from hummingbot.connector.sharding.sharded_user_stream_tracker_data_source import ShardedUserStreamTrackerDataSource
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+class FakeUserStreamTracker:
+    def __init__(self):
+        self.user_stream = asyncio.Queue()
+        self.last_recv_time = 0
+
+    async def start(self):
+        self.last_recv_time = 1640000000.0
+        self.user_stream.put_nowait({"e": "executionReport", "pid": os.getpid()})
+        await asyncio.sleep(10)
+
+
+class FakeShardConnector:
+    """
+    Connector created in the worker processes.
+    """
+
+    def __init__(self, trading_pairs: List[str], trading_required: bool = True):
+        self.is_trading_required = trading_required
+        self.rate_limits_shares = 1
+        self.time_synchronizations = 0
+        self.order_book_tracker = MagicMock()
+        self._order_entry_channel = None
+        self._user_stream_tracker = FakeUserStreamTracker()
+        self.order_books = {}
+        for trading_pair in trading_pairs:
+            price = float(trading_pair.split("-")[0][-1])
+            order_book = OrderBook()
+            order_book.apply_snapshot([OrderBookRow(price, 1, 1)], [OrderBookRow(price + 1, 2, 1)], 1)
+            self.order_books[trading_pair] = order_book
+
+    def _share_rate_limits(self, shares: int):
+        self.rate_limits_shares = shares
+
+    async def _update_time_synchronizer(self, pass_on_non_cancelled_error: bool = False):
+        self.time_synchronizations += 1
+
+    async def _place_order(self, order_id: str, trading_pair: str, amount: Decimal, trade_type: TradeType,
+                           order_type: OrderType, price: Decimal, **kwargs):
+        if order_id == "EXIT":
+            # The worker process exits without answering
+            os._exit(1)
+        return f"{os.getpid()}-{order_id}-{amount}-{trade_type.name}", 1640000000.0
+
+    async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
+        if tracked_order.exchange_order_id is None:
+            raise IOError("Order not found")
+        return True
+
+
+class SynchronizationReportingShardConnector(FakeShardConnector):
+
+    async def _place_order(self, order_id: str, trading_pair: str, amount: Decimal, trade_type: TradeType,
+                           order_type: OrderType, price: Decimal, **kwargs):
+        return f"{self.time_synchronizations}-{self.rate_limits_shares}", 1640000000.0
+
+
+class SlowStoppingShardConnector(FakeShardConnector):
+
+    def __init__(self, trading_pairs: List[str], trading_required: bool = True):
+        super().__init__(trading_pairs=trading_pairs, trading_required=trading_required)
+        self.order_book_tracker.stop.side_effect = lambda: time.sleep(0.5)
+
+
+class ShardRouterTests(unittest.TestCase):
+    level = 0
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.trading_pairs = ["COIN1-HBOT", "COIN2-HBOT", "COIN3-HBOT"]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.router = ShardRouter(
+            connector_factory=FakeShardConnector,
+            trading_pairs=self.trading_pairs,
+            shards=2,
+            run_user_stream=True)
+
+    def tearDown(self) -> None:
+        self.async_run_with_timeout(self.router.stop())
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 5):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def run_until(self, condition: Callable[[], bool], timeout: float = 5):
+        deadline = time.time() + timeout
+        while not condition():
+            self.assertLess(time.time(), deadline, "The condition was not met before the timeout.")
+            self.async_run_with_timeout(asyncio.sleep(0.02))
+
+    def test_trading_pairs_are_distributed_among_the_shards(self):
+        self.assertEqual([["COIN1-HBOT", "COIN3-HBOT"], ["COIN2-HBOT"]], self.router.shards_trading_pairs)
+        self.assertEqual(1, self.router.shard_for_trading_pair("COIN2-HBOT"))
+        self.assertEqual(3, self.router.rate_limits_shares)
+
+        router = ShardRouter(connector_factory=FakeShardConnector, trading_pairs=["COIN1-HBOT"], shards=4,
+                             run_user_stream=False)
+
+        self.assertEqual([["COIN1-HBOT"]], router.shards_trading_pairs)
+        self.assertEqual(2, router.rate_limits_shares)
+
+    def test_order_books_published_by_the_workers_are_copied_by_the_tracker(self):
+        data_source = MagicMock()
+        data_source.order_book_create_function = OrderBook
+        tracker = ShardedOrderBookTracker(data_source=data_source, trading_pairs=self.trading_pairs, router=self.router)
+        self.router.start()
+        tracker.start()
+
+        self.async_run_with_timeout(tracker.wait_ready())
+
+        for index, trading_pair in enumerate(self.trading_pairs):
+            self.assertEqual(index + 1, tracker.order_books[trading_pair].get_price(is_buy=False))
+            self.assertEqual(index + 2, tracker.order_books[trading_pair].get_price(is_buy=True))
+        tracker.stop()
+
+    def test_order_requests_are_routed_to_the_worker_of_the_trading_pair(self):
+        self.router.start()
+        pids = [process.pid for process in self.router._processes]
+
+        exchange_order_id, _ = self.async_run_with_timeout(self.router.place_order(
+            order_id="OID1", trading_pair="COIN2-HBOT", amount=Decimal("1.5"), trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT, price=Decimal("2")))
+        self.assertEqual(f"{pids[1]}-OID1-1.5-BUY", exchange_order_id)
+
+        exchange_order_id, _ = self.async_run_with_timeout(self.router.place_order(
+            order_id="OID2", trading_pair="COIN3-HBOT", amount=Decimal("1"), trade_type=TradeType.SELL,
+            order_type=OrderType.LIMIT, price=Decimal("3")))
+        self.assertEqual(f"{pids[0]}-OID2-1-SELL", exchange_order_id)
+
+        order = InFlightOrder(client_order_id="OID1", trading_pair="COIN2-HBOT", order_type=OrderType.LIMIT,
+                              trade_type=TradeType.BUY, amount=Decimal("1.5"), creation_timestamp=1640000000,
+                              price=Decimal("2"), exchange_order_id="EOID1")
+        self.assertTrue(self.async_run_with_timeout(self.router.place_cancel(order_id="OID1", tracked_order=order)))
+
+        order.exchange_order_id = None
+        with self.assertRaises(IOError) as error:
+            self.async_run_with_timeout(self.router.place_cancel(order_id="OID1", tracked_order=order))
+        self.assertEqual("OSError: Order not found", str(error.exception))
+
+    def test_user_stream_events_are_forwarded_from_the_first_shard(self):
+        data_source = ShardedUserStreamTrackerDataSource(router=self.router)
+        output = asyncio.Queue()
+        self.router.start()
+        listening_task = self.ev_loop.create_task(data_source.listen_for_user_stream(output))
+
+        event_message = self.async_run_with_timeout(output.get())
+
+        self.assertEqual({"e": "executionReport", "pid": self.router._processes[0].pid}, event_message)
+        self.run_until(lambda: data_source.last_recv_time > 0)
+        self.assertEqual(1640000000.0, data_source.last_recv_time)
+        listening_task.cancel()
+
+    def test_every_worker_synchronizes_its_time_and_uses_its_share_of_the_rate_limits(self):
+        router = ShardRouter(connector_factory=SynchronizationReportingShardConnector,
+                             trading_pairs=self.trading_pairs, shards=2, run_user_stream=True)
+        router.start()
+
+        try:
+            for trading_pair in ["COIN1-HBOT", "COIN2-HBOT"]:
+                report, _ = self.async_run_with_timeout(router.place_order(
+                    order_id="OID1", trading_pair=trading_pair, amount=Decimal("1"), trade_type=TradeType.BUY,
+                    order_type=OrderType.LIMIT, price=Decimal("2")))
+                # Both shards and the strategy process share the rate limits
+                self.assertEqual("1-3", report)
+        finally:
+            self.async_run_with_timeout(router.stop())
+
+    def test_pending_requests_fail_as_soon_as_their_worker_exits(self):
+        self.router.start()
+        start_time = time.time()
+
+        with self.assertRaises(IOError) as error:
+            self.async_run_with_timeout(self.router.place_order(
+                order_id="EXIT", trading_pair="COIN2-HBOT", amount=Decimal("1"), trade_type=TradeType.BUY,
+                order_type=OrderType.LIMIT, price=Decimal("2")))
+
+        self.assertEqual("The worker of shard 1 exited before answering the request.", str(error.exception))
+        self.assertLess(time.time() - start_time, self.router.REQUEST_TIMEOUT)
+        with self.assertRaises(IOError) as error:
+            self.async_run_with_timeout(self.router.place_order(
+                order_id="OID2", trading_pair="COIN2-HBOT", amount=Decimal("1"), trade_type=TradeType.BUY,
+                order_type=OrderType.LIMIT, price=Decimal("2")))
+        self.assertEqual("The worker of shard 1 is not running.", str(error.exception))
+        # The other shard keeps working
+        exchange_order_id, _ = self.async_run_with_timeout(self.router.place_order(
+            order_id="OID3", trading_pair="COIN1-HBOT", amount=Decimal("1"), trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT, price=Decimal("2")))
+        self.assertEqual(f"{self.router._processes[0].pid}-OID3-1-BUY", exchange_order_id)
+
+    def test_requests_fail_when_the_workers_are_not_running(self):
+        with self.assertRaises(IOError):
+            self.async_run_with_timeout(self.router.place_order(
+                order_id="OID1", trading_pair="COIN2-HBOT", amount=Decimal("1"), trade_type=TradeType.BUY,
+                order_type=OrderType.LIMIT, price=Decimal("2")))
+
+    def test_stop_waits_for_the_workers_without_blocking_the_event_loop(self):
+        router = ShardRouter(connector_factory=SlowStoppingShardConnector, trading_pairs=self.trading_pairs, shards=2,
+                             run_user_stream=False)
+        router.start()
+        processes = list(router._processes)
+        ticks = []
+        # The workers are running once they have published their order books
+        self.run_until(lambda: all(router.order_book_view.version(trading_pair) > 0
+                                   for trading_pair in self.trading_pairs))
+
+        async def tick_until_stopped(stop_task: asyncio.Task):
+            while not stop_task.done():
+                ticks.append(time.time())
+                await asyncio.sleep(0.02)
+
+        async def stop_router():
+            stop_task = asyncio.ensure_future(router.stop())
+            await asyncio.gather(stop_task, tick_until_stopped(stop_task))
+
+        start_time = time.time()
+        self.async_run_with_timeout(stop_router())
+
+        self.assertFalse(router.is_running)
+        self.assertTrue(all(not process.is_alive() for process in processes))
+        # Both workers are stopped at the same time, and the event loop keeps running while waiting for them
+        self.assertLess(time.time() - start_time, 0.9)
+        self.assertGreater(len(ticks), 10)
@@ -0,0 +1,82 @@
+import pickle
+import unittest
+
+import numpy as np
+
+from hummingbot.connector.sharding.shared_order_book_view import SharedOrderBookView
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+class SharedOrderBookViewTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.view = SharedOrderBookView(trading_pairs=["COINALPHA-HBOT", "WETH-USDT"], depth=2)
+
+    def tearDown(self) -> None:
+        self.view.close()
+        super().tearDown()
+
+    def test_order_book_not_published_is_not_read(self):
+        self.assertEqual(0, self.view.version("COINALPHA-HBOT"))
+        self.assertIsNone(self.view.read("COINALPHA-HBOT"))
+
+    def test_published_order_book_is_read_up_to_the_depth(self):
+        self.view.publish(
+            trading_pair="WETH-USDT",
+            bids=np.array([[99, 1, 5], [98, 2, 5], [97, 3, 5]], dtype=np.float64),
+            asks=np.array([[101, 4, 6]], dtype=np.float64),
+            last_trade_price=100.5)
+
+        snapshot = self.view.read("WETH-USDT")
+
+        self.assertEqual(1, snapshot.version)
+        self.assertEqual(1, self.view.version("WETH-USDT"))
+        self.assertEqual(100.5, snapshot.last_trade_price)
+        self.assertEqual([[99, 1, 5], [98, 2, 5]], snapshot.bids.tolist())
+        self.assertEqual([[101, 4, 6]], snapshot.asks.tolist())
+        self.assertIsNone(self.view.read("COINALPHA-HBOT"))
+
+    def test_order_book_being_written_is_not_read(self):
+        self.view.publish(
+            trading_pair="WETH-USDT",
+            bids=np.array([[99, 1, 5]], dtype=np.float64),
+            asks=np.array([[101, 4, 6]], dtype=np.float64),
+            last_trade_price=100.5)
+        # The writer increments the sequence before writing the row
+        self.view._buffer[1, SharedOrderBookView.SEQUENCE] += 1
+
+        self.assertIsNone(self.view.read("WETH-USDT"))
+
+    def test_publish_order_book(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot(
+            [OrderBookRow(10, 1, 3), OrderBookRow(9, 1, 3), OrderBookRow(8, 1, 3)],
+            [OrderBookRow(11, 2, 3)],
+            3)
+        order_book.last_trade_price = 10.5
+
+        self.view.publish_order_book(trading_pair="COINALPHA-HBOT", order_book=order_book)
+        snapshot = self.view.read("COINALPHA-HBOT")
+
+        self.assertEqual([[10, 1, 3], [9, 1, 3]], snapshot.bids.tolist())
+        self.assertEqual([[11, 2, 3]], snapshot.asks.tolist())
+        self.assertEqual(10.5, snapshot.last_trade_price)
+
+    def test_pickled_view_attaches_to_the_same_block(self):
+        attached_view = pickle.loads(pickle.dumps(self.view))
+        self.assertEqual(["COINALPHA-HBOT", "WETH-USDT"], attached_view.trading_pairs)
+        self.assertEqual(2, attached_view.depth)
+
+        attached_view.publish(
+            trading_pair="WETH-USDT",
+            bids=np.array([[99, 1, 5]], dtype=np.float64),
+            asks=np.array([[101, 4, 6]], dtype=np.float64),
+            last_trade_price=100.5)
+        # Only the creator removes the block
+        attached_view.close()
+
+        snapshot = self.view.read("WETH-USDT")
+        self.assertEqual([[99, 1, 5]], snapshot.bids.tolist())
+        self.assertEqual(100.5, snapshot.last_trade_price)
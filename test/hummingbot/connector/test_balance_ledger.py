@@ -0,0 +1,168 @@
+import copy
+import unittest
+import unittest.mock
+from decimal import Decimal
+from typing import Dict
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import (
+    BuyOrderCreatedEvent,
+    MarketEvent,
+    OrderCancelledEvent,
+    OrderFilledEvent,
+    SellOrderCreatedEvent,
+)
+
+
+class MockTestConnector(ConnectorBase):
+
+    def __init__(self, client_config_map: "ClientConfigAdapter"):
+        super().__init__(client_config_map)
+        self._in_flight_orders = {}
+
+    @property
+    def in_flight_orders(self) -> Dict[str, InFlightOrder]:
+        return self._in_flight_orders
+
+
+class BalanceLedgerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._patcher = unittest.mock.patch("hummingbot.connector.connector_base.estimate_fee")
+        cls._estimate_fee_mock = cls._patcher.start()
+        cls._estimate_fee_mock.return_value = AddedToCostTradeFee(percent=Decimal("0.01"), flat_fees=[])
+        cls.trading_pair = "COINALPHA-HBOT"
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._patcher.stop()
+        super().tearDownClass()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.connector = MockTestConnector(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        self.ledger = self.connector._balance_ledger
+
+    def _create_order(self, order_id: str, trade_type: TradeType, price: Decimal, amount: Decimal) -> InFlightOrder:
+        order = InFlightOrder(
+            client_order_id=order_id,
+            exchange_order_id=f"E{order_id}",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=trade_type,
+            price=price,
+            amount=amount,
+            creation_timestamp=1640000000,
+            initial_state=OrderState.OPEN,
+        )
+        self.connector._in_flight_orders[order_id] = order
+        event_tag = MarketEvent.BuyOrderCreated if trade_type == TradeType.BUY else MarketEvent.SellOrderCreated
+        event_class = BuyOrderCreatedEvent if trade_type == TradeType.BUY else SellOrderCreatedEvent
+        self.connector.trigger_event(
+            event_tag,
+            event_class(
+                timestamp=1640000000,
+                type=OrderType.LIMIT,
+                trading_pair=self.trading_pair,
+                amount=amount,
+                price=price,
+                order_id=order_id,
+                creation_timestamp=1640000000,
+            ))
+        return order
+
+    def _fill_order(self, order: InFlightOrder, amount: Decimal, timestamp: float) -> OrderFilledEvent:
+        order.executed_amount_base += amount
+        fill_event = OrderFilledEvent(
+            timestamp=timestamp,
+            order_id=order.client_order_id,
+            trading_pair=order.trading_pair,
+            trade_type=order.trade_type,
+            order_type=order.order_type,
+            price=order.price,
+            amount=amount,
+            trade_fee=AddedToCostTradeFee(),
+        )
+        self.connector.trigger_event(MarketEvent.OrderFilled, fill_event)
+        return fill_event
+
+    def test_locked_balance_is_reduced_by_fills_and_recalculated_when_orders_change(self):
+        buy_order = self._create_order("OID1", TradeType.BUY, Decimal("100"), Decimal("2"))
+        self._create_order("OID2", TradeType.SELL, Decimal("110"), Decimal("3"))
+
+        self.assertEqual(Decimal("202"), self.ledger.locked_balance("HBOT"))
+        self.assertEqual(Decimal("3"), self.ledger.locked_balance("COINALPHA"))
+
+        self._fill_order(buy_order, Decimal("0.5"), timestamp=1640000001)
+
+        self.assertEqual(Decimal("151.5"), self.ledger.locked_balance("HBOT"))
+        self.assertEqual(Decimal("0.5"), self.ledger.filled_balance("COINALPHA"))
+        self.assertEqual(Decimal("-50"), self.ledger.filled_balance("HBOT"))
+
+        buy_order.current_state = OrderState.CANCELED
+        self.connector.trigger_event(MarketEvent.OrderCancelled,
+                                     OrderCancelledEvent(timestamp=1640000002, order_id=buy_order.client_order_id))
+
+        self.assertEqual(Decimal("0"), self.ledger.locked_balance("HBOT"))
+        self.assertEqual(Decimal("3"), self.ledger.locked_balance("COINALPHA"))
+        self.assertEqual(self.connector.in_flight_asset_balances(self.connector.in_flight_orders),
+                         {"COINALPHA": self.ledger.locked_balance("COINALPHA")})
+
+    def test_orders_added_without_events_are_included_in_the_locked_balance(self):
+        self.assertEqual(Decimal("0"), self.ledger.locked_balance("HBOT"))
+
+        self.connector._in_flight_orders["OID1"] = InFlightOrder(
+            client_order_id="OID1",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            price=Decimal("100"),
+            amount=Decimal("1"),
+            creation_timestamp=1640000000,
+        )
+
+        self.assertEqual(Decimal("101"), self.ledger.locked_balance("HBOT"))
+
+    def test_available_balance_since_snapshot_matches_the_full_recalculation(self):
+        self.connector.real_time_balance_update = False
+        buy_order = self._create_order("OID1", TradeType.BUY, Decimal("100"), Decimal("2"))
+        sell_order = self._create_order("OID2", TradeType.SELL, Decimal("110"), Decimal("3"))
+        self._fill_order(buy_order, Decimal("0.5"), timestamp=1640000001)
+
+        self.connector._account_available_balances = {"COINALPHA": Decimal("7"), "HBOT": Decimal("798.5")}
+        self.connector.in_flight_orders_snapshot = {k: copy.copy(v) for k, v in self.connector.in_flight_orders.items()}
+        self.connector.in_flight_orders_snapshot_timestamp = 1640000002
+
+        self._fill_order(buy_order, Decimal("1"), timestamp=1640000003)
+        self._fill_order(sell_order, Decimal("2"), timestamp=1640000004)
+
+        for currency in ["COINALPHA", "HBOT"]:
+            expected_balance = self.connector.apply_balance_update_since_snapshot(
+                currency=currency, available_balance=self.connector._account_available_balances[currency])
+            self.assertEqual(expected_balance, self.connector.get_available_balance(currency))
+        self.assertEqual(Decimal("8"), self.connector.get_available_balance("COINALPHA"))
+        self.assertEqual(Decimal("1019.5"), self.connector.get_available_balance("HBOT"))
+
+        # The new snapshot includes the fills
+        self.connector._account_available_balances = {"COINALPHA": Decimal("8"), "HBOT": Decimal("1019.5")}
+        self.connector.in_flight_orders_snapshot = {k: copy.copy(v) for k, v in self.connector.in_flight_orders.items()}
+        self.connector.in_flight_orders_snapshot_timestamp = 1640000005
+
+        self.assertEqual(Decimal("8"), self.connector.get_available_balance("COINALPHA"))
+        self.assertEqual(Decimal("1019.5"), self.connector.get_available_balance("HBOT"))
+        self.assertEqual(0, len(self.ledger._fills_since_snapshot))
+
+    def test_balance_limit_accounts_for_locked_and_filled_balances(self):
+        buy_order = self._create_order("OID1", TradeType.BUY, Decimal("100"), Decimal("2"))
+        self._fill_order(buy_order, Decimal("1"), timestamp=1640000001)
+
+        limited_balance = self.connector.apply_balance_limit(
+            currency="HBOT", available_balance=Decimal("1000"), limit=Decimal("500"))
+
+        self.assertEqual(Decimal("500") - Decimal("101") - Decimal("100"), limited_balance)
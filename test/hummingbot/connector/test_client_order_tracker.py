@@ -9,7 +9,13 @@ from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.data_type.common import OrderType, TradeType
-from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
+from hummingbot.core.data_type.in_flight_order import (
+    InFlightOrder,
+    OrderAmendment,
+    OrderState,
+    OrderUpdate,
+    TradeUpdate,
+)
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.trade_fee import TokenAmount
 from hummingbot.core.event.event_logger import EventLogger
@@ -18,6 +24,7 @@ from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     MarketEvent,
     MarketOrderFailureEvent,
+    OrderAmendedEvent,
     OrderCancelledEvent,
     OrderFilledEvent,
 )
@@ -61,6 +68,7 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
         self.buy_order_completed_logger = EventLogger()
         self.buy_order_created_logger = EventLogger()
         self.order_cancelled_logger = EventLogger()
+        self.order_amended_logger = EventLogger()
         self.order_failure_logger = EventLogger()
         self.order_filled_logger = EventLogger()
         self.sell_order_completed_logger = EventLogger()
@@ -70,6 +78,7 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
             (MarketEvent.BuyOrderCompleted, self.buy_order_completed_logger),
             (MarketEvent.BuyOrderCreated, self.buy_order_created_logger),
             (MarketEvent.OrderCancelled, self.order_cancelled_logger),
+            (MarketEvent.OrderAmended, self.order_amended_logger),
             (MarketEvent.OrderFailure, self.order_failure_logger),
             (MarketEvent.OrderFilled, self.order_filled_logger),
             (MarketEvent.SellOrderCompleted, self.sell_order_completed_logger),
@@ -357,6 +366,47 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
         self.assertEqual(event_logged.trading_pair, order.trading_pair)
         self.assertEqual(event_logged.type, order.order_type)
 
+    def test_process_order_amendment_trigger_order_amended_event(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.SELL,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+            initial_state=OrderState.OPEN,
+        )
+        self.tracker.start_tracking_order(order)
+
+        self.tracker.process_order_amendment(OrderAmendment(
+            client_order_id=order.client_order_id,
+            trading_pair=self.trading_pair,
+            update_timestamp=1640001113.0,
+            price=Decimal("1.05"),
+            amount=Decimal("500"),
+        ))
+
+        updated_order: InFlightOrder = self.tracker.fetch_tracked_order(order.client_order_id)
+        self.assertEqual(Decimal("1.05"), updated_order.price)
+        self.assertEqual(Decimal("500"), updated_order.amount)
+        self.assertTrue(updated_order.is_open)
+        self.assertTrue(
+            self._is_logged(
+                "INFO",
+                f"Order {order.client_order_id} amended to 500 {self.base_asset} at 1.05 {self.quote_asset}.",
+            )
+        )
+
+        self.assertEqual(1, len(self.order_amended_logger.event_log))
+        event: OrderAmendedEvent = self.order_amended_logger.event_log[0]
+        self.assertEqual(order.client_order_id, event.order_id)
+        self.assertEqual(self.trading_pair, event.trading_pair)
+        self.assertEqual(Decimal("1.05"), event.price)
+        self.assertEqual(Decimal("500"), event.amount)
+        self.assertEqual("someExchangeOrderId", event.exchange_order_id)
+
     def test_process_order_update_trigger_order_creation_event_without_client_order_id(self):
         order: InFlightOrder = InFlightOrder(
             client_order_id="someClientOrderId",
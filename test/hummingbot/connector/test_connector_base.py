@@ -2,7 +2,7 @@ import copy
 import unittest
 import unittest.mock
 from decimal import Decimal
-from typing import Dict, List
+from typing import Dict
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
@@ -11,6 +11,7 @@ from hummingbot.connector.in_flight_order_base import InFlightOrderBase
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import MarketEvent
 
 
 class InFightOrderTest(InFlightOrderBase):
@@ -32,16 +33,11 @@ class MockTestConnector(ConnectorBase):
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
         self._in_flight_orders = {}
-        self._event_logs = []
 
     @property
     def in_flight_orders(self) -> Dict[str, InFlightOrder]:
         return self._in_flight_orders
 
-    @property
-    def event_logs(self) -> List:
-        return self._event_logs
-
 
 class ConnectorBaseUnitTest(unittest.TestCase):
     @classmethod
@@ -244,7 +240,7 @@ class ConnectorBaseUnitTest(unittest.TestCase):
             amount=Decimal(2),
             trade_fee=AddedToCostTradeFee(),
         )
-        connector._event_logs.append(fill_event)
+        connector.trigger_event(MarketEvent.OrderFilled, fill_event)
 
         estimated_coinalpha_balance = connector.apply_balance_update_since_snapshot(
             currency="COINALPHA",
@@ -279,7 +275,7 @@ class ConnectorBaseUnitTest(unittest.TestCase):
             amount=Decimal(2),
             trade_fee=AddedToCostTradeFee(),
         )
-        connector._event_logs.append(fill_event)
+        connector.trigger_event(MarketEvent.OrderFilled, fill_event)
 
         estimated_coinalpha_balance = connector.apply_balance_update_since_snapshot(
             currency="COINALPHA",
@@ -338,7 +334,7 @@ class ConnectorBaseUnitTest(unittest.TestCase):
             amount=Decimal("0.5"),
             trade_fee=AddedToCostTradeFee(),
         )
-        connector._event_logs.append(buy_fill_event)
+        connector.trigger_event(MarketEvent.OrderFilled, buy_fill_event)
         initial_buy_order.executed_amount_base = buy_fill_event.amount
         initial_buy_order.executed_amount_quote = buy_fill_event.amount * buy_fill_event.price
 
@@ -352,7 +348,7 @@ class ConnectorBaseUnitTest(unittest.TestCase):
             amount=Decimal("0.1"),
             trade_fee=AddedToCostTradeFee(),
         )
-        connector._event_logs.append(sell_fill_event)
+        connector.trigger_event(MarketEvent.OrderFilled, sell_fill_event)
         initial_sell_order.executed_amount_base = sell_fill_event.amount
         initial_sell_order.executed_amount_quote = sell_fill_event.amount * sell_fill_event.price
 
@@ -417,7 +413,7 @@ class ConnectorBaseUnitTest(unittest.TestCase):
             amount=Decimal("0.5"),
             trade_fee=AddedToCostTradeFee(),
         )
-        connector._event_logs.append(buy_fill_event)
+        connector.trigger_event(MarketEvent.OrderFilled, buy_fill_event)
         initial_buy_order.executed_amount_base = buy_fill_event.amount
         initial_buy_order.executed_amount_quote = buy_fill_event.amount * buy_fill_event.price
 
@@ -431,7 +427,7 @@ class ConnectorBaseUnitTest(unittest.TestCase):
             amount=Decimal("0.1"),
             trade_fee=AddedToCostTradeFee(),
         )
-        connector._event_logs.append(sell_fill_event)
+        connector.trigger_event(MarketEvent.OrderFilled, sell_fill_event)
         initial_sell_order.executed_amount_base = sell_fill_event.amount
         initial_sell_order.executed_amount_quote = sell_fill_event.amount * sell_fill_event.price
 
@@ -520,7 +516,7 @@ class ConnectorBaseUnitTest(unittest.TestCase):
             amount=Decimal("0.5"),
             trade_fee=AddedToCostTradeFee(),
         )
-        connector._event_logs.append(buy_fill_event)
+        connector.trigger_event(MarketEvent.OrderFilled, buy_fill_event)
         current_buy_order.executed_amount_base = buy_fill_event.amount
         current_buy_order.executed_amount_quote = buy_fill_event.amount * buy_fill_event.price
 
@@ -534,7 +530,7 @@ class ConnectorBaseUnitTest(unittest.TestCase):
             amount=Decimal("0.1"),
             trade_fee=AddedToCostTradeFee(),
         )
-        connector._event_logs.append(sell_fill_event)
+        connector.trigger_event(MarketEvent.OrderFilled, sell_fill_event)
         current_sell_order.executed_amount_base = sell_fill_event.amount
         current_sell_order.executed_amount_quote = sell_fill_event.amount * sell_fill_event.price
 
@@ -548,7 +544,7 @@ class ConnectorBaseUnitTest(unittest.TestCase):
             amount=Decimal(3),
             trade_fee=AddedToCostTradeFee(),
         )
-        connector._event_logs.append(extra_fill_event)
+        connector.trigger_event(MarketEvent.OrderFilled, extra_fill_event)
 
         estimated_coinalpha_balance = connector.apply_balance_update_since_snapshot(
             currency="COINALPHA",
@@ -0,0 +1,84 @@
+import unittest
+from unittest.mock import MagicMock
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.fill_dedup_index import ExchangeOrderIdIndex, TradeFillIndex
+from hummingbot.connector.utils import TradeFillOrderDetails
+
+
+class FillDedupIndexTests(unittest.TestCase):
+
+    def test_trade_fills_not_cached_are_looked_up_once(self):
+        recorded_fill = TradeFillOrderDetails("binance", "TID1", "COINALPHA-HBOT")
+        new_fill = TradeFillOrderDetails("binance", "TID2", "COINALPHA-HBOT")
+        lookup = MagicMock(side_effect=lambda trade_fill: True if trade_fill == recorded_fill else None)
+        index = TradeFillIndex(lookup=lookup)
+
+        self.assertIn(recorded_fill, index)
+        self.assertIn(recorded_fill, index)
+        self.assertNotIn(new_fill, index)
+        self.assertNotIn(new_fill, index)
+        self.assertEqual(2, lookup.call_count)
+
+        index.add(new_fill)
+
+        self.assertIn(new_fill, index)
+        self.assertEqual(2, lookup.call_count)
+
+    def test_least_recently_used_keys_are_evicted(self):
+        lookup = MagicMock(return_value=None)
+        index = TradeFillIndex(max_cached_keys=2, lookup=lookup)
+        first_fill, second_fill, third_fill = [TradeFillOrderDetails("binance", f"TID{i}", "COINALPHA-HBOT")
+                                               for i in range(3)]
+        index.update([first_fill, second_fill])
+
+        self.assertIn(first_fill, index)
+        index.add(third_fill)
+
+        self.assertEqual(2, len(index))
+        self.assertIn(first_fill, index)
+        self.assertIn(third_fill, index)
+        lookup.assert_not_called()
+        self.assertNotIn(second_fill, index)
+        lookup.assert_called_once_with(second_fill)
+
+    def test_keys_cached_as_missing_are_looked_up_again_with_a_new_lookup(self):
+        index = TradeFillIndex()
+        trade_fill = TradeFillOrderDetails("binance", "TID1", "COINALPHA-HBOT")
+
+        self.assertNotIn(trade_fill, index)
+
+        index.set_lookup(lambda _: True)
+
+        self.assertIn(trade_fill, index)
+
+    def test_exchange_order_ids(self):
+        lookup = MagicMock(side_effect=lambda exchange_order_id: "OID1" if exchange_order_id == "EOID1" else None)
+        index = ExchangeOrderIdIndex(lookup=lookup)
+        index.update({"EOID2": "OID2"})
+
+        self.assertEqual("OID1", index.get("EOID1"))
+        self.assertEqual("OID2", index["EOID2"])
+        self.assertIn("EOID1", index)
+        self.assertNotIn(None, index)
+        self.assertEqual("default", index.get("EOID3", "default"))
+        with self.assertRaises(KeyError):
+            index["EOID3"]
+        lookup.assert_has_calls([unittest.mock.call("EOID1"), unittest.mock.call("EOID3")])
+        self.assertEqual(2, lookup.call_count)
+
+    def test_connector_confirms_new_fills_of_recorded_orders(self):
+        connector = ConnectorBase(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        connector.set_market_recorder_lookups(
+            trade_fill_lookup=lambda trade_fill: True if trade_fill.exchange_trade_id == "TID1" else None,
+            exchange_order_id_lookup=lambda exchange_order_id: "OID1" if exchange_order_id == "EOID1" else None)
+
+        self.assertFalse(connector.is_confirmed_new_order_filled_event("TID1", "EOID1", "COINALPHA-HBOT"))
+        self.assertFalse(connector.is_confirmed_new_order_filled_event("TID2", "EOID2", "COINALPHA-HBOT"))
+        self.assertTrue(connector.is_confirmed_new_order_filled_event("TID2", "EOID1", "COINALPHA-HBOT"))
+
+        connector._current_trade_fills.add(TradeFillOrderDetails(connector.display_name, "TID2", "COINALPHA-HBOT"))
+
+        self.assertFalse(connector.is_confirmed_new_order_filled_event("TID2", "EOID1", "COINALPHA-HBOT"))
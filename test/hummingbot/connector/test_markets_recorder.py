@@ -11,6 +11,7 @@ from sqlalchemy import create_engine
 from hummingbot.client.config.client_config_map import ClientConfigMap, MarketDataCollectionConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
@@ -85,6 +86,10 @@ class MarketsRecorderTests(TestCase):
     def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
         pass
 
+    def set_market_recorder_lookups(self, trade_fill_lookup, exchange_order_id_lookup):
+        self.trade_fill_lookup = trade_fill_lookup
+        self.exchange_order_id_lookup = exchange_order_id_lookup
+
     def test_properties(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -143,6 +148,50 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(1, len(trades))
         self.assertEqual(fill_id, trades[0].exchange_trade_id)
 
+    def test_recorded_trade_fills_and_orders_are_looked_up_in_the_db(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+        trade_fill = TradeFillOrderDetails(market=self.display_name, exchange_trade_id="TID1", symbol=self.trading_pair)
+
+        self.assertIsNone(self.trade_fill_lookup(trade_fill))
+        self.assertIsNone(self.exchange_order_id_lookup("EOID1"))
+
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, BuyOrderCreatedEvent(
+            timestamp=int(time.time()),
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id="OID1",
+            creation_timestamp=1640001112.223,
+            exchange_order_id="EOID1",
+        ))
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, OrderFilledEvent(
+            timestamp=int(time.time()),
+            order_id="OID1",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal(1000),
+            amount=Decimal(1),
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TID1",
+        ))
+
+        self.assertTrue(self.trade_fill_lookup(trade_fill))
+        self.assertIsNone(self.trade_fill_lookup(trade_fill._replace(market="other_market")))
+        self.assertEqual("OID1", self.exchange_order_id_lookup("EOID1"))
+        self.assertIsNone(recorder.get_order_id_for_exchange_order_id("other_market", "EOID1"))
+
     def test_buy_order_created_event_creates_order_record(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -0,0 +1,46 @@
+import random
+import unittest
+from decimal import Decimal
+
+from hummingbot.connector.trading_rule import OrderQuantizer, TradingRule
+
+
+class TradingRuleTest(unittest.TestCase):
+
+    def test_quantizer_matches_the_floor_division_by_the_increments(self):
+        rng = random.Random(7)
+        for price_increment, size_increment in [(Decimal("0.01"), Decimal("0.001")),
+                                                (Decimal("0.5"), Decimal("5")),
+                                                (Decimal("0.00000025"), Decimal("1")),
+                                                (Decimal("0.010"), Decimal("0.10"))]:
+            quantizer = OrderQuantizer(price_increment, size_increment)
+            for _ in range(1000):
+                value = Decimal(rng.randint(1, 10 ** 9)).scaleb(rng.randint(-10, 0))
+                self.assertEqual(str((value // price_increment) * price_increment),
+                                 str(quantizer.quantize_price(value)))
+                self.assertEqual(str((value // size_increment) * size_increment),
+                                 str(quantizer.quantize_amount(value)))
+
+    def test_quantizer_quantizes_order_ladders(self):
+        quantizer = OrderQuantizer(Decimal("0.01"), Decimal("0.1"))
+
+        self.assertEqual([Decimal("99.99"), Decimal("98.98"), Decimal("97.00")],
+                         quantizer.quantize_prices([Decimal("99.999"), Decimal("98.985"), Decimal("97")]))
+        self.assertEqual([Decimal("1.0"), Decimal("1.5"), Decimal("0")],
+                         quantizer.quantize_amounts([Decimal("1.01"), Decimal("1.55"), Decimal("0.09")]))
+        self.assertTrue(quantizer.quantize_price(Decimal("NaN")).is_nan())
+
+    def test_quantizer_is_created_again_when_the_increments_change(self):
+        trading_rule = TradingRule(trading_pair="COINALPHA-HBOT",
+                                   min_price_increment=Decimal("0.01"),
+                                   min_base_amount_increment=Decimal("1"))
+        quantizer = trading_rule.quantizer
+
+        self.assertIs(quantizer, trading_rule.quantizer)
+        self.assertEqual(Decimal("1.23"), quantizer.quantize_price(Decimal("1.2345")))
+
+        trading_rule.min_price_increment = Decimal("0.1")
+
+        self.assertIsNot(quantizer, trading_rule.quantizer)
+        self.assertEqual(Decimal("1.2"), trading_rule.quantizer.quantize_price(Decimal("1.2345")))
+        self.assertEqual(Decimal("12"), trading_rule.quantizer.quantize_amount(Decimal("12.5")))
@@ -6,7 +6,13 @@ from typing import Awaitable
 from unittest.mock import patch
 
 from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
-from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
+from hummingbot.core.data_type.in_flight_order import (
+    InFlightOrder,
+    OrderAmendment,
+    OrderState,
+    OrderUpdate,
+    TradeUpdate,
+)
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
@@ -569,6 +575,43 @@ class InFlightOrderPyUnitTests(unittest.TestCase):
         self.assertTrue(order.exchange_order_id_update_event.is_set())
         self.assertEqual(0, len(order.order_fills))
 
+    def test_update_with_amendment(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id=self.client_order_id,
+            exchange_order_id=self.exchange_order_id,
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+            initial_state=OrderState.OPEN,
+        )
+        amendment = OrderAmendment(
+            client_order_id=self.client_order_id,
+            trading_pair=self.trading_pair,
+            update_timestamp=2,
+            price=Decimal("1.1"),
+            amount=Decimal("900"),
+        )
+        order.pending_amendment = amendment
+
+        self.assertTrue(order.is_pending_amendment)
+        self.assertFalse(order.update_with_amendment(amendment._replace(client_order_id="otherClientOrderId",
+                                                                        exchange_order_id="otherExchangeOrderId")))
+        self.assertTrue(order.update_with_amendment(amendment))
+
+        self.assertFalse(order.is_pending_amendment)
+        self.assertEqual(Decimal("1.1"), order.price)
+        self.assertEqual(Decimal("900"), order.amount)
+        self.assertEqual(self.exchange_order_id, order.exchange_order_id)
+        self.assertEqual(OrderState.OPEN, order.current_state)
+        self.assertEqual(2, order.last_update_timestamp)
+
+        # Some exchanges assign a new exchange order id to the amended order
+        self.assertTrue(order.update_with_amendment(amendment._replace(exchange_order_id="newExchangeOrderId")))
+        self.assertEqual("newExchangeOrderId", order.exchange_order_id)
+
     def test_update_with_trade_update_trade_update_with_trade_fee_percent(self):
 
         order: InFlightOrder = InFlightOrder(
@@ -0,0 +1,213 @@
+import asyncio
+import unittest
+from typing import Awaitable, Dict, List, Optional
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class SequencedOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(trading_pairs)
+        self.snapshots: List[OrderBookMessage] = []
+        self.snapshot_requests: List[str] = []
+        self.inconsistent_update_ids = set()
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {}
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        self.snapshot_requests.append(trading_pair)
+        return self.snapshots.pop(0)
+
+    def is_order_book_diff_in_sequence(self, last_update_id: int, diff_message: OrderBookMessage) -> bool:
+        return diff_message.first_update_id <= last_update_id + 1
+
+    def is_order_book_diff_stale(self, last_update_id: int, diff_message: OrderBookMessage) -> bool:
+        return diff_message.update_id <= last_update_id
+
+    def is_order_book_consistent(self, order_book: OrderBook, diff_message: OrderBookMessage) -> bool:
+        return diff_message.update_id not in self.inconsistent_update_ids
+
+
+class OrderBookTrackerTests(unittest.TestCase):
+    level = 0
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.log_records = []
+        self.data_source = SequencedOrderBookTrackerDataSource(trading_pairs=[self.trading_pair])
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=[self.trading_pair])
+        self.tracker.RESYNC_SNAPSHOT_REQUEST_INTERVAL = 0
+        self.tracker.logger().setLevel(1)
+        self.tracker.logger().addHandler(self)
+
+        order_book = OrderBook()
+        order_book.apply_snapshot(*self._rows(bid=10, ask=11), 100)
+        self.tracker._order_books[self.trading_pair] = order_book
+        self.tracker._tracking_message_queues[self.trading_pair] = asyncio.Queue()
+        self.tasks = [
+            self.ev_loop.create_task(self.tracker._track_single_book(self.trading_pair)),
+            self.ev_loop.create_task(self.tracker._order_book_resync_loop()),
+        ]
+
+    def tearDown(self) -> None:
+        for task in self.tasks:
+            task.cancel()
+        self.tracker.logger().removeHandler(self)
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def _is_logged(self, log_level: str, message: str) -> bool:
+        return any(record.levelname == log_level and record.getMessage() == message for record in self.log_records)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    @staticmethod
+    def _rows(bid: float, ask: float):
+        return [OrderBookRow(bid, 1, 0)], [OrderBookRow(ask, 1, 0)]
+
+    def _diff(self, first_update_id: int, update_id: int, bid: float) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pair,
+            "first_update_id": first_update_id,
+            "update_id": update_id,
+            "bids": [[bid, 1]],
+            "asks": [],
+        }, timestamp=1640000000)
+
+    def _snapshot(self, update_id: int, bid: float) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": self.trading_pair,
+            "update_id": update_id,
+            "bids": [[bid, 1]],
+            "asks": [[bid + 1, 1]],
+        }, timestamp=1640000000)
+
+    def _process(self, *messages: OrderBookMessage):
+        for message in messages:
+            self.tracker._tracking_message_queues[self.trading_pair].put_nowait(message)
+        self.async_run_with_timeout(asyncio.sleep(0.05))
+
+    def test_diffs_in_sequence_are_applied_without_snapshots(self):
+        self._process(self._diff(first_update_id=101, update_id=105, bid=10.5),
+                      self._diff(first_update_id=106, update_id=110, bid=10.7))
+
+        order_book = self.tracker.order_books[self.trading_pair]
+        self.assertEqual(110, order_book.last_diff_uid)
+        self.assertEqual(10.7, order_book.get_price(False))
+        self.assertEqual([], self.data_source.snapshot_requests)
+        self.assertEqual(set(), self.tracker.out_of_sync_trading_pairs)
+
+    def test_stale_diffs_are_dropped(self):
+        # Diff 95-100 is already included in the snapshot 100 of the order book
+        self._process(self._diff(first_update_id=95, update_id=100, bid=9.5),
+                      self._diff(first_update_id=101, update_id=105, bid=10.5))
+
+        order_book = self.tracker.order_books[self.trading_pair]
+        self.assertEqual(105, order_book.last_diff_uid)
+        self.assertEqual([10.5, 10], [row.price for row in order_book.bid_entries()])
+        self.assertEqual([], self.data_source.snapshot_requests)
+        self.assertEqual(set(), self.tracker.out_of_sync_trading_pairs)
+
+    def test_gap_in_diffs_triggers_a_resync_with_buffered_diffs(self):
+        self.data_source.snapshots.append(self._snapshot(update_id=115, bid=10.8))
+        # Diff 106-110 is missing
+        self._process(self._diff(first_update_id=101, update_id=105, bid=10.5),
+                      self._diff(first_update_id=111, update_id=114, bid=10.6))
+
+        self.assertEqual([self.trading_pair], self.data_source.snapshot_requests)
+        self.assertTrue(self._is_logged(
+            "WARNING",
+            f"The order book for {self.trading_pair} is out of sync (missing updates between 105 and 111). "
+            f"Requesting a new snapshot."))
+
+        self._process(self._diff(first_update_id=115, update_id=118, bid=10.9))
+
+        order_book = self.tracker.order_books[self.trading_pair]
+        self.assertEqual(set(), self.tracker.out_of_sync_trading_pairs)
+        self.assertEqual(115, order_book.snapshot_uid)
+        self.assertEqual(118, order_book.last_diff_uid)
+        self.assertEqual(10.9, order_book.get_price(False))
+        self.assertTrue(self._is_logged("INFO", f"Resynchronized the order book for {self.trading_pair}."))
+
+    def test_buffered_diffs_newer_than_snapshot_are_replayed(self):
+        self.tracker._schedule_order_book_resync(trading_pair=self.trading_pair, reason="test")
+        self.tracker._order_book_resync_queue.get_nowait()
+        self._process(self._diff(first_update_id=119, update_id=121, bid=10.2),
+                      self._diff(first_update_id=122, update_id=125, bid=10.3))
+
+        self._process(self._snapshot(update_id=120, bid=10.1))
+
+        order_book = self.tracker.order_books[self.trading_pair]
+        self.assertEqual(set(), self.tracker.out_of_sync_trading_pairs)
+        self.assertEqual(125, order_book.last_diff_uid)
+        self.assertEqual(10.3, order_book.get_price(False))
+
+    def test_snapshot_older_than_buffered_diffs_is_requested_again(self):
+        self.data_source.snapshots.append(self._snapshot(update_id=130, bid=10.4))
+        self.tracker._schedule_order_book_resync(trading_pair=self.trading_pair, reason="test")
+        self.tracker._order_book_resync_queue.get_nowait()
+        self._process(self._diff(first_update_id=125, update_id=128, bid=10.2))
+
+        self._process(self._snapshot(update_id=120, bid=10.1))
+
+        self.assertEqual([self.trading_pair], self.data_source.snapshot_requests)
+        order_book = self.tracker.order_books[self.trading_pair]
+        self.assertEqual(set(), self.tracker.out_of_sync_trading_pairs)
+        self.assertEqual(130, order_book.snapshot_uid)
+        self.assertEqual(10.4, order_book.get_price(False))
+
+    def test_inconsistent_order_book_triggers_a_resync(self):
+        self.data_source.inconsistent_update_ids.add(105)
+        self.data_source.snapshots.append(self._snapshot(update_id=106, bid=10.6))
+
+        self._process(self._diff(first_update_id=101, update_id=105, bid=10.5))
+
+        order_book = self.tracker.order_books[self.trading_pair]
+        self.assertEqual([self.trading_pair], self.data_source.snapshot_requests)
+        self.assertEqual(set(), self.tracker.out_of_sync_trading_pairs)
+        self.assertEqual(106, order_book.snapshot_uid)
+        self.assertEqual(10.6, order_book.get_price(False))
+
+    def test_failed_snapshot_requests_are_retried(self):
+        self.data_source.snapshots.append(self._snapshot(update_id=106, bid=10.6))
+        original_snapshot_request = self.data_source._order_book_snapshot
+        calls = []
+
+        async def failing_once(trading_pair: str) -> OrderBookMessage:
+            calls.append(trading_pair)
+            if len(calls) == 1:
+                raise IOError("Test error")
+            return await original_snapshot_request(trading_pair)
+
+        self.data_source._order_book_snapshot = failing_once
+
+        self._process(self._diff(first_update_id=103, update_id=105, bid=10.5))
+
+        self.assertEqual(2, len(calls))
+        self.assertEqual(set(), self.tracker.out_of_sync_trading_pairs)
+        self.assertEqual(106, self.tracker.order_books[self.trading_pair].snapshot_uid)
+
+    def test_queue_depths(self):
+        self.tracker._order_book_diff_stream.put_nowait(self._diff(first_update_id=101, update_id=105, bid=10.5))
+        self.data_source._message_queue[self.data_source._trade_messages_queue_key].put_nowait({})
+
+        queue_depths = self.tracker.queue_depths()
+
+        self.assertEqual(1, queue_depths["order_book_diff_stream"])
+        self.assertEqual(0, queue_depths["order_book_snapshot_stream"])
+        self.assertEqual(1, queue_depths["trade_messages"])
+        self.assertEqual(0, queue_depths["order_book_tracking"])
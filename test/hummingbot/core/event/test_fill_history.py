@@ -0,0 +1,104 @@
+import os
+import unittest
+from decimal import Decimal
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderCancelledEvent, OrderFilledEvent
+from hummingbot.core.event.fill_history import FillHistory
+
+
+class FillHistoryTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.history = FillHistory(max_in_memory_fills=3, spill_batch_size=2)
+
+    def tearDown(self) -> None:
+        self.history.clear()
+        super().tearDown()
+
+    @staticmethod
+    def _fill(timestamp: float, trade_type: TradeType = TradeType.BUY, price: Decimal = Decimal("100"),
+              amount: Decimal = Decimal("1"), trading_pair: str = "COINALPHA-HBOT") -> OrderFilledEvent:
+        return OrderFilledEvent(
+            timestamp=timestamp,
+            order_id=f"OID{timestamp}",
+            trading_pair=trading_pair,
+            trade_type=trade_type,
+            order_type=OrderType.LIMIT,
+            price=price,
+            amount=amount,
+            trade_fee=AddedToCostTradeFee(percent=Decimal("0.01"), flat_fees=[TokenAmount("BNB", Decimal("0.1"))]),
+            exchange_trade_id=f"TID{timestamp}",
+        )
+
+    def test_oldest_fills_are_spilled_in_batches(self):
+        fills = [self._fill(timestamp) for timestamp in range(1, 5)]
+        for fill in fills:
+            self.history.add(fill)
+
+        self.assertEqual(4, len(self.history))
+        self.assertEqual(0, self.history.spilled_fills_count)
+
+        fills.append(self._fill(5))
+        self.history.add(fills[-1])
+
+        self.assertEqual(5, len(self.history))
+        self.assertEqual(2, self.history.spilled_fills_count)
+        self.assertEqual(fills[2:], self.history.recent_fills)
+        self.assertTrue(os.path.exists(self.history._spill_file_path))
+
+    def test_fills_query_reads_spilled_fills_only_when_the_window_reaches_them(self):
+        fills = [self._fill(timestamp) for timestamp in range(1, 6)]
+        for fill in fills:
+            self.history.add(fill)
+        spill_file_path = self.history._spill_file_path
+
+        self.assertEqual(fills, self.history.fills())
+        self.assertEqual(fills[1:4], self.history.fills(start_timestamp=1, end_timestamp=4))
+
+        os.remove(spill_file_path)
+        self.assertEqual(fills[2:], self.history.fills(start_timestamp=2))
+
+    def test_aggregates_cover_the_spilled_fills(self):
+        self.history.add(self._fill(1, TradeType.BUY, Decimal("100"), Decimal("1")))
+        self.history.add(self._fill(2, TradeType.BUY, Decimal("110"), Decimal("3")))
+        self.history.add(self._fill(3, TradeType.SELL, Decimal("120"), Decimal("2")))
+        self.history.add(self._fill(4, TradeType.SELL, Decimal("130"), Decimal("2")))
+        self.history.add(self._fill(5, TradeType.BUY, Decimal("10"), Decimal("1"), trading_pair="WETH-USDT"))
+
+        aggregates = self.history.aggregates("COINALPHA-HBOT")
+
+        self.assertEqual(["COINALPHA-HBOT", "WETH-USDT"], self.history.trading_pairs)
+        self.assertEqual(4, aggregates.fill_count)
+        self.assertEqual(Decimal("8"), aggregates.volume)
+        self.assertEqual(Decimal("930"), aggregates.quote_volume)
+        self.assertEqual(Decimal("107.5"), aggregates.buy_vwap)
+        self.assertEqual(Decimal("125"), aggregates.sell_vwap)
+        self.assertEqual({"HBOT": Decimal("9.30"), "BNB": Decimal("0.4")}, aggregates.fees)
+        self.assertTrue(self.history.aggregates("COINALPHA-USDT").vwap.is_nan())
+
+    def test_clear_removes_the_spill_file(self):
+        for timestamp in range(1, 6):
+            self.history.add(self._fill(timestamp))
+        spill_file_path = self.history._spill_file_path
+
+        self.history.clear()
+
+        self.assertEqual(0, len(self.history))
+        self.assertEqual([], self.history.fills())
+        self.assertFalse(os.path.exists(spill_file_path))
+
+    def test_event_logger_keeps_fills_in_the_fill_history(self):
+        event_logger = EventLogger(fill_history=self.history)
+        cancel_event = OrderCancelledEvent(timestamp=1, order_id="OID1")
+        fills = [self._fill(timestamp) for timestamp in range(1, 6)]
+
+        event_logger(cancel_event)
+        for fill in fills:
+            event_logger(fill)
+
+        self.assertEqual([cancel_event] + fills[2:], event_logger.event_log)
+        self.assertEqual(fills, event_logger.fill_history.fills())
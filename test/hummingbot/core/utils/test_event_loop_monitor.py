@@ -0,0 +1,102 @@
+import asyncio
+import time
+import unittest
+from typing import Awaitable
+
+from hummingbot.core.utils import async_utils
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.event_loop_monitor import EventLoopMonitor
+
+
+class EventLoopMonitorTests(unittest.TestCase):
+    level = 0
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.log_records = []
+        self.monitor = EventLoopMonitor(lag_warning_threshold=0.1, slow_callback_threshold=0.05, profile_tasks=True)
+        self.monitor.SAMPLE_INTERVAL = 0.05
+        self.monitor.logger().setLevel(1)
+        self.monitor.logger().addHandler(self)
+
+    def tearDown(self) -> None:
+        self.monitor.stop()
+        self.monitor.logger().removeHandler(self)
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 2):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    @staticmethod
+    async def _blocking_coroutine():
+        await asyncio.sleep(0.01)
+        time.sleep(0.2)
+
+    def test_lag_and_slow_callbacks_are_registered_and_logged(self):
+        self.monitor.start()
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        safe_ensure_future(self._blocking_coroutine())
+        self.async_run_with_timeout(asyncio.sleep(0.2))
+
+        self.assertGreaterEqual(self.monitor.max_lag, 0.1)
+        self.assertEqual(1, len(self.monitor.slow_callbacks))
+        slow_callback = self.monitor.slow_callbacks[0]
+        self.assertGreaterEqual(slow_callback.duration, 0.2)
+        self.assertIn(f"{__name__}:", slow_callback.description)
+        self.assertIn("EventLoopMonitorTests._blocking_coroutine", slow_callback.description)
+        warnings = [record.getMessage() for record in self.log_records if record.levelname == "WARNING"]
+        self.assertEqual(1, len(warnings))
+        self.assertTrue(warnings[0].startswith("The event loop was blocked for "))
+        self.assertIn("Slowest callbacks: ", warnings[0])
+
+    def test_report_counts_live_tasks_by_origin(self):
+        self.monitor.start()
+        tasks = [safe_ensure_future(asyncio.sleep(1)) for _ in range(3)]
+        finished_task = safe_ensure_future(asyncio.sleep(0))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        report = self.monitor.report(queue_depths={"binance": {"user_stream": 2}})
+
+        origins = report["tasks"]["by_origin"]
+        self.assertEqual([3], [count for origin, count in origins.items() if origin.endswith(" sleep")])
+        self.assertTrue(finished_task.done())
+        self.assertGreaterEqual(report["tasks"]["live"], 3)
+        self.assertEqual({"binance": {"user_stream": 2}}, report["queues"])
+        formatted_report = self.monitor.format_report(report)
+        self.assertIn("Live tasks by origin:", formatted_report)
+        self.assertIn("user_stream: 2", formatted_report)
+        for task in tasks:
+            task.cancel()
+
+    def test_stop_restores_the_event_loop_callbacks(self):
+        original_handle_run = asyncio.events.Handle._run
+        self.monitor.start()
+
+        self.assertTrue(self.monitor.is_profiling)
+        self.assertIsNot(original_handle_run, asyncio.events.Handle._run)
+
+        self.monitor.stop()
+
+        self.assertFalse(self.monitor.is_running)
+        self.assertFalse(self.monitor.is_profiling)
+        self.assertIs(original_handle_run, asyncio.events.Handle._run)
+        self.assertEqual({}, async_utils.live_tasks_by_origin())
+
+    def test_task_origins_are_not_tracked_without_profiler(self):
+        self.monitor._profile_tasks = False
+        self.monitor.start()
+        task = safe_ensure_future(asyncio.sleep(1))
+
+        self.assertFalse(self.monitor.is_profiling)
+        self.assertEqual({}, async_utils.live_tasks_by_origin())
+        self.assertEqual("sleep", async_utils.task_description(task))
+        task.cancel()
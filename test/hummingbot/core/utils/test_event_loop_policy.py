@@ -0,0 +1,45 @@
+import asyncio
+import os
+import unittest
+from unittest.mock import patch
+
+from hummingbot.core.utils import event_loop_policy
+from hummingbot.core.utils.event_loop_policy import (
+    USE_UVLOOP_ENV_VAR,
+    install_event_loop_policy,
+    new_event_loop,
+    use_uvloop_from_env,
+)
+
+
+class EventLoopPolicyTests(unittest.TestCase):
+
+    def tearDown(self) -> None:
+        asyncio.set_event_loop_policy(None)
+        super().tearDown()
+
+    def test_use_uvloop_from_env(self):
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertFalse(use_uvloop_from_env())
+            self.assertTrue(use_uvloop_from_env(default=True))
+        with patch.dict(os.environ, {USE_UVLOOP_ENV_VAR: "1"}):
+            self.assertTrue(use_uvloop_from_env())
+        with patch.dict(os.environ, {USE_UVLOOP_ENV_VAR: "False"}):
+            self.assertFalse(use_uvloop_from_env(default=True))
+
+    @patch.object(event_loop_policy, "is_uvloop_available", return_value=False)
+    def test_default_event_loop_is_used_when_uvloop_is_not_installed(self, _):
+        with self.assertLogs(event_loop_policy.__name__, level="WARNING") as logs:
+            self.assertFalse(install_event_loop_policy(use_uvloop=True))
+
+        self.assertEqual(["uvloop is not installed. Using the default asyncio event loop."],
+                         [record.getMessage() for record in logs.records])
+        self.assertIsInstance(asyncio.get_event_loop_policy(), asyncio.DefaultEventLoopPolicy)
+        self.assertIsNone(new_event_loop(use_uvloop=True))
+
+    def test_new_default_event_loop(self):
+        loop = new_event_loop(use_uvloop=False)
+        try:
+            self.assertIsInstance(loop, asyncio.BaseEventLoop)
+        finally:
+            loop.close()
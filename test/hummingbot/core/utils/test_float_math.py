@@ -0,0 +1,73 @@
+import random
+import unittest
+from decimal import Decimal
+
+from hummingbot.core.utils.float_math import to_decimal
+
+
+class FloatMathTest(unittest.TestCase):
+    iterations = 20000
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.random = random.Random(42)
+
+    def _random_decimal(self, significant_digits: int, min_exponent: int, max_exponent: int) -> Decimal:
+        mantissa = self.random.randint(10 ** (significant_digits - 1), 10 ** significant_digits - 1)
+        return Decimal(mantissa).scaleb(self.random.randint(min_exponent, max_exponent) - significant_digits + 1)
+
+    @staticmethod
+    def _quantize(value: Decimal, quantum: Decimal) -> Decimal:
+        return (value // quantum) * quantum
+
+    def test_quantized_level_prices_match_the_decimal_math(self):
+        for _ in range(self.iterations):
+            reference_price = self._random_decimal(significant_digits=8, min_exponent=-4, max_exponent=5)
+            # Spreads with up to 4 decimals, like the percentages with 2 decimals of the strategy configurations
+            spread = Decimal(self.random.randint(0, 2000)).scaleb(-4)
+            level_spread = Decimal(self.random.randint(0, 100)).scaleb(-4)
+            level = self.random.randint(0, 9)
+            is_buy = self.random.random() < 0.5
+            # The quantum of the order prices is between 3 and 8 significant digits of the reference price
+            quantum = Decimal(1).scaleb(reference_price.adjusted() - self.random.randint(2, 7))
+
+            if is_buy:
+                decimal_price = reference_price * (Decimal(1) - spread - level * level_spread)
+                float_price = float(reference_price) * (1 - float(spread) - level * float(level_spread))
+            else:
+                decimal_price = reference_price * (Decimal(1) + spread + level * level_spread)
+                float_price = float(reference_price) * (1 + float(spread) + level * float(level_spread))
+
+            self.assertEqual(decimal_price, to_decimal(float_price))
+            self.assertEqual(self._quantize(decimal_price, quantum), self._quantize(to_decimal(float_price), quantum))
+
+    def test_quantized_amounts_match_the_decimal_math(self):
+        for _ in range(self.iterations):
+            order_amount = self._random_decimal(significant_digits=6, min_exponent=-3, max_exponent=4)
+            level_amount = self._random_decimal(significant_digits=3, min_exponent=-3, max_exponent=2)
+            level = self.random.randint(0, 9)
+            fee_amount = self._random_decimal(significant_digits=4, min_exponent=-6, max_exponent=-4)
+            quantum = Decimal(1).scaleb(order_amount.adjusted() - self.random.randint(2, 5))
+
+            decimal_amount = order_amount + level * level_amount - fee_amount
+            float_amount = float(order_amount) + level * float(level_amount) - float(fee_amount)
+
+            self.assertEqual(self._quantize(decimal_amount, quantum),
+                             self._quantize(to_decimal(float_amount), quantum))
+
+    def test_ratios_match_the_decimal_math_to_fifteen_decimals(self):
+        for _ in range(self.iterations):
+            entry_price = self._random_decimal(significant_digits=6, min_exponent=-2, max_exponent=4)
+            price_change = self._random_decimal(significant_digits=2, min_exponent=-3, max_exponent=-1)
+            close_price = entry_price * (Decimal(1) + price_change)
+
+            decimal_ratio = (close_price - entry_price) / entry_price
+            float_ratio = (float(close_price) - float(entry_price)) / float(entry_price)
+
+            self.assertAlmostEqual(decimal_ratio, to_decimal(float_ratio), delta=Decimal("1e-15"))
+
+    def test_special_values_are_kept(self):
+        self.assertTrue(to_decimal(float("nan")).is_nan())
+        self.assertEqual(Decimal("Infinity"), to_decimal(float("inf")))
+        self.assertEqual(Decimal("0"), to_decimal(0.0))
+        self.assertEqual(Decimal("99"), to_decimal(100 * (1 - 0.01)))
@@ -1,7 +1,11 @@
 import asyncio
 import json
+import os
+import time
 import unittest
 from decimal import Decimal
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from typing import Any, Awaitable, Dict
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -15,6 +19,7 @@ from hummingbot.client.settings import ConnectorSetting, ConnectorType
 from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS, binance_web_utils
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
+from hummingbot.core.utils.trading_pairs_cache import TradingPairsCache
 
 
 class TestTradingPairFetcher(unittest.TestCase):
@@ -125,6 +130,54 @@ class TestTradingPairFetcher(unittest.TestCase):
         self.assertEqual(2, len(trading_pairs))
         self.assertEqual({"binance": ["MOCK-HBOT"], "mock_paper_trade": ["MOCK-HBOT"]}, trading_pairs)
 
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
+    def test_fresh_cached_trading_pairs_are_not_fetched(self, _, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mockConnector", connector=connector),
+        }
+        with TemporaryDirectory() as cache_dir:
+            cache = TradingPairsCache.initialize(ttl=60, cache_dir=Path(cache_dir))
+            self.addCleanup(TradingPairsCache.initialize, ttl=0)
+            cache.put("trading_pairs_mockConnector", ["CACHED-HBOT"])
+
+            client_config_map = ClientConfigAdapter(ClientConfigMap())
+            client_config_map.fetch_pairs_from_all_exchanges = True
+            trading_pair_fetcher = TradingPairFetcher(client_config_map)
+            self.async_run_with_timeout(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher), 1.0)
+
+        self.assertEqual({"mockConnector": ["CACHED-HBOT"]}, trading_pair_fetcher.trading_pairs)
+        connector.all_trading_pairs.assert_not_called()
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
+    def test_expired_cached_trading_pairs_are_refreshed(self, _, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mockConnector", connector=connector),
+        }
+        with TemporaryDirectory() as cache_dir:
+            cache = TradingPairsCache.initialize(ttl=60, cache_dir=Path(cache_dir))
+            self.addCleanup(TradingPairsCache.initialize, ttl=0)
+            cache.put("trading_pairs_mockConnector", ["CACHED-HBOT"])
+            expired_time = time.time() - 120
+            os.utime(Path(cache_dir) / "trading_pairs_mockConnector.json", (expired_time, expired_time))
+
+            client_config_map = ClientConfigAdapter(ClientConfigMap())
+            client_config_map.fetch_pairs_from_all_exchanges = True
+            trading_pair_fetcher = TradingPairFetcher(client_config_map)
+            self.async_run_with_timeout(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher), 1.0)
+            self.async_run_with_timeout(asyncio.sleep(0.1))
+
+            connector.all_trading_pairs.assert_called_once()
+            self.assertEqual({"mockConnector": ["MOCK-HBOT"]}, trading_pair_fetcher.trading_pairs)
+            entry = cache.get("trading_pairs_mockConnector")
+            self.assertEqual(["MOCK-HBOT"], entry.data)
+            self.assertTrue(cache.is_fresh(entry))
+
     @aioresponses()
     @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
     @patch("hummingbot.core.gateway.gateway_http_client.GatewayHttpClient.get_perp_markets")
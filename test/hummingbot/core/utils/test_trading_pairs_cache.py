@@ -0,0 +1,102 @@
+import asyncio
+import json
+import os
+import time
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from hummingbot.core.utils.trading_pairs_cache import TradingPairsCache
+
+
+class TradingPairsCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = TemporaryDirectory()
+        self.cache_dir = Path(self.temp_dir.name)
+        self.cache = TradingPairsCache(cache_dir=self.cache_dir, ttl=60)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        TradingPairsCache._shared_instance = None
+        super().tearDown()
+
+    def test_put_and_get(self):
+        self.assertIsNone(self.cache.get("binance"))
+
+        self.assertTrue(self.cache.put("binance", ["BTC-USDT", "ETH-USDT"]))
+        entry = self.cache.get("binance")
+
+        self.assertEqual(["BTC-USDT", "ETH-USDT"], entry.data)
+        self.assertEqual(TradingPairsCache.content_hash(["BTC-USDT", "ETH-USDT"]), entry.content_hash)
+        self.assertTrue(self.cache.is_fresh(entry))
+
+    def test_put_with_same_content_only_refreshes_the_entry(self):
+        self.cache.put("binance", ["BTC-USDT"])
+        path = self.cache_dir / "binance.json"
+        expired_time = time.time() - 120
+        os.utime(path, (expired_time, expired_time))
+        self.assertFalse(self.cache.is_fresh(self.cache.get("binance")))
+
+        self.assertFalse(self.cache.put("binance", ["BTC-USDT"]))
+        self.assertTrue(self.cache.is_fresh(self.cache.get("binance")))
+
+        self.assertTrue(self.cache.put("binance", ["BTC-USDT", "ETH-USDT"]))
+        self.assertEqual(["BTC-USDT", "ETH-USDT"], self.cache.get("binance").data)
+
+    def test_put_compares_with_the_hash_in_memory(self):
+        self.cache.put("binance", ["BTC-USDT"])
+        # A new instance reads the stored hash once, the first time the key is stored
+        cache = TradingPairsCache(cache_dir=self.cache_dir, ttl=60)
+        self.assertFalse(cache.put("binance", ["BTC-USDT"]))
+
+        with patch.object(TradingPairsCache, "get") as get_mock:
+            self.assertFalse(cache.put("binance", ["BTC-USDT"]))
+            self.assertTrue(cache.put("binance", ["BTC-USDT", "ETH-USDT"]))
+            self.assertFalse(cache.put("binance", ["BTC-USDT", "ETH-USDT"]))
+            get_mock.assert_not_called()
+
+        self.assertEqual(["BTC-USDT", "ETH-USDT"], cache.get("binance").data)
+
+    def test_put_and_get_in_the_executor(self):
+        async def run():
+            stored = await self.cache.put_async("binance", ["BTC-USDT"])
+            return stored, await self.cache.get_async("binance")
+
+        stored, entry = asyncio.get_event_loop().run_until_complete(run())
+
+        self.assertTrue(stored)
+        self.assertEqual(["BTC-USDT"], entry.data)
+
+    def test_modified_or_invalid_entries_are_ignored(self):
+        self.cache.put("binance", ["BTC-USDT"])
+        path = self.cache_dir / "binance.json"
+        with open(path) as entry_file:
+            stored = json.load(entry_file)
+        stored["data"].append("ETH-USDT")
+        with open(path, "w") as entry_file:
+            json.dump(stored, entry_file)
+
+        self.assertIsNone(self.cache.get("binance"))
+
+        with open(path, "w") as entry_file:
+            entry_file.write('{"hash": ')
+
+        self.assertIsNone(self.cache.get("binance"))
+
+    def test_keys_are_sanitized_for_file_names(self):
+        self.cache.put("exchange_info_binance_/exchangeInfo", {"symbols": []})
+
+        self.assertEqual(["exchange_info_binance__exchangeInfo.json"], os.listdir(self.cache_dir))
+        self.assertEqual({"symbols": []}, self.cache.get("exchange_info_binance_/exchangeInfo").data)
+
+    def test_initialize_shared_instance(self):
+        self.assertIsNone(TradingPairsCache.get_instance())
+
+        cache = TradingPairsCache.initialize(ttl=10, cache_dir=self.cache_dir)
+
+        self.assertIs(cache, TradingPairsCache.get_instance())
+        self.assertEqual(10, cache.ttl)
+        self.assertIsNone(TradingPairsCache.initialize(ttl=0))
+        self.assertIsNone(TradingPairsCache.get_instance())
@@ -0,0 +1,151 @@
+import asyncio
+import unittest
+from typing import Awaitable
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from hummingbot.core.web_assistant.connections.connection_pool_manager import (
+    ConnectionPoolConfig,
+    ConnectionPoolManager,
+)
+from hummingbot.core.web_assistant.connections.connections_factory import ConnectionsFactory
+
+
+class ConnectionPoolManagerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.manager = ConnectionPoolManager()
+        app = web.Application()
+        app.router.add_get("/", self._handle_request)
+        self.server = TestServer(app)
+        self.async_run_with_timeout(self.server.start_server())
+        self.request_delay = 0
+
+    def tearDown(self) -> None:
+        self.async_run_with_timeout(self.manager.close())
+        self.async_run_with_timeout(self.server.close())
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 5):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    async def _handle_request(self, request: web.Request) -> web.Response:
+        await asyncio.sleep(self.request_delay)
+        return web.json_response({"ok": True})
+
+    async def _get(self, session):
+        async with session.get(self.server.make_url("/")) as response:
+            return await response.json()
+
+    def test_sessions_share_the_pool_connector(self):
+        self.manager.configure_pool("test", ConnectionPoolConfig(limit=10, limit_per_host=5))
+
+        async def run():
+            first_session = self.manager.get_client_session("test")
+            second_session = self.manager.get_client_session("test")
+            self.assertIs(first_session.connector, second_session.connector)
+            self.assertEqual(5, first_session.connector.limit_per_host)
+
+            await self._get(first_session)
+            await first_session.close()
+            # Closing a session does not close the pooled connections
+            self.assertFalse(second_session.connector.closed)
+            await self._get(second_session)
+            await second_session.close()
+
+        self.async_run_with_timeout(run())
+
+        metrics = self.manager.get_metrics("test")
+        self.assertEqual(2, metrics.requests_total)
+        self.assertEqual(0, metrics.requests_in_flight)
+        self.assertEqual(1, metrics.connections_created)
+        self.assertEqual(1, metrics.connections_reused)
+        self.assertEqual(0.5, metrics.connection_reuse_ratio)
+
+    def test_queue_wait_metrics_when_the_host_limit_is_reached(self):
+        self.manager.configure_pool("test", ConnectionPoolConfig(limit=10, limit_per_host=1))
+        self.request_delay = 0.05
+
+        async def run():
+            session = self.manager.get_client_session("test")
+            await asyncio.gather(*[self._get(session) for _ in range(3)])
+            await session.close()
+
+        self.async_run_with_timeout(run())
+
+        metrics = self.manager.get_metrics("test")
+        self.assertEqual(3, metrics.requests_total)
+        self.assertEqual(2, metrics.queue_wait_count)
+        self.assertEqual(0, metrics.requests_queued)
+        self.assertGreater(metrics.queue_wait_time_max, 0.04)
+        self.assertGreater(metrics.queue_wait_time_avg, 0)
+
+    def test_configure_pool_replaces_the_connector(self):
+        async def run():
+            connector = self.manager.get_connector("test")
+            self.assertIs(connector, self.manager.get_connector("test"))
+            self.manager.configure_pool("test", ConnectionPoolConfig(limit_per_host=2))
+            new_connector = self.manager.get_connector("test")
+            self.assertIsNot(connector, new_connector)
+            self.assertEqual(2, new_connector.limit_per_host)
+            self.assertEqual(2, self.manager.get_metrics("test").limit_per_host)
+            await connector.close()
+
+        self.async_run_with_timeout(run())
+
+    def test_connections_factory_uses_the_pool(self):
+        factory = ConnectionsFactory(connection_pool_name="factory_pool")
+        manager = ConnectionPoolManager.get_instance()
+
+        connection = self.async_run_with_timeout(factory.get_rest_connection())
+
+        self.assertIs(manager.get_connector("factory_pool"), connection._client_session.connector)
+        self.async_run_with_timeout(connection._client_session.close())
+
+    def test_ws_connections_use_a_connector_without_limits(self):
+        self.manager.configure_pool("test", ConnectionPoolConfig(limit=10, limit_per_host=1))
+
+        async def run():
+            ws_connector = self.manager.get_ws_connector("test")
+            self.assertIsNot(self.manager.get_connector("test"), ws_connector)
+            self.assertIs(ws_connector, self.manager.get_ws_connector("test"))
+            self.assertEqual(0, ws_connector.limit)
+            self.assertEqual(0, ws_connector.limit_per_host)
+            session = self.manager.get_ws_client_session("test")
+            self.assertIs(ws_connector, session.connector)
+            await session.close()
+
+            await self.manager.close()
+            self.assertTrue(ws_connector.closed)
+
+        self.async_run_with_timeout(run())
+
+    def test_register_pool_keeps_the_limits_of_configured_pools(self):
+        self.manager.configure_pool("exchange", ConnectionPoolConfig(limit_per_host=20))
+
+        self.manager.register_pool("exchange", ConnectionPoolConfig(limit_per_host=5))
+        self.manager.register_pool("other_exchange", ConnectionPoolConfig(limit_per_host=5))
+
+        self.assertEqual(20, self.manager.get_metrics("exchange").limit_per_host)
+        self.assertEqual(5, self.manager.get_metrics("other_exchange").limit_per_host)
+
+    def test_connections_factory_uses_the_ws_connector_of_its_pool(self):
+        factory = ConnectionsFactory()
+        factory.set_connection_pool_name("exchange_pool")
+        manager = ConnectionPoolManager.get_instance()
+
+        rest_connection = self.async_run_with_timeout(factory.get_rest_connection())
+        ws_connection = self.async_run_with_timeout(factory.get_ws_connection())
+
+        self.assertEqual("exchange_pool", factory.connection_pool_name)
+        self.assertIs(manager.get_connector("exchange_pool"), rest_connection._client_session.connector)
+        self.assertIs(manager.get_ws_connector("exchange_pool"), ws_connection._client_session.connector)
+        self.async_run_with_timeout(rest_connection._client_session.close())
+        self.async_run_with_timeout(ws_connection._client_session.close())
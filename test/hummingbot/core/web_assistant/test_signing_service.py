@@ -0,0 +1,61 @@
+import asyncio
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable
+
+from hummingbot.core.web_assistant.auth import AuthBase
+from hummingbot.core.web_assistant.signing_service import SigningService
+
+
+class SigningServiceTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.service = SigningService(executor=self.executor)
+
+    def tearDown(self) -> None:
+        self.service.shutdown()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @staticmethod
+    def sign(payload: str, suffix: str = "") -> str:
+        return f"signed-{payload}{suffix}-{threading.current_thread().name}"
+
+    def test_sign_runs_outside_of_the_event_loop_thread(self):
+        result = self.async_run_with_timeout(self.service.sign(self.sign, "order", suffix="!"))
+
+        self.assertTrue(result.startswith("signed-order!-"))
+        self.assertNotEqual(threading.current_thread().name, result[len("signed-order!-"):])
+        self.assertEqual(1, self.service.metrics.signatures)
+        self.assertGreater(self.service.metrics.latency_avg, 0)
+        self.assertGreaterEqual(self.service.metrics.latency_total, self.service.metrics.execution_time_total)
+
+    def test_sign_propagates_errors(self):
+        def failing_sign():
+            raise ValueError("invalid key")
+
+        with self.assertRaises(ValueError):
+            self.async_run_with_timeout(self.service.sign(failing_sign))
+
+    def test_auth_uses_the_shared_service_by_default(self):
+        class TestAuth(AuthBase):
+            async def rest_authenticate(self, request):
+                return request
+
+            async def ws_authenticate(self, request):
+                return request
+
+        auth = TestAuth()
+        self.assertIs(SigningService.get_instance(), auth.signing_service)
+        auth.signing_service = self.service
+        self.assertIs(self.service, auth.signing_service)
@@ -0,0 +1,162 @@
+import asyncio
+import json
+import unittest
+from typing import Any, Awaitable, List, Optional, Tuple
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+
+from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest, WSRequest
+from hummingbot.core.web_assistant.ws_hub import WSHub, WSHubAdapter
+
+
+class StreamsWSHubAdapter(WSHubAdapter):
+    max_channels_per_connection = 3
+    max_channels_per_request = 2
+
+    def subscription_request(self, channels: List[str], request_id: int) -> WSRequest:
+        return WSJSONRequest(payload={"op": "subscribe", "args": channels, "id": request_id})
+
+    def unsubscription_request(self, channels: List[str], request_id: int) -> WSRequest:
+        return WSJSONRequest(payload={"op": "unsubscribe", "args": channels, "id": request_id})
+
+    def route_message(self, message: Any) -> Optional[Tuple[str, Any]]:
+        if "stream" in message:
+            return message["stream"], message["data"]
+        return None
+
+
+class WSHubTests(unittest.TestCase):
+    level = 0
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.ws_url = "wss://test.com/stream"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.log_records = []
+        self.mocking_assistant = NetworkMockingAssistant()
+        self.ws_mocks: List[AsyncMock] = []
+        self.hub = WSHub(ws_url=self.ws_url, adapter=StreamsWSHubAdapter())
+        self.hub.RECONNECT_DELAY = 0
+        self.hub.logger().setLevel(1)
+        self.hub.logger().addHandler(self)
+
+        self.ws_connect_patch = patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+        ws_connect_mock = self.ws_connect_patch.start()
+        ws_connect_mock.side_effect = self._new_ws_mock
+
+    def tearDown(self) -> None:
+        for channel in self.hub.channels:
+            for queue in list(self.hub._subscribers[channel]):
+                self.hub.unsubscribe(channels=[channel], queue=queue)
+        self.ws_connect_patch.stop()
+        self.hub.logger().removeHandler(self)
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def _new_ws_mock(self, *args, **kwargs) -> AsyncMock:
+        ws_mock = self.mocking_assistant.create_websocket_mock()
+        self.ws_mocks.append(ws_mock)
+        return ws_mock
+
+    def _add_stream_message(self, ws_mock: AsyncMock, channel: str, data: Any):
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_mock, message=json.dumps({"stream": channel, "data": data}))
+
+    def _run(self, delay: float = 0.05):
+        self.async_run_with_timeout(asyncio.sleep(delay))
+
+    def test_channels_are_distributed_among_connections_and_batched_in_requests(self):
+        queue = asyncio.Queue()
+        self.hub.subscribe(channels=["a", "b", "c", "d"], queue=queue)
+        self._run()
+
+        self.assertEqual(2, self.hub.connections_count)
+        self.assertEqual(2, len(self.ws_mocks))
+        first_requests = self.mocking_assistant.json_messages_sent_through_websocket(self.ws_mocks[0])
+        second_requests = self.mocking_assistant.json_messages_sent_through_websocket(self.ws_mocks[1])
+        self.assertEqual([["a", "b"], ["c"]], [request["args"] for request in first_requests])
+        self.assertEqual([["d"]], [request["args"] for request in second_requests])
+        self.assertEqual({"subscribe"}, {request["op"] for request in first_requests + second_requests})
+        self.assertEqual(3, len({request["id"] for request in first_requests + second_requests}))
+
+    def test_messages_are_delivered_to_the_subscribers_of_their_channel(self):
+        first_queue = asyncio.Queue()
+        second_queue = asyncio.Queue()
+        self.hub.subscribe(channels=["a", "b"], queue=first_queue)
+        self.hub.subscribe(channels=["b"], queue=second_queue)
+        self._run()
+
+        ws_mock = self.ws_mocks[0]
+        self.mocking_assistant.add_websocket_aiohttp_message(websocket_mock=ws_mock, message=json.dumps({"id": 1}))
+        self._add_stream_message(ws_mock, "a", {"value": 1})
+        self._add_stream_message(ws_mock, "b", {"value": 2})
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_mock)
+
+        self.assertEqual(1, len(self.ws_mocks))
+        requests = self.mocking_assistant.json_messages_sent_through_websocket(ws_mock)
+        self.assertEqual([["a", "b"]], [request["args"] for request in requests])
+        self.assertEqual({"value": 1}, first_queue.get_nowait())
+        self.assertEqual({"value": 2}, first_queue.get_nowait())
+        self.assertEqual({"value": 2}, second_queue.get_nowait())
+        self.assertTrue(second_queue.empty())
+
+    def test_channels_are_unsubscribed_when_they_have_no_subscribers(self):
+        first_queue = asyncio.Queue()
+        second_queue = asyncio.Queue()
+        self.hub.subscribe(channels=["a", "b"], queue=first_queue)
+        self.hub.subscribe(channels=["b"], queue=second_queue)
+        self._run()
+
+        self.hub.unsubscribe(channels=["a", "b"], queue=first_queue)
+        self._run()
+
+        requests = self.mocking_assistant.json_messages_sent_through_websocket(self.ws_mocks[0])
+        self.assertEqual("unsubscribe", requests[-1]["op"])
+        self.assertEqual(["a"], requests[-1]["args"])
+        self.assertEqual(["b"], self.hub.channels)
+        self.assertEqual(1, self.hub.connections_count)
+
+        self.hub.unsubscribe(channels=["b"], queue=second_queue)
+
+        self.assertEqual([], self.hub.channels)
+        self.assertEqual(0, self.hub.connections_count)
+
+    def test_subscribers_are_notified_of_disconnections_and_channels_subscribed_again(self):
+        queue = asyncio.Queue()
+        self.hub.subscribe(channels=["a", "b"], queue=queue)
+        self._run()
+
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=self.ws_mocks[0], message="", message_type=aiohttp.WSMsgType.CLOSE)
+        self._run()
+
+        self.assertIsNone(queue.get_nowait())
+        self.assertTrue(queue.empty())
+        self.assertEqual(2, len(self.ws_mocks))
+        requests = self.mocking_assistant.json_messages_sent_through_websocket(self.ws_mocks[1])
+        self.assertEqual([["a", "b"]], [request["args"] for request in requests])
+
+        self._add_stream_message(self.ws_mocks[1], "a", {"value": 1})
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(self.ws_mocks[1])
+
+        self.assertEqual({"value": 1}, queue.get_nowait())
+
+    def test_get_hub_returns_the_same_hub_for_each_url(self):
+        adapter = StreamsWSHubAdapter()
+        with patch.object(WSHub, "_hubs", {}):
+            hub = WSHub.get_hub(ws_url=self.ws_url, adapter=adapter)
+
+            self.assertIs(hub, WSHub.get_hub(ws_url=self.ws_url, adapter=StreamsWSHubAdapter()))
+            self.assertIsNot(hub, WSHub.get_hub(ws_url="wss://other.com/stream", adapter=adapter))
+            self.assertIs(adapter, hub.adapter)
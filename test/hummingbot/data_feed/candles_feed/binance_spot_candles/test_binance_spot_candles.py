@@ -1,7 +1,10 @@
 import asyncio
+import json
 from test.hummingbot.data_feed.candles_feed.test_candles_base import TestCandlesBase
+from unittest.mock import AsyncMock, patch
 
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
+from hummingbot.core.web_assistant.ws_hub import WSHub
 from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
 
 
@@ -152,3 +155,33 @@ class TestBinanceSpotCandles(TestCandlesBase):
     @staticmethod
     def _success_subscription_mock():
         return {}
+
+    @patch("hummingbot.data_feed.candles_feed.candles_base.CandlesBase.fill_historical_candles", new_callable=AsyncMock)
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_listen_for_subscriptions_through_ws_hub(self, ws_connect_mock, _):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        hub = WSHub(ws_url=self.data_feed.ws_hub_url, adapter=self.data_feed.ws_hub_adapter)
+        self.data_feed.use_ws_hub(hub)
+
+        self.listening_task = self.ev_loop.create_task(self.data_feed.listen_for_subscriptions())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        channel = f"{self.ex_trading_pair.lower()}@kline_{self.interval}"
+        self.assertEqual([channel], hub.channels)
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(ws_connect_mock.return_value)
+        self.assertEqual([channel], sent_messages[0]["params"])
+        self.assertTrue(self.is_logged("INFO", "Subscribed to public klines..."))
+
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps({"stream": channel, "data": self.get_candles_ws_data_mock_1()}))
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertEqual(1, len(self.data_feed._candles))
+        self.assertEqual(1718667720, self.data_feed._candles[-1][0])
+
+        self.listening_task.cancel()
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertEqual([], hub.channels)
@@ -845,6 +845,23 @@ class RemoteIfaceMQTTTests(TestCase):
         self.assertTrue(self.is_msg_received(topic, msg, msg_key='data'))
         self.hbapp.strategy = None
 
+    @patch("hummingbot.client.command.status_command.StatusCommand.event_loop_diagnostics")
+    def test_mqtt_command_status_diagnostics(
+        self,
+        event_loop_diagnostics_mock: MagicMock
+    ):
+        diagnostics = {"event_loop": {"lag": 0.01}, "queues": {"binance": {"user_stream": 0}}}
+        event_loop_diagnostics_mock.return_value = diagnostics
+        self.start_mqtt()
+        self.fake_mqtt_broker.publish_to_subscription(
+            self.get_topic_for(self.STATUS_URI),
+            {'diagnostics': 1}
+        )
+        topic = f"test_reply/hbot/{self.instance_id}/status"
+        msg = {'status': 200, 'msg': '', 'data': diagnostics}
+        self.async_run_with_timeout(self.wait_for_rcv(topic, msg, msg_key='data'), timeout=10)
+        self.assertTrue(self.is_msg_received(topic, msg, msg_key='data'))
+
     @patch("hummingbot.client.command.status_command.StatusCommand.strategy_status", new_callable=AsyncMock)
     def test_mqtt_command_status_failure(
         self,
@@ -503,6 +503,17 @@ class AvellanedaMarketMakingUnitTests(unittest.TestCase):
                 OrderType.LIMIT
             ))
 
+    def test_trading_intensity_refit_settings_are_taken_from_the_config_map(self):
+        self.config_map.trading_intensity_refit_interval = 10
+        self.config_map.trading_intensity_refit_threshold = Decimal("0.2")
+        self.config_map.trading_intensity_fit_method = "log_linear"
+
+        self.strategy.get_config_map_indicators()
+
+        self.assertEqual(10, self.strategy.trading_intensity.refit_interval)
+        self.assertEqual(0.2, self.strategy.trading_intensity.refit_threshold)
+        self.assertEqual("log_linear", self.strategy.trading_intensity.fit_method)
+
     def test_all_markets_ready(self):
         self.assertTrue(self.strategy.all_markets_ready())
 
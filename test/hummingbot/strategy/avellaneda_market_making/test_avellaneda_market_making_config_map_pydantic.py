@@ -200,6 +200,24 @@ class AvellanedaMarketMakingConfigMapPydanticTest(unittest.TestCase):
         model.hanging_orders_cancel_pct = "3"
         self.assertEqual(3, model.hanging_orders_cancel_pct)
 
+        with self.assertRaises(ConfigValidationError) as e:
+            self.config_map.trading_intensity_refit_interval = "0"
+
+        error_msg = "Value cannot be less than 1."
+        self.assertEqual(error_msg, str(e.exception))
+
+        self.config_map.trading_intensity_refit_threshold = "0.1"
+        self.assertEqual(Decimal("0.1"), self.config_map.trading_intensity_refit_threshold)
+
+        with self.assertRaises(ConfigValidationError) as e:
+            self.config_map.trading_intensity_fit_method = "XXX"
+
+        error_msg = "Invalid fit method, please choose value from ['curve_fit', 'log_linear']."
+        self.assertEqual(error_msg, str(e.exception))
+
+        self.config_map.trading_intensity_fit_method = "log_linear"
+        self.assertEqual("log_linear", self.config_map.trading_intensity_fit_method)
+
     def test_load_configs_from_yaml(self):
         cur_dir = Path(__file__).parent
         f_path = cur_dir / "test_config.yml"
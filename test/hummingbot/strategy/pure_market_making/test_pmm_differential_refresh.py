@@ -0,0 +1,125 @@
+import logging
+import unittest
+from decimal import Decimal
+
+import pandas as pd
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent, OrderBookTradeEvent
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.pure_market_making.pure_market_making import PureMarketMakingStrategy
+
+logging.basicConfig(level=logging.ERROR)
+
+
+class PMMDifferentialRefreshUnitTest(unittest.TestCase):
+    start: pd.Timestamp = pd.Timestamp("2019-01-01", tz="UTC")
+    end: pd.Timestamp = pd.Timestamp("2019-01-01 01:00:00", tz="UTC")
+    start_timestamp: float = start.timestamp()
+    end_timestamp: float = end.timestamp()
+    trading_pair = "HBOT-ETH"
+    base_asset = trading_pair.split("-")[0]
+    quote_asset = trading_pair.split("-")[1]
+
+    def simulate_maker_market_trade(self, is_buy: bool, quantity: Decimal, price: Decimal):
+        order_book = self.market.get_order_book(self.trading_pair)
+        trade_event = OrderBookTradeEvent(
+            self.trading_pair,
+            self.clock.current_timestamp,
+            TradeType.BUY if is_buy else TradeType.SELL,
+            price,
+            quantity
+        )
+        order_book.apply_trade(trade_event)
+
+    def setUp(self):
+        self.clock_tick_size = 1
+        self.clock: Clock = Clock(ClockMode.BACKTEST, self.clock_tick_size, self.start_timestamp, self.end_timestamp)
+        self.market: MockPaperExchange = MockPaperExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap())
+        )
+        self.market.set_balanced_order_book(trading_pair=self.trading_pair,
+                                            mid_price=100,
+                                            min_price=1,
+                                            max_price=200,
+                                            price_step_size=1,
+                                            volume_step_size=10)
+        self.market.set_balance("HBOT", 500)
+        self.market.set_balance("ETH", 5000)
+        self.market.set_quantization_param(
+            QuantizationParams(
+                self.trading_pair, 6, 6, 6, 6
+            )
+        )
+        self.market_info = MarketTradingPairTuple(self.market, self.trading_pair,
+                                                  self.base_asset, self.quote_asset)
+        self.clock.add_iterator(self.market)
+        self.order_fill_logger: EventLogger = EventLogger()
+        self.cancel_order_logger: EventLogger = EventLogger()
+        self.market.add_listener(MarketEvent.OrderFilled, self.order_fill_logger)
+        self.market.add_listener(MarketEvent.OrderCancelled, self.cancel_order_logger)
+
+        self.strategy: PureMarketMakingStrategy = PureMarketMakingStrategy()
+        self.strategy.init_params(
+            self.market_info,
+            bid_spread=Decimal("0.01"),
+            ask_spread=Decimal("0.01"),
+            order_amount=Decimal("1"),
+            order_levels=3,
+            order_level_spread=Decimal("0.01"),
+            order_refresh_time=4,
+            filled_order_delay=10,
+            order_refresh_tolerance_pct=Decimal("0"),
+            differential_order_refresh_enabled=True
+        )
+        self.clock.add_iterator(self.strategy)
+
+    def test_only_the_filled_level_is_created_again(self):
+        self.clock.backtest_til(self.start_timestamp + 1)
+        self.assertEqual(3, len(self.strategy.active_buys))
+        self.assertEqual(3, len(self.strategy.active_sells))
+        buy_ids = {o.client_order_id for o in self.strategy.active_buys}
+        sell_ids = {o.client_order_id for o in self.strategy.active_sells}
+
+        self.simulate_maker_market_trade(True, Decimal("100"), Decimal("101.1"))
+        self.clock.backtest_til(self.start_timestamp + 2)
+        self.assertEqual(1, len(self.order_fill_logger.event_log))
+        self.assertEqual(2, len(self.strategy.active_sells))
+
+        # The other orders are kept after the order refresh time and the filled order delay
+        self.clock.backtest_til(self.start_timestamp + 12)
+        self.assertEqual(0, len(self.cancel_order_logger.event_log))
+        self.assertEqual(buy_ids, {o.client_order_id for o in self.strategy.active_buys})
+        self.assertEqual(3, len(self.strategy.active_sells))
+        new_sells = [o for o in self.strategy.active_sells if o.client_order_id not in sell_ids]
+        self.assertEqual(1, len(new_sells))
+        self.assertEqual(Decimal("101"), new_sells[0].price)
+
+    def test_all_levels_are_replaced_when_the_price_moves(self):
+        self.clock.backtest_til(self.start_timestamp + 1)
+        order_ids = {o.client_order_id for o in self.strategy.active_orders}
+
+        self.market.order_books[self.trading_pair].apply_diffs([OrderBookRow(99.5, 30, 2)],
+                                                               [OrderBookRow(100.1, 30, 2)], 2)
+        self.clock.backtest_til(self.start_timestamp + 7)
+
+        self.assertEqual(6, len(self.cancel_order_logger.event_log))
+        self.assertEqual(3, len(self.strategy.active_buys))
+        self.assertEqual(3, len(self.strategy.active_sells))
+        self.assertTrue(order_ids.isdisjoint({o.client_order_id for o in self.strategy.active_orders}))
+
+    def test_hanging_orders_use_the_full_refresh(self):
+        self.strategy.hanging_orders_enabled = True
+        self.clock.backtest_til(self.start_timestamp + 1)
+
+        self.simulate_maker_market_trade(True, Decimal("100"), Decimal("101.1"))
+        self.clock.backtest_til(self.start_timestamp + 7)
+
+        self.assertEqual(0, len(self.strategy.active_non_hanging_orders))
@@ -0,0 +1,79 @@
+import unittest
+from decimal import Decimal
+from typing import List
+
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.strategy.pure_market_making.data_types import PriceSize, Proposal
+from hummingbot.strategy.pure_market_making.proposal_diff import diff_proposal
+
+
+class ProposalDiffTests(unittest.TestCase):
+    trading_pair = "HBOT-ETH"
+
+    def _orders(self, is_buy: bool, prices: List[str]) -> List[LimitOrder]:
+        return [
+            LimitOrder(client_order_id=f"{'buy' if is_buy else 'sell'}_{price}",
+                       trading_pair=self.trading_pair,
+                       is_buy=is_buy,
+                       base_currency="HBOT",
+                       quote_currency="ETH",
+                       price=Decimal(price),
+                       quantity=Decimal("1"))
+            for price in prices
+        ]
+
+    @staticmethod
+    def _price_sizes(prices: List[str]) -> List[PriceSize]:
+        return [PriceSize(Decimal(price), Decimal("1")) for price in prices]
+
+    @staticmethod
+    def _prices(price_sizes: List[PriceSize]) -> List[Decimal]:
+        return [price_size.price for price_size in price_sizes]
+
+    def test_orders_within_tolerance_are_kept(self):
+        buys = self._orders(True, ["99", "98", "97"])
+        sells = self._orders(False, ["101", "102", "103"])
+        proposal = Proposal(self._price_sizes(["99.01", "98", "97"]), self._price_sizes(["101", "102", "103.01"]))
+
+        diff = diff_proposal(buys + sells, proposal, Decimal("0.001"))
+
+        self.assertTrue(diff.is_empty)
+        self.assertEqual(buys + sells, diff.orders_to_keep)
+
+    def test_missing_level_is_created_and_moved_levels_are_replaced(self):
+        # The best bid was filled and the asks moved away
+        buys = self._orders(True, ["98", "97"])
+        sells = self._orders(False, ["101", "102"])
+        proposal = Proposal(self._price_sizes(["99", "98", "97"]), self._price_sizes(["101.5", "102.5"]))
+
+        diff = diff_proposal(buys + sells, proposal, Decimal("0.001"))
+
+        self.assertEqual(buys, diff.orders_to_keep)
+        self.assertEqual([Decimal("99")], self._prices(diff.buys_to_create))
+        self.assertEqual(sells, [order for order, _ in diff.orders_to_replace])
+        self.assertEqual([Decimal("101.5"), Decimal("102.5")],
+                         self._prices([price_size for _, price_size in diff.orders_to_replace]))
+        self.assertEqual([], diff.orders_to_cancel)
+        self.assertEqual([], diff.sells_to_create)
+        self.assertEqual([Decimal("99")], self._prices(diff.buys_to_submit))
+        self.assertEqual([Decimal("101.5"), Decimal("102.5")], self._prices(diff.sells_to_submit))
+
+    def test_extra_orders_are_cancelled(self):
+        buys = self._orders(True, ["99", "98"])
+        sells = self._orders(False, ["101"])
+        proposal = Proposal(self._price_sizes(["99"]), [])
+
+        diff = diff_proposal(buys + sells, proposal, Decimal("0.001"))
+
+        self.assertEqual(buys[:1], diff.orders_to_keep)
+        self.assertEqual([buys[1], sells[0]], diff.orders_to_cancel)
+        self.assertEqual([], diff.orders_to_replace)
+
+    def test_negative_tolerance_replaces_all_orders(self):
+        buys = self._orders(True, ["99"])
+        proposal = Proposal(self._price_sizes(["99"]), [])
+
+        diff = diff_proposal(buys, proposal, Decimal("-1"))
+
+        self.assertEqual([], diff.orders_to_keep)
+        self.assertEqual([(buys[0], proposal.buys[0])], diff.orders_to_replace)
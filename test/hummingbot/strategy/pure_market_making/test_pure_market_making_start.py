@@ -57,6 +57,7 @@ class PureMarketMakingStartTest(unittest.TestCase):
         c_map.get("ask_order_level_spreads").value = "1,2"
         c_map.get("bid_order_level_amounts").value = "1,2"
         c_map.get("ask_order_level_amounts").value = None
+        c_map.get("differential_order_refresh_enabled").value = True
 
     def _initialize_market_assets(self, market, trading_pairs):
         return [("ETH", "USDT")]
@@ -100,6 +101,7 @@ class PureMarketMakingStartTest(unittest.TestCase):
         self.assertEqual(self.strategy.price_type, PriceType.BestBid)
         self.assertEqual(self.strategy.order_refresh_tolerance_pct, Decimal("0.02"))
         self.assertEqual(self.strategy.split_order_levels_enabled, True)
+        self.assertEqual(self.strategy.differential_order_refresh_enabled, True)
         self.assertEqual(self.strategy.bid_order_level_spreads, [Decimal("1"), Decimal("2")])
         self.assertEqual(self.strategy.ask_order_level_spreads, [Decimal("1"), Decimal("2")])
         self.assertEqual(self.strategy.order_override, {"split_level_0": ['buy', Decimal("1"), Decimal("1")],
@@ -10,12 +10,14 @@ from typing import Any, Dict, List, Tuple, Union
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.connector.derivative_base import DerivativeBase
 from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
 from hummingbot.connector.in_flight_order_base import InFlightOrderBase
 from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
-from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.market_order import MarketOrder
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.order_tracker import OrderTracker
@@ -45,6 +47,32 @@ class ExtendedMockPaperExchange(MockPaperExchange):
         })
 
 
+class RecordingPerpetualConnector(DerivativeBase):
+
+    def __init__(self, client_config_map: "ClientConfigAdapter"):
+        super().__init__(client_config_map)
+        self.placed_orders: Dict[str, Dict[str, Any]] = {}
+        self.cancelled_order_ids: List[str] = []
+
+    @property
+    def limit_orders(self) -> List[LimitOrder]:
+        return []
+
+    def buy(self, trading_pair: str, amount: Decimal, order_type: OrderType, price: Decimal, **kwargs) -> str:
+        order_id = f"buy-{len(self.placed_orders)}"
+        self.placed_orders[order_id] = {"amount": amount, "price": price, **kwargs}
+        return order_id
+
+    def sell(self, trading_pair: str, amount: Decimal, order_type: OrderType, price: Decimal, **kwargs) -> str:
+        order_id = f"sell-{len(self.placed_orders)}"
+        self.placed_orders[order_id] = {"amount": amount, "price": price, **kwargs}
+        return order_id
+
+    def cancel(self, trading_pair: str, client_order_id: str):
+        self.cancelled_order_ids.append(client_order_id)
+        return client_order_id
+
+
 class MockStrategy(StrategyBase):
 
     @classmethod
@@ -125,6 +153,23 @@ class StrategyBaseUnitTests(unittest.TestCase):
 
         self.assertEqual(1, len(self.strategy.trades))
 
+    def test_trades_returns_the_trades_in_memory_and_trades_since_all_the_trades(self):
+        fill_history = self.market.fill_history
+        fill_history._max_in_memory_fills = 1
+        fill_history._spill_batch_size = 1
+        for timestamp in (1000, 2000, 3000):
+            self.market.trigger_event(
+                MarketEvent.OrderFilled,
+                OrderFilledEvent(timestamp, f"OID{timestamp}", self.trading_pair, TradeType.BUY, OrderType.LIMIT,
+                                 Decimal("100"), Decimal("1"), AddedToCostTradeFee())
+            )
+
+        self.assertEqual(2, fill_history.spilled_fills_count)
+        self.assertEqual([3000], [trade.timestamp for trade in self.strategy.trades])
+        self.assertEqual([1000, 2000, 3000], [trade.timestamp for trade in self.strategy.trades_since()])
+        self.assertEqual([3000], [trade.timestamp for trade in self.strategy.trades_since(2000)])
+        fill_history.clear()
+
     def test_add_markets(self):
 
         self.assertEqual(1, len(self.strategy.active_markets))
@@ -283,6 +328,50 @@ class StrategyBaseUnitTests(unittest.TestCase):
         self.strategy.cancel_order(self.market_info, limit_order_id)
         self.assertEqual(0, len(self.strategy.order_tracker.in_flight_cancels))
 
+    def test_amend_order_cancels_and_replaces_when_the_market_cannot_amend(self):
+        self.assertFalse(self.market.supports_order_amendment)
+
+        limit_order_id: str = self.strategy.buy_with_specific_market(
+            market_trading_pair_tuple=self.market_info,
+            order_type=OrderType.LIMIT,
+            price=Decimal("90"),
+            amount=Decimal("50"),
+        )
+
+        new_order_id: str = self.strategy.amend_order(self.market_info, limit_order_id, Decimal("95"), Decimal("40"))
+
+        self.assertIsNotNone(new_order_id)
+        self.assertNotEqual(limit_order_id, new_order_id)
+        self.assertIsNone(self.strategy.order_tracker.get_limit_order(self.market_info, limit_order_id))
+        new_order: LimitOrder = self.strategy.order_tracker.get_limit_order(self.market_info, new_order_id)
+        self.assertTrue(new_order.is_buy)
+        self.assertEqual(Decimal("95"), new_order.price)
+        self.assertEqual(Decimal("40"), new_order.quantity)
+
+    def test_amend_order_replaces_closing_orders_of_perpetual_markets_with_closing_orders(self):
+        market = RecordingPerpetualConnector(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        market_info = MarketTradingPairTuple(market, self.trading_pair, *self.trading_pair.split("-"))
+        self.strategy.add_markets([market])
+        self.assertFalse(market.supports_order_amendment)
+
+        take_profit_id: str = self.strategy.sell_with_specific_market(
+            market_trading_pair_tuple=market_info,
+            order_type=OrderType.LIMIT,
+            price=Decimal("110"),
+            amount=Decimal("2"),
+            position_action=PositionAction.CLOSE,
+        )
+
+        new_order_id: str = self.strategy.amend_order(market_info, take_profit_id, Decimal("105"), Decimal("2"),
+                                                      position_action=PositionAction.CLOSE)
+
+        self.assertEqual([take_profit_id], market.cancelled_order_ids)
+        self.assertEqual(PositionAction.CLOSE, market.placed_orders[new_order_id]["position_action"])
+        self.assertEqual(Decimal("105"), market.placed_orders[new_order_id]["price"])
+
+    def test_amend_order_ignores_untracked_orders(self):
+        self.assertIsNone(self.strategy.amend_order(self.market_info, "unknown", Decimal("95"), Decimal("40")))
+
     def test_start_tracking_limit_order(self):
         self.assertEqual(0, len(self.strategy.order_tracker.tracked_limit_orders))
 
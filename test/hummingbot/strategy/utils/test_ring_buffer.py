@@ -107,3 +107,32 @@ class RingBufferTest(unittest.TestCase):
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([0, 1, 2, 3])))
         buffer.add_value(4)
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([1, 2, 3, 4])))
+
+    def test_running_stats_match_full_array(self):
+        buffer = RingBuffer(7)
+        self.assertTrue(np.isnan(buffer.running_mean))
+        self.assertTrue(np.isnan(buffer.running_variance))
+        self.assertTrue(np.isnan(buffer.diff_variance))
+
+        values = np.random.default_rng(0).normal(100, 5, 50)
+        for value in values:
+            buffer.add_value(value)
+            window = buffer.get_as_numpy_array()
+            self.assertEqual(len(window), buffer.count)
+            self.assertAlmostEqual(np.mean(window), buffer.running_mean, 9)
+            self.assertAlmostEqual(np.var(window), buffer.running_variance, 9)
+            self.assertAlmostEqual(np.sum(np.square(np.diff(window))), buffer.diff_sum_squares, 9)
+            if len(window) > 1:
+                self.assertAlmostEqual(np.var(np.diff(window)), buffer.diff_variance, 9)
+            if buffer.is_full:
+                self.assertAlmostEqual(np.var(window), buffer.variance, 9)
+
+    def test_running_stats_after_length_change(self):
+        buffer = RingBuffer(5)
+        for value in [1, 4, 2, 8, 5, 7]:
+            buffer.add_value(value)
+        buffer.length = 3
+        self.assertTrue(np.array_equal(np.array([8, 5, 7]), buffer.get_as_numpy_array()))
+        self.assertAlmostEqual(np.mean([8, 5, 7]), buffer.mean_value)
+        self.assertAlmostEqual(np.var([8, 5, 7]), buffer.variance)
+        self.assertAlmostEqual(9 + 4, buffer.diff_sum_squares)
@@ -66,3 +66,13 @@ class HistoricalVolatilityTest(unittest.TestCase):
         energy_smoothed = sum(x ** 2 for x in np.diff(output_smoothed))
 
         self.assertGreater(energy_normal, energy_smoothed)
+
+    def test_incremental_calculation_matches_full_array(self):
+        samples = 100 * np.exp(np.cumsum(np.random.normal(0, 0.01, 500)))
+        indicator = HistoricalVolatilityIndicator(50, 1)
+
+        indicator.add_sample(samples[0])
+        self.assertTrue(np.isnan(indicator._indicator_calculation()))
+        for sample in samples[1:]:
+            indicator.add_sample(sample)
+            self.assertAlmostEqual(indicator._full_indicator_calculation(), indicator._indicator_calculation(), 12)
@@ -20,3 +20,11 @@ class InstantVolatilityTest(unittest.TestCase):
             self.indicator.add_sample(sample)
 
         self.assertAlmostEqual(self.indicator.current_value, 14.068197250366211, 4)
+
+    def test_incremental_calculation_matches_full_array(self):
+        samples = np.random.normal(100, 10, 500)
+        indicator = InstantVolatilityIndicator(50, 1)
+
+        for sample in samples:
+            indicator.add_sample(sample)
+            self.assertAlmostEqual(indicator._full_indicator_calculation(), indicator.current_value, 9)
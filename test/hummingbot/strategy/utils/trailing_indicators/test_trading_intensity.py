@@ -259,3 +259,62 @@ class TradingIntensityTest(unittest.TestCase):
 
         self.assertAlmostEqual(a, alpha, 10)
         self.assertAlmostEqual(b, kappa, 10)
+
+    def test_calculate_trading_intensity_log_linear(self):
+        last_price = 1
+        trade_price_levels = [2, 3, 4, 5]
+        a = 2
+        b = 0.1
+
+        timestamp = self.start_timestamp
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1, fit_method="log_linear")
+        indicator.last_quotes = [{"timestamp": timestamp, "price": last_price}]
+        timestamp += 1
+
+        for p in trade_price_levels:
+            indicator.register_trade(OrderBookTradeEvent(
+                trading_pair="COINALPHAHBOT",
+                timestamp=timestamp,
+                price=p,
+                amount=a * np.exp(-b * (p - last_price)),
+                type=TradeType.SELL,
+            ))
+        indicator.calculate(timestamp)
+        alpha, kappa = indicator.current_value
+
+        self.assertAlmostEqual(a, alpha, 10)
+        self.assertAlmostEqual(b, kappa, 10)
+
+    def test_invalid_fit_method(self):
+        with self.assertRaises(ValueError):
+            TradingIntensityIndicator(OrderBook(), self.price_delegate, 1, fit_method="unknown")
+
+    def test_trades_consolidated_with_window_eviction(self):
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 2, refit_interval=3)
+        timestamp = self.start_timestamp
+        indicator.last_quotes = [{"timestamp": timestamp, "price": 100}]
+
+        fitted_values = []
+        for trade_price in [101, 102, 101, 103, 104]:
+            timestamp += 1
+            indicator.register_trade(OrderBookTradeEvent(
+                trading_pair="COINALPHAHBOT",
+                timestamp=timestamp,
+                price=trade_price,
+                amount=trade_price - 100,
+                type=TradeType.BUY,
+            ))
+            indicator.calculate(timestamp)
+            # Every calculation stores the mid price quote, keep the reference price constant
+            indicator.last_quotes = [{"timestamp": timestamp, "price": 100}]
+            fitted_values.append(indicator.current_value)
+
+        # Only the last two samples remain in the window, the level of the evicted trades is removed
+        self.assertTrue(indicator.is_sampling_buffer_full)
+        self.assertEqual({3: 3, 4: 4}, indicator.trades_consolidated)
+        # The first estimate is fitted as soon as the buffer is full, then it is only refitted every 3 ticks
+        self.assertEqual((0, 0), fitted_values[0])
+        self.assertNotEqual((0, 0), fitted_values[1])
+        self.assertEqual(fitted_values[1], fitted_values[2])
+        self.assertEqual(fitted_values[1], fitted_values[3])
+        self.assertNotEqual(fitted_values[3], fitted_values[4])
@@ -0,0 +1,113 @@
+import unittest
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.strategy_v2.backtesting.executors_simulator.batch_position_executor_simulator import (
+    BatchPositionExecutorSimulator,
+)
+from hummingbot.strategy_v2.backtesting.executors_simulator.position_executor_simulator import PositionExecutorSimulator
+from hummingbot.strategy_v2.backtesting.executors_simulator.price_arrays import PriceArrays
+from hummingbot.strategy_v2.executors.position_executor.data_types import (
+    PositionExecutorConfig,
+    TrailingStop,
+    TripleBarrierConfig,
+)
+from hummingbot.strategy_v2.models.executors import CloseType
+
+
+class TestBatchPositionExecutorSimulator(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.002, 2000)))
+        self.df = pd.DataFrame({
+            "timestamp": np.arange(2000) * 60.0,
+            "open": close,
+            "high": close * (1 + rng.uniform(0, 0.001, 2000)),
+            "low": close * (1 - rng.uniform(0, 0.001, 2000)),
+            "close": close,
+            "volume": 1.0,
+        })
+        self.simulator = BatchPositionExecutorSimulator()
+        self.trade_cost = 0.0006
+
+    def get_config(self, index: int, side: TradeType, open_order_type: OrderType = OrderType.MARKET,
+                   trailing_stop: bool = False) -> PositionExecutorConfig:
+        close = self.df["close"].iloc[index]
+        return PositionExecutorConfig(
+            timestamp=self.df["timestamp"].iloc[index],
+            trading_pair="ETH-USDT",
+            connector_name="binance",
+            side=side,
+            entry_price=Decimal(str(close * (0.999 if side == TradeType.BUY else 1.001))),
+            amount=Decimal("1"),
+            triple_barrier_config=TripleBarrierConfig(
+                stop_loss=Decimal("0.01"),
+                take_profit=Decimal("0.015"),
+                time_limit=60 * 300,
+                trailing_stop=TrailingStop(activation_price=Decimal("0.005"),
+                                           trailing_delta=Decimal("0.002")) if trailing_stop else None,
+                open_order_type=open_order_type,
+            ),
+        )
+
+    def test_first_hit_matches_linear_scan(self):
+        prices = PriceArrays(self.df)
+        start = np.array([0, 10, 500, 1990, 1500])
+        end = np.array([1999, 50, 400, 1999, 1600])
+        threshold = np.array([101.0, 100.0, 0.0, 1000.0, 95.0])
+        result = prices.first_cross_above("close", start, end, threshold)
+        for s, e, p, r in zip(start, end, threshold, result):
+            hits = np.flatnonzero(self.df["close"].to_numpy()[s:e + 1] > p)
+            self.assertEqual(s + hits[0] if len(hits) > 0 and s <= e else -1, r)
+
+    def test_simulate_matches_position_executor_simulator(self):
+        reference_simulator = PositionExecutorSimulator()
+        for index in range(0, 1900, 37):
+            for side in [TradeType.BUY, TradeType.SELL]:
+                for open_order_type in [OrderType.MARKET, OrderType.LIMIT]:
+                    for trailing_stop in [False, True]:
+                        config = self.get_config(index, side, open_order_type, trailing_stop)
+                        df = self.df.iloc[index:]
+                        expected = reference_simulator.simulate(df, config, self.trade_cost)
+                        result = self.simulator.simulate(df, config, self.trade_cost)
+                        self.assertEqual(expected.close_type, result.close_type)
+                        expected_df = expected.executor_simulation
+                        result_df = result.executor_simulation
+                        self.assertEqual(expected_df["timestamp"].iloc[-1], result_df["timestamp"].iloc[-1])
+                        for column in ["net_pnl_pct", "net_pnl_quote", "filled_amount_quote"]:
+                            self.assertAlmostEqual(expected_df[column].iloc[-1], result_df[column].iloc[-1], places=6)
+
+    def test_simulate_configs_shares_market_data(self):
+        configs = [self.get_config(index, TradeType.BUY) for index in range(0, 1000, 100)]
+        simulations = self.simulator.simulate_configs(self.df, configs, self.trade_cost)
+        self.assertEqual(len(configs), len(simulations))
+        self.assertIs(self.df, self.simulator._market_data)
+        for config, simulation in zip(configs, simulations):
+            self.assertEqual(config.timestamp, simulation.executor_simulation["timestamp"].iloc[0])
+
+    def test_simulate_batch(self):
+        prices = PriceArrays(self.df)
+        result = self.simulator.simulate_batch(
+            prices=prices,
+            start_indexes=np.array([0, 100]),
+            sides=np.array([1, -1]),
+            amounts=np.array([1.0, 2.0]),
+            trade_cost=0.0,
+            time_limit_timestamps=np.array([self.df["timestamp"].iloc[10], np.nan]),
+        )
+        self.assertEqual(2, len(result))
+        self.assertEqual(10, result.close_index[0])
+        self.assertEqual(CloseType.TIME_LIMIT, result.close_type[0])
+        self.assertEqual(len(self.df) - 1, result.close_index[1])
+        expected_pnl = -(self.df["close"].iloc[-1] / self.df["close"].iloc[100] - 1)
+        self.assertAlmostEqual(expected_pnl, result.net_pnl_pct[1])
+        self.assertAlmostEqual(2 * self.df["close"].iloc[100], result.filled_amount_quote[1])
+
+    def test_simulate_empty_dataframe(self):
+        config = self.get_config(0, TradeType.BUY)
+        result = self.simulator.simulate(self.df.iloc[0:0], config, self.trade_cost)
+        self.assertTrue(result.executor_simulation.empty)
+        self.assertEqual(CloseType.TIME_LIMIT, result.close_type)
@@ -0,0 +1,116 @@
+import time
+import unittest
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy_v2.backtesting.executors_simulator.grid_executor_simulator import GridExecutorSimulator
+from hummingbot.strategy_v2.executors.grid_executor.data_types import GridExecutorConfig
+from hummingbot.strategy_v2.executors.position_executor.data_types import TripleBarrierConfig
+from hummingbot.strategy_v2.models.executors import CloseType
+
+
+class TestGridExecutorSimulator(unittest.TestCase):
+    def setUp(self):
+        self.simulator = GridExecutorSimulator()
+
+    @staticmethod
+    def get_candles(close_prices) -> pd.DataFrame:
+        close = np.array(close_prices, dtype=float)
+        return pd.DataFrame({
+            "timestamp": np.arange(len(close)) * 60.0,
+            "open": close,
+            "high": close,
+            "low": close,
+            "close": close,
+            "volume": 1.0,
+        })
+
+    @staticmethod
+    def get_config(**kwargs) -> GridExecutorConfig:
+        params = dict(
+            timestamp=0,
+            connector_name="binance",
+            trading_pair="ETH-USDT",
+            start_price=Decimal("95"),
+            end_price=Decimal("105"),
+            limit_price=Decimal("90"),
+            side=TradeType.BUY,
+            total_amount_quote=Decimal("100"),
+            min_spread_between_orders=Decimal("0.05"),
+            min_order_amount_quote=Decimal("10"),
+            triple_barrier_config=TripleBarrierConfig(stop_loss=None, take_profit=Decimal("0.01"), time_limit=None,
+                                                      trailing_stop=None),
+        )
+        params.update(kwargs)
+        return GridExecutorConfig(**params)
+
+    def test_generate_grid_levels(self):
+        prices, amounts = self.simulator.generate_grid_levels(self.get_config(), 100)
+        np.testing.assert_allclose([95, 105], prices)
+        np.testing.assert_allclose([50, 50], amounts)
+
+    def test_simulate_level_cycles_and_take_profit(self):
+        df = self.get_candles([100, 99.9, 94.9, 96, 100, 105.5, 100])
+        result = self.simulator.simulate(df, self.get_config(), trade_cost=0)
+        self.assertEqual(CloseType.TAKE_PROFIT, result.close_type)
+        simulation = result.executor_simulation
+        self.assertEqual(6, len(simulation))
+        last_row = simulation.iloc[-1]
+        # Level 95 completed a cycle, level 105 was filled at the quote with the safe extra spread and remains open
+        realized_pnl = 0.5 * (95.95 - 95)
+        position_pnl = 0.5 * 105.5 - 0.5 * 99.98
+        self.assertAlmostEqual(realized_pnl + position_pnl, last_row["net_pnl_quote"])
+        self.assertAlmostEqual(0.5 * 99.98 + 0.5 * 95 + 0.5 * 95.95 + 0.5 * 105.5, last_row["filled_amount_quote"])
+        self.assertAlmostEqual(last_row["net_pnl_quote"] / last_row["filled_amount_quote"], last_row["net_pnl_pct"])
+
+    def test_simulate_limit_price_stop_loss(self):
+        df = self.get_candles([100, 99.9, 94.9, 89, 100])
+        result = self.simulator.simulate(df, self.get_config(), trade_cost=0.001)
+        self.assertEqual(CloseType.STOP_LOSS, result.close_type)
+        self.assertEqual(4, len(result.executor_simulation))
+        self.assertLess(result.executor_simulation["net_pnl_quote"].iloc[-1], 0)
+
+    def test_simulate_position_stop_loss_and_time_limit(self):
+        df = self.get_candles([100, 99.9, 94.9, 93, 92, 91, 100])
+        barrier = TripleBarrierConfig(stop_loss=Decimal("0.05"), take_profit=Decimal("0.01"), time_limit=60 * 5,
+                                      trailing_stop=None)
+        result = self.simulator.simulate(df, self.get_config(triple_barrier_config=barrier), trade_cost=0)
+        self.assertEqual(CloseType.STOP_LOSS, result.close_type)
+        self.assertEqual(df["timestamp"].iloc[4], result.executor_simulation["timestamp"].iloc[-1])
+
+        df = self.get_candles([100, 100, 100, 100, 100, 100, 100])
+        result = self.simulator.simulate(df, self.get_config(triple_barrier_config=barrier), trade_cost=0)
+        self.assertEqual(CloseType.TIME_LIMIT, result.close_type)
+        self.assertEqual(300, result.executor_simulation["timestamp"].iloc[-1])
+
+    def test_simulate_sell_grid(self):
+        df = self.get_candles([100, 100.1, 105.1, 104, 100, 94.5, 100])
+        config = self.get_config(side=TradeType.SELL, limit_price=Decimal("110"))
+        result = self.simulator.simulate(df, config, trade_cost=0)
+        self.assertEqual(CloseType.TAKE_PROFIT, result.close_type)
+        realized_pnl = 0.5 * (105 - 103.95)
+        position_pnl = 0.5 * 100 * 1.0002 - 0.5 * 94.5
+        self.assertAlmostEqual(realized_pnl + position_pnl, result.executor_simulation["net_pnl_quote"].iloc[-1])
+
+    def test_simulate_without_levels(self):
+        df = self.get_candles([100, 100])
+        result = self.simulator.simulate(df, self.get_config(total_amount_quote=Decimal("5")), trade_cost=0)
+        self.assertEqual(CloseType.FAILED, result.close_type)
+
+    def test_simulate_hundred_levels_month_of_candles(self):
+        rng = np.random.default_rng(1)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.0005, 60 * 24 * 30)))
+        df = self.get_candles(close)
+        df["high"] = df["close"] * 1.0005
+        df["low"] = df["close"] * 0.9995
+        config = self.get_config(start_price=Decimal("80"), end_price=Decimal("120"), limit_price=Decimal("70"),
+                                 total_amount_quote=Decimal("1000"), min_spread_between_orders=Decimal("0.004"),
+                                 activation_bounds=Decimal("0.01"))
+        self.assertEqual(100, len(self.simulator.generate_grid_levels(config, 100)[0]))
+        start = time.perf_counter()
+        result = self.simulator.simulate(df, config, trade_cost=0.0002)
+        self.assertLess(time.perf_counter() - start, 1)
+        self.assertFalse(result.executor_simulation.empty)
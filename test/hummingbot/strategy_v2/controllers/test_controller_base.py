@@ -112,3 +112,17 @@ class TestControllerBase(IsolatedAsyncioWrapperTestCase):
     def test_balance_requirements(self):
         # Test the balance_required method
         self.assertEqual(self.controller.get_balance_requirements(), [])
+
+    def test_executors_info_updates_the_executors_registry(self):
+        active_executor = MagicMock(id="1", is_active=True, custom_info={"level_id": "buy_0"})
+        closed_executor = MagicMock(id="2", is_active=False, custom_info={"level_id": "buy_1"})
+
+        self.controller.executors_info = [active_executor, closed_executor]
+
+        self.assertEqual([active_executor, closed_executor], self.controller.executors_info)
+        self.assertEqual([active_executor], self.controller.executors_registry.get_executors(is_active=True))
+        self.assertEqual([closed_executor], self.controller.executors_registry.get_executors(level_id="buy_1"))
+
+        self.controller.executors_info = [closed_executor]
+
+        self.assertEqual([], self.controller.executors_registry.get_executors(is_active=True))
@@ -63,6 +63,33 @@ class TestMarketMakingControllerBase(IsolatedAsyncioWrapperTestCase):
         for action in actions:
             self.assertIsInstance(action, ExecutorAction)
 
+    def test_get_price_and_amount(self):
+        self.controller.processed_data = {"reference_price": Decimal("100"), "spread_multiplier": Decimal("2")}
+
+        buy_price, buy_amount = self.controller.get_price_and_amount("buy_1")
+        sell_price, sell_amount = self.controller.get_price_and_amount("sell_0")
+
+        self.assertEqual(Decimal("96"), buy_price)
+        self.assertAlmostEqual(Decimal("25") / Decimal("96"), buy_amount, places=12)
+        self.assertEqual(Decimal("102"), sell_price)
+        self.assertAlmostEqual(Decimal("25") / Decimal("102"), sell_amount, places=12)
+
+    @patch("hummingbot.strategy_v2.controllers.market_making_controller_base.MarketMakingControllerBase.get_executor_config", new_callable=MagicMock)
+    def test_create_actions_proposal_only_for_the_levels_without_executor(self, executor_config_mock: MagicMock):
+        executor_config_mock.return_value = PositionExecutorConfig(
+            timestamp=1234, controller_id=self.controller.config.id, connector_name="binance_perpetual",
+            trading_pair="ETH-USDT", side=TradeType.BUY, entry_price=Decimal(100), amount=Decimal(10))
+        self.controller.processed_data = {"reference_price": Decimal("100"), "spread_multiplier": Decimal("1")}
+        active_executor = MagicMock(is_active=True, custom_info={"level_id": "buy_0"})
+        self.controller.executors_info = [active_executor]
+
+        actions = self.controller.create_actions_proposal()
+
+        self.assertEqual(3, len(actions))
+        self.assertEqual(["buy_1", "sell_0", "sell_1"], [call.args[0] for call in executor_config_mock.call_args_list])
+        self.assertEqual([Decimal("98"), Decimal("101"), Decimal("102")],
+                         [call.args[1] for call in executor_config_mock.call_args_list])
+
     def test_stop_actions_proposal(self):
         stop_actions = self.controller.stop_actions_proposal()
         self.assertIsInstance(stop_actions, list)
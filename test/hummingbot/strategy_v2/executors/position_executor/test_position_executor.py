@@ -4,7 +4,7 @@ from unittest.mock import MagicMock, PropertyMock, patch
 
 from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.trading_rule import TradingRule
-from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, TradeUpdate
 from hummingbot.core.data_type.order_candidate import OrderCandidate
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
@@ -617,6 +617,37 @@ class TestPositionExecutor(IsolatedAsyncioWrapperTestCase):
         position_executor.process_order_canceled_event("102", market, event)
         self.assertEqual(position_executor.close_type, None)
 
+    @patch.object(PositionExecutor, "amount_to_close", new_callable=PropertyMock, return_value=Decimal("1"))
+    @patch.object(PositionExecutor, "take_profit_price", new_callable=PropertyMock, return_value=Decimal("110"))
+    def test_renew_take_profit_order_amends_it_as_a_closing_order(self, _, __):
+        position_config = self.get_position_config_market_long()
+        position_executor = self.get_position_executor_running_from_config(position_config)
+        position_executor._take_profit_limit_order = TrackedOrder("OID-SELL-1")
+        self.strategy.amend.return_value = "OID-SELL-2"
+
+        position_executor.renew_take_profit_order()
+
+        self.strategy.amend.assert_called_once_with("binance", "ETH-USDT", "OID-SELL-1", Decimal("110"), Decimal("1"),
+                                                    OrderType.LIMIT, PositionAction.CLOSE)
+        self.strategy.cancel.assert_not_called()
+        self.assertEqual("OID-SELL-2", position_executor._take_profit_limit_order.order_id)
+
+    @patch.object(PositionExecutor, "amount_to_close", new_callable=PropertyMock, return_value=Decimal("1"))
+    @patch.object(PositionExecutor, "take_profit_price", new_callable=PropertyMock, return_value=Decimal("110"))
+    def test_renew_take_profit_order_cancels_it_before_placing_a_new_one_when_not_amended(self, _, __):
+        position_config = self.get_position_config_market_long()
+        position_executor = self.get_position_executor_running_from_config(position_config)
+        position_executor._take_profit_limit_order = TrackedOrder("OID-SELL-0")
+        self.strategy.amend.return_value = None
+
+        position_executor.renew_take_profit_order()
+
+        self.strategy.cancel.assert_called_once_with(connector_name="binance", trading_pair="ETH-USDT",
+                                                     order_id="OID-SELL-0")
+        self.strategy.sell.assert_called_once()
+        self.assertEqual(PositionAction.CLOSE, self.strategy.sell.call_args.args[5])
+        self.assertEqual("OID-SELL-1", position_executor._take_profit_limit_order.order_id)
+
     @patch("hummingbot.strategy_v2.executors.position_executor.position_executor.PositionExecutor.get_price",
            return_value=Decimal("101"))
     def test_position_executor_created_without_entry_price(self, _):
@@ -162,6 +162,43 @@ class TestExecutorBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         executor_info = self.component.executor_info
         self.assertEqual(executor_info.id, "test")
 
+    @patch.object(ExecutorBase, "get_net_pnl_pct")
+    @patch.object(ExecutorBase, "get_net_pnl_quote")
+    @patch.object(ExecutorBase, "get_cum_fees_quote")
+    def test_executor_info_is_built_again_after_state_changes(self, cum_fees_quote_mock, net_pnl_quote_mock,
+                                                              net_pnl_pct_mock):
+        net_pnl_pct_mock.return_value = Decimal("0.01")
+        net_pnl_quote_mock.return_value = Decimal("NaN")
+        cum_fees_quote_mock.return_value = 0
+        executor_info = self.component.executor_info
+
+        self.assertIs(self.config, executor_info.config)
+        self.assertEqual(Decimal("0.01"), executor_info.net_pnl_pct)
+        self.assertEqual(Decimal("0"), executor_info.net_pnl_quote)
+        self.assertEqual(Decimal("0"), executor_info.cum_fees_quote)
+        self.assertIsInstance(executor_info.cum_fees_quote, Decimal)
+
+        self.component.after_control_task()
+        self.assertIs(executor_info, self.component.executor_info)
+
+        net_pnl_pct_mock.return_value = Decimal("0.02")
+        self.assertIs(executor_info, self.component.executor_info)
+
+        self.component.after_control_task()
+        self.assertIsNot(executor_info, self.component.executor_info)
+        executor_info = self.component.executor_info
+        self.assertEqual(Decimal("0.02"), executor_info.net_pnl_pct)
+
+        self.component._fill_order_forwarder(MagicMock())
+        self.assertIsNot(executor_info, self.component.executor_info)
+        executor_info = self.component.executor_info
+
+        self.component.start()
+        self.component.stop()
+        self.assertIsNot(executor_info, self.component.executor_info)
+        self.assertEqual(RunnableStatus.TERMINATED, self.component.executor_info.status)
+        self.assertFalse(self.component.executor_info.is_active)
+
     def test_get_price_by_type(self):
         price = self.component.get_price("connector1", "EHT-USDT", PriceType.MidPrice)
         self.assertEqual(price, Decimal("1000.0"))
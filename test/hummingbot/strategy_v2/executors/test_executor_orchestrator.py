@@ -76,6 +76,9 @@ class TestExecutorOrchestrator(unittest.TestCase):
             CreateExecutorAction(executor_config=dca_executor_config, controller_id="test"),
             CreateExecutorAction(executor_config=twap_executor_config, controller_id="test"),
         ]
+        # The validated configs are not copied or validated again by the actions
+        self.assertIs(position_executor_config, actions[0].executor_config)
+        self.assertIs(twap_executor_config, actions[3].executor_config)
         self.orchestrator.execute_actions(actions)
         self.assertEqual(len(self.orchestrator.active_executors["test"]), 4)
 
@@ -0,0 +1,99 @@
+import unittest
+from decimal import Decimal
+from typing import Optional
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executor_registry import ExecutorRegistry
+from hummingbot.strategy_v2.models.executors import CloseType
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+
+
+class TestExecutorRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = ExecutorRegistry()
+
+    @staticmethod
+    def executor_info(executor_id: str, side: TradeType, level_id: str, trading_pair: str = "ETH-USDT",
+                      status: RunnableStatus = RunnableStatus.RUNNING,
+                      close_type: Optional[CloseType] = None) -> ExecutorInfo:
+        config = PositionExecutorConfig(timestamp=1234, trading_pair=trading_pair, connector_name="binance",
+                                        side=side, amount=Decimal(10), entry_price=Decimal(100), level_id=level_id)
+        return ExecutorInfo(
+            id=executor_id, timestamp=1234, type="position_executor", status=status, close_type=close_type,
+            config=config, filled_amount_quote=Decimal(0), net_pnl_quote=Decimal(0), net_pnl_pct=Decimal(0),
+            cum_fees_quote=Decimal(0), is_trading=False, is_active=status != RunnableStatus.TERMINATED,
+            custom_info={"side": side, "level_id": level_id}, controller_id="controller")
+
+    def test_get_executors_by_indexed_values(self):
+        buy = self.executor_info("1", TradeType.BUY, "buy_0")
+        sell = self.executor_info("2", TradeType.SELL, "sell_0")
+        closed_buy = self.executor_info("3", TradeType.BUY, "buy_1", status=RunnableStatus.TERMINATED,
+                                        close_type=CloseType.STOP_LOSS)
+        other_pair = self.executor_info("4", TradeType.BUY, "buy_0", trading_pair="BTC-USDT")
+        self.registry.update([buy, sell, closed_buy, other_pair])
+
+        self.assertEqual([buy, sell, closed_buy, other_pair], self.registry.get_executors())
+        self.assertEqual([buy, other_pair], self.registry.get_executors(side=TradeType.BUY, is_active=True))
+        self.assertEqual([buy], self.registry.get_executors(level_id="buy_0", trading_pair="ETH-USDT"))
+        self.assertEqual([closed_buy], self.registry.get_executors(status=RunnableStatus.TERMINATED))
+        self.assertEqual([closed_buy], self.registry.get_executors(is_active=False, close_type=CloseType.STOP_LOSS))
+        self.assertEqual([buy, sell, closed_buy, other_pair], self.registry.get_executors(controller_id="controller"))
+        self.assertEqual([], self.registry.get_executors(controller_id="other"))
+        self.assertEqual([], self.registry.get_executors(side=TradeType.SELL, status=RunnableStatus.TERMINATED))
+
+    def test_update_indexes_the_new_snapshots_again_and_removes_the_missing_executors(self):
+        buy = self.executor_info("1", TradeType.BUY, "buy_0")
+        sell = self.executor_info("2", TradeType.SELL, "sell_0")
+        self.registry.update([buy, sell])
+
+        closed_buy = self.executor_info("1", TradeType.BUY, "buy_0", status=RunnableStatus.TERMINATED,
+                                        close_type=CloseType.TAKE_PROFIT)
+        new_buy = self.executor_info("3", TradeType.BUY, "buy_0")
+        self.registry.update([closed_buy, sell, new_buy])
+
+        self.assertEqual(3, len(self.registry))
+        self.assertIs(closed_buy, self.registry.get("1"))
+        self.assertEqual([closed_buy, new_buy], self.registry.get_executors(level_id="buy_0"))
+        self.assertEqual([new_buy], self.registry.get_executors(level_id="buy_0", is_active=True))
+        self.assertEqual([closed_buy], self.registry.get_executors(close_type=CloseType.TAKE_PROFIT))
+
+        self.registry.update([new_buy])
+
+        self.assertEqual([new_buy], list(self.registry))
+        self.assertNotIn("1", self.registry)
+        self.assertEqual([], self.registry.get_executors(side=TradeType.SELL))
+        self.assertEqual([], self.registry.get_executors(status=RunnableStatus.TERMINATED))
+
+    def test_remove_unknown_executor_is_ignored(self):
+        self.registry.remove("unknown")
+        self.assertEqual(0, len(self.registry))
+
+    def test_update_removes_the_executors_added_out_of_the_reported_list(self):
+        self.registry.add(self.executor_info("1", TradeType.BUY, "buy_0"))
+
+        self.registry.update([])
+
+        self.assertEqual(0, len(self.registry))
+        self.assertEqual([], self.registry.get_executors(side=TradeType.BUY))
+
+    def test_new_snapshots_only_move_the_executor_when_its_state_changes(self):
+        buy = self.executor_info("1", TradeType.BUY, "buy_0")
+        self.registry.update([buy])
+
+        same_state_buy = self.executor_info("1", TradeType.BUY, "buy_0")
+        self.registry.update([same_state_buy])
+
+        self.assertIs(same_state_buy, self.registry.get("1"))
+        self.assertEqual([same_state_buy], self.registry.get_executors(is_active=True, level_id="buy_0"))
+
+        closed_buy = self.executor_info("1", TradeType.BUY, "buy_0", status=RunnableStatus.TERMINATED,
+                                        close_type=CloseType.STOP_LOSS)
+        self.registry.update([closed_buy])
+
+        self.assertEqual([], self.registry.get_executors(is_active=True))
+        self.assertEqual([closed_buy], self.registry.get_executors(is_active=False, close_type=CloseType.STOP_LOSS,
+                                                                   level_id="buy_0"))
+        self.assertEqual([], self.registry.get_executors(status=RunnableStatus.RUNNING))
@@ -0,0 +1,62 @@
+import unittest
+from decimal import Decimal
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy_v2.utils.distributions import Distributions
+from hummingbot.strategy_v2.utils.order_ladder import LadderLevel, OrderLadder
+
+
+class TestOrderLadder(unittest.TestCase):
+
+    def test_from_spreads_places_buys_below_and_sells_above_the_reference_price(self):
+        buys = OrderLadder.from_spreads(TradeType.BUY, Decimal("100"), [0.01, 0.02], [50, 60],
+                                        spread_multiplier=Decimal("2"), level_id_prefix="buy_")
+        sells = OrderLadder.from_spreads(TradeType.SELL, Decimal("100"), [0.01, 0.02], [50, 60],
+                                         level_id_prefix="sell_")
+
+        self.assertEqual(LadderLevel("buy_1", TradeType.BUY, 1, Decimal("96"), Decimal("0.625"), Decimal("60")),
+                         buys.get_level(1))
+        self.assertEqual(Decimal("98"), buys.get_level(0).price)
+        self.assertAlmostEqual(Decimal("50") / Decimal("98"), buys.get_level(0).amount, places=12)
+        self.assertEqual([Decimal("101"), Decimal("102")], [level.price for level in sells.get_levels()])
+        self.assertEqual(["sell_0", "sell_1"], [level.level_id for level in sells.get_levels()])
+
+    def test_levels_match_the_decimal_math(self):
+        reference_price = Decimal("2345.67")
+        spreads = Distributions.linear(100, 0.001, 0.05)
+        amounts_quote = [Decimal("10") + i for i in range(100)]
+        ladder = OrderLadder.from_spreads(TradeType.SELL, reference_price, spreads, amounts_quote)
+
+        for level in ladder.get_levels():
+            price = reference_price * (1 + spreads[level.level])
+            self.assertAlmostEqual(price, level.price, delta=price * Decimal("1e-13"))
+            self.assertAlmostEqual(amounts_quote[level.level] / price, level.amount,
+                                   delta=amounts_quote[level.level] / price * Decimal("1e-13"))
+
+    def test_get_levels_only_returns_the_requested_levels(self):
+        ladder = OrderLadder.from_spreads(TradeType.BUY, 100, [0.01, 0.02, 0.03], [10, 10, 10], level_id_prefix="buy_")
+
+        levels = ladder.get_levels([2, 0])
+
+        self.assertEqual(["buy_2", "buy_0"], [level.level_id for level in levels])
+        self.assertEqual([Decimal("97"), Decimal("99")], [level.price for level in levels])
+        self.assertEqual("custom_id", ladder.get_level(1, "custom_id").level_id)
+
+    def test_from_price_range_matches_the_linear_distribution(self):
+        ladder = OrderLadder.from_price_range(TradeType.BUY, Decimal("90"), Decimal("110"), 5, Decimal("1000"),
+                                              level_id_prefix="L")
+
+        self.assertEqual(Distributions.linear(5, 90, 110), [level.price for level in ladder.get_levels()])
+        self.assertEqual([Decimal("200")] * 5, [level.amount_quote for level in ladder.get_levels()])
+        self.assertEqual(["L0", "L1", "L2", "L3", "L4"], [level.level_id for level in ladder.get_levels()])
+        self.assertEqual(5, len(ladder))
+
+    def test_levels_without_price_have_no_amount(self):
+        ladder = OrderLadder.from_spreads(TradeType.BUY, 100, [0.5, 1], [10, 10])
+
+        self.assertEqual(Decimal("0"), ladder.get_level(1).price)
+        self.assertEqual(Decimal("0"), ladder.get_level(1).amount)
+
+    def test_prices_and_amounts_must_have_the_same_length(self):
+        with self.assertRaises(ValueError):
+            OrderLadder.from_spreads(TradeType.BUY, 100, [0.01, 0.02], [10])